@@ -0,0 +1,147 @@
+import argparse
+import glob
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from core.constants import ARCHIVE_CODEC, ARCHIVE_LEVEL
+from data.batch_analyzer import SEGMENT_PATTERN, segment_sort_key
+from data.event_log import EventLogWriter, event_log_path
+from data.recording_repository import SIDECAR_SUFFIX
+from data.segment_archive import (
+    ARCHIVE_EXTENSION,
+    SegmentArchive,
+    archive_csv,
+    archive_path,
+    verify_archive,
+)
+
+
+def pack(csv_path: str, codec: str, level: int, delete: bool) -> dict:
+    """Tek segmenti arşivler ve doğrular (işçi süreçte çalışır)."""
+    try:
+        result = archive_csv(csv_path, codec=codec, level=level)
+    except (OSError, ValueError) as e:
+        return {"error": str(e)}
+    result["verified"] = verify_archive(csv_path, result["path"])
+    if not result["verified"]:
+        os.remove(result["path"])
+    elif delete:
+        for path in (csv_path, csv_path + SIDECAR_SUFFIX, event_log_path(csv_path)):
+            if os.path.exists(path):
+                os.remove(path)
+    return result
+
+
+def unpack(path: str, force: bool) -> str:
+    """Arşivden segment CSV'sini (ve olay dosyasını) geri yazar."""
+    csv_path = os.path.splitext(path)[0] + ".csv"
+    if os.path.exists(csv_path) and not force:
+        raise FileExistsError(f"{csv_path} exists (use --force)")
+    archive = SegmentArchive(path)
+    try:
+        archive.write_csv(csv_path)
+        if archive.events:
+            writer = EventLogWriter(event_log_path(csv_path))
+            for event in archive.events:
+                writer.write(event)
+            writer.close()
+    finally:
+        archive.close()
+    return csv_path
+
+
+def _expand(inputs, pattern: str):
+    paths = []
+    for item in inputs:
+        if os.path.isdir(item):
+            paths.extend(glob.glob(os.path.join(glob.escape(item), pattern)))
+        else:
+            paths.append(item)
+    return sorted(paths, key=segment_sort_key)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Segment CSV'lerini sıkıştırılmış arşive (.gmka) çevirir ve geri açar."
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_pack = sub.add_parser("pack", help="CSV'leri paralel olarak arşivle")
+    p_pack.add_argument("inputs", nargs="+", help="Segment CSV'leri veya klasörler")
+    p_pack.add_argument("-j", "--workers", type=int, default=None, help="İşçi süreç sayısı")
+    p_pack.add_argument("--codec", default=ARCHIVE_CODEC, choices=("zlib", "zstd"))
+    p_pack.add_argument("--level", type=int, default=ARCHIVE_LEVEL)
+    p_pack.add_argument(
+        "--delete", action="store_true", help="Doğrulanan CSV'yi (ve yan dosyalarını) sil"
+    )
+
+    p_unpack = sub.add_parser("unpack", help="Arşivden CSV üret")
+    p_unpack.add_argument("inputs", nargs="+", help=".gmka dosyaları veya klasörler")
+    p_unpack.add_argument("--force", action="store_true", help="Var olan CSV'nin üzerine yaz")
+
+    p_info = sub.add_parser("info", help="Arşiv bilgisi")
+    p_info.add_argument("inputs", nargs="+")
+    args = parser.parse_args()
+
+    if args.command == "pack":
+        paths = [
+            p for p in _expand(args.inputs, SEGMENT_PATTERN)
+            if not p.endswith(("_events.csv", "_recovered.csv"))
+            and not os.path.exists(archive_path(p))
+        ]
+        if not paths:
+            print("No segment files to archive.")
+            return
+        csv_total = archive_total = failed = 0
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            jobs = pool.map(
+                pack,
+                paths,
+                [args.codec] * len(paths),
+                [args.level] * len(paths),
+                [args.delete] * len(paths),
+            )
+            for path, result in zip(paths, jobs):
+                if "error" in result:
+                    failed += 1
+                    print(f"{os.path.basename(path)}: {result['error']}")
+                    continue
+                ok = result["verified"]
+                failed += not ok
+                csv_total += result["csv_bytes"]
+                archive_total += result["archive_bytes"] if ok else 0
+                print(
+                    f"{os.path.basename(path)}: {result['rows']} rows, "
+                    f"{result['csv_bytes'] / 1e6:.2f} -> {result['archive_bytes'] / 1e6:.2f} MB"
+                    + ("" if ok else "  VERIFY FAILED, archive removed")
+                )
+        if archive_total:
+            print(
+                f"{len(paths) - failed} archived: {csv_total / 1e6:.1f} MB -> "
+                f"{archive_total / 1e6:.1f} MB ({csv_total / archive_total:.1f}x)"
+            )
+        if failed:
+            raise SystemExit(1)
+
+    elif args.command == "unpack":
+        for path in _expand(args.inputs, "*" + ARCHIVE_EXTENSION):
+            try:
+                print(f"{path} -> {unpack(path, args.force)}")
+            except (OSError, ValueError) as e:
+                print(f"{path}: {e}")
+
+    else:
+        for path in _expand(args.inputs, "*" + ARCHIVE_EXTENSION):
+            archive = SegmentArchive(path)
+            t0, t1 = archive.time_span
+            print(
+                f"{path}: source={archive.footer.get('source')} "
+                f"rows={archive.row_count} blocks={len(archive.blocks)} "
+                f"t={t0:.3f}..{t1:.3f} s codec={archive.footer['codec']} "
+                f"events={len(archive.events)} channels={', '.join(archive.keys[1:])}"
+            )
+            archive.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+import argparse
+import os
+
+from data.batch_analyzer import COMPARISON_COLUMNS, BatchAnalyzer, comparison_rows
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Bir klasördeki <ad>_segmentN.csv kayıtlarını toplu analiz eder."
+    )
+    parser.add_argument("folder", help="Segment CSV'lerinin bulunduğu klasör")
+    parser.add_argument(
+        "-j", "--workers", type=int, default=None, help="İşçi süreç sayısı"
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        default=None,
+        help="Karşılaştırma tablosu (varsayılan: <klasör>/batch_comparison.csv)",
+    )
+    args = parser.parse_args()
+
+    analyzer = BatchAnalyzer(args.folder, max_workers=args.workers)
+    results = analyzer.run(
+        progress_cb=lambda done, total: print(f"\r{done}/{total}", end="", flush=True)
+    )
+    print()
+
+    if not results:
+        print("No segment files found.")
+        return
+
+    header = ["Segment"] + [c[0] for c in COMPARISON_COLUMNS[:6]]
+    print(" | ".join(header))
+    for name, cells in comparison_rows(results):
+        print(" | ".join([name] + cells[:6]))
+
+    out = args.output or os.path.join(args.folder, "batch_comparison.csv")
+    analyzer.write_comparison_csv(results, out)
+    print(f"Comparison table: {out}")
+
+
+if __name__ == "__main__":
+    main()
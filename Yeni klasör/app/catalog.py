@@ -0,0 +1,94 @@
+import argparse
+import os
+import time
+
+from data.batch_analyzer import BatchAnalyzer, segment_sort_key
+from data.catalog import SETUP_FIELDS, SegmentCatalog, default_catalog_path, flatten_metrics
+from data.event_log import load_event_log
+
+
+SEARCH_COLUMNS = ("started", "test_name", "segment", "motor", "prop", "thrust_kgf.max", "current.max")
+
+
+def add_folder(catalog: SegmentCatalog, folder: str, setup: dict, force: bool) -> int:
+    """Klasördeki segment CSV'lerini (BatchAnalyzer önbelleğiyle) kataloğa ekler."""
+    analyzer = BatchAnalyzer(folder)
+    if not force:
+        paths = [p for p in analyzer.find_segments() if not catalog.has_path(p)]
+        if not paths:
+            return 0
+    results = analyzer.run(
+        progress_cb=lambda done, total: print(f"\r{done}/{total}", end="", flush=True)
+    )
+    print()
+
+    added = 0
+    for res in results:
+        path = res["path"]
+        if not force and catalog.has_path(path):
+            continue
+        metrics = res["metrics"]
+        name, segment = segment_sort_key(path)
+        mtime = os.path.getmtime(path)
+        info = dict(
+            setup,
+            path=path,
+            test_name=name,
+            segment=segment,
+            started=time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(mtime)),
+            started_ts=mtime,
+            duration_s=metrics.get("duration"),
+            samples=metrics.get("count"),
+            safety_stops=len(load_event_log(path)),
+        )
+        catalog.add_segment(info, flatten_metrics(metrics))
+        added += 1
+    return added
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Segment kataloğu (SQLite).")
+    parser.add_argument("--db", default=None, help="Katalog dosyası (varsayılan: kullanıcı veri klasörü)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_add = sub.add_parser("add", help="Klasördeki segment CSV'lerini kataloğa ekle")
+    p_add.add_argument("folders", nargs="+")
+    p_add.add_argument("--force", action="store_true", help="Kataloğdakileri yeniden ekle")
+    for field, kind in SETUP_FIELDS:
+        p_add.add_argument(
+            f"--{field.replace('_', '-')}", dest=field, type=float if kind == "REAL" else str
+        )
+
+    p_search = sub.add_parser("search", help='Sorgu, örn. "prop_diameter_in = 10, thrust_kgf.max > 2"')
+    p_search.add_argument("query", nargs="?", default="")
+    p_search.add_argument("-n", "--limit", type=int, default=50)
+
+    sub.add_parser("prune", help="Dosyası silinmiş segmentleri çıkar")
+    args = parser.parse_args()
+
+    catalog = SegmentCatalog(args.db or default_catalog_path())
+    try:
+        if args.command == "add":
+            setup = {f: getattr(args, f) for f, _k in SETUP_FIELDS if getattr(args, f) is not None}
+            for folder in args.folders:
+                print(f"{folder}: {add_folder(catalog, folder, setup, args.force)} segment(s) added")
+        elif args.command == "prune":
+            print(f"{catalog.remove_missing()} segment(s) removed")
+        else:
+            t = time.perf_counter()
+            try:
+                rows = catalog.search(args.query, SEARCH_COLUMNS[-2:], limit=args.limit)
+            except ValueError as e:
+                parser.error(str(e))
+            dt_ms = 1000.0 * (time.perf_counter() - t)
+            print(" | ".join(SEARCH_COLUMNS + ("path",)))
+            for row in rows:
+                cells = ["--" if row.get(c) is None else str(row[c]) for c in SEARCH_COLUMNS]
+                print(" | ".join(cells + [row["path"]]))
+            print(f"{len(rows)} of {catalog.count()} segment(s), {dt_ms:.1f} ms")
+    finally:
+        catalog.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -6,8 +6,7 @@ from PyQt6.QtWidgets import QApplication
 from presentation.windows.main_window import MainWindow
 
 
-def main():
-    app = QApplication([])
+def load_stylesheet(app: QApplication):
     app.setFont(QFont("Segoe UI", 10))
 
     qss_path = Path(__file__).resolve().parent.parent / "styles" / "app.qss"
@@ -15,6 +14,11 @@ def main():
         with open(qss_path, "r", encoding="utf-8") as f:
             app.setStyleSheet(f.read())
 
+
+def main():
+    app = QApplication([])
+    load_stylesheet(app)
+
     win = MainWindow()
     win.show()
     app.exec()
@@ -0,0 +1,59 @@
+import argparse
+import os
+import sys
+
+from PyQt6.QtGui import QGuiApplication
+
+from presentation.reports.session_report import SessionReport
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Segment CSV'lerinden HTML/PDF oturum raporu üretir."
+    )
+    parser.add_argument(
+        "inputs", nargs="+", help="Segment klasörü veya tek tek segment CSV'leri"
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        default=None,
+        help="Rapor dosyası, .html veya .pdf (varsayılan: <klasör>/session_report.html)",
+    )
+    parser.add_argument(
+        "-j", "--workers", type=int, default=None, help="İşçi thread sayısı"
+    )
+    parser.add_argument("--title", default=None, help="Rapor başlığı")
+    args = parser.parse_args()
+
+    # Grafikler QImage'a çizildiği için bir QGuiApplication gerekir;
+    # ekransız ortamda (CI, sunucu) offscreen eklentisi kullanılır.
+    if not os.environ.get("DISPLAY") and sys.platform.startswith("linux"):
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QGuiApplication(sys.argv[:1])
+
+    if len(args.inputs) == 1 and os.path.isdir(args.inputs[0]):
+        folder = args.inputs[0]
+        report = SessionReport.from_folder(
+            folder, title=args.title, max_workers=args.workers
+        )
+    else:
+        folder = os.path.dirname(os.path.abspath(args.inputs[0]))
+        report = SessionReport(args.inputs, title=args.title, max_workers=args.workers)
+
+    if not report.paths:
+        print("No segment files found.")
+        return
+
+    out = args.output or os.path.join(folder, "session_report.html")
+    report.write(
+        out,
+        progress_cb=lambda done, total: print(f"\r{done}/{total}", end="", flush=True),
+    )
+    print()
+    print(f"Report: {out}")
+    del app
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+import argparse
+import os
+
+from data.event_log import EventLogWriter, event_log_path
+from data.recording_repository import RecordingRepository
+from data.segment_journal import JOURNAL_EXTENSION, find_journals, read_journal
+from domain.segment_summary import format_segment_summary
+
+
+def recover(path: str, force: bool = False) -> str:
+    """
+    Günlükten CSV'yi, olay dosyasını ve özet metnini yeniden üretir.
+
+    CSV zaten varsa (çökmede yarım kalmış olabilir) --force verilmedikçe
+    üzerine yazılmaz, <ad>_recovered.csv üretilir. Üretilen CSV yolunu
+    döndürür.
+    """
+    contents = read_journal(path)
+    if not contents.csv_text:
+        raise ValueError("Journal contains no rows.")
+
+    folder = os.path.dirname(os.path.abspath(path))
+    csv_name = contents.header.get("csv") or os.path.basename(path)[: -len(JOURNAL_EXTENSION)]
+    csv_path = os.path.join(folder, os.path.splitext(csv_name)[0] + ".csv")
+    if os.path.exists(csv_path) and not force:
+        csv_path = os.path.splitext(csv_path)[0] + "_recovered.csv"
+
+    with open(csv_path, "wb") as f:
+        f.write(contents.csv_text)
+
+    if contents.events:
+        writer = EventLogWriter(event_log_path(csv_path))
+        for event in contents.events:
+            writer.write(event)
+        writer.close()
+
+    recording = RecordingRepository(csv_path)
+    try:
+        lines = format_segment_summary(
+            recording.stats, f"Recovered: {os.path.basename(csv_path)}"
+        )
+    finally:
+        recording.close()
+
+    header = contents.header
+    lines.append(f"Journal: {path}")
+    for key in ("test_name", "segment", "started", "port"):
+        if header.get(key) not in (None, ""):
+            lines.append(f"{key}: {header[key]}")
+    lines.append(
+        "Journal state: "
+        + ("closed cleanly" if contents.closed is not None else "interrupted")
+        + f", {contents.chunks} chunks, {contents.discarded_bytes} bytes discarded"
+    )
+
+    summary_path = os.path.splitext(csv_path)[0] + "_summary.txt"
+    with open(summary_path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+    print("\n".join(lines))
+    return csv_path
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Yarım kalmış segment günlüklerinden (.gmkj) CSV ve özet üretir."
+    )
+    parser.add_argument(
+        "inputs", nargs="+", help="Günlük dosyaları veya günlüklerin bulunduğu klasör"
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="Var olan segment CSV'sinin üzerine yaz"
+    )
+    parser.add_argument(
+        "--delete", action="store_true", help="Başarılı kurtarmadan sonra günlüğü sil"
+    )
+    args = parser.parse_args()
+
+    paths = []
+    for item in args.inputs:
+        paths.extend(find_journals(item) if os.path.isdir(item) else [item])
+    if not paths:
+        print("No journal files found.")
+        return
+
+    for path in paths:
+        try:
+            csv_path = recover(path, force=args.force)
+        except (OSError, ValueError) as e:
+            print(f"{path}: {e}")
+            continue
+        print(f"-> {csv_path}\n")
+        if args.delete:
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
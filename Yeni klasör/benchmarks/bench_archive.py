@@ -0,0 +1,94 @@
+"""
+Segment arşivi (.gmka) sıkıştırma oranı ve kodlama/çözme hızı.
+
+Çalıştırma:
+    python -m benchmarks.bench_archive [satır_sayısı]
+
+Simüle düzenek modeli (data/protocol_sim.MotorModel) throttle basamaklarıyla
+sürülüp kayıt yazıcısının biçiminde bir segment CSV'si üretilir; araya bir
+bağlantı kesintisi (boş hücreli iki satır) eklenir. Arşivleme, tam okuma,
+tek blok okuma ve CSV boyutuna oran raporlanır; değerlerin bit düzeyinde
+aynı olduğu doğrulanır.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from core.channels import CSV_COLUMNS, CSV_PRECISION
+from data.protocol_sim import MotorModel
+from data.segment_archive import SegmentArchive, archive_csv, verify_archive
+
+
+RATE_HZ = 100.0
+STEP_S = 20.0
+
+
+def write_simulated(path: str, rows: int):
+    model = MotorModel(seed=0)
+    keys = list(CSV_COLUMNS)
+    fmt = {k: f"={{:.{CSV_PRECISION[k]}f}}" for k in keys}
+    dt = 1.0 / RATE_HZ
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        f.write(";".join(CSV_COLUMNS.values()) + "\r\n")
+        for i in range(rows):
+            t = i * dt
+            model.throttle = 10.0 * (int(t / STEP_S) % 10)
+            model.step(dt)
+            if i == rows // 2:
+                f.write(f"={t:.3f}" + ";" * (len(keys) - 1) + "\r\n")
+                f.write(f"={t + 0.5:.3f}" + ";" * (len(keys) - 1) + "\r\n")
+            cells = dict(
+                part.split("=") for part in model.telemetry_line().split(" | ")
+            )
+            v, w, c = float(cells["V"]), float(cells["Weight(kg)"]), float(cells["I"])
+            p = v * c
+            # Sütun adıyla anahtarlı satır: kayıttaki kanal değişiklikleri
+            # (ek kanal, sıra) biçimi bozmaz; bilinmeyen kanallar 0 yazılır
+            row = {
+                "time_s": t,
+                "voltage": v,
+                "current": c,
+                "thrust_kgf": w,
+                "temperature": float(cells["T"]),
+                "rpm": float(cells["RPM"]),
+                "power": p,
+                "pt_eff": w / p if p else 0.0,
+                "tpa": w / c if c else 0.0,
+            }
+            f.write(";".join(fmt[k].format(row.get(k, 0.0)) for k in keys) + "\r\n")
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    with tempfile.TemporaryDirectory() as folder:
+        csv_path = os.path.join(folder, "bench_segment1.csv")
+        write_simulated(csv_path, rows)
+
+        t = time.perf_counter()
+        result = archive_csv(csv_path)
+        t_encode = time.perf_counter() - t
+
+        archive = SegmentArchive(result["path"])
+        t = time.perf_counter()
+        archive.read_columns()
+        t_decode = time.perf_counter() - t
+        t = time.perf_counter()
+        mid = sum(archive.time_span) / 2
+        archive.read_range(mid, mid + 10.0, ["thrust_kgf"])
+        t_range = time.perf_counter() - t
+        archive.close()
+
+        csv_mb = result["csv_bytes"] / 1e6
+        print(f"rows={result['rows']}  csv={csv_mb:.1f} MB  "
+              f"archive={result['archive_bytes'] / 1e6:.2f} MB  "
+              f"ratio={result['csv_bytes'] / result['archive_bytes']:.1f}x")
+        print(f"archive (parse + encode)  {t_encode * 1e3:8.1f} ms  {csv_mb / t_encode:7.1f} MB/s CSV")
+        print(f"read all                  {t_decode * 1e3:8.1f} ms  {result['rows'] / t_decode / 1e6:7.1f} M rows/s")
+        print(f"read 10 s, one channel    {t_range * 1e3:8.1f} ms")
+        print(f"bit-exact: {verify_archive(csv_path, result['path'])}")
+
+
+if __name__ == "__main__":
+    main()
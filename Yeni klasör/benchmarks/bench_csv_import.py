@@ -0,0 +1,75 @@
+"""
+CSV içe aktarıcı verim ölçümü.
+
+Çalıştırma:
+    python -m benchmarks.bench_csv_import [satır_sayısı]
+
+Kayıt yazıcısıyla aynı biçimde (';' ayraçlı, '=' önekli) sentetik bir
+segment üretir; vektörize yol ile satır satır yolu MB/s olarak karşılaştırır.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from core.channels import CSV_COLUMNS, CSV_PRECISION
+from data import csv_importer
+
+
+def write_synthetic(path: str, rows: int):
+    rng = np.random.default_rng(0)
+    scale = {
+        "voltage": 16 + rng.random(rows),
+        "current": 40 * rng.random(rows),
+        "thrust_kgf": 5 * rng.random(rows),
+        "temperature": 30 + 10 * rng.random(rows),
+        "rpm": 30000 * rng.random(rows),
+        "power": 900 * rng.random(rows),
+        "pt_eff": 0.02 * rng.random(rows),
+        "tpa": 0.2 * rng.random(rows),
+    }
+    cols = [np.arange(rows) * 0.01] + [
+        scale[key] if key in scale else 10 * rng.random(rows)
+        for key in list(CSV_COLUMNS)[1:]
+    ]
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        f.write(";".join(CSV_COLUMNS.values()) + "\r\n")
+        fmt = ";".join(f"={{:.{CSV_PRECISION.get(k, 3)}f}}" for k in CSV_COLUMNS) + "\r\n"
+        for row in zip(*cols):
+            f.write(fmt.format(*row))
+
+
+def measure(label: str, fn, size: int):
+    t0 = time.perf_counter()
+    fn()
+    dt = time.perf_counter() - t0
+    print(f"{label:<28s} {dt * 1e3:9.1f} ms   {size / dt / 1e6:8.1f} MB/s")
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench_segment1.csv")
+        write_synthetic(path, rows)
+        size = os.path.getsize(path)
+        print(f"rows={rows}  size={size / 1e6:.1f} MB")
+
+        with open(path, "rb") as f:
+            f.readline()
+            body = f.read()
+        ncols = len(CSV_COLUMNS)
+
+        measure("import_csv (vectorized)", lambda: csv_importer.import_csv(path), size)
+        measure(
+            "parse_rows (line-by-line)",
+            lambda: csv_importer._parse_rows_slow(body, ncols),
+            size,
+        )
+
+
+if __name__ == "__main__":
+    main()
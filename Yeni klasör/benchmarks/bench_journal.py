@@ -0,0 +1,72 @@
+"""
+Segment günlüğü yazma maliyeti.
+
+Çalıştırma:
+    python -m benchmarks.bench_journal [satır_sayısı]
+
+Aynı satırlar üç şekilde yazılır: yalnızca CSV (mevcut davranış), CSV +
+günlük (parça/fsync bütçeli) ve karşılaştırma için her satırda fsync.
+Satır başına süre ve saniyedeki satır sayısı raporlanır.
+"""
+
+import csv
+import os
+import sys
+import tempfile
+import time
+
+from data.segment_journal import JournaledFile, SegmentJournal
+
+
+def _rows(n: int):
+    for i in range(n):
+        t = i * 0.01
+        yield [f"={t:.3f}"] + [f"={(i * k) % 997 / 7.0:.4f}" for k in range(1, 13)]
+
+
+def write_plain(path: str, n: int):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f, delimiter=";")
+        for row in _rows(n):
+            writer.writerow(row)
+
+
+def write_journaled(path: str, n: int):
+    raw = open(path, "w", newline="", encoding="utf-8")
+    journal = SegmentJournal(path + ".gmkj", {"csv": os.path.basename(path)})
+    f = JournaledFile(raw, journal, discard=True)
+    writer = csv.writer(f, delimiter=";")
+    for row in _rows(n):
+        writer.writerow(row)
+    f.close()
+
+
+def write_fsync_each(path: str, n: int):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f, delimiter=";")
+        for row in _rows(n):
+            writer.writerow(row)
+            f.flush()
+            os.fsync(f.fileno())
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    with tempfile.TemporaryDirectory() as folder:
+        for label, fn, count in (
+            ("plain CSV", write_plain, n),
+            ("CSV + journal", write_journaled, n),
+            ("fsync every row", write_fsync_each, min(n, 2000)),
+        ):
+            path = os.path.join(folder, f"{fn.__name__}.csv")
+            t = time.perf_counter()
+            fn(path, count)
+            dt = time.perf_counter() - t
+            print(
+                f"{label:<16s} rows={count:7d}  {1e6 * dt / count:7.2f} us/row  "
+                f"{count / dt:10.0f} rows/s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Güvenlik durdurması gecikme ölçümü (simüle düzenekte).
+
+Çalıştırma:
+    python -m benchmarks.bench_safety [yük_oranı] [tekrar]
+
+"sim://" düzeneğinde throttle akım sınırını aşacak değere çıkarılır;
+SafetyMonitor okuma thread'inde sınır aşımını yakalayıp STOP yazar. Ana
+thread bu sırada UI'ı taklit eden saf Python işiyle (varsayılan: zamanın
+%80'i) meşgul tutulur. Örneğin okunduğu an ile STOP satırının porta
+yazıldığı an arasındaki gecikme raporlanır.
+"""
+
+import sys
+import threading
+import time
+
+from core.constants import SERIAL_BAUDRATE
+from data.serial_repository import SerialRepository, open_serial
+from data.serial_worker import SerialWorker
+from domain.commands import CommandChannel, throttle_setpoint
+from domain.safety import TRIP, SafetyMonitor
+
+from benchmarks.bench_sequencer import busy_main_thread
+
+
+CURRENT_LIMIT_A = 10.0
+THROTTLE_PCT = 70.0
+
+
+def trip_once(duty: float) -> float:
+    commands = CommandChannel()
+    tripped = threading.Event()
+    monitor = SafetyMonitor(
+        commands,
+        notify=lambda kind, info: tripped.set() if kind == TRIP else None,
+        limits={"current": (None, CURRENT_LIMIT_A)},
+    )
+    ser = open_serial("sim://?rate=100", SERIAL_BAUDRATE)
+    worker = SerialWorker(SerialRepository(ser, commands), commands)
+    worker.add_task(monitor)
+    worker.start()
+    commands.submit(throttle_setpoint(THROTTLE_PCT))
+
+    until = time.monotonic() + 5.0
+    while not tripped.is_set() and time.monotonic() < until:
+        if duty > 0:
+            busy_main_thread(time.monotonic() + 0.1, duty)
+        else:
+            tripped.wait(0.1)
+
+    worker.stop()
+    ser.close()
+    if not tripped.is_set():
+        raise RuntimeError("safety limit did not trip")
+    return monitor.latencies[0]
+
+
+def main():
+    duty = float(sys.argv[1]) if len(sys.argv) > 1 else 0.8
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    print(f"limit: current > {CURRENT_LIMIT_A:g} A, throttle {THROTTLE_PCT:g} %")
+    for label, d in (("idle main thread", 0.0), (f"main thread {duty:.0%} busy", duty)):
+        lat = sorted(trip_once(d) for _ in range(repeat))
+        print(
+            f"{label:<24s} trips={len(lat):3d}  detect->STOP written "
+            f"p50={lat[len(lat) // 2]:6.3f} ms  max={lat[-1]:6.3f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
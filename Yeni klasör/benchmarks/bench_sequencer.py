@@ -0,0 +1,89 @@
+"""
+Sweep sequencer zamanlama ölçümü (simüle düzenekte).
+
+Çalıştırma:
+    python -m benchmarks.bench_sequencer [yük_oranı]
+
+Kısa bir sweep profili "sim://" düzeneğine karşı SerialWorker içinde
+yürütülür; ana thread bu sırada UI'ı taklit eden saf Python işiyle
+(varsayılan: zamanın %80'i) meşgul tutulur. Set noktalarının planlanan
+zamana göre gecikmesi yüksüz ve yüklü durumda karşılaştırılır.
+"""
+
+import sys
+import time
+
+from core.constants import SERIAL_BAUDRATE
+from data.serial_repository import SerialRepository, open_serial
+from data.serial_worker import SerialWorker
+from domain.commands import CommandChannel
+from domain.sequencer import FINISHED, SequenceRunner, SweepProfile
+
+
+PROFILE = {
+    "name": "bench",
+    "start_pct": 0,
+    "stop_pct": 50,
+    "step_pct": 10,
+    "dwell_s": 0.5,
+    "ramp_s": 0.25,
+    "cooldown_s": 0.5,
+}
+
+
+def busy_main_thread(until: float, duty: float, period: float = 0.05):
+    """UI thread'i gibi: her periyodun `duty` kadarı saf Python işi."""
+    while time.monotonic() < until:
+        t = time.monotonic()
+        x = 0
+        while time.monotonic() - t < period * duty:
+            x += 1
+        time.sleep(period * (1.0 - duty))
+
+
+def run(duty: float) -> dict:
+    commands = CommandChannel()
+    ser = open_serial("sim://?rate=100", SERIAL_BAUDRATE)
+    worker = SerialWorker(SerialRepository(ser, commands), commands)
+    events = {}
+    runner = SequenceRunner(
+        SweepProfile.from_dict(PROFILE),
+        commands,
+        notify=lambda kind, info: events.__setitem__(kind, info),
+    )
+    worker.add_task(runner)
+    worker.start()
+    runner.start()
+
+    until = time.monotonic() + runner.duration_s + 0.2
+    if duty > 0:
+        busy_main_thread(until, duty)
+    else:
+        time.sleep(max(0.0, until - time.monotonic()))
+
+    worker.stop()
+    ser.close()
+    late = sorted(runner.lateness)
+    return {
+        "finished": FINISHED in events,
+        "setpoints": len(late),
+        "p50_ms": 1000.0 * late[len(late) // 2],
+        "p99_ms": 1000.0 * late[int(len(late) * 0.99)],
+        "max_ms": 1000.0 * late[-1],
+    }
+
+
+def main():
+    duty = float(sys.argv[1]) if len(sys.argv) > 1 else 0.8
+    print(f"profile: {PROFILE}")
+    for label, d in (("idle main thread", 0.0), (f"main thread {duty:.0%} busy", duty)):
+        r = run(d)
+        print(
+            f"{label:<24s} set points={r['setpoints']:4d}  late p50={r['p50_ms']:6.2f} ms  "
+            f"p99={r['p99_ms']:6.2f} ms  max={r['max_ms']:6.2f} ms  "
+            f"finished={r['finished']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
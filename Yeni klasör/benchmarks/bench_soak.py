@@ -0,0 +1,164 @@
+"""
+Uzun oturum bellek testi (soak): RSS zamanla düz kalıyor mu.
+
+Çalıştırma:
+    python -m benchmarks.bench_soak [--hours 24] [--rate 1000]
+    python -m benchmarks.bench_soak --gui 30 [--rate 200]
+
+Varsayılan kip hızlandırılmış zamandır: --hours saatlik oturum, okuma
+thread'inin 100 ms'lik paketleri halinde canlı tamponlara (kanal başına
+SampleBuffer + 30 s pencere), hızlı kanal halka tamponuna (4 kHz titreşim)
+ve spektrum motorlarına beslenir; bellek bütçesi her simüle dakikada
+denetlenir. --gui N, ana pencereyi simüle düzeneğe (sim://) bağlayıp N
+dakika gerçek zamanlı kayıt alır. İki kipte de RSS örnekleri ve ilk
+saatten sonraki eğim (MB/saat) raporlanır.
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from core.channels import AUX_CHANNELS, CHANNEL_KEYS
+from core.constants import LIVE_BUFFER_MAX_SAMPLES, SPECTRUM_CHANNELS
+from domain.aux_stream import AuxStream
+from domain.memory_budget import MB, MemoryBudget
+from domain.sample_buffer import SampleBuffer
+from domain.spectrum import IncrementalWelch
+
+
+WINDOW_S = 30.0
+BATCH_S = 0.1
+
+
+def soak_fast(hours: float, rate: float, report_every_s: float = 3600.0):
+    rng = np.random.default_rng(0)
+    budget = MemoryBudget()
+    buffers = {key: SampleBuffer(LIVE_BUFFER_MAX_SAMPLES) for key in CHANNEL_KEYS}
+    aux = AUX_CHANNELS[0]
+    stream = AuxStream(aux.key, aux.rate_hz)
+    welch = IncrementalWelch(aux.rate_hz, SPECTRUM_CHANNELS.get(aux.key, 1024))
+
+    budget.register("graph buffers", lambda: sum(b.nbytes for b in buffers.values()))
+    budget.register("aux buffers", lambda: stream.nbytes)
+    budget.register("spectrogram", lambda: welch.nbytes, welch.shrink)
+
+    per_batch = max(1, int(round(rate * BATCH_S)))
+    frame = int(aux.rate_hz * BATCH_S)
+    samples = []
+    t = 0.0
+    seq = 0
+    next_check = 0.0
+    next_report = 0.0
+    t_end = hours * 3600.0
+    wall = time.perf_counter()
+    while t < t_end:
+        ts = t + np.arange(1, per_batch + 1) / rate
+        for key, buf in buffers.items():
+            buf.extend(ts, rng.standard_normal(per_batch))
+            buf.trim_before(ts[-1] - WINDOW_S)
+        chunk = stream.push(seq, rng.standard_normal(frame).astype(np.float32), t + BATCH_S)
+        welch.feed(chunk, t + BATCH_S)
+        seq = (seq + 1) % 65536
+        t += BATCH_S
+
+        if t >= next_check:
+            budget.check()
+            next_check += 60.0
+        if t >= next_report:
+            samples.append((t / 3600.0, budget.rss))
+            print(
+                f"t={t / 3600.0:6.2f} h  rss={_fmt(budget.rss)}  "
+                f"buffers={budget.report()['accounted_mb']:.1f} MB  "
+                f"wall={time.perf_counter() - wall:6.1f} s",
+                flush=True,
+            )
+            next_report += report_every_s
+    budget.check()
+    samples.append((t / 3600.0, budget.rss))
+    return samples, budget
+
+
+def soak_gui(minutes: float, rate: float, report_every_s: float = 30.0):
+    from PyQt6.QtCore import QTimer
+    from PyQt6.QtWidgets import QApplication
+
+    app = QApplication(sys.argv[:1])
+    from presentation.windows.main_window import MainWindow
+
+    folder = tempfile.mkdtemp(prefix="gmk_soak_")
+    w = MainWindow()
+    w.port_watcher.stop()
+    w.show()
+    w.control_panel.output_edit.setText(folder)
+    w.control_panel.test_name_edit.setText("soak")
+    w._open_port(f"sim://?rate={rate:g}")
+    w._start_test_segment()
+    w.control_panel.throttle_slider.setValue(600)
+
+    samples = []
+    t0 = time.monotonic()
+    next_report = [0.0]
+
+    def sample():
+        elapsed = time.monotonic() - t0
+        if elapsed < next_report[0] and elapsed < minutes * 60.0:
+            return
+        next_report[0] += report_every_s
+        w._check_memory()
+        samples.append((elapsed / 3600.0, w.memory.rss))
+        print(
+            f"t={elapsed / 60.0:6.1f} min  rss={_fmt(w.memory.rss)}  "
+            f"buffers={w.memory.report()['accounted_mb']:.1f} MB  "
+            f"rows={w.segment_stats['count'] if w.segment_stats else 0}",
+            flush=True,
+        )
+        if elapsed >= minutes * 60.0:
+            timer.stop()
+            w._stop_test_segment(show_summary=False)
+            w._disconnect_serial()
+            app.quit()
+
+    timer = QTimer()
+    timer.timeout.connect(sample)
+    timer.start(1000)
+    app.exec()
+    print(f"recording: {folder}")
+    return samples, w.memory
+
+
+def _fmt(rss):
+    return "--" if rss is None else f"{rss / MB:7.1f} MB"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Uzun oturum RSS ölçümü.")
+    parser.add_argument("--hours", type=float, default=24.0, help="Hızlandırılmış oturum süresi")
+    parser.add_argument("--rate", type=float, default=None, help="Telemetri hızı (Hz)")
+    parser.add_argument("--gui", type=float, default=None, metavar="MIN",
+                        help="Ana pencere + simülatör ile gerçek zamanlı dakika")
+    args = parser.parse_args()
+
+    if args.gui is not None:
+        samples, budget = soak_gui(args.gui, args.rate or 200.0)
+    else:
+        samples, budget = soak_fast(args.hours, args.rate or 1000.0)
+
+    measured = [(h, rss) for h, rss in samples if rss is not None]
+    settled = [(h, rss) for h, rss in measured if h >= min(1.0, measured[-1][0] / 4)]
+    if len(settled) >= 2:
+        hours = np.array([h for h, _ in settled])
+        rss = np.array([r / MB for _, r in settled])
+        slope = np.polyfit(hours, rss, 1)[0] if np.ptp(hours) > 0 else 0.0
+        print(f"RSS after warm-up: {rss.min():.1f}..{rss.max():.1f} MB, slope {slope:+.2f} MB/h")
+    report = budget.report()
+    print(
+        f"peak RSS {report['peak_rss_mb'] or 0:.1f} MB (process {report['process_peak_mb'] or 0:.1f} MB), "
+        f"peak accounted buffers {report['peak_accounted_mb']:.1f} MB, shrinks {report['shrinks']}"
+    )
+
+
+if __name__ == "__main__":
+    main()
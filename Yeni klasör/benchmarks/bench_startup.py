@@ -0,0 +1,120 @@
+"""
+Uygulama açılış süresi ölçümü (time-to-first-window).
+
+Çalıştırma:
+    python -m benchmarks.bench_startup [tekrar_sayısı]
+
+Her ölçüm ayrı bir Python sürecinde yapılır (soğuk import). Çıktı:
+- Açılış aşamaları: import, QApplication, QSS, MainWindow(), ilk paint
+  olayı (pencere ekranda) ve ertelenmiş grafiklerin tamamlanması
+- `-X importtime` ile en pahalı modüllerin import profili
+Ekran yoksa Qt "offscreen" platformu kullanılır.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_CHILD = r"""
+import json, time
+t0 = time.perf_counter()
+marks = {}
+
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QObject, QEvent, QTimer
+from app.main import load_stylesheet
+from presentation.windows.main_window import MainWindow
+marks["imports"] = time.perf_counter() - t0
+
+app = QApplication([])
+marks["qapplication"] = time.perf_counter() - t0
+
+load_stylesheet(app)
+marks["stylesheet"] = time.perf_counter() - t0
+
+win = MainWindow()
+marks["main_window"] = time.perf_counter() - t0
+
+class FirstPaint(QObject):
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Paint and "first_window" not in marks:
+            marks["first_window"] = time.perf_counter() - t0
+            QTimer.singleShot(0, wait_plots)
+        return False
+
+first_paint = FirstPaint()
+win.installEventFilter(first_paint)
+win.show()
+
+def wait_plots():
+    if win.graph_panel.plots_pending():
+        QTimer.singleShot(1, wait_plots)
+        return
+    marks["all_plots"] = time.perf_counter() - t0
+    print(json.dumps(marks))
+    app.quit()
+
+app.exec()
+"""
+
+
+def _env():
+    env = dict(os.environ)
+    if not env.get("DISPLAY") and not env.get("WAYLAND_DISPLAY") and sys.platform.startswith("linux"):
+        env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    return env
+
+
+def measure_startup() -> dict:
+    out = subprocess.run(
+        [sys.executable, "-c", _CHILD],
+        cwd=PROJECT_ROOT,
+        env=_env(),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def import_profile(top: int = 15):
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import presentation.windows.main_window"],
+        cwd=PROJECT_ROOT,
+        env=_env(),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows = []
+    for line in out.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cum_us, name = line.split(":", 1)[1].split("|")
+        rows.append((int(cum_us), int(self_us), name.rstrip()))
+    rows.sort(reverse=True)
+    return rows[:top]
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+
+    results = [measure_startup() for _ in range(runs)]
+    print(f"Startup phases (ms, median of {runs} cold runs):")
+    for phase in results[0]:
+        values = sorted(r[phase] for r in results)
+        print(f"  {phase:<14s} {values[len(values) // 2] * 1e3:8.1f}")
+
+    print()
+    print("Import-time profile of presentation.windows.main_window (top 15, ms):")
+    print(f"  {'cumulative':>10s} {'self':>8s}  module")
+    for cum_us, self_us, name in import_profile():
+        print(f"  {cum_us / 1e3:10.1f} {self_us / 1e3:8.1f}  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""
+Segment özeti açıkken örnek kaybı denetimi (simüle düzenekte).
+
+Çalıştırma:
+    python -m benchmarks.bench_summary [saniye] [--rate 200] [--keep]
+
+Ana pencere "sim://" düzeneğine bağlanır, kısa bir segment kaydedilip
+durdurulur ve özet penceresi açılır. Özet açık kalırken yeni segment
+başlatılıp verilen süre boyunca akış sürer. Sonunda şunlar denetlenir:
+
+- düzeneğin gönderdiği telemetri satırı sayısı = UI'ın işlediği örnek sayısı
+- segment içinde işlenen örnekler = CSV satırları
+- her segmentin canlı istatistikleri (stats_metrics, katalogun yazdığı hızlı
+  yol) = kaydedilen CSV'den compute_segment_metrics (CSV hassasiyeti içinde)
+
+Herhangi biri tutmazsa çıkış kodu 1'dir. Kayıt klasörü geçicidir ve
+sonunda silinir; --keep ile saklanır.
+"""
+
+import argparse
+import shutil
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+from core.channels import CSV_PRECISION
+from data.batch_analyzer import BatchAnalyzer
+from data.csv_importer import import_csv
+from domain.ports import SAMPLE_TIME_KEY
+from domain.segment_summary import STAT_KEYS, compute_segment_metrics, stats_metrics
+
+
+FIRST_SEGMENT_S = 1.0
+
+
+def compare_metrics(live: Dict, recorded: Dict) -> List[str]:
+    """
+    Canlı istatistiklerden metrikleri CSV'den hesaplananlarla karşılaştırır.
+
+    CSV değerleri kanalın CSV hassasiyetine yuvarlanmış olduğundan avg, min
+    ve max en fazla yarım son basamak farklı olabilir. Tutmayanların
+    açıklamaları döner (boş liste: eşit).
+    """
+    errors = []
+    if live["count"] != recorded["count"]:
+        errors.append(f"count: live {live['count']} != csv {recorded['count']}")
+    for key in STAT_KEYS:
+        a, b = live.get(key), recorded.get(key)
+        if (a is None) != (b is None):
+            errors.append(f"{key}: live {a} != csv {b}")
+            continue
+        if a is None:
+            continue
+        tol = 0.5 * 10.0 ** -CSV_PRECISION.get(key, 3) + 1e-9
+        for stat in ("avg", "min", "max"):
+            if abs(a[stat] - b[stat]) > tol:
+                errors.append(f"{key}.{stat}: live {a[stat]!r} != csv {b[stat]!r}")
+    return errors
+
+
+def run(seconds: float, rate: float, folder: str) -> dict:
+    from PyQt6.QtWidgets import QApplication
+
+    app = QApplication(sys.argv[:1])
+    from presentation.windows.main_window import MainWindow
+
+    w = MainWindow()
+    w.port_watcher.stop()
+    w.show()
+    w.control_panel.output_edit.setText(folder)
+    w.control_panel.test_name_edit.setText("summary")
+
+    # UI'a ulaşan her telemetri örneğini say (sensor_status hariç)
+    counts = {"ingested": 0, "in_segment": 0}
+    update = w._update_ui_with_values
+
+    def counting_update(values):
+        if values.keys() - {"sensor_status", SAMPLE_TIME_KEY}:
+            counts["ingested"] += 1
+            stamp = values.get(SAMPLE_TIME_KEY)
+            if (
+                w.segment_active
+                and w.segment_start_time is not None
+                and stamp is not None
+                and stamp >= w.segment_start_time
+            ):
+                counts["in_segment"] += 1
+        update(values)
+
+    w._update_ui_with_values = counting_update
+
+    error = w._open_port(f"sim://?rate={rate:g}")
+    if error is not None:
+        raise SystemExit(f"sim:// could not be opened: {error}")
+    sim = w.ser
+    w._start_test_segment()
+    w.control_panel.throttle_slider.setValue(500)
+
+    def pump(seconds: float):
+        # Olay döngüsü elle döndürülür (exec() + zamanlayıcı yerine)
+        until = time.monotonic() + seconds
+        while time.monotonic() < until:
+            app.processEvents()
+            time.sleep(0.005)
+
+    result = {}
+    live_stats = []  # segment başına canlı istatistik (durdurulunca None olur)
+    pump(FIRST_SEGMENT_S)
+    live_stats.append(w.segment_stats)
+    w._stop_test_segment(show_summary=True)
+    result["summary_open"] = w.summary_dialog is not None and w.summary_dialog.isVisible()
+    w._start_test_segment()  # özet açık kalır
+
+    pump(seconds)
+    result["summary_open_at_end"] = (
+        w.summary_dialog is not None and w.summary_dialog.isVisible()
+    )
+    live_stats.append(w.segment_stats)
+    w._stop_test_segment(show_summary=False)
+    w._disconnect_serial()
+    # Port kapandı: okunan satırlar sabit. Okuma thread'inin son paketi
+    # kuyruklanmış olabilir; işlenmesini bekle
+    delivered = sim.lines_sent - sim.lines_pending
+    deadline = time.monotonic() + 2.0
+    while time.monotonic() < deadline and counts["ingested"] < delivered:
+        pump(0.01)
+    result["delivered"] = delivered
+    w.close()
+
+    rows = 0
+    errors = []
+    paths = BatchAnalyzer(folder).find_segments()
+    if len(paths) != len(live_stats):
+        errors.append(f"{len(paths)} segment files for {len(live_stats)} segments")
+    for path, stats in zip(paths, live_stats):
+        columns = import_csv(path)
+        rows += len(columns["time_s"])
+        errors += [
+            f"{path}: {e}"
+            for e in compare_metrics(stats_metrics(stats), compute_segment_metrics(columns))
+        ]
+
+    result.update(counts)
+    result["csv_rows"] = rows
+    result["metric_errors"] = errors
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Özet açıkken örnek kaybı denetimi.")
+    parser.add_argument("seconds", nargs="?", type=float, default=10.0,
+                        help="Özet açıkken akış süresi")
+    parser.add_argument("--rate", type=float, default=200.0, help="Telemetri hızı (Hz)")
+    parser.add_argument("--keep", action="store_true", help="Kayıt klasörünü silme")
+    args = parser.parse_args()
+
+    folder = tempfile.mkdtemp(prefix="gmk_summary_")
+    try:
+        r = run(args.seconds, args.rate, folder)
+    finally:
+        if not args.keep:
+            shutil.rmtree(folder, ignore_errors=True)
+    print(
+        f"summary open: {r.get('summary_open')} (still open at end: {r.get('summary_open_at_end')})\n"
+        f"lines sent={r['delivered']}  ingested={r['ingested']}  "
+        f"in segments={r['in_segment']}  csv rows={r['csv_rows']}"
+    )
+    for e in r["metric_errors"]:
+        print(f"metrics mismatch: {e}")
+    if args.keep:
+        print(f"recording: {folder}")
+    ok = (
+        r.get("summary_open")
+        and r.get("summary_open_at_end")
+        and r["delivered"] == r["ingested"]
+        and r["in_segment"] == r["csv_rows"]
+        and not r["metric_errors"]
+    )
+    print("OK" if ok else "FAILED: samples were lost, metrics differ or the summary did not stay open")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
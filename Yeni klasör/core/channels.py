@@ -0,0 +1,247 @@
+"""
+Kanal kaydı: telemetri kanallarının tek tanım yeri.
+
+Parser (seri hat öneki), canlı değer paneli, grafikler, segment
+istatistikleri, özet ve CSV logger bu listeden üretilir. Yeni bir kanal
+(titreşim, ikinci yük hücresi, tork ...) eklemek için CHANNELS'a bir satır
+eklemek yeterlidir; sıra grafik ızgarası ve canlı panel sırasıdır. CSV
+sütunları eski kayıtlarla aynı konumda kalsın diye CSV_ORDER'a göre dizilir.
+Kullanıcı tanımlı türetilmiş kanallar (core/constants.py ->
+EXTRA_DERIVED_CHANNELS) listenin sonuna eklenir.
+"""
+
+from typing import Dict, Mapping, Optional, Tuple, Union
+
+from core.constants import EXTRA_DERIVED_CHANNELS
+
+
+class Channel:
+    """
+    Bir telemetri kanalının tanımı.
+
+    wire: seri satırdaki "<önek>=<değer>" öneki (yoksa kanal seri hattan okunmaz)
+    csv: CSV başlık adı
+    precision / csv_precision: canlı gösterim / CSV ondalık basamak sayısı
+    range: tipik değer aralığı (eksen ve sınır ayarları için)
+    derived: türetilmiş kanal ifadesi (örn. "voltage * current"); verilirse
+        firmware değeri yerine her pakette bu ifade hesaplanır
+    summary: segment özetinde gösterilen istatistikler ("avg", "min", "max")
+    """
+
+    __slots__ = (
+        "key",
+        "title",
+        "name",
+        "unit",
+        "wire",
+        "csv",
+        "precision",
+        "csv_precision",
+        "range",
+        "derived",
+        "summary",
+    )
+
+    def __init__(
+        self,
+        key: str,
+        title: str,
+        name: str,
+        unit: str,
+        wire: Optional[str] = None,
+        csv: Optional[str] = None,
+        precision: int = 3,
+        csv_precision: int = 3,
+        range: Tuple[float, float] = (0.0, 1.0),
+        derived: Optional[str] = None,
+        summary: Tuple[str, ...] = ("avg", "max"),
+    ):
+        self.key = key
+        self.title = title
+        self.name = name
+        self.unit = unit
+        self.wire = wire
+        self.csv = csv or key
+        self.precision = precision
+        self.csv_precision = csv_precision
+        self.range = range
+        self.derived = derived
+        self.summary = summary
+
+    @property
+    def is_derived(self) -> bool:
+        return self.derived is not None
+
+    @property
+    def label(self) -> str:
+        """Birimli kısa ad, örn. "Thrust (kgf)"."""
+        return f"{self.name} ({self.unit})" if self.unit else self.name
+
+    def format(self, value: float) -> str:
+        return f"{value:.{self.precision}f}"
+
+    def __repr__(self):
+        return f"Channel({self.key!r})"
+
+
+BUILTIN_CHANNELS: Tuple[Channel, ...] = (
+    Channel(
+        "thrust_kgf", "Thrust (kgf)", "Thrust", "kgf",
+        wire="Weight(kg)", csv="thrust_kgf",
+        precision=4, csv_precision=3, range=(0.0, 10.0),
+    ),
+    Channel(
+        "voltage", "Voltage (V)", "Voltage", "V",
+        wire="V", csv="voltage_V",
+        precision=3, csv_precision=3, range=(0.0, 30.0),
+        summary=("avg", "min"),
+    ),
+    Channel(
+        "current", "Current (A)", "Current", "A",
+        wire="I", csv="current_A",
+        precision=3, csv_precision=3, range=(0.0, 80.0),
+    ),
+    Channel(
+        "rpm", "Motor Speed (RPM)", "RPM", "RPM",
+        wire="RPM", csv="rpm",
+        precision=0, csv_precision=0, range=(0.0, 40000.0),
+    ),
+    Channel(
+        "temperature", "Temperature (°C)", "Temperature", "°C",
+        wire="T", csv="temperature_C",
+        precision=2, csv_precision=2, range=(20.0, 100.0),
+    ),
+    Channel(
+        "power", "Electrical Power (W)", "Power", "W",
+        wire="P_elec", csv="power_W",
+        precision=2, csv_precision=3, range=(0.0, 3000.0),
+        derived="voltage * current", summary=(),
+    ),
+    Channel(
+        "pt_eff", "PT Efficiency (kgf/W)", "PT Efficiency", "kgf/W",
+        wire="PTEff", csv="pt_eff_kgf_per_W",
+        precision=6, csv_precision=4, range=(0.0, 0.03),
+        derived="thrust_kgf / power", summary=("avg",),
+    ),
+    Channel(
+        "tpa", "Thrust per Amp (kgf/A)", "Thrust per Amp", "kgf/A",
+        wire="TPA", csv="tpa_kgf_per_A",
+        precision=6, csv_precision=4, range=(0.0, 0.2),
+        derived="thrust_kgf / current", summary=("avg",),
+    ),
+)
+
+
+def extra_channel(key: str, spec: Union[str, Mapping]) -> Channel:
+    """EXTRA_DERIVED_CHANNELS girdisinden kanal: ifade ya da alan sözlüğü."""
+    if any(ch.key == key for ch in BUILTIN_CHANNELS):
+        raise ValueError(f"Extra channel {key!r} clashes with a built-in channel")
+    fields = {"expr": spec} if isinstance(spec, str) else dict(spec)
+    try:
+        expr = fields.pop("expr")
+    except KeyError:
+        raise ValueError(f"Extra channel {key!r} has no 'expr'") from None
+    name = fields.pop("name", key)
+    unit = fields.pop("unit", "")
+    title = fields.pop("title", f"{name} ({unit})" if unit else name)
+    fields.setdefault("summary", ("avg",))
+    return Channel(key, title, name, unit, derived=expr, **fields)
+
+
+CHANNELS: Tuple[Channel, ...] = BUILTIN_CHANNELS + tuple(
+    extra_channel(key, spec) for key, spec in EXTRA_DERIVED_CHANNELS.items()
+)
+
+
+# ============================================================
+#              KAYITTAN ÜRETİLEN SABİT TABLOLAR
+# ============================================================
+CHANNELS_BY_KEY: Dict[str, Channel] = {ch.key: ch for ch in CHANNELS}
+CHANNEL_KEYS: Tuple[str, ...] = tuple(ch.key for ch in CHANNELS)
+
+# Seri hat öneki -> kanal anahtarı ("Weight(kg)" -> "thrust_kgf")
+WIRE_KEYS: Dict[str, str] = {ch.wire: ch.key for ch in CHANNELS if ch.wire}
+
+# CSV sütun sırası, gösterim sırasından bağımsızdır: mevcut sütunlar ilk
+# sürümdeki yerlerinde kalır (sütunları konumla okuyan tablolar için). Burada
+# olmayan kanallar (yeni / EXTRA_DERIVED_CHANNELS) kayıt sırasıyla sona eklenir.
+CSV_ORDER: Tuple[str, ...] = (
+    "voltage",
+    "current",
+    "thrust_kgf",
+    "temperature",
+    "rpm",
+    "power",
+    "pt_eff",
+    "tpa",
+)
+
+# Kayıt (CSV) sütunları: kanal anahtarı -> başlık adı, dosyadaki sırayla
+CSV_COLUMNS: Dict[str, str] = {
+    "time_s": "time_s",
+    **{key: CHANNELS_BY_KEY[key].csv for key in CSV_ORDER if key in CHANNELS_BY_KEY},
+    **{ch.key: ch.csv for ch in CHANNELS if ch.key not in CSV_ORDER},
+}
+CSV_PRECISION: Dict[str, int] = {
+    "time_s": 3,
+    **{ch.key: ch.csv_precision for ch in CHANNELS},
+}
+
+# Türetilmiş kanallar (sıra önemli; bir ifade öncekileri kullanabilir)
+DERIVED_CHANNELS: Dict[str, str] = {
+    ch.key: ch.derived for ch in CHANNELS if ch.is_derived
+}
+
+PLOT_TITLES: Dict[str, str] = {ch.key: ch.title for ch in CHANNELS}
+FIXED_RANGES: Dict[str, Tuple[float, float]] = {ch.key: ch.range for ch in CHANNELS}
+
+
+def channel(key: str) -> Optional[Channel]:
+    return CHANNELS_BY_KEY.get(key)
+
+
+# ============================================================
+#              YÜKSEK HIZLI (BLOK ÇERÇEVELİ) KANALLAR
+# ============================================================
+class AuxChannel:
+    """
+    Satır başına tek değer yerine blok çerçeveleriyle gelen hızlı kanal.
+
+    Firmware her çerçevede sabit hızda örneklenmiş bir bloğu gönderir:
+        BLK|<wire>|<seq>|<base64 int16 little-endian örnekler>
+    seq 0..65535 arasında artan çerçeve sayacıdır (kayıp çerçeve tespiti);
+    örnek değeri = ham int16 * scale.
+    """
+
+    __slots__ = ("key", "title", "unit", "wire", "rate_hz", "scale")
+
+    def __init__(
+        self,
+        key: str,
+        title: str,
+        unit: str,
+        wire: str,
+        rate_hz: float,
+        scale: float = 1.0,
+    ):
+        self.key = key
+        self.title = title
+        self.unit = unit
+        self.wire = wire
+        self.rate_hz = rate_hz
+        self.scale = scale
+
+    def __repr__(self):
+        return f"AuxChannel({self.key!r}, {self.rate_hz:g} Hz)"
+
+
+AUX_CHANNELS: Tuple[AuxChannel, ...] = (
+    # ±16 g ivmeölçer, 16 bit (2048 LSB/g)
+    AuxChannel(
+        "vibration", "Vibration (g)", "g",
+        wire="VIB", rate_hz=4000.0, scale=1.0 / 2048.0,
+    ),
+)
+
+AUX_CHANNELS_BY_KEY: Dict[str, AuxChannel] = {ch.key: ch for ch in AUX_CHANNELS}
+AUX_WIRE_KEYS: Dict[str, str] = {ch.wire: ch.key for ch in AUX_CHANNELS}
@@ -6,25 +6,149 @@ TYTO_ORANGE = (243, 146, 0)
 AXIS_COLOR = (60, 60, 60)
 GRID_ALPHA = 0.18
 
-# Tipik drone motor testi için mantıklı sabit Y aralıkları
-FIXED_RANGES = {
-    "thrust_kgf": (0.0, 10.0),       # 0–10 kgf
-    "voltage": (0.0, 30.0),          # 0–30 V (3–12S LiPo)
-    "current": (0.0, 80.0),          # 0–80 A
-    "rpm": (0.0, 40000.0),           # 0–40k RPM
-    "temperature": (20.0, 100.0),    # 20–100 °C
-    "power": (0.0, 3000.0),          # 0–3 kW
-    "pt_eff": (0.0, 0.03),           # 0–0.03 kgf/W
-    "tpa": (0.0, 0.2),               # 0–0.2 kgf/A
+# Seri hat hızı. core/channels.py → AUX_CHANNELS blok çerçeveleri base64
+# int16 taşır (4 kHz ≈ 11 kB/s); hızlı kanal kullanan firmware için
+# 460800 veya 921600 seçilmelidir.
+SERIAL_BAUDRATE = 115200
+
+# Yanıt bekleyen cihaz komutları (STATUS? vb.) için zaman aşımı
+COMMAND_TIMEOUT_S = 3.0
+
+# Donanımsız deneme: True ise port listesine simüle düzenek eklenir
+# (data/protocol_sim.py; örn. "sim://?rate=20" ile telemetri hızı değişir)
+SIMULATOR_ENABLED = False
+SIMULATOR_URL = "sim://"
+
+# Throttle sweep sequencer (domain/sequencer.py). Rampalarda set noktası bu
+# hızla güncellenir. Profilin "limits" alanı aşağıdaki güvenlik sınırlarına
+# ek olarak teste özgü (daha dar) iptal sınırları verir.
+SWEEP_SETPOINT_RATE_HZ = 50.0
+
+# Güvenlik sınırları (domain/safety.py), FIXED_RANGES gibi kanal ->
+# (alt, üst), None = sınırsız. Okuma thread'inde her örnekte denetlenir;
+# DEBOUNCE ardışık örnek sınır dışındaysa STOP gönderilir ve throttle
+# komutları operatör yeniden kurana (Re-arm) kadar kilitlenir. Alarm,
+# değer sınırın HYSTERESIS kadar içine dönünce temizlenir.
+SAFETY_LIMITS = {
+    "current": (None, 60.0),
+    "temperature": (None, 90.0),
+    "voltage": (10.0, None),
 }
+SAFETY_HYSTERESIS = {
+    "current": 5.0,
+    "temperature": 5.0,
+    "voltage": 0.5,
+}
+SAFETY_DEBOUNCE_SAMPLES = 2
+
+# Kanal tanımları (başlık, birim, seri önek, CSV adı, hassasiyet, aralık,
+# türetme ifadesi) core/channels.py içindeki CHANNELS kaydındadır.
+
+# Kullanıcı tanımlı ek kanallar: anahtar -> ifade ya da Channel alanları
+# ("expr" zorunlu; name, unit, title, precision, csv_precision, range,
+# summary isteğe bağlı). Kanal kaydının sonuna eklenir; grafik, canlı panel,
+# istatistik, özet, rapor ve CSV'de yerleşik kanallar gibi yer alır.
+# Varsayılan boştur (CSV sütunları ve yerleşim değişmez). Örnekler:
+#   "mech_power_w": "torque_nm * rpm * 2 * pi / 60",
+#   "g_per_w": {
+#       "expr": "thrust_kgf * 1000 / power",
+#       "name": "Thrust per Watt", "unit": "g/W",
+#       "precision": 3, "range": (0.0, 30.0), "summary": ("avg",),
+#   },
+EXTRA_DERIVED_CHANNELS = {}
+
+# Parser ile tüketiciler arasındaki gerçek zamanlı filtreler (kanal -> ayar).
+# Tipler: moving_average (n), median (n), ema (alpha), butterworth (order, cutoff_hz)
+# Ham değer kanalın kendi sütununda kalır; filtrelenmiş değer grafikte
+# gösterilir ve CSV'ye "<kanal>_filt" ek sütunu olarak yazılır.
+# Varsayılan boştur (filtre uygulanmaz). Örnek:
+#   "thrust_kgf": {"type": "butterworth", "order": 2, "cutoff_hz": 1.5},
+#   "current": {"type": "median", "n": 5},
+FILTERS = {}
+# İlk tasarım hızı; gerçek hız örnek damgalarından ölçülür ve butterworth
+# filtreler hız değişince yeniden tasarlanır (domain/filters.FilterStage)
+FILTER_SAMPLE_RATE_HZ = 10.0
+RAW_TRACE_COLOR = (170, 170, 170)
+GAP_REGION_COLOR = (211, 47, 47, 40)   # bağlantı kesintisi bölgesi (RGBA)
+SAFETY_EVENT_COLOR = (198, 40, 40)     # güvenlik durdurması işareti
+CROSSHAIR_COLOR = (90, 90, 90)         # grafik imleci (bağlı dikey + yatay çizgi)
+CROSSHAIR_RATE_HZ = 30                 # fare hareketi işleme üst sınırı
 
-PLOT_TITLES = {
-    "thrust_kgf": "Thrust (kgf)",
-    "voltage": "Voltage (V)",
-    "current": "Current (A)",
-    "rpm": "Motor Speed (RPM)",
-    "temperature": "Temperature (°C)",
-    "power": "Electrical Power (W)",
-    "pt_eff": "PT Efficiency (kgf/W)",
-    "tpa": "Thrust per Amp (kgf/A)",
+# Sabitlenmiş referans segmentler (canlı grafikte soluk izler). Kayıt bir
+# kez, 30 s'lik pencerede yaklaşık REFERENCE_POINTS_PER_WINDOW nokta olacak
+# yoğunlukta (en fazla REFERENCE_MAX_POINTS) piramitten okunur; renk sayısı
+# aynı anda sabitlenebilecek segment sayısıdır.
+REFERENCE_COLORS = (
+    (230, 126, 34, 130),
+    (39, 174, 96, 130),
+    (142, 68, 173, 130),
+)
+REFERENCE_POINTS_PER_WINDOW = 1000
+REFERENCE_MAX_POINTS = 200_000
+
+# Çökmeye dayanıklı segment günlüğü (data/segment_journal.py). CSV satırları
+# ayrıca CRC'li parçalarla .gmkj dosyasına eklenir; parça boyut veya süre
+# bütçesi dolunca yazılır, fsync arka planda en fazla bu aralıkla yapılır.
+# Temiz kapanışta (CSV diske inince) günlük silinir, JOURNAL_KEEP = True
+# ise saklanır. Kurtarma: python -m app.recover_journal <klasör>
+JOURNAL_ENABLED = True
+JOURNAL_CHUNK_BYTES = 64 * 1024
+JOURNAL_FLUSH_INTERVAL_S = 0.5
+JOURNAL_FSYNC_INTERVAL_S = 1.0
+JOURNAL_KEEP = False
+
+# Segment kataloğu (data/catalog.py): loglanan her segment bitince düzenek
+# bilgisi ve özet metriklerle SQLite'a yazılır. Boş: kullanıcı veri klasörü
+# (örn. ~/.local/share/GMK AIR/Motor Test Unit/catalog.sqlite3).
+CATALOG_ENABLED = True
+CATALOG_PATH = ""
+
+# Uzun süreli arşiv (data/segment_archive.py, .gmka): her kanal ondalık
+# hassasiyetinde tamsayıya çevrilip delta + zigzag + bayt düzlemleriyle
+# sıkıştırılır (değerler birebir korunur). Zaman blokları ayrı ayrı okunur.
+# ARCHIVE_CODEC: "zlib" (standart kütüphane) veya "zstd" (zstandard kuruluysa).
+ARCHIVE_BLOCK_ROWS = 16384
+ARCHIVE_CODEC = "zlib"
+ARCHIVE_LEVEL = 6
+
+# Bellek bütçesi (domain/memory_budget.py): RSS her MEMORY_CHECK_INTERVAL_MS
+# ölçülür; MEMORY_MAX_RSS_MB aşılırsa önce açık kaydın piramit seviyeleri
+# (sidecar'dan yeniden okunur) bırakılır, sonra canlı tamponlar küçültülür.
+# Canlı grafik tamponu kanal başına en fazla LIVE_BUFFER_MAX_SAMPLES örnek
+# tutar (float64 zaman + float32 değer); pencere bu sayıya sığmazsa eski
+# örnekler düşer.
+MEMORY_MAX_RSS_MB = 1024
+MEMORY_CHECK_INTERVAL_MS = 2000
+LIVE_BUFFER_MAX_SAMPLES = 1 << 17
+
+# Segment sonunda grafik panosunun aktarımı (arka planda, veri tamponlarından).
+# Uzantılar: "png", "jpg", "svg", "pdf"; vektör çıktı için "svg"/"pdf" ekleyin.
+GRAPH_EXPORT_FORMATS = ("png",)
+GRAPH_EXPORT_SIZE_PX = (1920, 1080)
+GRAPH_EXPORT_DPI = 96
+
+# Canlı spektrum penceresi: kanal -> FFT pencere uzunluğu (nperseg).
+# Temel kanallar FILTER_SAMPLE_RATE_HZ ızgarasına yeniden örneklenir;
+# hızlı kanallar (AUX_CHANNELS) kendi örnekleme hızlarıyla işlenir.
+SPECTRUM_CHANNELS = {
+    "vibration": 1024,
+    "rpm": 64,
+    "thrust_kgf": 64,
 }
+SPECTRUM_REFRESH_MS = 250
+
+# X-Y karakteristik eğrileri (domain/characteristic.py): (x, y) kanal
+# çiftleri; "throttle" komut verilen throttle yüzdesidir (yalnızca canlı
+# akışta, CSV'de sütunu yoktur). Her çift CHARACTERISTIC_BINS kovalık
+# istatistik olarak birikir; MIN_COUNT'tan az örnekli kovalar çizilmez ve
+# uydurmaya katılmaz. Biten segmentler en fazla MAX_OVERLAYS katman tutulur.
+CHARACTERISTIC_PAIRS = (
+    ("rpm", "thrust_kgf"),
+    ("power", "thrust_kgf"),
+    ("throttle", "pt_eff"),
+)
+CHARACTERISTIC_BINS = 64
+CHARACTERISTIC_MIN_COUNT = 5
+CHARACTERISTIC_FIT = "poly2"        # "linear", "poly2", "poly3", "power" veya None
+CHARACTERISTIC_MAX_OVERLAYS = 8
+CHARACTERISTIC_REFRESH_MS = 500
@@ -0,0 +1,69 @@
+"""
+Hızlı kanal kayıt dosyaları (<ad>_segmentN_<kanal>.aux).
+
+kHz'lik veri CSV'ye satır satır yazılmaz; her kanal kendi ikili dosyasına
+gider:
+    GMKAUX1\\n
+    {"key": ..., "unit": ..., "rate_hz": ..., "t0": ...}\\n   (JSON başlık)
+    float32 little-endian örnekler ...
+Örnek i'nin zamanı t0 + i / rate_hz'dir (segment zamanı); NaN örnekler
+kayıp çerçeve veya bağlantı kesintisini gösterir. Okuma np.memmap ile
+yapılır, dosya belleğe yüklenmez.
+"""
+
+import json
+import os
+from typing import Dict, Tuple
+
+import numpy as np
+
+
+AUX_MAGIC = b"GMKAUX1\n"
+AUX_EXTENSION = ".aux"
+
+
+def aux_recording_path(csv_path: str, key: str) -> str:
+    """Segment CSV'sinin yanındaki hızlı kanal dosyasının yolu."""
+    return f"{os.path.splitext(csv_path)[0]}_{key}{AUX_EXTENSION}"
+
+
+class AuxRecordingWriter:
+    """Bir hızlı kanalın segment kaydını yazar (AuxStream.push çıktısını alır)."""
+
+    def __init__(self, path: str, key: str, unit: str, rate_hz: float, t0: float):
+        self.path = path
+        self.file = open(path, "wb")
+        header = {"key": key, "unit": unit, "rate_hz": rate_hz, "t0": t0}
+        self.file.write(AUX_MAGIC)
+        self.file.write(json.dumps(header).encode("utf-8") + b"\n")
+
+    def write(self, chunk: np.ndarray) -> None:
+        self.file.write(np.asarray(chunk, dtype="<f4").tobytes())
+
+    def flush(self) -> None:
+        self.file.flush()
+
+    def close(self) -> None:
+        try:
+            self.file.flush()
+            self.file.close()
+        except OSError:
+            pass
+
+
+def load_aux_recording(path: str) -> Tuple[Dict, np.ndarray]:
+    """Başlık sözlüğü ve örnek dizisi (salt okunur memmap) döndürür."""
+    with open(path, "rb") as f:
+        if f.readline() != AUX_MAGIC:
+            raise ValueError(f"Not an aux recording: {path}")
+        try:
+            header = json.loads(f.readline().decode("utf-8"))
+        except ValueError as e:
+            raise ValueError(f"Invalid aux header in {path}: {e}") from e
+        offset = f.tell()
+
+    n = (os.path.getsize(path) - offset) // 4
+    if n == 0:
+        return header, np.empty(0, dtype="<f4")
+    samples = np.memmap(path, dtype="<f4", mode="r", offset=offset, shape=(n,))
+    return header, samples
@@ -0,0 +1,195 @@
+import glob
+import hashlib
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+from core.channels import CSV_COLUMNS
+from data.csv_importer import import_csv
+from domain.segment_summary import (
+    CURVE_PAIRS,
+    compute_binned_curve,
+    compute_segment_metrics,
+)
+
+
+CACHE_FILENAME = ".gmkbatch.json"
+# Önbellek sürümü: metrik hesabı değişince CACHE_SCHEMA artırılır; kanal
+# kaydı (CSV_COLUMNS) değişince sürüm kendiliğinden değişir, eski girdiler
+# yeni kanalların metrikleri olmadan sunulmaz
+CACHE_SCHEMA = 2
+CACHE_VERSION = "{}-{}".format(
+    CACHE_SCHEMA, hashlib.sha1(";".join(CSV_COLUMNS).encode("utf-8")).hexdigest()[:12]
+)
+SEGMENT_PATTERN = "*_segment*.csv"
+# Glob yan dosyaları da yakalar (_events.csv, _recovered.csv); ad tam eşleşmeli
+SEGMENT_NAME_RE = re.compile(r"(.*)_segment(\d+)\.csv$")
+
+# Karşılaştırma tablosu sütunları: (başlık, kanal, metrik, biçim)
+COMPARISON_COLUMNS = [
+    ("Duration (s)", None, "duration", "{:.2f}"),
+    ("Samples", None, "count", "{:d}"),
+    ("Avg Thrust (kgf)", "thrust_kgf", "avg", "{:.4f}"),
+    ("Max Thrust (kgf)", "thrust_kgf", "max", "{:.4f}"),
+    ("P95 Thrust (kgf)", "thrust_kgf", "p95", "{:.4f}"),
+    ("Avg Current (A)", "current", "avg", "{:.3f}"),
+    ("Max Current (A)", "current", "max", "{:.3f}"),
+    ("P95 Current (A)", "current", "p95", "{:.3f}"),
+    ("Avg Voltage (V)", "voltage", "avg", "{:.3f}"),
+    ("Min Voltage (V)", "voltage", "min", "{:.3f}"),
+    ("P5 Voltage (V)", "voltage", "p5", "{:.3f}"),
+    ("Avg Temp (°C)", "temperature", "avg", "{:.2f}"),
+    ("Max Temp (°C)", "temperature", "max", "{:.2f}"),
+    ("Avg RPM", "rpm", "avg", "{:.0f}"),
+    ("Max RPM", "rpm", "max", "{:.0f}"),
+    ("Avg Power (W)", "power", "avg", "{:.2f}"),
+    ("Avg PT Eff (kgf/W)", "pt_eff", "avg", "{:.6f}"),
+    ("Median PT Eff (kgf/W)", "pt_eff", "p50", "{:.6f}"),
+    ("Avg TPA (kgf/A)", "tpa", "avg", "{:.6f}"),
+]
+
+
+def analyze_segment_file(path: str) -> Dict:
+    """
+    Tek bir segment CSV'sini analiz eder (işçi süreçte çalışır).
+
+    Dönen sözlük JSON'a yazılabilir: metrikler ve karakteristik eğriler.
+    """
+    columns = import_csv(path)
+    curves = {}
+    for x_key, y_key in CURVE_PAIRS:
+        if x_key in columns and y_key in columns:
+            curves[f"{y_key}:{x_key}"] = compute_binned_curve(
+                columns[x_key], columns[y_key]
+            )
+    return {
+        "metrics": compute_segment_metrics(columns),
+        "curves": curves,
+    }
+
+
+def file_digest(path: str, chunk_bytes: int = 1024 * 1024) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(chunk_bytes)
+            if not chunk:
+                break
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def segment_sort_key(path: str):
+    """<ad>_segment<N>.csv dosyalarını ada, sonra segment numarasına göre sıralar."""
+    name = os.path.basename(path)
+    m = SEGMENT_NAME_RE.match(name)
+    if not m:
+        return (name, 0)
+    return (m.group(1), int(m.group(2)))
+
+
+def is_segment_file(path: str) -> bool:
+    return SEGMENT_NAME_RE.match(os.path.basename(path)) is not None
+
+
+class BatchAnalyzer:
+    """
+    Bir klasördeki tüm segment CSV'lerini paralel analiz eder.
+
+    Sonuçlar dosya içeriğinin hash'ine göre klasördeki JSON önbelleğe
+    yazılır; tekrar çalıştırıldığında yalnızca yeni/değişmiş dosyalar
+    işlenir.
+    """
+
+    def __init__(self, folder: str, max_workers: Optional[int] = None):
+        self.folder = folder
+        self.max_workers = max_workers
+        self.cache_path = os.path.join(folder, CACHE_FILENAME)
+
+    def find_segments(self) -> List[str]:
+        paths = glob.glob(os.path.join(glob.escape(self.folder), SEGMENT_PATTERN))
+        return sorted(filter(is_segment_file, paths), key=segment_sort_key)
+
+    def run(
+        self, progress_cb: Optional[Callable[[int, int], None]] = None
+    ) -> List[Dict]:
+        """
+        Analizi çalıştırır; segment başına
+        {"path", "name", "digest", "metrics", "curves"} listesi döner.
+        """
+        paths = self.find_segments()
+        cache = self._load_cache()
+
+        digests = {p: file_digest(p) for p in paths}
+        todo = [p for p in paths if digests[p] not in cache]
+
+        done = len(paths) - len(todo)
+        if progress_cb:
+            progress_cb(done, len(paths))
+
+        if todo:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+                for path, result in zip(todo, pool.map(analyze_segment_file, todo)):
+                    cache[digests[path]] = result
+                    done += 1
+                    if progress_cb:
+                        progress_cb(done, len(paths))
+            self._save_cache(cache)
+
+        return [
+            {
+                "path": p,
+                "name": os.path.basename(p),
+                "digest": digests[p],
+                **cache[digests[p]],
+            }
+            for p in paths
+        ]
+
+    def write_comparison_csv(self, results: List[Dict], path: str) -> None:
+        rows = comparison_rows(results)
+        header = ["Segment"] + [c[0] for c in COMPARISON_COLUMNS]
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            f.write(";".join(header) + "\r\n")
+            for name, cells in rows:
+                f.write(";".join([name] + cells) + "\r\n")
+
+    # ============================================================
+    #                       ÖNBELLEK
+    # ============================================================
+    def _load_cache(self) -> Dict:
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if data.get("version") != CACHE_VERSION:
+            return {}
+        return data.get("entries", {})
+
+    def _save_cache(self, entries: Dict) -> None:
+        tmp = self.cache_path + ".tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"version": CACHE_VERSION, "entries": entries}, f)
+            os.replace(tmp, self.cache_path)
+        except OSError:
+            pass
+
+
+def comparison_rows(results: List[Dict]):
+    """Karşılaştırma tablosu için (segment adı, biçimlenmiş hücreler) listesi."""
+    rows = []
+    for res in results:
+        metrics = res["metrics"]
+        cells = []
+        for _title, channel, metric, fmt in COMPARISON_COLUMNS:
+            if channel is None:
+                value = metrics.get(metric)
+            else:
+                value = (metrics.get(channel) or {}).get(metric)
+            cells.append("--" if value is None else fmt.format(value))
+        rows.append((res["name"], cells))
+    return rows
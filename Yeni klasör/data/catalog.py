@@ -0,0 +1,268 @@
+"""
+Yerel segment kataloğu (SQLite).
+
+Her bitmiş segment için düzenek bilgisi (motor, pervane, ESC, batarya...)
+ve önceden hesaplanmış özet metrikler tek satır + metrik satırları olarak
+yazılır. Metrikler kanal kaydından gelir ve ("thrust_kgf.max", değer)
+çiftleri halinde indekslenir; böylece binlerce segment dosyalar yeniden
+taranmadan sorgulanır:
+    prop_diameter_in = 10, thrust_kgf.max > 2
+    motor ~ 2306, current.max < 40
+Operatörler: = != < <= > >= ve ~ (içerir). Koşullar virgül veya "and"
+ile ayrılır; operatörsüz sözcükler metin alanlarında aranır.
+"""
+
+import os
+import re
+import sqlite3
+import time
+from typing import Dict, Iterable, List, Tuple
+
+from core.channels import CHANNEL_KEYS
+from core.constants import CATALOG_PATH
+
+
+SCHEMA_VERSION = 1
+
+# Düzenek bilgisi alanları: (sütun, SQL tipi)
+SETUP_FIELDS = (
+    ("motor", "TEXT"),
+    ("prop", "TEXT"),
+    ("prop_diameter_in", "REAL"),
+    ("prop_pitch_in", "REAL"),
+    ("esc", "TEXT"),
+    ("battery", "TEXT"),
+    ("notes", "TEXT"),
+)
+
+# segments tablosunun sorgulanabilir sütunları (metrikler ayrı tabloda)
+SEGMENT_FIELDS = (
+    ("path", "TEXT"),
+    ("test_name", "TEXT"),
+    ("segment", "INTEGER"),
+    ("started", "TEXT"),
+    ("started_ts", "REAL"),
+    ("duration_s", "REAL"),
+    ("samples", "INTEGER"),
+    ("port", "TEXT"),
+    ("safety_stops", "INTEGER"),
+    ("gaps", "INTEGER"),
+) + SETUP_FIELDS
+
+_TEXT_FIELDS = tuple(name for name, kind in SEGMENT_FIELDS if kind == "TEXT")
+_FIELD_NAMES = frozenset(name for name, _kind in SEGMENT_FIELDS)
+_INDEXED = ("test_name", "started_ts", "motor", "prop", "prop_diameter_in", "esc", "battery")
+
+_CONDITION = re.compile(r"^\s*(?:(.*?)\s+)?([\w.]+)\s*(<=|>=|!=|=|<|>|~)\s*(.+?)\s*$")
+_SPLIT = re.compile(r"\s*,\s*|\s+and\s+", re.IGNORECASE)
+
+
+def flatten_metrics(metrics: Dict) -> Dict[str, float]:
+    """compute_segment_metrics / stats_metrics çıktısı -> {"kanal.istatistik": değer}."""
+    flat = {}
+    for key in CHANNEL_KEYS:
+        for stat, value in (metrics.get(key) or {}).items():
+            if value is not None:
+                flat[f"{key}.{stat}"] = float(value)
+    return flat
+
+
+def parse_query(text: str) -> Tuple[List[Tuple[str, str, str]], List[str]]:
+    """Sorgu metni -> (koşullar [(alan, op, değer)], serbest sözcükler)."""
+    conditions, words = [], []
+    for part in _SPLIT.split(text.strip()):
+        if not part:
+            continue
+        m = _CONDITION.match(part)
+        if m:
+            words.extend((m.group(1) or "").split())
+            conditions.append((m.group(2), m.group(3), m.group(4).strip("\"'")))
+        else:
+            words.extend(part.split())
+    return conditions, words
+
+
+class SegmentCatalog:
+    """
+    Segment kataloğu. Bağlantı tek thread'den (UI veya CLI) kullanılır.
+
+    Yazma WAL kipinde ve synchronous=NORMAL ile yapılır; segment sonunda
+    tek işlem birkaç milisaniye sürer.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        folder = os.path.dirname(os.path.abspath(path))
+        os.makedirs(folder, exist_ok=True)
+        self.db = sqlite3.connect(path)
+        self.db.row_factory = sqlite3.Row
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+
+    def close(self):
+        self.db.close()
+
+    def _create_schema(self):
+        version = self.db.execute("PRAGMA user_version").fetchone()[0]
+        if version == SCHEMA_VERSION:
+            return
+        if version != 0:
+            raise ValueError(f"Unsupported catalog version {version}: {self.path}")
+        columns = ",\n".join(f"{name} {kind}" for name, kind in SEGMENT_FIELDS)
+        with self.db:
+            self.db.execute(
+                f"CREATE TABLE segments (id INTEGER PRIMARY KEY,\n{columns},\nUNIQUE(path))"
+            )
+            self.db.execute(
+                "CREATE TABLE metrics (segment_id INTEGER NOT NULL, "
+                "name TEXT NOT NULL, value REAL NOT NULL, "
+                "PRIMARY KEY (segment_id, name)) WITHOUT ROWID"
+            )
+            self.db.execute("CREATE INDEX metrics_name_value ON metrics(name, value)")
+            for name in _INDEXED:
+                self.db.execute(f"CREATE INDEX segments_{name} ON segments({name})")
+            self.db.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+
+    # ============================================================
+    #                       YAZMA
+    # ============================================================
+    def add_segment(self, info: Dict, metrics: Dict[str, float]) -> int:
+        """
+        Segmenti ekler; aynı yol varsa (yeniden kayıt) satırı değiştirir.
+
+        info: SEGMENT_FIELDS anahtarları (eksikler NULL), metrics:
+        flatten_metrics çıktısı.
+        """
+        info = dict(info)
+        info["path"] = os.path.abspath(info["path"])
+        if info.get("started_ts") is None:
+            info["started_ts"] = time.time()
+        names = [name for name, _kind in SEGMENT_FIELDS]
+        values = [info.get(name) for name in names]
+        with self.db:
+            self.db.execute(
+                "DELETE FROM metrics WHERE segment_id IN "
+                "(SELECT id FROM segments WHERE path = ?)",
+                (info["path"],),
+            )
+            self.db.execute("DELETE FROM segments WHERE path = ?", (info["path"],))
+            cur = self.db.execute(
+                f"INSERT INTO segments ({', '.join(names)}) "
+                f"VALUES ({', '.join('?' * len(names))})",
+                values,
+            )
+            segment_id = cur.lastrowid
+            self.db.executemany(
+                "INSERT INTO metrics (segment_id, name, value) VALUES (?, ?, ?)",
+                [(segment_id, name, value) for name, value in metrics.items()],
+            )
+        return segment_id
+
+    def remove_missing(self) -> int:
+        """Dosyası silinmiş segmentleri katalogdan çıkarır."""
+        rows = self.db.execute("SELECT id, path FROM segments").fetchall()
+        gone = [(row["id"],) for row in rows if not os.path.exists(row["path"])]
+        with self.db:
+            self.db.executemany("DELETE FROM metrics WHERE segment_id = ?", gone)
+            self.db.executemany("DELETE FROM segments WHERE id = ?", gone)
+        return len(gone)
+
+    def has_path(self, path: str) -> bool:
+        row = self.db.execute(
+            "SELECT 1 FROM segments WHERE path = ?", (os.path.abspath(path),)
+        ).fetchone()
+        return row is not None
+
+    # ============================================================
+    #                       SORGU
+    # ============================================================
+    def search(
+        self,
+        query: str = "",
+        metric_names: Iterable[str] = (),
+        limit: int = 1000,
+    ) -> List[Dict]:
+        """
+        Sorgu metnine uyan segmentler (en yeni önce).
+
+        Her sonuç segments sütunlarını ve istenen metrikleri
+        ("thrust_kgf.max" gibi) içerir. Bilinmeyen alan ValueError verir.
+        """
+        conditions, words = parse_query(query)
+        where, params = [], []
+        for field, op, value in conditions:
+            if field in _FIELD_NAMES:
+                where.append(_field_condition(field, op, value, params))
+            elif "." in field and field.split(".", 1)[0] in CHANNEL_KEYS:
+                if op == "~":
+                    raise ValueError(f"'~' is not valid for metric {field}")
+                where.append(
+                    "id IN (SELECT segment_id FROM metrics WHERE name = ? "
+                    f"AND value {'<>' if op == '!=' else op} ?)"
+                )
+                params.extend([field, _number(value)])
+            else:
+                raise ValueError(f"Unknown field: {field}")
+        for word in words:
+            where.append(
+                "(" + " OR ".join(f"{name} LIKE ?" for name in _TEXT_FIELDS) + ")"
+            )
+            params.extend([f"%{word}%"] * len(_TEXT_FIELDS))
+
+        sql = "SELECT * FROM segments"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY started_ts DESC LIMIT ?"
+        params.append(int(limit))
+        rows = [dict(row) for row in self.db.execute(sql, params)]
+
+        names = list(metric_names)
+        if rows and names:
+            by_id = {row["id"]: row for row in rows}
+            for row in rows:
+                row.update({name: None for name in names})
+            ids = list(by_id)
+            for chunk in range(0, len(ids), 500):
+                part = ids[chunk : chunk + 500]
+                for seg_id, name, value in self.db.execute(
+                    f"SELECT segment_id, name, value FROM metrics "
+                    f"WHERE segment_id IN ({', '.join('?' * len(part))}) "
+                    f"AND name IN ({', '.join('?' * len(names))})",
+                    part + names,
+                ):
+                    by_id[seg_id][name] = value
+        return rows
+
+    def count(self) -> int:
+        return self.db.execute("SELECT COUNT(*) FROM segments").fetchone()[0]
+
+
+def _field_condition(field: str, op: str, value: str, params: List) -> str:
+    numeric = dict(SEGMENT_FIELDS)[field] in ("REAL", "INTEGER")
+    if op == "~":
+        params.append(f"%{value}%")
+        return f"{field} LIKE ?"
+    params.append(_number(value) if numeric else value)
+    if not numeric and op == "=":
+        return f"{field} = ? COLLATE NOCASE"
+    return f"{field} {'<>' if op == '!=' else op} ?"
+
+
+def _number(text: str) -> float:
+    try:
+        return float(text)
+    except ValueError as e:
+        raise ValueError(f"Not a number: {text!r}") from e
+
+
+def default_catalog_path() -> str:
+    """CATALOG_PATH boşsa kullanıcı veri klasörü; GUI ve CLI aynı dosyayı açar."""
+    if CATALOG_PATH:
+        return CATALOG_PATH
+    from PyQt6.QtCore import QStandardPaths
+
+    base = QStandardPaths.writableLocation(
+        QStandardPaths.StandardLocation.GenericDataLocation
+    )
+    return os.path.join(base, "GMK AIR", "Motor Test Unit", "catalog.sqlite3")
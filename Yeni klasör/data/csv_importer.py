@@ -0,0 +1,244 @@
+"""
+Segment CSV'leri için vektörize toplu içe aktarıcı.
+
+Kayıtlar ';' ayraçlı ve her sayı Excel için '=' önekli yazılır (=12.345).
+Bu modül dosyayı parça parça okuyup hücreleri Python'a hiç sokmadan bayt
+dizisi üzerinde çözer: rakamlar tamsayı mantise toplanır ve ondalık basamak
+sayısının 10 kuvvetine bölünür, böylece sonuç float("12.345") ile birebir
+aynıdır.
+Önek içermeyen eski kayıtlar ve boş hücreler (NaN) da desteklenir.
+"""
+
+import mmap
+import os
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from core.channels import CSV_COLUMNS
+
+
+CHUNK_BYTES = 1024 * 1024  # ara diziler önbellekte kalsın diye küçük tutulur
+
+_SEMICOLON = 0x3B
+_NEWLINE = 0x0A
+_DOT = 0x2E
+_MINUS = 0x2D
+_EQUALS = 0x3D
+
+_MAX_DIGITS = 15
+_MAX_WIDTH = 24
+_POW10 = 10.0 ** np.arange(_MAX_DIGITS + 1)
+
+
+def parse_header(line: bytes) -> List[str]:
+    """Başlık satırını kanal anahtarlarına çevirir (bilinmeyen adlar aynen kalır)."""
+    names = line.decode("utf-8", errors="ignore").strip().split(";")
+    by_header = {v: k for k, v in CSV_COLUMNS.items()}
+    return [by_header.get(n.strip(), n.strip()) for n in names]
+
+
+def parse_rows(buf: bytes, ncols: int) -> np.ndarray:
+    """
+    Satır bloğunu (n, ncols) float64 dizisine çevirir.
+
+    Her '\\n' ile biten satır tam olarak bir satır üretir; boş hücreler NaN.
+    Blok beklenen düzende değilse (bozuk satır, metin hücresi, üslü sayı)
+    satır satır çalışan yavaş yola düşülür.
+    """
+    if not buf:
+        return np.empty((0, ncols), dtype=np.float64)
+    if not buf.endswith(b"\n"):
+        buf += b"\n"
+
+    rows = _parse_rows_fast(buf, ncols)
+    if rows is None:
+        rows = _parse_rows_slow(buf, ncols)
+    return rows
+
+
+def iter_row_chunks(
+    path: str, chunk_bytes: int = CHUNK_BYTES
+) -> Iterator[np.ndarray]:
+    """Dosyayı satır sınırlarında parçalara bölüp (n, ncols) diziler üretir."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            header_end = mm.find(b"\n")
+            if header_end == -1:
+                return
+            ncols = len(parse_header(mm[:header_end]))
+            for start, end in iter_line_ranges(mm, header_end + 1, chunk_bytes):
+                yield parse_rows(mm[start:end], ncols)
+
+
+def iter_line_ranges(mm, start: int, chunk_bytes: int = CHUNK_BYTES):
+    """mmap içinde satır sonlarına hizalı (başlangıç, bitiş) bayt aralıkları."""
+    size = len(mm)
+    pos = start
+    while pos < size:
+        end = min(pos + chunk_bytes, size)
+        if end < size:
+            nl = mm.rfind(b"\n", pos, end)
+            if nl == -1:
+                nl = mm.find(b"\n", end)
+            end = size if nl == -1 else nl + 1
+        yield pos, end
+        pos = end
+
+
+def import_csv(
+    path: str, keys: Optional[List[str]] = None, chunk_bytes: int = CHUNK_BYTES
+) -> Dict[str, np.ndarray]:
+    """
+    Tüm kaydı kanal anahtarı -> sütun dizisi sözlüğü olarak içe aktarır.
+
+    keys verilirse yalnızca o sütunlar tutulur (bellek tasarrufu).
+    """
+    header = read_header(path)
+    wanted = [(i, k) for i, k in enumerate(header) if keys is None or k in keys]
+
+    parts: Dict[str, List[np.ndarray]] = {k: [] for _, k in wanted}
+    for rows in iter_row_chunks(path, chunk_bytes):
+        for col, key in wanted:
+            parts[key].append(rows[:, col])
+
+    return {
+        key: (np.concatenate(chunks) if chunks else np.empty(0))
+        for key, chunks in parts.items()
+    }
+
+
+def read_header(path: str) -> List[str]:
+    with open(path, "rb") as f:
+        return parse_header(f.readline())
+
+
+# ============================================================
+#                       PARSE YOLLARI
+# ============================================================
+def _parse_rows_fast(buf: bytes, ncols: int) -> Optional[np.ndarray]:
+    """
+    Sabit ondalık hassasiyetli sütunlar için vektörize çözücü.
+
+    Her hücre ayracına sağa hizalanıp (hücre, W) bayt matrisine alınır.
+    Bir sütundaki tüm sayılar aynı basamak düzenine sahip olduğundan
+    (yazıcı sütun başına sabit hassasiyet kullanır) basamak ağırlıkları
+    sütun başına tek bir vektördür ve mantis tek bir matris çarpımıdır.
+
+    Hücre biçimi ham bayt dizisi üzerinde, yalnızca '=', '-' ve '.'
+    konumlarında denetlenir: dolu hücre '='* '-'? [rakam|nokta]+ olmalıdır.
+    Uymayan hücre ('=1-2', '=--1.5', boşluk, tırnak, yalnız '=') bloğu
+    yavaş yola düşürür; böylece iki yol her girdi için aynı sonucu verir.
+    """
+    if b"\r" in buf:
+        buf = buf.replace(b"\r", b"")
+    c = np.frombuffer(buf, dtype=np.uint8)
+
+    is_sep = (c == _SEMICOLON) | (c == _NEWLINE)
+    bpos = np.flatnonzero(is_sep)
+    nfields = len(bpos)
+    nrows = nfields // ncols
+    if nrows == 0 or nfields != nrows * ncols:
+        return None
+
+    # Her satır tam ncols hücre içermeli
+    seps = c[bpos].reshape(nrows, ncols)
+    if not (seps[:, -1] == _NEWLINE).all() or not (seps[:, :-1] == _SEMICOLON).all():
+        return None
+
+    # Yalnızca yazıcının ürettiği karakterler: rakam . - = ; \n
+    is_digit = (c - np.uint8(48)) < 10
+    is_minus = c == _MINUS
+    is_equals = c == _EQUALS
+    is_number = is_digit | (c == _DOT)
+    n_minus = np.count_nonzero(is_minus)
+    known = np.count_nonzero(is_number) + nfields + n_minus + np.count_nonzero(is_equals)
+    if known != len(c):
+        return None
+
+    # '=' ve '-' yalnız hücre başında ('=' ya da ayraçtan sonra); '='
+    # ardından '=', '-' ya da sayı, '-' ardından sayı gelmeli. Tampon '\n'
+    # ile bittiği için her '=' / '-' bir sonraki bayta sahiptir.
+    lead = is_sep | is_equals
+    if (
+        (is_equals[1:] & ~lead[:-1]).any()
+        or (is_minus[1:] & ~lead[:-1]).any()
+        or (is_equals[:-1] & ~(is_number | is_minus | is_equals)[1:]).any()
+        or (is_minus[:-1] & ~is_number[1:]).any()
+    ):
+        return None
+
+    lens = np.diff(bpos, prepend=-1) - 1
+    width = int(lens.max())
+    if width == 0:
+        return np.full((nrows, ncols), np.nan)
+    if width > _MAX_WIDTH:
+        return None
+    nonempty = (lens > 0).reshape(nrows, ncols)
+
+    negative = np.zeros(nfields, dtype=bool)
+    if n_minus:
+        negative[np.searchsorted(bpos, np.flatnonzero(is_minus))] = True
+    negative = negative.reshape(nrows, ncols)
+
+    # Hücreler ayraca sağa hizalı (hücre, W) matris; önceki hücrenin
+    # baytları maskelenir. Rakam dışı baytlar (. - =) ağırlıkta sıfırlanır.
+    padded = np.concatenate((np.zeros(width, dtype=np.uint8), c))
+    cells = sliding_window_view(padded, width)[bpos]
+    cells *= np.arange(width, dtype=np.uint8) >= (width - lens).astype(np.uint8)[:, None]
+    cells = cells.reshape(nrows, ncols, width)
+    is_dot = cells == _DOT
+    digits = cells - np.uint8(48)
+    digits *= digits < 10
+
+    # Sütun başına tek ondalık düzeni: nokta konumu ilk dolu hücreden alınır;
+    # her dolu hücrede tam o konumda tek nokta olmalı (ya da sütunda hiç
+    # nokta olmamalı). "5." gibi sonda nokta yavaş yola düşer.
+    columns = np.arange(ncols)
+    first = np.argmax(nonempty, axis=0)
+    first_dots = is_dot[first, columns]
+    dot_at = np.where(first_dots.any(axis=1), np.argmax(first_dots, axis=1), -1)
+    if (dot_at == width - 1).any():
+        return None
+    expected = nonempty & (dot_at >= 0)
+    if np.count_nonzero(is_dot) != np.count_nonzero(expected):
+        return None
+    if not is_dot[:, columns, np.maximum(dot_at, 0)][expected].all():
+        return None
+
+    # Basamak ağırlıkları: noktanın solundakiler bir kuvvet aşağı kayar.
+    # Mantis tamsayıdır (<= 15 basamak, float64'te tam); 10^frac'a tek
+    # bölme float("12.345") ile aynı yuvarlamayı verir.
+    pos = np.arange(width)
+    exps = (width - 1 - pos) - (pos < dot_at[:, None])
+    if exps.max() > _MAX_DIGITS:
+        return None
+    frac = np.where(dot_at >= 0, width - 1 - dot_at, 0)
+
+    out = np.einsum("rkw,kw->rk", digits.astype(np.float64), _POW10[exps])
+    out /= _POW10[frac]
+    out[negative] *= -1.0
+    out[~nonempty] = np.nan
+    return out
+
+
+def _parse_rows_slow(buf: bytes, ncols: int) -> np.ndarray:
+    lines = buf.split(b"\n")
+    if lines and not lines[-1]:
+        lines.pop()
+
+    out = np.full((len(lines), ncols), np.nan, dtype=np.float64)
+    for r, line in enumerate(lines):
+        cells = line.rstrip(b"\r").split(b";")
+        for c, cell in enumerate(cells[:ncols]):
+            cell = cell.strip().strip(b'"').lstrip(b"=")
+            if not cell:
+                continue
+            try:
+                out[r, c] = float(cell)
+            except ValueError:
+                pass
+    return out
@@ -0,0 +1,91 @@
+"""
+Segment olay kaydı (<ad>_segmentN_events.csv).
+
+Güvenlik durdurması gibi anlık olaylar ölçüm CSV'sinin sütunlarını
+değiştirmeden yanındaki ayrı bir dosyaya yazılır (aynı ";" ayracı).
+Dosya ilk olayda açılır; olaysız segmentte oluşmaz. Kayıt açılırken
+(RecordingRepository) varsa okunur ve grafiklerde işaretlenir.
+"""
+
+import csv
+import os
+from typing import Dict, List
+
+
+EVENT_SUFFIX = "_events.csv"
+EVENT_COLUMNS = ("time_s", "event", "channel", "value", "limit", "latency_ms", "detail")
+
+
+def event_log_path(csv_path: str) -> str:
+    """Segment CSV'sinin yanındaki olay dosyasının yolu."""
+    return os.path.splitext(csv_path)[0] + EVENT_SUFFIX
+
+
+class EventLogWriter:
+    """Bir segmentin olaylarını yazar; her satırdan sonra diske boşaltır."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.file = open(path, "w", newline="", encoding="utf-8")
+        self.writer = csv.writer(self.file, delimiter=";")
+        self.writer.writerow(EVENT_COLUMNS)
+
+    def write(self, event: Dict) -> None:
+        self.writer.writerow(
+            [
+                _fmt(event.get("t"), 3),
+                event.get("event", ""),
+                event.get("key", ""),
+                _fmt(event.get("value"), 3),
+                _fmt(event.get("limit"), 3),
+                _fmt(event.get("latency_ms"), 3),
+                event.get("reason", ""),
+            ]
+        )
+        try:
+            self.file.flush()
+        except OSError:
+            pass
+
+    def close(self) -> None:
+        try:
+            self.file.close()
+        except OSError:
+            pass
+
+
+def load_event_log(csv_path: str) -> List[Dict]:
+    """Segment CSV'sine ait olaylar; olay dosyası yoksa boş liste."""
+    path = event_log_path(csv_path)
+    if not os.path.isfile(path):
+        return []
+    events = []
+    with open(path, "r", newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f, delimiter=";"):
+            try:
+                t = float(row["time_s"])
+            except (KeyError, TypeError, ValueError):
+                continue
+            events.append(
+                {
+                    "t": t,
+                    "event": row.get("event", ""),
+                    "key": row.get("channel", ""),
+                    "value": _float_or_none(row.get("value")),
+                    "limit": _float_or_none(row.get("limit")),
+                    "latency_ms": _float_or_none(row.get("latency_ms")),
+                    "reason": row.get("detail", ""),
+                }
+            )
+    return events
+
+
+def _fmt(value, precision: int) -> str:
+    return "" if value is None else f"{value:.{precision}f}"
+
+
+def _float_or_none(text):
+    try:
+        return float(text)
+    except (TypeError, ValueError):
+        return None
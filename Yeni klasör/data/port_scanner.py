@@ -0,0 +1,90 @@
+import threading
+from typing import Dict, List, Optional
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+
+def scan_ports() -> List[Dict]:
+    """Sistemdeki seri portları sözlük listesi olarak döndürür."""
+    from serial.tools import list_ports
+
+    return [
+        {
+            "device": p.device,
+            "description": p.description,
+            "vid": p.vid,
+            "pid": p.pid,
+            "serial_number": p.serial_number,
+        }
+        for p in list_ports.comports()
+    ]
+
+
+def port_key(port: Dict) -> str:
+    """
+    Bir test düzeneğini port adından bağımsız tanımlayan anahtar.
+
+    USB adaptörlerde "VID:PID:seri no" kullanılır; kablo çıkıp takılınca
+    ttyUSB0 -> ttyUSB1 (veya COM3 -> COM5) olsa da anahtar değişmez.
+    VID'i olmayan (yerleşik) portlarda cihaz adı kullanılır.
+    """
+    if port.get("vid") is None:
+        return port["device"]
+    return "{:04X}:{:04X}:{}".format(
+        port["vid"], port["pid"] or 0, port.get("serial_number") or ""
+    )
+
+
+def find_port(ports: List[Dict], key: Optional[str]) -> Optional[Dict]:
+    if not key:
+        return None
+    for p in ports:
+        if port_key(p) == key:
+            return p
+    return None
+
+
+class PortWatcher(QThread):
+    """
+    Seri portları UI thread'i dışında periyodik tarar (hot-plug).
+
+    Liste yalnızca değiştiğinde ports_changed yayınlanır; rescan() bir
+    sonraki taramayı hemen yaptırır ve sonucu değişmese de yayınlatır.
+    udev/WM_DEVICECHANGE yerine yoklama kullanılır: comports() Linux'ta
+    sysfs'i, Windows'ta SetupAPI'yi okur ve ek bağımlılık gerektirmez.
+    """
+
+    POLL_INTERVAL_S = 1.0
+
+    ports_changed = pyqtSignal(list)
+
+    def __init__(self, parent=None, interval_s: float = POLL_INTERVAL_S):
+        super().__init__(parent)
+        self.interval_s = interval_s
+        self._wake = threading.Event()
+        self._force = True
+
+    def rescan(self):
+        self._force = True
+        self._wake.set()
+
+    def stop(self):
+        self.requestInterruption()
+        self._wake.set()
+        self.wait(2000)
+
+    def run(self):
+        last = None
+        while not self.isInterruptionRequested():
+            try:
+                ports = scan_ports()
+            except OSError:
+                ports = []
+
+            force, self._force = self._force, False
+            if force or ports != last:
+                last = ports
+                self.ports_changed.emit(ports)
+
+            self._wake.wait(self.interval_s)
+            self._wake.clear()
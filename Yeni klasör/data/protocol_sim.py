@@ -0,0 +1,216 @@
+"""
+Simüle motor test düzeneği: pyserial "sim://" URL işleyicisi.
+
+data.serial_repository.open_serial("sim://") gerçek port yerine bu sınıfı
+açar. Donanım olmadan sequencer, komut katmanı ve tüm okuma/kayıt hattı
+uçtan uca denenebilir:
+- telemetri satırları gerçek firmware biçiminde, sabit hızla üretilir
+  ("V=.. | Weight(kg)=.. | T=.. | I=.. | RPM=..")
+- THR <yüzde>, STOP ve STATUS? komutları firmware gibi işlenir
+- motor birinci dereceden gecikmeli bir pervane modelidir: thrust ~ rpm²,
+  akım ~ rpm³, voltaj iç dirençle düşer, sıcaklık I²R ile ısınır
+
+Model okuma anında zamanla ilerletilir (ek thread yoktur).
+
+URL seçenekleri: sim://?rate=10&seed=0&noise=1
+"""
+
+import math
+import random
+import threading
+import time
+import urllib.parse
+
+from serial.serialutil import PortNotOpenError, SerialBase, SerialException
+
+
+class MotorModel:
+    """Pervaneli fırçasız motor + batarya + yük hücresinin basit modeli."""
+
+    RPM_MAX = 24000.0
+    TAU_RPM_S = 0.25            # rotor ivmelenme zaman sabiti
+    THRUST_AT_MAX_KGF = 6.0
+    CURRENT_IDLE_A = 0.4
+    CURRENT_AT_MAX_A = 55.0
+    V_BATTERY = 25.2
+    R_INTERNAL_OHM = 0.035
+    T_AMBIENT_C = 24.0
+    THERMAL_TAU_S = 90.0
+    HEAT_C_PER_A2 = 0.018       # kararlı durum ısınması (°C / A²)
+
+    def __init__(self, noise: float = 1.0, seed: int = 0):
+        self.noise = noise
+        self.rng = random.Random(seed)
+        self.throttle = 0.0         # set noktası (%)
+        self.rpm = 0.0
+        self.temperature = self.T_AMBIENT_C
+
+    def step(self, dt: float):
+        target = self.RPM_MAX * self.throttle / 100.0
+        self.rpm += (target - self.rpm) * (1.0 - math.exp(-dt / self.TAU_RPM_S))
+        current = self.current()
+        steady = self.T_AMBIENT_C + self.HEAT_C_PER_A2 * current * current
+        self.temperature += (steady - self.temperature) * (
+            1.0 - math.exp(-dt / self.THERMAL_TAU_S)
+        )
+
+    def current(self) -> float:
+        x = self.rpm / self.RPM_MAX
+        idle = self.CURRENT_IDLE_A if x > 0.01 else 0.0
+        return idle + self.CURRENT_AT_MAX_A * x ** 3
+
+    def telemetry_line(self) -> str:
+        g = self.rng.gauss
+        n = self.noise
+        x = self.rpm / self.RPM_MAX
+        current = max(0.0, self.current() + g(0.0, 0.05 * n))
+        voltage = self.V_BATTERY - self.R_INTERNAL_OHM * current + g(0.0, 0.01 * n)
+        thrust = self.THRUST_AT_MAX_KGF * x * x + g(0.0, 0.004 * n)
+        rpm = max(0.0, self.rpm + g(0.0, 15.0 * n))
+        temperature = self.temperature + g(0.0, 0.05 * n)
+        return (
+            f"V={voltage:.3f} | Weight(kg)={thrust:.4f} | T={temperature:.2f} | "
+            f"I={current:.3f} | RPM={rpm:.0f}"
+        )
+
+
+class Serial(SerialBase):
+    """SerialBase arayüzünde simüle düzenek (pyserial serial_for_url ile açılır)."""
+
+    def __init__(self, *args, **kwargs):
+        self.model = None
+        self.rate_hz = 10.0
+        self._lock = threading.Lock()
+        self._rx = bytearray()       # cihazdan gelen (okunacak) baytlar
+        self._cmd = b""              # cihaza yazılan yarım komut satırı
+        self._t_model = 0.0
+        self._t_next_line = 0.0
+        self.lines_sent = 0          # üretilen telemetri satırı (ölçümler için)
+        super().__init__(*args, **kwargs)
+
+    # ------------------------------------------------------------
+    #   Bağlantı
+    # ------------------------------------------------------------
+    def open(self):
+        if self.is_open:
+            raise SerialException("Port is already open.")
+        if self._port is None:
+            raise SerialException("Port must be configured before it can be used.")
+        options = self.from_url(self._port)
+        self.rate_hz = options["rate"]
+        self.model = MotorModel(noise=options["noise"], seed=int(options["seed"]))
+        now = time.monotonic()
+        self._t_model = now
+        self._t_next_line = now
+        self._rx = bytearray()
+        self._cmd = b""
+        self.lines_sent = 0
+        self.is_open = True
+
+    def close(self):
+        self.is_open = False
+        super().close()
+
+    def _reconfigure_port(self):
+        pass
+
+    def from_url(self, url: str) -> dict:
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme != "sim":
+            raise SerialException(f"expected sim://[?rate=..&seed=..&noise=..]: {url!r}")
+        options = {"rate": 10.0, "seed": 0.0, "noise": 1.0}
+        try:
+            for key, values in urllib.parse.parse_qs(parts.query).items():
+                if key not in options:
+                    raise ValueError(f"unknown option: {key!r}")
+                options[key] = float(values[0])
+        except ValueError as e:
+            raise SerialException(f"invalid sim:// URL {url!r}: {e}") from e
+        if options["rate"] <= 0:
+            raise SerialException("sim:// rate must be positive")
+        return options
+
+    # ------------------------------------------------------------
+    #   Model / telemetri
+    # ------------------------------------------------------------
+    def _advance(self):
+        """Modeli şimdiye kadar ilerletir, vadesi gelen telemetri satırlarını üretir."""
+        now = time.monotonic()
+        period = 1.0 / self.rate_hz
+        # Uzun duraklamadan sonra (debugger vb.) satır seli üretme
+        if now - self._t_next_line > 2.0:
+            self._t_next_line = now - period
+        while self._t_next_line <= now:
+            self.model.step(self._t_next_line - self._t_model)
+            self._t_model = self._t_next_line
+            self._rx += self.model.telemetry_line().encode("ascii") + b"\n"
+            self.lines_sent += 1
+            self._t_next_line += period
+
+    def _handle_command(self, line: str):
+        line = line.strip()
+        if not line:
+            return
+        name, _, arg = line.partition(" ")
+        if name == "STATUS?":
+            self._rx += b"STATUS => V:READY, LC:READY, T:READY, I:READY, RPM:READY\n"
+        elif name == "THR":
+            try:
+                self.model.throttle = min(100.0, max(0.0, float(arg)))
+            except ValueError:
+                self._rx += b"ERR THR bad value\n"
+        elif name == "STOP":
+            self.model.throttle = 0.0
+        else:
+            self._rx += f"ERR {name} unknown command\n".encode("ascii", "replace")
+
+    # ------------------------------------------------------------
+    #   SerialBase
+    # ------------------------------------------------------------
+    @property
+    def lines_pending(self) -> int:
+        """Üretilmiş ama henüz okunmamış satır sayısı."""
+        with self._lock:
+            return self._rx.count(b"\n")
+
+    @property
+    def in_waiting(self) -> int:
+        if not self.is_open:
+            raise PortNotOpenError()
+        with self._lock:
+            self._advance()
+            return len(self._rx)
+
+    def read(self, size: int = 1) -> bytes:
+        if not self.is_open:
+            raise PortNotOpenError()
+        with self._lock:
+            self._advance()
+            data = bytes(self._rx[:size])
+            del self._rx[:size]
+        return data
+
+    def write(self, data) -> int:
+        if not self.is_open:
+            raise PortNotOpenError()
+        data = bytes(data)
+        with self._lock:
+            self._advance()
+            *lines, self._cmd = (self._cmd + data).split(b"\n")
+            for line in lines:
+                self._handle_command(line.decode("ascii", errors="ignore"))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def reset_input_buffer(self):
+        with self._lock:
+            self._rx = bytearray()
+
+    def reset_output_buffer(self):
+        pass
+
+    @property
+    def out_waiting(self) -> int:
+        return 0
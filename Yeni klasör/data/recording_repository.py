@@ -0,0 +1,375 @@
+import mmap
+import os
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from data.csv_importer import CHUNK_BYTES, iter_line_ranges, parse_header, parse_rows
+from data.event_log import load_event_log
+from domain.segment_summary import new_segment_stats
+
+
+INDEX_VERSION = 2
+SIDECAR_SUFFIX = ".gmkidx.npz"
+
+
+class RecordingRepository:
+    """
+    Kaydedilmiş bir segment CSV'sini salt-okunur açar.
+
+    Dosya memory-map ile okunur; ilk açılışta min/max decimation piramidi ve
+    satır blok ofsetleri çıkarılıp yanındaki sidecar dosyaya yazılır. Sonraki
+    açılışlarda CSV hiç parse edilmeden sidecar yüklenir, yakınlaştırılan
+    aralıklar ise ofsetler üzerinden doğrudan mmap'ten okunur.
+
+    Piramit seviyeleri (float32) bellekte yalnızca kullanıldıkça tutulur;
+    sidecar yazılabildiyse release_memory() onları bırakır ve gerektiğinde
+    sidecar'dan yeniden okunur.
+    """
+
+    BLOCK_ROWS = 4096          # ham okuma için ofset tutulan satır aralığı
+    BUCKET_ROWS = 64           # piramidin en ince seviyesindeki kova boyu
+    LEVEL_FACTOR = 8           # seviyeler arası birleşme oranı
+    MIN_LEVEL_BUCKETS = 1024   # bu sayının altına inen seviye üretilmez
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        self._mm: Optional[mmap.mmap] = None
+        self._levels: Dict[int, Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+        self._levels_on_disk = False
+
+        try:
+            size = os.fstat(self._file.fileno()).st_size
+            if size == 0:
+                raise ValueError("Recording file is empty.")
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+            header_end = self._mm.find(b"\n")
+            if header_end == -1:
+                raise ValueError("Recording has no data rows.")
+            self._data_start = header_end + 1
+            self._size = size
+
+            self.keys: List[str] = parse_header(self._mm[:header_end])
+            if "time_s" not in self.keys:
+                raise ValueError("Recording has no time_s column.")
+            self._time_col = self.keys.index("time_s")
+
+            self._index = self._load_or_build_index()
+            self.events: List[Dict] = load_event_log(path)
+        except Exception:
+            self.close()
+            raise
+
+    # ============================================================
+    #                       PUBLIC API
+    # ============================================================
+    @property
+    def channel_keys(self) -> List[str]:
+        return [k for k in self.keys if k != "time_s"]
+
+    @property
+    def row_count(self) -> int:
+        return int(self._index["row_count"])
+
+    @property
+    def time_span(self) -> Tuple[float, float]:
+        return float(self._index["t_first"]), float(self._index["t_last"])
+
+    @property
+    def stats(self) -> Dict:
+        """Tüm dosya için segment_stats ile aynı biçimde istatistik."""
+        t_first, t_last = self.time_span
+        stats = new_segment_stats(t_first)
+        stats["end_time"] = t_last
+        stats["count"] = self.row_count
+        stats["events"] = list(self.events)
+
+        for col, key in enumerate(self.keys):
+            if key not in stats["sum"]:
+                continue
+            stats["sum"][key] = float(self._index["sum"][col])
+            stats["n"][key] = int(self._index["count"][col])
+            stats["min"][key] = _none_if_nan(self._index["min"][col])
+            stats["max"][key] = _none_if_nan(self._index["max"][col])
+        return stats
+
+    def read_range(
+        self, t0: float, t1: float, max_points: int = 4000
+    ) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+        """
+        [t0, t1] aralığı için kanal başına (x, y) dizileri döndürür.
+
+        Aralıktaki satır sayısı max_points'i aşıyorsa uygun piramit
+        seviyesinden min/max zarfı, aşmıyorsa ham satırlar döner.
+        """
+        block_t = self._index["block_t"]
+        b0 = max(0, int(np.searchsorted(block_t, t0, side="right")) - 1)
+        b1 = int(np.searchsorted(block_t, t1, side="right"))
+
+        # Blok başlarından doğrusal ara değerle aralıktaki satır sayısı
+        knots_t = np.append(block_t, self._index["t_last"])
+        knots_row = np.append(
+            np.arange(len(block_t)) * self.BLOCK_ROWS, self.row_count
+        )
+        approx_rows = np.interp(t1, knots_t, knots_row) - np.interp(
+            t0, knots_t, knots_row
+        )
+
+        if approx_rows <= max_points:
+            return self._read_raw(b0, b1, t0, t1)
+        return self._read_envelope(t0, t1, approx_rows, max_points)
+
+    def close(self):
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    # ============================================================
+    #                       OKUMA
+    # ============================================================
+    def _read_raw(self, b0: int, b1: int, t0: float, t1: float):
+        offsets = self._index["block_offsets"]
+        start = int(offsets[b0]) if b0 < len(offsets) else self._size
+        end = int(offsets[b1]) if b1 < len(offsets) else self._size
+
+        rows = parse_rows(self._mm[start:end], len(self.keys))
+        t = rows[:, self._time_col]
+
+        # Kenarlarda birer örnek fazladan bırak ki çizgi ekran dışına uzansın
+        i0 = max(0, int(np.searchsorted(t, t0, side="left")) - 1)
+        i1 = min(len(t), int(np.searchsorted(t, t1, side="right")) + 1)
+        rows = rows[i0:i1]
+        t = rows[:, self._time_col]
+
+        return {
+            key: (t, rows[:, col])
+            for col, key in enumerate(self.keys)
+            if key != "time_s"
+        }
+
+    def _read_envelope(self, t0: float, t1: float, approx_rows: float, max_points: int):
+        levels = int(self._index["n_levels"])
+        level = levels - 1
+        for lv in range(levels):
+            bucket_rows = self.BUCKET_ROWS * self.LEVEL_FACTOR ** lv
+            if approx_rows / bucket_rows <= max_points // 2:
+                level = lv
+                break
+
+        lt, lmin, lmax = self._level(level)
+        i0 = max(0, int(np.searchsorted(lt, t0, side="right")) - 1)
+        i1 = min(len(lt), int(np.searchsorted(lt, t1, side="right")) + 1)
+        lmin = lmin[i0:i1]
+        lmax = lmax[i0:i1]
+
+        xs = np.repeat(lt[i0:i1], 2)
+        result = {}
+        for col, key in enumerate(self.keys):
+            if key == "time_s":
+                continue
+            ys = np.empty(len(xs), dtype=np.float64)
+            ys[0::2] = lmin[:, col]
+            ys[1::2] = lmax[:, col]
+            result[key] = (xs, ys)
+        return result
+
+    # ============================================================
+    #                       BELLEK BÜTÇESİ
+    # ============================================================
+    def memory_bytes(self) -> int:
+        index = sum(a.nbytes for a in self._index.values())
+        levels = sum(a.nbytes for arrays in self._levels.values() for a in arrays)
+        return index + levels
+
+    def release_memory(self) -> None:
+        """Piramit seviyelerini bırakır (sidecar diskteyse)."""
+        if self._levels_on_disk:
+            self._levels.clear()
+
+    def _level(self, level: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        arrays = self._levels.get(level)
+        if arrays is None:
+            names = [f"level{level}_{part}" for part in ("t", "min", "max")]
+            try:
+                with np.load(self._sidecar_path(), allow_pickle=False) as npz:
+                    arrays = tuple(npz[name] for name in names)
+            except (OSError, ValueError, KeyError):
+                # Sidecar silinmiş/bozulmuş: yeniden üret, bellekte tut
+                index = self._build_index()
+                self._levels_on_disk = False
+                self._levels = _split_levels(index)
+                arrays = self._levels[level]
+            self._levels[level] = arrays
+        return arrays
+
+    # ============================================================
+    #                       INDEX (SIDECAR)
+    # ============================================================
+    def _sidecar_path(self) -> str:
+        return self.path + SIDECAR_SUFFIX
+
+    def _load_or_build_index(self) -> Dict[str, np.ndarray]:
+        st = os.stat(self.path)
+        sidecar = self._sidecar_path()
+
+        if os.path.exists(sidecar):
+            try:
+                # Piramit seviyeleri ilk kullanımda okunur (_level)
+                with np.load(sidecar, allow_pickle=False) as npz:
+                    index = {k: npz[k] for k in npz.files if not k.startswith("level")}
+                if (
+                    int(index["version"]) == INDEX_VERSION
+                    and int(index["src_size"]) == st.st_size
+                    and int(index["src_mtime_ns"]) == st.st_mtime_ns
+                ):
+                    self._levels_on_disk = True
+                    return index
+            except (OSError, ValueError, KeyError):
+                pass
+
+        index = self._build_index()
+        index["version"] = np.array(INDEX_VERSION)
+        index["src_size"] = np.array(st.st_size)
+        index["src_mtime_ns"] = np.array(st.st_mtime_ns)
+
+        tmp = sidecar + ".tmp"
+        try:
+            with open(tmp, "wb") as f:
+                np.savez(f, **index)
+            os.replace(tmp, sidecar)
+            self._levels_on_disk = True
+        except OSError:
+            # Klasör yazılamıyorsa index yalnızca bu oturumda kullanılır
+            pass
+        self._levels = _split_levels(index)
+        return index
+
+    def _build_index(self) -> Dict[str, np.ndarray]:
+        mm = self._mm
+        ncols = len(self.keys)
+        tcol = self._time_col
+        B = self.BUCKET_ROWS
+
+        block_offsets: List[int] = []
+        block_t: List[float] = []
+        row = 0
+
+        carry = np.empty((0, ncols), dtype=np.float64)
+        l0_t: List[np.ndarray] = []
+        l0_min: List[np.ndarray] = []
+        l0_max: List[np.ndarray] = []
+
+        col_sum = np.zeros(ncols, dtype=np.float64)
+        col_count = np.zeros(ncols, dtype=np.int64)
+        col_min = np.full(ncols, np.nan)
+        col_max = np.full(ncols, np.nan)
+        t_first = np.nan
+        t_last = np.nan
+
+        for pos, end in iter_line_ranges(mm, self._data_start, CHUNK_BYTES):
+            chunk = mm[pos:end]
+            rows = parse_rows(chunk, ncols)
+            n = len(rows)
+            if n == 0:
+                continue
+
+            # Blok başlangıç ofsetleri (her BLOCK_ROWS satırda bir)
+            nl_pos = np.flatnonzero(np.frombuffer(chunk, dtype=np.uint8) == 0x0A)
+            starts = np.concatenate(([0], nl_pos + 1))[:n] + pos
+            first = (-row) % self.BLOCK_ROWS
+            block_offsets.extend(starts[first::self.BLOCK_ROWS].tolist())
+
+            t = rows[:, tcol]
+            block_t.extend(t[first::self.BLOCK_ROWS].tolist())
+            if np.isnan(t_first):
+                t_first = t[0]
+            t_last = t[-1]
+
+            col_sum += np.nansum(rows, axis=0)
+            col_count += np.count_nonzero(~np.isnan(rows), axis=0)
+            col_min = np.fmin(col_min, np.fmin.reduce(rows, axis=0))
+            col_max = np.fmax(col_max, np.fmax.reduce(rows, axis=0))
+
+            data = np.concatenate((carry, rows)) if len(carry) else rows
+            nb = len(data) // B
+            if nb:
+                buckets = data[: nb * B].reshape(nb, B, ncols)
+                l0_t.append(buckets[:, 0, tcol].copy())
+                l0_min.append(np.fmin.reduce(buckets, axis=1).astype(np.float32))
+                l0_max.append(np.fmax.reduce(buckets, axis=1).astype(np.float32))
+            carry = data[nb * B:]
+
+            row += n
+
+        if len(carry):
+            l0_t.append(carry[:1, tcol].copy())
+            l0_min.append(np.fmin.reduce(carry, axis=0, keepdims=True).astype(np.float32))
+            l0_max.append(np.fmax.reduce(carry, axis=0, keepdims=True).astype(np.float32))
+
+        if row == 0:
+            raise ValueError("Recording has no data rows.")
+
+        index: Dict[str, np.ndarray] = {
+            "row_count": np.array(row),
+            "t_first": np.array(t_first),
+            "t_last": np.array(t_last),
+            "block_offsets": np.asarray(block_offsets, dtype=np.int64),
+            "block_t": np.asarray(block_t, dtype=np.float64),
+            "sum": col_sum,
+            "count": col_count,
+            "min": col_min,
+            "max": col_max,
+        }
+
+        lt = np.concatenate(l0_t)
+        lmin = np.concatenate(l0_min)
+        lmax = np.concatenate(l0_max)
+        level = 0
+        while True:
+            index[f"level{level}_t"] = lt
+            index[f"level{level}_min"] = lmin
+            index[f"level{level}_max"] = lmax
+            level += 1
+            if len(lt) <= self.MIN_LEVEL_BUCKETS:
+                break
+            lt, lmin, lmax = _merge_level(lt, lmin, lmax, self.LEVEL_FACTOR)
+
+        index["n_levels"] = np.array(level)
+        return index
+
+
+def _split_levels(index: Dict[str, np.ndarray]) -> Dict[int, Tuple]:
+    """Piramit seviyelerini index sözlüğünden çıkarır: seviye -> (t, min, max)."""
+    levels = {}
+    for level in range(int(index["n_levels"])):
+        levels[level] = tuple(
+            index.pop(f"level{level}_{part}") for part in ("t", "min", "max")
+        )
+    return levels
+
+
+def _merge_level(lt, lmin, lmax, factor: int):
+    """Bir piramit seviyesini factor kadar kabalaştırır."""
+    n = len(lt)
+    m = -(-n // factor)
+    pad = m * factor - n
+    if pad:
+        fill = np.full((pad, lmin.shape[1]), np.nan, dtype=lmin.dtype)
+        lmin = np.concatenate((lmin, fill))
+        lmax = np.concatenate((lmax, fill))
+    ncols = lmin.shape[1]
+    return (
+        lt[::factor].copy(),
+        np.fmin.reduce(lmin.reshape(m, factor, ncols), axis=1),
+        np.fmax.reduce(lmax.reshape(m, factor, ncols), axis=1),
+    )
+
+
+def _none_if_nan(value) -> Optional[float]:
+    value = float(value)
+    return None if np.isnan(value) else value
@@ -0,0 +1,431 @@
+"""
+Uzun süreli segment arşivi (<ad>_segmentN.gmka).
+
+CSV'deki her hücre "=12.345" gibi metindir; arşiv aynı değerleri kanal
+başına ikili ve sıkıştırılmış tutar:
+    GMKARC1\\n
+    bloklar: her blokta kanal başına ayrı sıkıştırılmış sütun
+    JSON dipnot (anahtarlar, başlık adları, blok ofsetleri ve zaman aralıkları)
+    dipnot ofseti (u64) + GMKAEND\\n
+Sütun kodlaması: değer, yazıldığı ondalık hassasiyette tamsayıya çevrilir
+(q = değer * 10^p), ardışık farkı alınır, zigzag ile işaretsiz yapılır ve
+en küçük tamsayı genişliğinde bayt düzlemlerine ayrılır (önce tüm düşük
+baytlar); ardından zlib/zstd. Çözülen değer q / 10^p, içe aktarıcının
+("=12.345" -> 12345 / 10^3) ürettiği float ile bit düzeyinde aynıdır.
+Bu şekilde gösterilemeyen az sayıdaki hücre (NaN kesinti satırları, -0.0)
+istisna olarak ham float64 saklanır; istisna çoksa sütun bloğu önceki
+değerle XOR'lanmış float64 bitleri olarak yazılır (Gorilla benzeri).
+
+Bloklar ARCHIVE_BLOCK_ROWS satırdır; zaman aralığı dipnotta tutulduğundan
+istenen zaman aralığı ve kanallar yalnızca ilgili bloklar açılarak okunur.
+"""
+
+import json
+import os
+import struct
+import zlib
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from core.channels import CSV_PRECISION
+from core.constants import ARCHIVE_BLOCK_ROWS, ARCHIVE_CODEC, ARCHIVE_LEVEL
+from data.csv_importer import iter_row_chunks, read_header
+from data.event_log import load_event_log
+
+
+ARCHIVE_VERSION = 1
+ARCHIVE_MAGIC = b"GMKARC1\n"
+ARCHIVE_EXTENSION = ".gmka"
+
+_TRAILER = struct.Struct("<Q8s")       # dipnot ofseti, bitiş imi
+_TRAILER_MAGIC = b"GMKAEND\n"
+_COLUMN = struct.Struct("<BBBxI")      # kip, hassasiyet, genişlik, istisna sayısı
+
+_QUANTIZED = 0
+_XOR = 1
+
+_MAX_PRECISION = 9
+_MAX_EXCEPTION_RATIO = 1.0 / 64
+_MAX_MANTISSA = float(2 ** 53)
+_POW10 = 10.0 ** np.arange(_MAX_PRECISION + 1)
+
+
+def archive_path(csv_path: str) -> str:
+    return os.path.splitext(csv_path)[0] + ARCHIVE_EXTENSION
+
+
+# ============================================================
+#                       SIKIŞTIRICI
+# ============================================================
+def _codec(name: str):
+    """(compress(bytes, level), decompress(bytes)) çifti."""
+    if name == "zlib":
+        return zlib.compress, zlib.decompress
+    if name == "zstd":
+        try:
+            import zstandard
+        except ImportError as e:
+            raise ValueError("The zstd codec requires the zstandard package.") from e
+        return (
+            lambda data, level: zstandard.ZstdCompressor(level=level).compress(data),
+            zstandard.ZstdDecompressor().decompress,
+        )
+    raise ValueError(f"Unknown archive codec: {name}")
+
+
+# ============================================================
+#                       SÜTUN KODLAMA
+# ============================================================
+def encode_column(values: np.ndarray, precision: int) -> bytes:
+    """
+    Bir sütun bloğunu sıkıştırılmamış ikili biçime çevirir.
+
+    precision, CSV yazıcısının hassasiyetidir; değerler bu hassasiyette
+    tam gösterilemiyorsa daha yüksek hassasiyetler, en son XOR denenir.
+    """
+    values = np.ascontiguousarray(values, dtype=np.float64)
+    for p in range(min(precision, _MAX_PRECISION), _MAX_PRECISION + 1):
+        payload = _encode_quantized(values, p)
+        if payload is not None:
+            return payload
+    return _encode_xor(values)
+
+
+def decode_column(payload: bytes, n: int) -> np.ndarray:
+    mode, p, width, n_exc = _COLUMN.unpack_from(payload)
+    pos = _COLUMN.size
+    exc_rows = np.frombuffer(payload, dtype="<u4", count=n_exc, offset=pos)
+    pos += 4 * n_exc
+    exc_values = np.frombuffer(payload, dtype="<f8", count=n_exc, offset=pos)
+    pos += 8 * n_exc
+
+    planes = np.frombuffer(payload, dtype=np.uint8, count=n * width, offset=pos)
+    packed = np.ascontiguousarray(planes.reshape(width, n).T)
+    zz = packed.view(f"<u{width}").ravel().astype(np.uint64)
+
+    if mode == _XOR:
+        return np.bitwise_xor.accumulate(zz).view(np.float64)
+
+    deltas = (zz >> np.uint64(1)).astype(np.int64) ^ -(zz & np.uint64(1)).astype(np.int64)
+    values = np.cumsum(deltas) / _POW10[p]
+    values[exc_rows] = exc_values
+    return values
+
+
+def _encode_quantized(values: np.ndarray, p: int) -> Optional[bytes]:
+    scaled = values * _POW10[p]
+    finite = np.isfinite(scaled)
+    scaled[~finite] = 0.0
+    if len(scaled) and np.abs(scaled).max() >= _MAX_MANTISSA:
+        return None
+    q = np.rint(scaled).astype(np.int64)
+
+    # q / 10^p, içe aktarıcının mantis / 10^frac işlemiyle aynıdır
+    exact = (q / _POW10[p]).view(np.int64) == values.view(np.int64)
+    exc_rows = np.flatnonzero(~exact)
+    if len(exc_rows) > len(values) * _MAX_EXCEPTION_RATIO:
+        return None
+    if len(exc_rows):
+        # İstisna hücreleri önceki değeri tekrarlar, fark büyümesin
+        last = np.where(exact, np.arange(len(q)), 0)
+        q = q[np.maximum.accumulate(last)]
+
+    deltas = np.diff(q, prepend=np.int64(0))
+    zz = ((deltas << 1) ^ (deltas >> 63)).view(np.uint64)
+    width = _width(zz)
+    return (
+        _COLUMN.pack(_QUANTIZED, p, width, len(exc_rows))
+        + exc_rows.astype("<u4").tobytes()
+        + values[exc_rows].astype("<f8").tobytes()
+        + _planes(zz, width)
+    )
+
+
+def _encode_xor(values: np.ndarray) -> bytes:
+    bits = values.view(np.uint64)
+    xored = bits ^ np.concatenate((np.zeros(1, dtype=np.uint64), bits[:-1]))
+    return _COLUMN.pack(_XOR, 0, 8, 0) + _planes(xored, 8)
+
+
+def _width(zz: np.ndarray) -> int:
+    top = int(zz.max()) if len(zz) else 0
+    for width in (1, 2, 4):
+        if top < 1 << (8 * width):
+            return width
+    return 8
+
+
+def _planes(zz: np.ndarray, width: int) -> bytes:
+    """Değerleri bayt düzlemlerine ayırır; yüksek baytlar çoğunlukla sıfırdır."""
+    packed = zz.astype(f"<u{width}").view(np.uint8).reshape(-1, width)
+    return packed.T.tobytes()
+
+
+# ============================================================
+#                       YAZMA
+# ============================================================
+class ArchiveWriter:
+    """
+    Satır bloklarını (n, ncols) alır, ARCHIVE_BLOCK_ROWS dolunca bloğu yazar.
+
+    Dosya önce .part adıyla yazılır; close() dipnotu ekleyip yeniden
+    adlandırır, yarım arşiv hiçbir zaman asıl adla kalmaz.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        keys: List[str],
+        header: Optional[Dict] = None,
+        block_rows: int = ARCHIVE_BLOCK_ROWS,
+        codec: str = ARCHIVE_CODEC,
+        level: int = ARCHIVE_LEVEL,
+    ):
+        if "time_s" not in keys:
+            raise ValueError("Recording has no time_s column.")
+        self.path = path
+        self.keys = list(keys)
+        self.block_rows = block_rows
+        self.level = level
+        self._compress, _ = _codec(codec)
+        self._time_col = self.keys.index("time_s")
+        self._precision = [CSV_PRECISION.get(k, 3) for k in self.keys]
+
+        self.footer = dict(header or {})
+        self.footer.update(
+            version=ARCHIVE_VERSION,
+            codec=codec,
+            keys=self.keys,
+            precision=self._precision,
+            rows=0,
+            blocks=[],
+        )
+        self._pending: List[np.ndarray] = []
+        self._pending_rows = 0
+        self._tmp_path = path + ".part"
+        self.file = open(self._tmp_path, "wb")
+        self.file.write(ARCHIVE_MAGIC)
+
+    def append(self, rows: np.ndarray) -> None:
+        if rows.shape[1] != len(self.keys):
+            raise ValueError(f"Expected {len(self.keys)} columns, got {rows.shape[1]}.")
+        self._pending.append(rows)
+        self._pending_rows += len(rows)
+        while self._pending_rows >= self.block_rows:
+            rows = np.concatenate(self._pending)
+            self._write_block(rows[: self.block_rows])
+            rest = rows[self.block_rows :]
+            self._pending = [rest] if len(rest) else []
+            self._pending_rows = len(rest)
+
+    def close(self) -> None:
+        try:
+            if self._pending_rows:
+                self._write_block(np.concatenate(self._pending))
+            self._pending = []
+            offset = self.file.tell()
+            self.file.write(json.dumps(self.footer, default=str).encode("utf-8"))
+            self.file.write(_TRAILER.pack(offset, _TRAILER_MAGIC))
+            self.file.close()
+            os.replace(self._tmp_path, self.path)
+        except BaseException:
+            self.discard()
+            raise
+
+    def discard(self) -> None:
+        self.file.close()
+        if os.path.exists(self._tmp_path):
+            os.remove(self._tmp_path)
+
+    def _write_block(self, rows: np.ndarray) -> None:
+        sizes = []
+        offset = self.file.tell()
+        for col in range(len(self.keys)):
+            payload = self._compress(
+                encode_column(rows[:, col], self._precision[col]), self.level
+            )
+            self.file.write(payload)
+            sizes.append(len(payload))
+
+        t = rows[:, self._time_col]
+        t = t[np.isfinite(t)]
+        self.footer["blocks"].append(
+            {
+                "offset": offset,
+                "rows": len(rows),
+                "t0": float(t.min()) if len(t) else None,
+                "t1": float(t.max()) if len(t) else None,
+                "sizes": sizes,
+            }
+        )
+        self.footer["rows"] += len(rows)
+
+
+def archive_csv(
+    csv_path: str,
+    path: Optional[str] = None,
+    block_rows: int = ARCHIVE_BLOCK_ROWS,
+    codec: str = ARCHIVE_CODEC,
+    level: int = ARCHIVE_LEVEL,
+) -> Dict:
+    """
+    Segment CSV'sini arşivler (olay dosyası varsa dipnota eklenir).
+
+    {"path", "rows", "csv_bytes", "archive_bytes"} döndürür.
+    """
+    path = path or archive_path(csv_path)
+    with open(csv_path, "rb") as f:
+        header_names = f.readline().decode("utf-8", errors="ignore").strip().split(";")
+    header = {
+        "source": os.path.basename(csv_path),
+        "columns": [name.strip() for name in header_names],
+        "events": load_event_log(csv_path),
+    }
+    writer = ArchiveWriter(path, read_header(csv_path), header, block_rows, codec, level)
+    try:
+        for rows in iter_row_chunks(csv_path):
+            writer.append(rows)
+    except BaseException:
+        writer.discard()
+        raise
+    writer.close()
+    return {
+        "path": path,
+        "rows": writer.footer["rows"],
+        "csv_bytes": os.path.getsize(csv_path),
+        "archive_bytes": os.path.getsize(path),
+    }
+
+
+# ============================================================
+#                       OKUMA
+# ============================================================
+class SegmentArchive:
+    """
+    Arşivi salt-okunur açar; yalnızca istenen blok ve kanallar çözülür.
+
+    Dönen sözlükler csv_importer.import_csv ile aynı biçimdedir
+    (kanal anahtarı -> float64 dizi).
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            if self._file.read(len(ARCHIVE_MAGIC)) != ARCHIVE_MAGIC:
+                raise ValueError(f"Not a segment archive: {path}")
+            self._file.seek(-_TRAILER.size, os.SEEK_END)
+            end = self._file.tell()
+            offset, magic = _TRAILER.unpack(self._file.read(_TRAILER.size))
+            if magic != _TRAILER_MAGIC or not len(ARCHIVE_MAGIC) <= offset <= end:
+                raise ValueError(f"Segment archive is incomplete: {path}")
+            self._file.seek(offset)
+            self.footer = json.loads(self._file.read(end - offset).decode("utf-8"))
+            if self.footer.get("version") != ARCHIVE_VERSION:
+                raise ValueError(f"Unsupported archive version: {self.footer.get('version')}")
+            _, self._decompress = _codec(self.footer["codec"])
+        except Exception:
+            self.close()
+            raise
+
+        self.keys: List[str] = self.footer["keys"]
+        self.blocks: List[Dict] = self.footer["blocks"]
+        self.events: List[Dict] = self.footer.get("events", [])
+
+    @property
+    def row_count(self) -> int:
+        return int(self.footer["rows"])
+
+    @property
+    def time_span(self):
+        t0 = [b["t0"] for b in self.blocks if b["t0"] is not None]
+        t1 = [b["t1"] for b in self.blocks if b["t1"] is not None]
+        return (min(t0), max(t1)) if t0 else (0.0, 0.0)
+
+    def read_block(self, index: int, keys: Optional[Iterable[str]] = None) -> Dict[str, np.ndarray]:
+        block = self.blocks[index]
+        wanted = self._columns(keys)
+        starts = np.concatenate(([0], np.cumsum(block["sizes"])))
+        self._file.seek(block["offset"])
+        data = self._file.read(int(starts[-1]))
+        return {
+            self.keys[col]: decode_column(
+                self._decompress(data[starts[col] : starts[col + 1]]), block["rows"]
+            )
+            for col in wanted
+        }
+
+    def read_range(
+        self, t0: float, t1: float, keys: Optional[Iterable[str]] = None
+    ) -> Dict[str, np.ndarray]:
+        """[t0, t1] aralığındaki satırlar; yalnızca kesişen bloklar okunur."""
+        keys = None if keys is None else set(keys) | {"time_s"}
+        wanted = [
+            i
+            for i, b in enumerate(self.blocks)
+            if b["t0"] is not None and b["t0"] <= t1 and b["t1"] >= t0
+        ]
+        columns = self._concat([self.read_block(i, keys) for i in wanted], keys)
+        t = columns["time_s"]
+        keep = (t >= t0) & (t <= t1)
+        return {key: values[keep] for key, values in columns.items()}
+
+    def read_columns(self, keys: Optional[Iterable[str]] = None) -> Dict[str, np.ndarray]:
+        """Tüm kayıt (import_csv karşılığı)."""
+        keys = None if keys is None else list(keys)
+        return self._concat(
+            [self.read_block(i, keys) for i in range(len(self.blocks))], keys
+        )
+
+    def write_csv(self, path: str) -> None:
+        """Kaydı CSV yazıcısının biçiminde (=12.345, kesintide boş hücre) geri yazar."""
+        names = self.footer.get("columns") or self.keys
+        formats = [f"={{:.{p}f}}" for p in self.footer["precision"]]
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            f.write(";".join(names) + "\r\n")
+            for i in range(len(self.blocks)):
+                block = self.read_block(i)
+                cells = []
+                for key, fmt in zip(self.keys, formats):
+                    values = block[key]
+                    cells.append(
+                        ["" if v != v else fmt.format(v) for v in values.tolist()]
+                    )
+                f.write("".join(";".join(row) + "\r\n" for row in zip(*cells)))
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _columns(self, keys) -> List[int]:
+        if keys is None:
+            return list(range(len(self.keys)))
+        return [col for col, key in enumerate(self.keys) if key in keys]
+
+    def _concat(self, parts: List[Dict], keys) -> Dict[str, np.ndarray]:
+        names = [self.keys[col] for col in self._columns(keys)]
+        return {
+            key: (np.concatenate([p[key] for p in parts]) if parts else np.empty(0))
+            for key in names
+        }
+
+
+def verify_archive(csv_path: str, path: str) -> bool:
+    """Arşivden çözülen her değer CSV'den içe aktarılanla bit düzeyinde aynı mı."""
+    from data.csv_importer import import_csv
+
+    original = import_csv(csv_path)
+    archive = SegmentArchive(path)
+    try:
+        restored = archive.read_columns()
+    finally:
+        archive.close()
+    if list(original) != list(restored):
+        return False
+    return all(
+        original[k].shape == restored[k].shape
+        and np.array_equal(original[k].view(np.int64), restored[k].view(np.int64))
+        for k in original
+    )
@@ -0,0 +1,246 @@
+"""
+Çökmeye dayanıklı segment günlüğü (<ad>_segmentN.<zaman>.gmkj).
+
+Segment CSV'sine giden her satır aynı zamanda yalnızca sona eklenen bu
+dosyaya yazılır:
+    GMKJRN1\\n
+    {"csv": ..., "segment": ..., "started": ..., ...}\\n   (JSON başlık)
+    parçalar: tür (1 bayt) + uzunluk (u32) + CRC32 (u32) + veri
+Parça türleri: R (CSV metni, satırlar bölünmeden), E (olay, JSON),
+X (temiz kapanış, JSON). Satırlar bellekte biriktirilir ve parça
+JOURNAL_CHUNK_BYTES dolunca veya JOURNAL_FLUSH_INTERVAL_S geçince
+işletim sistemine yazılır; fsync her satırda değil, ayrı bir thread'de
+en fazla JOURNAL_FSYNC_INTERVAL_S aralıkla yapılır. Çökme veya elektrik
+kesintisinde kayıp, son fsync'ten sonraki en fazla bu iki süre kadardır.
+
+Okuma (read_journal) ilk bozuk ya da yarım parçada durur; önceki parçalar
+CRC ile doğrulanmıştır. Kurtarma: python -m app.recover_journal
+"""
+
+import glob
+import json
+import os
+import struct
+import threading
+import time
+import zlib
+from typing import Dict, List, Optional
+
+from core.constants import (
+    JOURNAL_CHUNK_BYTES,
+    JOURNAL_FLUSH_INTERVAL_S,
+    JOURNAL_FSYNC_INTERVAL_S,
+)
+
+
+JOURNAL_MAGIC = b"GMKJRN1\n"
+JOURNAL_EXTENSION = ".gmkj"
+
+ROWS = b"R"
+EVENT = b"E"
+CLOSE = b"X"
+
+_CHUNK_HEADER = struct.Struct("<cII")  # tür, uzunluk, crc32
+
+
+def journal_path(csv_path: str, started: Optional[float] = None) -> str:
+    """Segment CSV'sinin yanındaki günlük; oturum zamanı ad çakışmasını önler."""
+    stamp = time.strftime(
+        "%Y%m%d-%H%M%S", time.localtime(time.time() if started is None else started)
+    )
+    return f"{os.path.splitext(csv_path)[0]}.{stamp}{JOURNAL_EXTENSION}"
+
+
+def find_journals(folder: str) -> List[str]:
+    """Klasörde kalmış (temiz kapanmamış) günlükler."""
+    return sorted(glob.glob(os.path.join(glob.escape(folder), "*" + JOURNAL_EXTENSION)))
+
+
+class SegmentJournal:
+    """
+    Bir segmentin sona eklenen günlüğü (UI thread'inden yazılır).
+
+    append_rows() yalnızca belleğe ekler; parça yazma boyut veya süre
+    bütçesi dolunca yapılır. fsync arka plandaki thread'dedir; disk
+    yavaş olsa da okuma/çizim akışı beklemez.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        header: Dict,
+        chunk_bytes: int = JOURNAL_CHUNK_BYTES,
+        flush_interval_s: float = JOURNAL_FLUSH_INTERVAL_S,
+        fsync_interval_s: float = JOURNAL_FSYNC_INTERVAL_S,
+    ):
+        self.path = path
+        self.chunk_bytes = chunk_bytes
+        self.flush_interval_s = flush_interval_s
+        self.file = open(path, "xb")
+        self.file.write(JOURNAL_MAGIC)
+        self.file.write(json.dumps(header).encode("utf-8") + b"\n")
+        self.file.flush()
+
+        self._buffer: List[str] = []
+        self._buffered = 0
+        self._t_flush = time.monotonic()
+        self.rows_bytes = 0
+
+        self._dirty = threading.Event()
+        self._dirty.set()  # başlık da diske inmeli
+        self._stop = threading.Event()
+        self._fsync_interval_s = fsync_interval_s
+        self._syncer = threading.Thread(
+            target=self._sync_loop, name="journal-fsync", daemon=True
+        )
+        self._syncer.start()
+
+    # ============================================================
+    #                       YAZMA
+    # ============================================================
+    def append_rows(self, text: str) -> None:
+        self._buffer.append(text)
+        self._buffered += len(text)
+        if (
+            self._buffered >= self.chunk_bytes
+            or time.monotonic() - self._t_flush >= self.flush_interval_s
+        ):
+            self.flush()
+
+    def append_event(self, event: Dict) -> None:
+        """Olay parçası hemen yazılır (önceki satırlardan sonra)."""
+        self.flush()
+        self._write_chunk(EVENT, json.dumps(event, default=str).encode("utf-8"))
+        self.file.flush()
+
+    def flush(self) -> None:
+        """Biriken satırları tek parça olarak işletim sistemine yazar."""
+        self._t_flush = time.monotonic()
+        if not self._buffer:
+            return
+        payload = "".join(self._buffer).encode("utf-8")
+        self._buffer = []
+        self._buffered = 0
+        self._write_chunk(ROWS, payload)
+        self.file.flush()
+        self.rows_bytes += len(payload)
+
+    def _write_chunk(self, kind: bytes, payload: bytes) -> None:
+        crc = zlib.crc32(kind + payload)
+        self.file.write(_CHUNK_HEADER.pack(kind, len(payload), crc))
+        self.file.write(payload)
+        self._dirty.set()
+
+    def _sync_loop(self):
+        while not self._stop.wait(self._fsync_interval_s):
+            if self._dirty.is_set():
+                self._dirty.clear()
+                try:
+                    os.fsync(self.file.fileno())
+                except (OSError, ValueError):
+                    return  # dosya kapandı
+
+    # ============================================================
+    #                       KAPANIŞ
+    # ============================================================
+    def close(self, summary: Optional[Dict] = None, discard: bool = False) -> None:
+        """
+        Temiz kapanış parçasını yazar ve günlüğü kapatır.
+
+        discard: CSV eksiksiz ve diske inmiş, günlük silinir.
+        """
+        self._stop.set()
+        self._syncer.join()
+        try:
+            self.flush()
+            self._write_chunk(CLOSE, json.dumps(summary or {}).encode("utf-8"))
+            self.file.flush()
+            if not discard:
+                os.fsync(self.file.fileno())
+            self.file.close()
+            if discard:
+                os.remove(self.path)
+        except OSError:
+            pass
+
+
+class JournaledFile:
+    """
+    csv.writer'a dosya olarak verilir: her yazma hem CSV'ye hem günlüğe gider.
+
+    close() CSV'yi fsync ile kapatır; ardından günlük temiz kapanır ve
+    discard ise silinir.
+    """
+
+    def __init__(self, file, journal: SegmentJournal, discard: bool = True):
+        self.file = file
+        self.journal = journal
+        self.discard = discard
+
+    def write(self, text: str) -> int:
+        self.journal.append_rows(text)
+        return self.file.write(text)
+
+    def flush(self) -> None:
+        self.file.flush()
+        self.journal.flush()
+
+    def close(self) -> None:
+        self.file.flush()
+        try:
+            os.fsync(self.file.fileno())
+            clean = True
+        except OSError:
+            clean = False
+        self.file.close()
+        self.journal.close({"rows_bytes": self.journal.rows_bytes}, self.discard and clean)
+
+
+# ============================================================
+#                       OKUMA / KURTARMA
+# ============================================================
+class JournalContents:
+    """read_journal sonucu: başlık, doğrulanmış CSV metni ve olaylar."""
+
+    __slots__ = ("header", "csv_text", "events", "closed", "chunks", "discarded_bytes")
+
+    def __init__(self, header: Dict):
+        self.header = header
+        self.csv_text = b""
+        self.events: List[Dict] = []
+        self.closed: Optional[Dict] = None  # temiz kapanış bilgisi
+        self.chunks = 0
+        self.discarded_bytes = 0
+
+
+def read_journal(path: str) -> JournalContents:
+    """Günlüğü okur; ilk bozuk veya yarım parçadan sonrası atılır."""
+    with open(path, "rb") as f:
+        if f.readline() != JOURNAL_MAGIC:
+            raise ValueError(f"Not a segment journal: {path}")
+        try:
+            header = json.loads(f.readline().decode("utf-8"))
+        except ValueError as e:
+            raise ValueError(f"Journal header is damaged: {e}") from e
+        data = f.read()
+
+    contents = JournalContents(header)
+    rows = []
+    pos = 0
+    size = _CHUNK_HEADER.size
+    while pos + size <= len(data):
+        kind, length, crc = _CHUNK_HEADER.unpack_from(data, pos)
+        payload = data[pos + size : pos + size + length]
+        if len(payload) < length or zlib.crc32(kind + payload) != crc:
+            break
+        pos += size + length
+        contents.chunks += 1
+        if kind == ROWS:
+            rows.append(payload)
+        elif kind == EVENT:
+            contents.events.append(json.loads(payload.decode("utf-8")))
+        elif kind == CLOSE:
+            contents.closed = json.loads(payload.decode("utf-8"))
+    contents.discarded_bytes = len(data) - pos
+    contents.csv_text = b"".join(rows)
+    return contents
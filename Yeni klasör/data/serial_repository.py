@@ -1,69 +1,171 @@
+import base64
+import binascii
+from typing import Optional
+
+import numpy as np
 import serial
 
+from core.channels import AUX_CHANNELS_BY_KEY, AUX_WIRE_KEYS, WIRE_KEYS
+from domain.commands import CommandChannel
 from domain.ports import SerialPortReader
 
 
+BLOCK_PREFIX = b"BLK|"
+
+# "sim://" gibi URL'ler için pyserial işleyicileri data/protocol_<ad>.py'de
+if "data" not in serial.protocol_handler_packages:
+    serial.protocol_handler_packages.append("data")
+
+
+def open_serial(port: str, baudrate: int) -> serial.Serial:
+    """
+    Port adını (COM3, /dev/ttyUSB0) veya URL'yi (sim://) açar.
+
+    Açılamazsa serial.SerialException yükselir.
+    """
+    try:
+        return serial.serial_for_url(port, baudrate=baudrate, timeout=0.1)
+    except ValueError as e:  # bilinmeyen URL şeması / geçersiz ayar
+        raise serial.SerialException(str(e)) from e
+
+
+def parse_status(line: str) -> dict:
+    """
+    STATUS yanıt satırını sensör -> durum sözlüğüne çevirir.
+
+    STATUS => V:READY, LC:READY, T:ERROR, I:READY, RPM:NO_RESPONSE
+    veya
+    STATUS | V:READY | LC:READY | T:ERROR | I:READY | RPM:NO_RESPONSE
+    """
+    status = {}
+
+    # "STATUS" kelimesini çıkar
+    cleaned = line.replace("STATUS", "", 1).strip()
+
+    # Ayraçları temizle: =>, |, ,
+    cleaned = cleaned.replace("=>", "").replace("|", ",")
+
+    # Her parçayı işle
+    parts = [p.strip() for p in cleaned.split(",") if p.strip()]
+
+    for part in parts:
+        if ":" in part:
+            key, value = part.split(":", 1)
+            key = key.strip()
+            value = value.strip()
+
+            # Boş değer kontrolü
+            if value and key:
+                status[key] = value
+
+    return status
+
+
 class SerialRepository(SerialPortReader):
     """Repository responsible for reading and parsing data from a serial port."""
 
-    def __init__(self, ser: serial.Serial):
+    def __init__(self, ser: serial.Serial, commands: Optional[CommandChannel] = None):
         self.ser = ser
+        # Giden komutlar ve yanıt eşleştirme (yalnızca okuma thread'inden)
+        self.commands = commands
+        # Yarım kalan son satır (bir sonraki okumada tamamlanır)
+        self._pending = b""
+        # Çözülmüş blok çerçeveleri: (kanal, seq, float32 örnekler)
+        self._blocks: list = []
 
     def read_available(self) -> list[dict]:
-        """Read all available lines from serial and return parsed value dicts."""
+        """
+        Read all available lines from serial and return parsed value dicts.
+
+        Bekleyen baytlar tek read() ile alınır (pyserial readline() bayt bayt
+        okur ve kHz'lik blok verisinde yetişemez). Blok çerçeveleri örnek
+        sözlüklerine dönüştürülmeden ayrılır; take_blocks() ile alınır.
+        """
         results: list[dict] = []
         if not self.ser or not self.ser.is_open:
             return results
 
         try:
-            while self.ser.in_waiting:
-                raw = self.ser.readline().decode("utf-8", errors="ignore").strip()
-                if not raw:
-                    break
-                values = self._parse_line(raw)
-                if values:
-                    results.append(values)
+            waiting = self.ser.in_waiting
+            if not waiting:
+                return results
+            data = self._pending + self.ser.read(waiting)
         except serial.SerialException as exc:
             # Surface the exception so callers can handle disconnect/error logic.
             raise exc
 
+        lines = data.split(b"\n")
+        self._pending = lines.pop()
+        for raw in lines:
+            if raw.startswith(BLOCK_PREFIX):
+                self._parse_block(raw)
+                continue
+            line = raw.decode("utf-8", errors="ignore").strip()
+            if not line:
+                continue
+            if self.commands is not None and self.commands.match_reply(line):
+                continue
+            values = self._parse_line(line)
+            if values:
+                results.append(values)
+
         return results
 
+    def write_pending(self) -> None:
+        """Kuyruktaki komutları tek write() ile gönderir (SerialException yükselir)."""
+        if self.commands is None or not self.ser or not self.ser.is_open:
+            return
+        data = self.commands.take_outgoing()
+        if data:
+            self.ser.write(data)
+            self.ser.flush()
+            self.commands.confirm_written()
+
+    def take_blocks(self) -> list:
+        """Son okumalardan biriken blok çerçevelerini döndürür ve boşaltır."""
+        blocks, self._blocks = self._blocks, []
+        return blocks
+
+    def _parse_block(self, raw: bytes) -> None:
+        """
+        BLK|<önek>|<seq>|<base64 int16 LE> çerçevesini çözer.
+
+        Bilinmeyen kanal veya bozuk çerçeve sessizce atlanır; kayıp çerçeve
+        seq atlamasından AuxStream tarafında anlaşılır.
+        """
+        parts = raw.strip().split(b"|", 3)
+        if len(parts) != 4:
+            return
+        key = AUX_WIRE_KEYS.get(parts[1].decode("ascii", errors="ignore"))
+        if key is None:
+            return
+        try:
+            seq = int(parts[2])
+            payload = base64.b64decode(parts[3], validate=True)
+        except (ValueError, binascii.Error):
+            return
+        if not payload or len(payload) % 2:
+            return
+        samples = np.frombuffer(payload, dtype="<i2").astype(np.float32)
+        samples *= AUX_CHANNELS_BY_KEY[key].scale
+        self._blocks.append((key, seq, samples))
+
     def _parse_line(self, line: str) -> dict:
         """
         Parse incoming serial data line
 
-        FORMAT 1 - Sensor Status Response:
+        FORMAT 1 - Sensor Status Response (bekleyen STATUS? isteği yoksa):
         STATUS => V:READY, LC:READY, T:ERROR, I:READY, RPM:NO_RESPONSE
-        veya
-        STATUS | V:READY | LC:READY | T:ERROR | I:READY | RPM:NO_RESPONSE
 
         FORMAT 2 - Normal Data:
         V=12.34 | Weight(kg)=0.56 | T=25.3 | I=1.2 | RPM=5000 | ...
+
+        (FORMAT 3 - blok çerçeveleri "BLK|..." read_available içinde ayrılır)
         """
 
         # -------- SENSOR STATUS LINE --------
         if line.startswith("STATUS"):
-            status = {}
-
-            # "STATUS" kelimesini çıkar
-            cleaned = line.replace("STATUS", "", 1).strip()
-
-            # Ayraçları temizle: =>, |, ,
-            cleaned = cleaned.replace("=>", "").replace("|", ",")
-
-            # Her parçayı işle
-            parts = [p.strip() for p in cleaned.split(",") if p.strip()]
-
-            for part in parts:
-                if ":" in part:
-                    key, value = part.split(":", 1)
-                    key = key.strip()
-                    value = value.strip()
-
-                    # Boş değer kontrolü
-                    if value and key:
-                        status[key] = value
+            status = parse_status(line)
 
             # En az bir sensör verisi varsa döndür
             if status:
@@ -87,38 +189,16 @@ class SerialRepository(SerialPortReader):
             except ValueError:
                 return None
 
+        # "<önek>=<değer>" parçaları; önek -> kanal eşlemesi kanal kaydından
         for part in parts:
-            if part.startswith("V="):
-                v = extract_float(part)
-                if v is not None:
-                    data["voltage"] = v
-            elif part.startswith("Weight(kg)="):
-                w = extract_float(part)
-                if w is not None:
-                    data["thrust_kgf"] = w
-            elif part.startswith("T="):
-                t = extract_float(part)
-                if t is not None:
-                    data["temperature"] = t
-            elif part.startswith("I="):
-                i = extract_float(part)
-                if i is not None:
-                    data["current"] = i
-            elif part.startswith("RPM="):
-                rpm = extract_float(part)
-                if rpm is not None:
-                    data["rpm"] = rpm
-            elif part.startswith("P_elec="):
-                p = extract_float(part)
-                if p is not None:
-                    data["power"] = p
-            elif part.startswith("PTEff="):
-                eff = extract_float(part)
-                if eff is not None:
-                    data["pt_eff"] = eff
-            elif part.startswith("TPA="):
-                tpa = extract_float(part)
-                if tpa is not None:
-                    data["tpa"] = tpa
-
-        return data
\ No newline at end of file
+            prefix, sep, _ = part.partition("=")
+            if not sep:
+                continue
+            key = WIRE_KEYS.get(prefix.strip())
+            if key is None:
+                continue
+            value = extract_float(part)
+            if value is not None:
+                data[key] = value
+
+        return data
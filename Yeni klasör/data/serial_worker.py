@@ -0,0 +1,108 @@
+import time
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from domain.commands import CommandChannel
+from domain.ports import SAMPLE_TIME_KEY, RealtimeTask, SerialPortReader
+
+
+class SerialWorker(QThread):
+    """
+    Seri hattın tek sahibi: okuma, ayrıştırma ve komut yazma bu thread'de.
+
+    Hat kısa aralıkla yoklanır; komut gönderildiğinde beklemeden uyanılır,
+    böylece throttle set noktaları ve yanıt zaman aşımları UI yükünden
+    bağımsızdır. Ayrıştırılan örnekler ve blok çerçeveleri biriktirilip UI
+    thread'ine EMIT_INTERVAL_S aralıkla toplu iletilir (çizim örnek başına
+    yapıldığından UI'a gönderim sıklığı eski okuma zamanlayıcısıyla aynıdır).
+
+    Her örnek sözlüğüne satırın okunduğu monotonic an SAMPLE_TIME_KEY ile
+    yazılır; UI, CSV ve dedektörler zamanı buradan alır, böylece paketleme
+    ve UI gecikmesi zaman eksenini kaydırmaz.
+
+    Gerçek zamanlı görevler (sequencer vb.) her turda tick() ile çalıştırılır
+    ve yeni örnekleri UI'dan önce on_samples() ile görür; thread bir sonraki
+    görev vadesinden fazla uyumaz.
+    """
+
+    POLL_INTERVAL_S = 0.005
+    EMIT_INTERVAL_S = 0.1
+
+    batch_ready = pyqtSignal(list, list)       # örnek sözlükleri, blok çerçeveleri
+    results_ready = pyqtSignal(list)           # CommandResult listesi
+    connection_lost = pyqtSignal(str)
+
+    def __init__(
+        self, repo: SerialPortReader, commands: CommandChannel, parent=None
+    ):
+        super().__init__(parent)
+        self.repo = repo
+        self.commands = commands
+        # Kopyala-değiştir: UI thread'i listeyi değiştirir, worker okur
+        self._tasks: list = []
+
+    def add_task(self, task: RealtimeTask):
+        self._tasks = self._tasks + [task]
+        self.commands.wake()
+
+    def remove_task(self, task: RealtimeTask):
+        self._tasks = [t for t in self._tasks if t is not task]
+
+    def stop(self):
+        """Thread'i durdurur; kuyrukta kalan komutlar (örn. STOP) önce yazılır."""
+        self.requestInterruption()
+        self.commands.wake()
+        self.wait(2000)
+
+    def run(self):
+        batch: list = []
+        blocks: list = []
+        last_emit = time.monotonic()
+        error = None
+        try:
+            while not self.isInterruptionRequested():
+                now = time.monotonic()
+                deadline = now + self.POLL_INTERVAL_S
+                tasks = self._tasks
+                for task in tasks:
+                    due = task.tick(now)
+                    if due is not None and due < deadline:
+                        deadline = due
+
+                self.repo.write_pending()
+                values = self.repo.read_available()
+                if values:
+                    now = time.monotonic()
+                    for v in values:
+                        v[SAMPLE_TIME_KEY] = now
+                    if tasks:
+                        for task in tasks:
+                            task.on_samples(values, now)
+                        self.repo.write_pending()  # iptal komutu beklemeden
+                    batch.extend(values)
+                new_blocks = self.repo.take_blocks()
+                if new_blocks:
+                    blocks.extend(new_blocks)
+
+                results = self.commands.take_results()
+                if results:
+                    self.results_ready.emit(results)
+
+                now = time.monotonic()
+                if (batch or blocks) and now - last_emit >= self.EMIT_INTERVAL_S:
+                    self.batch_ready.emit(batch, blocks)
+                    batch, blocks = [], []
+                    last_emit = now
+
+                if not values and not new_blocks:
+                    self.commands.wait(max(0.0, deadline - time.monotonic()))
+
+            self.repo.write_pending()
+        except OSError as e:
+            # SerialException da OSError'dır; USB sökülünce ioctl EIO verir
+            error = str(e)
+
+        if batch or blocks:
+            self.batch_ready.emit(batch, blocks)
+        if error is not None:
+            self.connection_lost.emit(error)
@@ -0,0 +1,144 @@
+"""
+Yüksek hızlı (blok çerçeveli) kanallar için halka tampon.
+
+Temel telemetri örnek başına sözlük olarak işlenirken hızlı kanallar
+(titreşim vb.) yalnızca NumPy blokları olarak taşınır: her çerçeve tek
+kopya ile tampona yazılır, görüntüleme sabit aralıkla ve vektörize
+(min/max zarf, son N örnek) yapılır. Böylece kHz'lik veri temel kanalların
+gecikmesini etkilemez.
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+SEQ_MODULO = 65536
+BUFFER_SECONDS = 30.0
+
+
+class AuxStream:
+    """
+    Tek bir hızlı kanalın örnek tamponu ve zaman ekseni.
+
+    Örnek i'nin zamanı t0 + i / rate_hz'dir (segment zamanı, s). t0 ilk
+    çerçevenin varış zamanından geriye doğru hesaplanır; kayıp çerçeveler
+    (seq atlaması) ve bağlantı kesintileri NaN örneklerle doldurulur, böylece
+    zaman ekseni kaymaz ve grafik/kayıt bu noktada bölünür.
+    """
+
+    def __init__(
+        self, key: str, rate_hz: float, buffer_seconds: float = BUFFER_SECONDS
+    ):
+        self.key = key
+        self.rate_hz = float(rate_hz)
+        self.capacity = max(1, int(rate_hz * buffer_seconds))
+        self._buf = np.full(self.capacity, np.nan, dtype=np.float32)
+        self.reset()
+
+    @property
+    def nbytes(self) -> int:
+        return self._buf.nbytes
+
+    def reset(self):
+        self._buf.fill(np.nan)
+        self.count = 0          # segment başından beri toplam örnek (NaN dahil)
+        self.t0: Optional[float] = None
+        self.dropped_frames = 0
+        self._next_seq: Optional[int] = None
+        self._frame_len = 0
+
+    def mark_gap(self):
+        """Bağlantı kesildi: sonraki çerçeve seq yerine varış zamanına hizalanır."""
+        self._next_seq = None
+
+    def push(self, seq: int, samples: np.ndarray, t_arrival: float) -> np.ndarray:
+        """
+        Bir çerçeveyi tampona ekler.
+
+        Dönen dizi tampona eklenen kesintisiz parçadır (varsa başta NaN
+        dolgusu + örnekler); kayıt dosyasına aynen yazılır.
+        """
+        n = len(samples)
+        if n == 0:
+            return samples
+
+        if self.t0 is None:
+            self.t0 = t_arrival - n / self.rate_hz
+            start = 0
+        elif self._next_seq is None or self._frame_len != n:
+            # Kesinti sonrası (veya çerçeve boyu değişti): varış zamanına hizala
+            start = max(self.count, round((t_arrival - self.t0) * self.rate_hz) - n)
+        else:
+            missed = (seq - self._next_seq) % SEQ_MODULO
+            if missed > SEQ_MODULO // 2:
+                missed = 0  # geri sayan seq: firmware yeniden başladı
+            self.dropped_frames += missed
+            start = self.count + missed * n
+
+        self._next_seq = (seq + 1) % SEQ_MODULO
+        self._frame_len = n
+
+        fill = start - self.count
+        if fill > 0:
+            chunk = np.concatenate((np.full(fill, np.nan, dtype=np.float32), samples))
+        else:
+            chunk = np.asarray(samples, dtype=np.float32)
+        self._write(chunk)
+        return chunk
+
+    def _write(self, chunk: np.ndarray):
+        n = len(chunk)
+        if n >= self.capacity:
+            chunk = chunk[-self.capacity :]
+            self._buf[:] = np.roll(chunk, self.count + n)
+            self.count += n
+            return
+        pos = self.count % self.capacity
+        first = min(n, self.capacity - pos)
+        self._buf[pos : pos + first] = chunk[:first]
+        self._buf[: n - first] = chunk[first:]
+        self.count += n
+
+    # ============================================================
+    #                       OKUMA
+    # ============================================================
+    def latest(self, n: int) -> Tuple[float, np.ndarray]:
+        """Son n örnek (kronolojik) ve ilk örneğin zamanı."""
+        n = min(n, self.count, self.capacity)
+        end = self.count % self.capacity
+        if n <= end:
+            values = self._buf[end - n : end].copy()
+        else:
+            values = np.concatenate((self._buf[end - n :], self._buf[:end]))
+        t_first = (self.t0 or 0.0) + (self.count - n) / self.rate_hz
+        return t_first, values
+
+    def envelope(
+        self, seconds: float, n_bins: int
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Son `seconds` saniyenin kova başına min/max zarfı.
+
+        Dönüş: (kova merkez zamanları, min, max); tamamı NaN olan kovalar
+        NaN döner (kesinti).
+        """
+        n = int(seconds * self.rate_hz)
+        t_first, values = self.latest(n)
+        per_bin = max(1, len(values) // max(1, n_bins))
+        usable = (len(values) // per_bin) * per_bin
+        if usable == 0:
+            empty = np.empty(0)
+            return empty, empty, empty
+
+        # Baştaki artık örnekler atılır, kova sınırları sona hizalı kalır
+        skip = len(values) - usable
+        blocks = values[skip:].reshape(-1, per_bin)
+        # fmin/fmax NaN'ı yok sayar, tamamı NaN kovada uyarısız NaN verir
+        mins = np.fmin.reduce(blocks, axis=1)
+        maxs = np.fmax.reduce(blocks, axis=1)
+        centers = (
+            t_first
+            + (skip + per_bin * (np.arange(len(blocks)) + 0.5)) / self.rate_hz
+        )
+        return centers, mins, maxs
@@ -0,0 +1,324 @@
+"""
+X-Y karakteristik eğrileri (thrust-RPM, thrust-güç, verim-throttle).
+
+Her çift için yalnızca sabit sayıda kova tutulur: x aralığı eşit
+genişlikte kovalara bölünür, her kovada örnek sayısı ile x, y ve y²
+toplamları birikir. Ham noktalar saklanmadığından segment ne kadar uzun
+olursa olsun bellek sabittir; kova ortalamaları ve yayılımı her an
+hazırdır, model uydurma (polinom / kuvvet yasası) kova ortalamaları
+üzerinde sayılarla ağırlıklı yapılır.
+
+Aralık kanalın tipik aralığıyla başlar; bir kovadan daha uzakta dışarı
+düşen bir örnek gelirse aralık o yönde ikiye katlanır ve komşu kovalar
+birleştirilir, böylece kova sayısı değişmez.
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core.channels import CHANNELS_BY_KEY
+from core.constants import (
+    CHARACTERISTIC_BINS,
+    CHARACTERISTIC_MAX_OVERLAYS,
+    CHARACTERISTIC_MIN_COUNT,
+    CHARACTERISTIC_PAIRS,
+)
+
+
+# Kanal olmayan eksen: komut verilen throttle (%), canlı akışta batch'le verilir
+THROTTLE_KEY = "throttle"
+
+FIT_MODELS = ("linear", "poly2", "poly3", "power")
+
+
+def axis_label(key: str) -> str:
+    if key == THROTTLE_KEY:
+        return "Throttle (%)"
+    ch = CHANNELS_BY_KEY.get(key)
+    return ch.title if ch else key
+
+
+def axis_range(key: str) -> Tuple[float, float]:
+    if key == THROTTLE_KEY:
+        return 0.0, 100.0
+    ch = CHANNELS_BY_KEY.get(key)
+    lo, hi = ch.range if ch else (0.0, 1.0)
+    return (float(lo), float(hi)) if hi > lo else (float(lo), float(lo) + 1.0)
+
+
+# ============================================================
+#                       MODEL UYDURMA
+# ============================================================
+class CurveFit:
+    """Uydurulmuş model: katsayılar, R² ve değerlendirme."""
+
+    __slots__ = ("model", "coeffs", "r2", "x_range")
+
+    def __init__(self, model: str, coeffs: np.ndarray, r2: float, x_range):
+        self.model = model
+        self.coeffs = coeffs
+        self.r2 = r2
+        self.x_range = x_range
+
+    def evaluate(self, xs: np.ndarray) -> np.ndarray:
+        xs = np.asarray(xs, dtype=np.float64)
+        if self.model == "power":
+            a, b = self.coeffs
+            with np.errstate(invalid="ignore", divide="ignore"):
+                return a * np.power(xs, b)
+        return np.polyval(self.coeffs, xs)
+
+    def curve(self, n: int = 200) -> Tuple[np.ndarray, np.ndarray]:
+        xs = np.linspace(self.x_range[0], self.x_range[1], n)
+        return xs, self.evaluate(xs)
+
+    def label(self) -> str:
+        if self.model == "power":
+            a, b = self.coeffs
+            text = f"y = {a:.4g}·x^{b:.3g}"
+        else:
+            terms = []
+            deg = len(self.coeffs) - 1
+            for i, c in enumerate(self.coeffs):
+                p = deg - i
+                terms.append(f"{c:.4g}" + ("" if p == 0 else "·x" if p == 1 else f"·x^{p}"))
+            text = "y = " + " + ".join(terms).replace("+ -", "- ")
+        return f"{text}  (R² {self.r2:.4f})"
+
+
+def fit_curve(
+    xs: np.ndarray, ys: np.ndarray, counts: np.ndarray, model: str
+) -> Optional[CurveFit]:
+    """
+    Kova ortalamalarına modeli uydurur (ağırlık: √örnek sayısı).
+
+    power: y = a·x^b, log-log doğrusal uydurma; yalnızca x, y > 0 kovalar.
+    Yeterli kova yoksa None.
+    """
+    xs = np.asarray(xs, dtype=np.float64)
+    ys = np.asarray(ys, dtype=np.float64)
+    w = np.sqrt(np.asarray(counts, dtype=np.float64))
+
+    if model == "power":
+        ok = (xs > 0) & (ys > 0)
+        if ok.sum() < 3:
+            return None
+        b, log_a = np.polyfit(np.log(xs[ok]), np.log(ys[ok]), 1, w=w[ok])
+        coeffs = np.array([np.exp(log_a), b])
+        fit = CurveFit(model, coeffs, 0.0, (float(xs[ok].min()), float(xs[ok].max())))
+        xs, ys, w = xs[ok], ys[ok], w[ok]
+    else:
+        deg = {"linear": 1, "poly2": 2, "poly3": 3}.get(model)
+        if deg is None:
+            raise ValueError(f"unknown fit model: {model!r}")
+        if len(xs) < deg + 2:
+            return None
+        coeffs = np.polyfit(xs, ys, deg, w=w)
+        fit = CurveFit(model, coeffs, 0.0, (float(xs.min()), float(xs.max())))
+
+    # R² (sayılarla ağırlıklı, kova ortalamaları üzerinde)
+    weights = w * w
+    mean = np.average(ys, weights=weights)
+    ss_tot = float(np.sum(weights * (ys - mean) ** 2))
+    ss_res = float(np.sum(weights * (ys - fit.evaluate(xs)) ** 2))
+    fit.r2 = 1.0 - ss_res / ss_tot if ss_tot > 0 else 1.0
+    return fit
+
+
+# ============================================================
+#                       ARTIMLI KOVALAR
+# ============================================================
+class CharacteristicCurve:
+    """Bir (x, y) çiftinin kova istatistikleri; örnekler vektör olarak eklenir."""
+
+    def __init__(
+        self,
+        x_key: str,
+        y_key: str,
+        bins: int = CHARACTERISTIC_BINS,
+        x_range: Optional[Tuple[float, float]] = None,
+    ):
+        self.x_key = x_key
+        self.y_key = y_key
+        self.bins = max(2, int(bins) + int(bins) % 2)  # birleştirme için çift
+        self.lo, self.hi = x_range or axis_range(x_key)
+        self._count = np.zeros(self.bins, dtype=np.int64)
+        self._sum_x = np.zeros(self.bins)
+        self._sum_y = np.zeros(self.bins)
+        self._sum_y2 = np.zeros(self.bins)
+
+    @property
+    def total(self) -> int:
+        return int(self._count.sum())
+
+    @property
+    def nbytes(self) -> int:
+        return (
+            self._count.nbytes + self._sum_x.nbytes
+            + self._sum_y.nbytes + self._sum_y2.nbytes
+        )
+
+    def reset(self):
+        self.lo, self.hi = axis_range(self.x_key)
+        for arr in (self._count, self._sum_x, self._sum_y, self._sum_y2):
+            arr.fill(0)
+
+    def feed(self, xs: np.ndarray, ys: np.ndarray) -> int:
+        """Sonlu (x, y) çiftlerini kovalara ekler; eklenen örnek sayısı."""
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        ok = np.isfinite(xs) & np.isfinite(ys)
+        if not ok.all():
+            xs, ys = xs[ok], ys[ok]
+        if len(xs) == 0:
+            return 0
+
+        # Sınırın bir kova içindeki taşmalar (sıfır civarı gürültü) uç
+        # kovaya yazılır; aralık yalnızca bundan uzaktaki örnekler için büyür
+        x_min, x_max = float(xs.min()), float(xs.max())
+        while x_max >= self.hi + (self.hi - self.lo) / self.bins:
+            self._expand(up=True)
+        while x_min < self.lo - (self.hi - self.lo) / self.bins:
+            self._expand(up=False)
+
+        idx = ((xs - self.lo) * (self.bins / (self.hi - self.lo))).astype(np.intp)
+        np.clip(idx, 0, self.bins - 1, out=idx)
+        self._count += np.bincount(idx, minlength=self.bins)
+        self._sum_x += np.bincount(idx, weights=xs, minlength=self.bins)
+        self._sum_y += np.bincount(idx, weights=ys, minlength=self.bins)
+        self._sum_y2 += np.bincount(idx, weights=ys * ys, minlength=self.bins)
+        return len(xs)
+
+    def _expand(self, up: bool):
+        """Aralığı bir yönde ikiye katlar; komşu kova çiftleri birleşir."""
+        span = self.hi - self.lo
+        half = self.bins // 2
+        for arr in (self._count, self._sum_x, self._sum_y, self._sum_y2):
+            merged = arr[0::2] + arr[1::2]
+            arr.fill(0)
+            if up:
+                arr[:half] = merged
+            else:
+                arr[half:] = merged
+        if up:
+            self.hi += span
+        else:
+            self.lo -= span
+
+    def points(
+        self, min_count: int = CHARACTERISTIC_MIN_COUNT
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Dolu kovalar: (x ortalaması, y ortalaması, y std, örnek sayısı)."""
+        filled = self._count >= max(1, min_count)
+        n = self._count[filled].astype(np.float64)
+        mean_x = self._sum_x[filled] / n
+        mean_y = self._sum_y[filled] / n
+        var = np.maximum(self._sum_y2[filled] / n - mean_y * mean_y, 0.0)
+        return mean_x, mean_y, np.sqrt(var), self._count[filled]
+
+    def fit(
+        self, model: str, min_count: int = CHARACTERISTIC_MIN_COUNT
+    ) -> Optional[CurveFit]:
+        xs, ys, _std, counts = self.points(min_count)
+        return fit_curve(xs, ys, counts, model)
+
+    def copy(self) -> "CharacteristicCurve":
+        other = CharacteristicCurve(self.x_key, self.y_key, self.bins, (self.lo, self.hi))
+        other._count[:] = self._count
+        other._sum_x[:] = self._sum_x
+        other._sum_y[:] = self._sum_y
+        other._sum_y2[:] = self._sum_y2
+        return other
+
+
+PairKey = Tuple[str, str]
+
+
+class CharacteristicSet:
+    """
+    Yapılandırılmış tüm çiftlerin eğrileri (bir segment).
+
+    feed_batch() okuma thread'inin ilettiği örnek sözlüklerini, feed_columns()
+    kayıttan okunan sütun dizilerini işler; ikisi de çift başına tek bincount.
+    """
+
+    def __init__(self, pairs: Sequence[PairKey] = CHARACTERISTIC_PAIRS, label: str = ""):
+        self.label = label
+        self.curves: Dict[PairKey, CharacteristicCurve] = {
+            (x, y): CharacteristicCurve(x, y) for x, y in pairs
+        }
+        self._keys = sorted({k for pair in self.curves for k in pair} - {THROTTLE_KEY})
+
+    @property
+    def total(self) -> int:
+        return max((c.total for c in self.curves.values()), default=0)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(c.nbytes for c in self.curves.values())
+
+    def reset(self):
+        for curve in self.curves.values():
+            curve.reset()
+
+    def feed_batch(self, batch: List[Dict], throttle: Optional[float] = None) -> None:
+        nan = float("nan")
+        columns = {
+            key: np.fromiter(
+                (nan if (v := values.get(key)) is None else v for values in batch),
+                dtype=np.float64,
+                count=len(batch),
+            )
+            for key in self._keys
+        }
+        if throttle is not None:
+            columns[THROTTLE_KEY] = np.full(len(batch), float(throttle))
+        self.feed_columns(columns)
+
+    def feed_columns(self, columns: Dict[str, np.ndarray]) -> None:
+        for (x_key, y_key), curve in self.curves.items():
+            xs = columns.get(x_key)
+            ys = columns.get(y_key)
+            if xs is not None and ys is not None:
+                curve.feed(xs, ys)
+
+    def copy(self, label: Optional[str] = None) -> "CharacteristicSet":
+        other = CharacteristicSet((), self.label if label is None else label)
+        other.curves = {pair: c.copy() for pair, c in self.curves.items()}
+        other._keys = list(self._keys)
+        return other
+
+
+class CharacteristicSession:
+    """
+    Canlı segmentin eğrileri + üst üste çizilecek önceki segmentler.
+
+    Segment bitince canlı küme kopyalanıp katmanlara eklenir (en fazla
+    CHARACTERISTIC_MAX_OVERLAYS; en eski düşer). Kayıttan okunan
+    segmentler de aynı listeye eklenir.
+    """
+
+    def __init__(self, pairs: Sequence[PairKey] = CHARACTERISTIC_PAIRS):
+        self.pairs = tuple(pairs)
+        self.live = CharacteristicSet(self.pairs, "Live")
+        self.overlays: List[CharacteristicSet] = []
+
+    @property
+    def nbytes(self) -> int:
+        return self.live.nbytes + sum(s.nbytes for s in self.overlays)
+
+    def start_segment(self):
+        self.live.reset()
+
+    def finish_segment(self, label: str):
+        if self.live.total > 0:
+            self.add_overlay(self.live.copy(label))
+        self.live.reset()
+
+    def add_overlay(self, curves: CharacteristicSet):
+        self.overlays.append(curves)
+        del self.overlays[:-CHARACTERISTIC_MAX_OVERLAYS]
+
+    def clear_overlays(self):
+        self.overlays = []
@@ -0,0 +1,293 @@
+"""
+Cihaza giden komutlar ve yanıt eşleştirme.
+
+Tüm yazmalar okuma thread'i (data/serial_worker.py) üzerinden yapılır:
+UI thread'i komutu CommandChannel'a bırakır, worker bir sonraki turda
+(beklemeden uyanarak) seri hatta yazar ve gelen satırları bekleyen
+isteklerle eşleştirir.
+
+Tel formatı (satır tabanlı, firmware'in mevcut STATUS? komutuyla uyumlu):
+    STATUS?            -> STATUS => V:READY, LC:READY, ...
+    THR <yüzde>        (throttle/ESC set noktası, yanıt beklenmez)
+    STOP               (motoru hemen durdur, yanıt beklenmez)
+    ERR <komut> [açıklama]   firmware hata yanıtı
+Yanıt bekleyen istekler gönderim sırasıyla (FIFO) yanıt önekine göre
+eşleşir; zaman aşımına uğrayanlar TIMEOUT sonucu üretir.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, List, Optional
+
+from core.constants import COMMAND_TIMEOUT_S
+
+# Sonuç durumları
+OK = "ok"
+ERROR = "error"
+TIMEOUT = "timeout"
+FAILED = "failed"
+
+
+class Command:
+    """
+    Tek bir cihaz komutu.
+
+    line: seri hatta gönderilen metin (satır sonu eklenir)
+    reply_prefix: yanıt satırının öneki; None ise komut yanıtsızdır ve
+        yazıldığı anda tamamlanmış sayılır
+    coalesce: gönderilmemiş aynı adlı komutun yerine geçer (set noktaları:
+        yalnızca en güncel değer önemlidir)
+    urgent: kuyruğun başına alınır ve bekleyen set noktalarını siler
+    motion: motoru hareket ettirebilir; güvenlik kilidi açıkken reddedilir
+    on_written: satır porta yazılınca okuma thread'inde çağrılır (zaman)
+    """
+
+    __slots__ = (
+        "name",
+        "line",
+        "reply_prefix",
+        "timeout_s",
+        "coalesce",
+        "urgent",
+        "motion",
+        "on_written",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        line: str,
+        reply_prefix: Optional[str] = None,
+        timeout_s: float = COMMAND_TIMEOUT_S,
+        coalesce: bool = False,
+        urgent: bool = False,
+        motion: bool = False,
+        on_written: Optional[Callable[[float], None]] = None,
+    ):
+        self.name = name
+        self.line = line
+        self.reply_prefix = reply_prefix
+        self.timeout_s = timeout_s
+        self.coalesce = coalesce
+        self.urgent = urgent
+        self.motion = motion
+        self.on_written = on_written
+
+    def __repr__(self):
+        return f"Command({self.line!r})"
+
+
+def status_request() -> Command:
+    return Command("STATUS", "STATUS?", reply_prefix="STATUS")
+
+
+def throttle_setpoint(percent: float) -> Command:
+    percent = min(100.0, max(0.0, float(percent)))
+    return Command("THR", f"THR {percent:.1f}", coalesce=True, motion=True)
+
+
+def motor_stop(on_written: Optional[Callable[[float], None]] = None) -> Command:
+    return Command("STOP", "STOP", urgent=True, on_written=on_written)
+
+
+class CommandResult:
+    """Yanıt bekleyen bir isteğin sonucu (UI thread'ine iletilir)."""
+
+    __slots__ = ("request_id", "name", "status", "reply", "latency_s")
+
+    def __init__(
+        self,
+        request_id: int,
+        name: str,
+        status: str,
+        reply: str = "",
+        latency_s: Optional[float] = None,
+    ):
+        self.request_id = request_id
+        self.name = name
+        self.status = status
+        self.reply = reply
+        self.latency_s = latency_s
+
+    @property
+    def ok(self) -> bool:
+        return self.status == OK
+
+    def __repr__(self):
+        return f"CommandResult({self.request_id}, {self.name!r}, {self.status!r})"
+
+
+class _Request:
+    __slots__ = ("request_id", "command", "sent_at")
+
+    def __init__(self, request_id: int, command: Command):
+        self.request_id = request_id
+        self.command = command
+        self.sent_at: Optional[float] = None
+
+
+class CommandChannel:
+    """
+    Thread güvenli komut kuyruğu ve istek/yanıt eşleştirici.
+
+    submit() herhangi bir thread'den çağrılabilir; take_outgoing(),
+    confirm_written(), match_reply() ve take_results() okuma thread'i
+    tarafından çağrılır.
+
+    Güvenlik kilidi (lock_out) açıkken motoru hareket ettiren komutlar
+    (motion) kuyruğa alınmaz; kilit yalnızca clear_lockout() ile kalkar.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # Kuyruk ile aynı kilit: uyandırma koşulu (kuyruk dolu ya da wake())
+        # kilit altında denetlenir, bekleme ile bildirim arasında kaybolmaz
+        self._wake = threading.Condition(self._lock)
+        self._woken = False
+        self._next_id = 1
+        self._queue: Deque[_Request] = deque()
+        self._in_flight: List[_Request] = []
+        self._results: List[CommandResult] = []
+        self._written_hooks: List[Callable[[float], None]] = []
+        self.locked_out: Optional[str] = None  # kilit nedeni
+
+    def lock_out(self, reason: str) -> None:
+        """Hareket komutlarını engeller ve henüz yazılmamış olanları siler."""
+        with self._lock:
+            self.locked_out = reason
+            self._queue = deque(r for r in self._queue if not r.command.motion)
+
+    def clear_lockout(self) -> None:
+        with self._lock:
+            self.locked_out = None
+
+    def submit(self, command: Command) -> int:
+        """
+        Komutu kuyruğa alır ve okuma thread'ini uyandırır; istek no döndürür.
+
+        Kilit açıkken hareket komutu reddedilir ve 0 döner.
+        """
+        with self._lock:
+            if command.motion and self.locked_out is not None:
+                return 0
+            request = _Request(self._next_id, command)
+            self._next_id += 1
+            if command.urgent:
+                # Bekleyen set noktaları durdurma komutundan sonra gitmemeli
+                self._queue = deque(r for r in self._queue if not r.command.coalesce)
+                self._queue.appendleft(request)
+            elif command.coalesce:
+                self._queue = deque(
+                    r for r in self._queue if r.command.name != command.name
+                )
+                self._queue.append(request)
+            else:
+                self._queue.append(request)
+            self._wake.notify_all()
+        return request.request_id
+
+    def wait(self, timeout: float) -> None:
+        """Yeni komut gelene veya süre dolana kadar bekler (okuma thread'i)."""
+        with self._wake:
+            self._wake.wait_for(lambda: self._queue or self._woken, timeout)
+            self._woken = False
+
+    def wake(self) -> None:
+        with self._wake:
+            self._woken = True
+            self._wake.notify_all()
+
+    def take_outgoing(self, now: Optional[float] = None) -> bytes:
+        """Kuyruktaki komutları tek yazma için birleştirir ve uçuşa alır."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            if not self._queue:
+                return b""
+            requests, self._queue = list(self._queue), deque()
+            for request in requests:
+                request.sent_at = now
+                if request.command.reply_prefix is not None:
+                    self._in_flight.append(request)
+                if request.command.on_written is not None:
+                    self._written_hooks.append(request.command.on_written)
+        return b"".join(
+            request.command.line.encode("ascii") + b"\n" for request in requests
+        )
+
+    def confirm_written(self, now: Optional[float] = None) -> None:
+        """Son take_outgoing() baytları porta yazıldı: on_written kancaları."""
+        if not self._written_hooks:
+            return
+        now = time.monotonic() if now is None else now
+        hooks, self._written_hooks = self._written_hooks, []
+        for hook in hooks:
+            hook(now)
+
+    def match_reply(self, line: str, now: Optional[float] = None) -> bool:
+        """
+        Satır bekleyen bir isteğin yanıtıysa sonucu kaydeder ve True döner.
+
+        Eşleşmeyen satırlar (telemetri, istenmemiş STATUS) normal
+        ayrıştırmaya devam eder.
+        """
+        if not self._in_flight:
+            return False
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            status = OK
+            for request in self._in_flight:
+                if line.startswith(request.command.reply_prefix):
+                    break
+            else:
+                if not line.startswith("ERR"):
+                    return False
+                name = line[3:].strip().split(" ", 1)[0]
+                for request in self._in_flight:
+                    if request.command.name == name:
+                        break
+                else:
+                    return False
+                status = ERROR
+
+            self._in_flight.remove(request)
+            self._results.append(
+                CommandResult(
+                    request.request_id,
+                    request.command.name,
+                    status,
+                    line,
+                    now - request.sent_at,
+                )
+            )
+        return True
+
+    def take_results(self, now: Optional[float] = None) -> List[CommandResult]:
+        """Tamamlanan ve zaman aşımına uğrayan isteklerin sonuçları."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            expired = [
+                r for r in self._in_flight if now - r.sent_at >= r.command.timeout_s
+            ]
+            for request in expired:
+                self._in_flight.remove(request)
+                self._results.append(
+                    CommandResult(request.request_id, request.command.name, TIMEOUT)
+                )
+            results, self._results = self._results, []
+        return results
+
+    def cancel_all(self, reason: str = "") -> List[CommandResult]:
+        """Bağlantı kapandı: bekleyen tüm isteklerin FAILED sonuçları."""
+        with self._lock:
+            pending = [
+                r for r in self._queue if r.command.reply_prefix is not None
+            ] + self._in_flight
+            self._queue.clear()
+            self._in_flight = []
+            results = self._results + [
+                CommandResult(r.request_id, r.command.name, FAILED, reason)
+                for r in pending
+            ]
+            self._results = []
+        return results
@@ -0,0 +1,344 @@
+import math
+from typing import Dict, List, Optional
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from domain.ports import SAMPLE_TIME_KEY
+
+_scipy_sosfilt = None
+_scipy_checked = False
+
+
+def _sosfilt():
+    """
+    Varsa C hızında kaskad biquad (scipy.signal.sosfilt), yoksa None.
+
+    scipy.signal'in importu yüzlerce ms sürebildiğinden açılışta değil ilk
+    IIR paketi filtrelenirken yapılır.
+    """
+    global _scipy_sosfilt, _scipy_checked
+    if not _scipy_checked:
+        _scipy_checked = True
+        try:
+            from scipy.signal import sosfilt as _scipy_sosfilt
+        except ImportError:
+            _scipy_sosfilt = None
+    return _scipy_sosfilt
+
+
+class StreamFilter:
+    """Paketler arasında durumunu koruyan akış filtresi arayüzü."""
+
+    def process(self, x: np.ndarray) -> np.ndarray:
+        raise NotImplementedError
+
+    def reset(self):
+        raise NotImplementedError
+
+
+# ============================================================
+#                   FIR / SIRA İSTATİSTİĞİ
+# ============================================================
+class MovingAverageFilter(StreamFilter):
+    """n örneklik kayan ortalama (ilk n-1 örnekte mevcut örneklerin ortalaması)."""
+
+    def __init__(self, n: int):
+        self.n = max(1, int(n))
+        self.reset()
+
+    def reset(self):
+        self._tail = np.empty(0)
+
+    def process(self, x: np.ndarray) -> np.ndarray:
+        data = np.concatenate((self._tail, x))
+        csum = np.concatenate(([0.0], np.cumsum(data)))
+        start = len(self._tail)
+        idx = np.arange(start, len(data))
+        lo = np.maximum(0, idx + 1 - self.n)
+        y = (csum[idx + 1] - csum[lo]) / (idx + 1 - lo)
+        self._tail = data[-(self.n - 1):] if self.n > 1 else np.empty(0)
+        return y
+
+
+class MedianFilter(StreamFilter):
+    """n örneklik kayan medyan; tek seferlik sıçramaları (spike) bastırır."""
+
+    def __init__(self, n: int):
+        self.n = max(1, int(n))
+        self.reset()
+
+    def reset(self):
+        self._tail = np.empty(0)
+
+    def process(self, x: np.ndarray) -> np.ndarray:
+        if len(self._tail) < self.n - 1:
+            # Isınma: pencereyi ilk örnekle doldur
+            first = self._tail[0] if len(self._tail) else x[0]
+            self._tail = np.concatenate(
+                (np.full(self.n - 1 - len(self._tail), first), self._tail)
+            )
+        data = np.concatenate((self._tail, x))
+        y = np.median(sliding_window_view(data, self.n), axis=1)
+        self._tail = data[len(data) - (self.n - 1):]
+        return y
+
+
+# ============================================================
+#                   IIR (KASKAD BİQUAD / SOS)
+# ============================================================
+class SosFilter(StreamFilter):
+    """
+    İkinci dereceden bölümler (SOS) kaskadı, direct form II transposed.
+
+    sos satırları scipy düzenindedir: [b0, b1, b2, 1, a1, a2].
+    İlk örnekte durum, o değerde kararlı rejime oturtulur; böylece
+    filtre sıfırdan yükselen bir geçiş üretmez.
+
+    scipy yoksa paket örnek başına döngü yerine durum-uzay blokları ile
+    süzülür: kaskadın BLOCK örneklik yanıtı bir kez matrislere açılır
+    (ilk durumdan çıkışa O, girişten çıkışa alt üçgen T, girişten son
+    duruma K) ve her blok iki matris-vektör çarpımıdır. Durum scipy ile
+    aynı düzendedir (bölüm başına z1, z2), paketler arasında korunur.
+
+    retune() katsayıları akış ortasında değiştirir; durum son çıkış
+    değerinde kararlı rejime oturtulur, böylece çıkış sıçramaz.
+    """
+
+    BLOCK = 64
+
+    def __init__(self, sos: np.ndarray):
+        self.sos = np.asarray(sos, dtype=np.float64)
+        self._blocks = None
+        self.reset()
+
+    def reset(self):
+        self._zi: Optional[np.ndarray] = None
+        self._last: Optional[float] = None
+
+    def retune(self, sos: np.ndarray):
+        self.sos = np.asarray(sos, dtype=np.float64)
+        self._blocks = None
+        self._zi = None if self._last is None else self._steady_state(self._last)
+
+    def process(self, x: np.ndarray) -> np.ndarray:
+        x = np.asarray(x, dtype=np.float64)
+        if self._zi is None:
+            self._zi = self._steady_state(float(x[0]))
+        y = self._filter(x)
+        self._last = float(y[-1])
+        return y
+
+    def _filter(self, x: np.ndarray) -> np.ndarray:
+        sosfilt = _sosfilt()
+        if sosfilt is not None:
+            y, self._zi = sosfilt(self.sos, x, zi=self._zi)
+            return y
+
+        if self._blocks is None:
+            self._blocks = self._state_space_blocks()
+        powers, obs, toeplitz, ctrl = self._blocks
+        n = self.BLOCK
+
+        z = self._zi.reshape(-1)
+        y = np.empty(len(x))
+        for start in range(0, len(x), n):
+            xb = x[start:start + n]
+            r = len(xb)
+            y[start:start + r] = obs[:r] @ z + toeplitz[:r, :r] @ xb
+            z = powers[r] @ z + ctrl[:, n - r:] @ xb
+        self._zi = z.reshape(-1, 2)
+        return y
+
+    def _step(self, z: np.ndarray, x: float):
+        """Kaskadın tek örneği (DF2T); matrisleri kurmak için kullanılır."""
+        z = z.reshape(-1, 2).copy()
+        for s, (b0, b1, b2, _a0, a1, a2) in enumerate(self.sos):
+            z1, z2 = z[s]
+            y = b0 * x + z1
+            z[s] = (b1 * x - a1 * y + z2, b2 * x - a2 * y)
+            x = y
+        return x, z.reshape(-1)
+
+    def _state_space_blocks(self):
+        n_state = 2 * len(self.sos)
+        eye = np.eye(n_state)
+        a = np.empty((n_state, n_state))
+        c = np.empty(n_state)
+        for j in range(n_state):
+            c[j], a[:, j] = self._step(eye[j], 0.0)
+        d, b = self._step(np.zeros(n_state), 1.0)
+
+        n = self.BLOCK
+        powers = np.empty((n + 1, n_state, n_state))
+        powers[0] = eye
+        for k in range(1, n + 1):
+            powers[k] = a @ powers[k - 1]
+
+        obs = c @ powers[:n]                          # (n, n_state): C·A^k
+        impulse = np.empty(n)
+        impulse[0] = d
+        impulse[1:] = (c @ powers[: n - 1]) @ b        # C·A^(k-1)·B
+        lag = np.subtract.outer(np.arange(n), np.arange(n))
+        toeplitz = np.where(lag >= 0, impulse[np.maximum(lag, 0)], 0.0)
+        ctrl = (powers[n - 1::-1] @ b).T               # (n_state, n): A^(n-1-k)·B
+        return powers, obs, toeplitz, ctrl
+
+    def _steady_state(self, x0: float) -> np.ndarray:
+        zi = np.zeros((len(self.sos), 2))
+        x = x0
+        for s, (b0, b1, b2, _a0, a1, a2) in enumerate(self.sos):
+            y = x * (b0 + b1 + b2) / (1.0 + a1 + a2)
+            zi[s, 1] = b2 * x - a2 * y
+            zi[s, 0] = y - b0 * x
+            x = y
+        return zi
+
+
+def ema_sos(alpha: float) -> np.ndarray:
+    """y[n] = alpha*x[n] + (1-alpha)*y[n-1] tek bölümlük SOS olarak."""
+    return np.array([[alpha, 0.0, 0.0, 1.0, -(1.0 - alpha), 0.0]])
+
+
+def butterworth_lowpass_sos(order: int, cutoff_hz: float, fs_hz: float) -> np.ndarray:
+    """
+    Alçak geçiren Butterworth tasarımı (bilineer dönüşüm, ön-bükmeli).
+
+    Eşlenik kutup çiftleri birer biquad, tek dereceli tasarımda kalan gerçek
+    kutup birinci dereceden bölüm olur; her bölümün DC kazancı 1'dir.
+    """
+    if not 0.0 < cutoff_hz < fs_hz / 2.0:
+        raise ValueError("cutoff_hz must be between 0 and fs_hz / 2")
+
+    k = 2.0 * fs_hz
+    wa = k * math.tan(math.pi * cutoff_hz / fs_hz)
+
+    sections = []
+    for i in range(order // 2):
+        p = wa * complex(
+            math.cos(math.pi * (2 * i + order + 1) / (2 * order)),
+            math.sin(math.pi * (2 * i + order + 1) / (2 * order)),
+        )
+        z = (k + p) / (k - p)
+        a1 = -2.0 * z.real
+        a2 = abs(z) ** 2
+        gain = (1.0 + a1 + a2) / 4.0
+        sections.append([gain, 2.0 * gain, gain, 1.0, a1, a2])
+
+    if order % 2:
+        z = (k - wa) / (k + wa)
+        gain = (1.0 - z) / 2.0
+        sections.append([gain, gain, 0.0, 1.0, -z, 0.0])
+
+    return np.array(sections)
+
+
+def build_filter(spec: Dict, fs_hz: float) -> StreamFilter:
+    """
+    Konfigürasyondan filtre üretir. Örnekler:
+      {"type": "moving_average", "n": 5}
+      {"type": "median", "n": 5}
+      {"type": "ema", "alpha": 0.3}
+      {"type": "butterworth", "order": 2, "cutoff_hz": 2.0}
+    """
+    kind = spec.get("type")
+    if kind == "moving_average":
+        return MovingAverageFilter(spec.get("n", 5))
+    if kind == "median":
+        return MedianFilter(spec.get("n", 5))
+    if kind == "ema":
+        return SosFilter(ema_sos(spec.get("alpha", 0.3)))
+    if kind == "butterworth":
+        return SosFilter(_butterworth_sos(spec, fs_hz))
+    raise ValueError(f"Unknown filter type: {kind!r}")
+
+
+def _butterworth_sos(spec: Dict, fs_hz: float) -> np.ndarray:
+    return butterworth_lowpass_sos(spec.get("order", 2), spec.get("cutoff_hz", 2.0), fs_hz)
+
+
+class FilterStage:
+    """
+    Parser ile tüketiciler arasındaki filtre katmanı.
+
+    Her okuma paketinde yapılandırılmış kanallar için paketteki mevcut
+    örnekler tek dizi halinde filtrelenir. Ham değer kanalın kendi
+    anahtarında kalır (log, istatistik, türetilmiş kanallar ham veriyi
+    kullanır); filtrelenmiş değer "<kanal>_filt" anahtarına yazılır ve
+    grafik / canlı panelde gösterilir.
+
+    Örnekleme hızı fs_hz ile başlar, sonra örneklerin okuma damgalarından
+    (SAMPLE_TIME_KEY) RATE_WINDOW_S pencerelerinde ölçülür. Ölçülen hız
+    tasarım hızından RATE_TOLERANCE oranından fazla saparsa frekansa bağlı
+    filtreler (butterworth) yeni hızla yeniden tasarlanır.
+    """
+
+    FILT_SUFFIX = "_filt"
+    RATE_WINDOW_S = 2.0
+    RATE_TOLERANCE = 0.2
+
+    def __init__(self, config: Optional[Dict[str, Dict]] = None, fs_hz: float = 10.0):
+        self.config = dict(config or {})
+        self.fs_hz = fs_hz
+        self.filters: Dict[str, StreamFilter] = {
+            key: build_filter(spec, fs_hz) for key, spec in self.config.items()
+        }
+        self._reset_rate()
+
+    @property
+    def filtered_keys(self) -> List[str]:
+        return [key + self.FILT_SUFFIX for key in self.filters]
+
+    def reset(self):
+        for f in self.filters.values():
+            f.reset()
+        self._reset_rate()
+
+    def _reset_rate(self):
+        self._rate_t0: Optional[float] = None
+        self._rate_count = 0
+
+    def apply(self, batch: List[Dict]) -> None:
+        if not self.filters:
+            return
+        self._measure_rate(batch)
+        for key, flt in self.filters.items():
+            samples = [v for v in batch if key in v]
+            if not samples:
+                continue
+
+            raw = np.fromiter(
+                (v[key] for v in samples), dtype=np.float64, count=len(samples)
+            )
+            filtered = flt.process(raw)
+            for v, y in zip(samples, filtered.tolist()):
+                v[key + self.FILT_SUFFIX] = y
+
+    def _measure_rate(self, batch: List[Dict]):
+        stamp = batch[-1].get(SAMPLE_TIME_KEY)
+        if stamp is None:
+            return
+        if self._rate_t0 is None:
+            # Bu paketin örnekleri pencere başlangıcında okunmuştur
+            self._rate_t0 = stamp
+            return
+        self._rate_count += sum(1 for v in batch if not self.filters.keys().isdisjoint(v))
+        span = stamp - self._rate_t0
+        if span < self.RATE_WINDOW_S:
+            return
+        measured = self._rate_count / span
+        self._rate_t0, self._rate_count = stamp, 0
+        if measured > 0 and abs(measured - self.fs_hz) > self.RATE_TOLERANCE * self.fs_hz:
+            self.retune(measured)
+
+    def retune(self, fs_hz: float):
+        """Frekansa bağlı filtreleri fs_hz için yeniden tasarlar (durum korunur)."""
+        self.fs_hz = fs_hz
+        for key, spec in self.config.items():
+            if spec.get("type") != "butterworth":
+                continue
+            try:
+                sos = _butterworth_sos(spec, fs_hz)
+            except ValueError:
+                continue  # kesim bu hızın Nyquist sınırını aşıyor; önceki tasarım kalır
+            self.filters[key].retune(sos)
@@ -0,0 +1,189 @@
+"""
+Süreç belleği bütçesi.
+
+Bellekte büyüyebilen yapılar (canlı grafik tamponları, hızlı kanal
+tamponları, spektrogram, açık kaydın piramidi) MemoryBudget'a ad, boyut
+fonksiyonu ve küçültme fonksiyonuyla kaydolur. check() periyodik olarak
+süreç RSS'ini ölçer, en yüksek değeri tutar ve RSS sınırı aşılmışsa
+tüketicileri küçültür: önce diskte karşılığı olanlar (yeniden okunabilen
+kayıt piramidi seviyeleri), sonra en büyükten başlayarak canlı tamponlar.
+
+RSS okuma bağımlılıksızdır: Linux'ta /proc, Windows'ta
+GetProcessMemoryInfo; ikisi de yoksa yalnızca tepe değer (getrusage).
+"""
+
+import os
+import sys
+from typing import Callable, Dict, List, Optional
+
+from core.constants import MEMORY_MAX_RSS_MB
+
+
+MB = 1024 * 1024
+
+
+# ============================================================
+#                       RSS ÖLÇÜMÜ
+# ============================================================
+def process_rss() -> Optional[int]:
+    """Sürecin şu anki RSS'i (bayt); ölçülemiyorsa None."""
+    if sys.platform.startswith("linux"):
+        return _proc_status("VmRSS")
+    if sys.platform == "win32":
+        counters = _win_memory_counters()
+        return None if counters is None else int(counters.WorkingSetSize)
+    return None
+
+
+def peak_rss() -> Optional[int]:
+    """Süreç başından beri en yüksek RSS (bayt)."""
+    if sys.platform.startswith("linux"):
+        return _proc_status("VmHWM")
+    if sys.platform == "win32":
+        counters = _win_memory_counters()
+        return None if counters is None else int(counters.PeakWorkingSetSize)
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024  # macOS: bayt
+
+
+def _proc_status(field: str) -> Optional[int]:
+    try:
+        with open(f"/proc/{os.getpid()}/status", "rb") as f:
+            for line in f:
+                if line.startswith(field.encode() + b":"):
+                    return int(line.split()[1]) * 1024  # kB
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def _win_memory_counters():
+    import ctypes
+    from ctypes import wintypes
+
+    class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+        _fields_ = [
+            ("cb", wintypes.DWORD),
+            ("PageFaultCount", wintypes.DWORD),
+            ("PeakWorkingSetSize", ctypes.c_size_t),
+            ("WorkingSetSize", ctypes.c_size_t),
+            ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+            ("PagefileUsage", ctypes.c_size_t),
+            ("PeakPagefileUsage", ctypes.c_size_t),
+        ]
+
+    counters = PROCESS_MEMORY_COUNTERS()
+    counters.cb = ctypes.sizeof(counters)
+    try:
+        kernel32 = ctypes.WinDLL("kernel32")
+        process = kernel32.GetCurrentProcess()
+        ok = kernel32.K32GetProcessMemoryInfo(
+            process, ctypes.byref(counters), counters.cb
+        )
+    except (AttributeError, OSError):
+        return None
+    return counters if ok else None
+
+
+# ============================================================
+#                       BÜTÇE
+# ============================================================
+class _Consumer:
+    __slots__ = ("name", "nbytes", "shrink", "spillable")
+
+    def __init__(self, name, nbytes, shrink, spillable):
+        self.name = name
+        self.nbytes = nbytes
+        self.shrink = shrink
+        self.spillable = spillable
+
+
+class MemoryBudget:
+    """
+    Kayıtlı bellek tüketicileri ve RSS sınırı (UI thread'inden kullanılır).
+
+    nbytes(): tüketicinin şu anki boyutu. shrink(): boyutunu küçültür
+    (yaklaşık yarıya; taban değerinin altına inmez). spillable: verinin
+    diskte karşılığı var, bırakmak yalnızca yeniden okuma maliyetidir.
+    """
+
+    def __init__(self, max_rss_mb: float = MEMORY_MAX_RSS_MB):
+        self.max_rss_bytes = int(max_rss_mb * MB)
+        self._consumers: List[_Consumer] = []
+        self.rss: Optional[int] = None
+        self.peak_rss: Optional[int] = None
+        self.peak_accounted = 0
+        self.shrink_count = 0
+
+    def register(
+        self,
+        name: str,
+        nbytes: Callable[[], int],
+        shrink: Optional[Callable[[], None]] = None,
+        spillable: bool = False,
+    ) -> None:
+        self.unregister(name)
+        self._consumers.append(_Consumer(name, nbytes, shrink, spillable))
+
+    def unregister(self, name: str) -> None:
+        self._consumers = [c for c in self._consumers if c.name != name]
+
+    def usage(self) -> Dict[str, int]:
+        return {c.name: int(c.nbytes()) for c in self._consumers}
+
+    def check(self, rss: Optional[int] = None) -> bool:
+        """
+        Ölçer ve gerekirse küçültür; sınır aşıldıysa True.
+
+        rss verilmezse süreçten okunur (testte/benchmark'ta elle verilebilir).
+        """
+        rss = process_rss() if rss is None else rss
+        usage = self.usage()
+        self.peak_accounted = max(self.peak_accounted, sum(usage.values()))
+        self.rss = rss
+        if rss is None:
+            return False
+        self.peak_rss = max(self.peak_rss or 0, rss)
+        if rss <= self.max_rss_bytes:
+            return False
+        self._shrink(rss - self.max_rss_bytes, usage)
+        return True
+
+    def _shrink(self, excess: int, usage: Dict[str, int]) -> None:
+        order = sorted(
+            (c for c in self._consumers if c.shrink is not None),
+            key=lambda c: (not c.spillable, -usage.get(c.name, 0)),
+        )
+        freed = 0
+        for consumer in order:
+            if freed >= excess:
+                break
+            before = usage.get(consumer.name, 0)
+            consumer.shrink()
+            freed += max(0, before - int(consumer.nbytes()))
+        self.shrink_count += 1
+
+    def report(self) -> Dict:
+        """Anlık ölçüm özeti (MB): rss, peak_rss, sınır, tüketiciler."""
+        usage = self.usage()
+        return {
+            "rss_mb": _mb(self.rss),
+            "peak_rss_mb": _mb(self.peak_rss),
+            "process_peak_mb": _mb(peak_rss()),
+            "max_rss_mb": self.max_rss_bytes / MB,
+            "accounted_mb": sum(usage.values()) / MB,
+            "peak_accounted_mb": self.peak_accounted / MB,
+            "consumers_mb": {name: b / MB for name, b in usage.items()},
+            "shrinks": self.shrink_count,
+        }
+
+
+def _mb(value: Optional[int]) -> Optional[float]:
+    return None if value is None else value / MB
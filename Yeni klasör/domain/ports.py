@@ -1,4 +1,8 @@
-from typing import Protocol, List, Dict
+from typing import Protocol, List, Dict, Optional
+
+
+# Sample dict key holding the monotonic time the line was read (seconds)
+SAMPLE_TIME_KEY = "t"
 
 
 class SerialPortReader(Protocol):
@@ -8,3 +12,22 @@ class SerialPortReader(Protocol):
         """Return parsed value dictionaries for all available serial lines."""
         ...
 
+    def take_blocks(self) -> List:
+        """Return and clear decoded high-rate block frames (key, seq, samples)."""
+        ...
+
+    def write_pending(self) -> None:
+        """Write queued device commands (called from the reader thread)."""
+        ...
+
+
+class RealtimeTask(Protocol):
+    """Work run inside the serial reader thread (sequencer, limit checks)."""
+
+    def tick(self, now: float) -> Optional[float]:
+        """Do due work; return the next monotonic deadline or None."""
+        ...
+
+    def on_samples(self, batch: List[Dict], now: float) -> None:
+        """Inspect freshly parsed samples before they are sent to the UI."""
+        ...
@@ -0,0 +1,194 @@
+"""
+Gerçek zamanlı güvenlik sınırları: okuma thread'inde denetim ve kilitli durdurma.
+
+SafetyMonitor bir RealtimeTask'tır; SerialWorker gelen her örnek paketini
+UI'a göndermeden önce on_samples() ile buraya verir. Bir kanal
+SAFETY_DEBOUNCE_SAMPLES ardışık örnek boyunca sınır dışında kalırsa:
+- STOP kuyruğun başına alınır; aynı turda porta yazılır
+- CommandChannel kilitlenir: throttle set noktaları (elle veya sweep)
+  operatör yeniden kurana (rearm) kadar reddedilir
+- STOP satırı porta yazıldığında tespit -> yazma gecikmesiyle birlikte
+  TRIP olayı bildirilir
+
+Alarm, değer sınırın SAFETY_HYSTERESIS kadar içine dönünce temizlenir
+(CLEAR); kilit ise yalnızca tüm alarmlar temizken rearm() ile açılır.
+"""
+
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+from core.channels import CHANNELS_BY_KEY
+from core.constants import (
+    SAFETY_DEBOUNCE_SAMPLES,
+    SAFETY_HYSTERESIS,
+    SAFETY_LIMITS,
+)
+from domain.commands import CommandChannel, motor_stop
+
+# Olay türleri (notify)
+TRIP = "trip"
+CLEAR = "clear"
+
+
+class LimitRule:
+    """Tek kanalın alt/üst sınırı; histerezis ve debounce durumu."""
+
+    __slots__ = ("key", "lo", "hi", "hysteresis", "debounce", "active", "_count")
+
+    def __init__(
+        self,
+        key: str,
+        lo: Optional[float],
+        hi: Optional[float],
+        hysteresis: float = 0.0,
+        debounce: int = 1,
+    ):
+        self.key = key
+        self.lo = None if lo is None else float(lo)
+        self.hi = None if hi is None else float(hi)
+        self.hysteresis = float(hysteresis)
+        self.debounce = max(1, int(debounce))
+        self.active = False
+        self._count = 0
+
+    def reset(self):
+        self.active = False
+        self._count = 0
+
+    def update(self, v: float) -> Optional[str]:
+        """Örneği işler; alarm bu örnekte başladıysa TRIP, bittiyse CLEAR."""
+        if self.active:
+            h = self.hysteresis
+            if (self.hi is None or v <= self.hi - h) and (
+                self.lo is None or v >= self.lo + h
+            ):
+                self.active = False
+                self._count = 0
+                return CLEAR
+            return None
+
+        if self.violation(v) is None:
+            self._count = 0
+            return None
+        self._count += 1
+        if self._count >= self.debounce:
+            self.active = True
+            return TRIP
+        return None
+
+    def violation(self, v: float) -> Optional[Tuple[str, float]]:
+        """Sınır dışıysa (işleç, sınır), değilse None."""
+        if self.hi is not None and v > self.hi:
+            return ">", self.hi
+        if self.lo is not None and v < self.lo:
+            return "<", self.lo
+        return None
+
+
+def limit_text(key: str, value: float, op: str, limit: float) -> str:
+    ch = CHANNELS_BY_KEY[key]
+    return f"{ch.name} {value:.2f} {ch.unit} {op} {limit:g} {ch.unit}"
+
+
+def build_rules(
+    limits: Dict[str, Tuple[Optional[float], Optional[float]]],
+    hysteresis: Optional[Dict[str, float]] = None,
+    debounce: int = 1,
+) -> List[LimitRule]:
+    hysteresis = hysteresis or {}
+    rules = []
+    for key, (lo, hi) in limits.items():
+        if key not in CHANNELS_BY_KEY:
+            raise ValueError(f"Unknown limit channel: {key}")
+        rules.append(LimitRule(key, lo, hi, hysteresis.get(key, 0.0), debounce))
+    return rules
+
+
+class SafetyMonitor:
+    """
+    Kilitli (latched) güvenlik durdurması; okuma thread'inde çalışır.
+
+    notify(kind, info) okuma thread'inden çağrılır; UI tarafı kuyruklu
+    sinyal ile almalıdır. TRIP bilgisi: key, value, limit, reason,
+    t (örneğin okunduğu monotonic an), latency_ms (STOP yazılana kadar).
+    """
+
+    def __init__(
+        self,
+        commands: CommandChannel,
+        notify: Optional[Callable[[str, Dict], None]] = None,
+        limits: Dict[str, Tuple[Optional[float], Optional[float]]] = SAFETY_LIMITS,
+        hysteresis: Dict[str, float] = SAFETY_HYSTERESIS,
+        debounce: int = SAFETY_DEBOUNCE_SAMPLES,
+    ):
+        self.commands = commands
+        self.notify = notify or (lambda kind, info: None)
+        self.rules = build_rules(limits, hysteresis, debounce)
+        self._lock = threading.Lock()
+        self.tripped = False
+        self.latencies: List[float] = []
+
+    # ============================================================
+    #                       RealtimeTask
+    # ============================================================
+    def tick(self, now: float) -> Optional[float]:
+        return None
+
+    def on_samples(self, batch: List[Dict], now: float) -> None:
+        for values in batch:
+            for rule in self.rules:
+                v = values.get(rule.key)
+                if v is None:
+                    continue
+                event = rule.update(v)
+                if event == TRIP:
+                    self._trip(rule, v, now)
+                elif event == CLEAR:
+                    self.notify(CLEAR, {"key": rule.key, "value": v, "t": now})
+
+    def _trip(self, rule: LimitRule, v: float, now: float):
+        op, limit = rule.violation(v)
+        reason = limit_text(rule.key, v, op, limit)
+        info = {"key": rule.key, "value": v, "limit": limit, "reason": reason, "t": now}
+
+        def on_written(t_written: float):
+            latency_ms = 1000.0 * (t_written - now)
+            self.latencies.append(latency_ms)
+            info["latency_ms"] = latency_ms
+            self.notify(TRIP, info)
+
+        with self._lock:
+            self.tripped = True
+        self.commands.lock_out(reason)
+        # Kilit zaten açık olsa da STOP tekrarlanır: zararsızdır ve her
+        # olayın gecikmesi ölçülür
+        self.commands.submit(motor_stop(on_written=on_written))
+
+    # ============================================================
+    #                       OPERATÖR
+    # ============================================================
+    @property
+    def active_alarms(self) -> List[str]:
+        return [rule.key for rule in self.rules if rule.active]
+
+    def rearm(self) -> bool:
+        """Kilidi açar; sınır dışında kalan kanal varsa False (kilit sürer)."""
+        with self._lock:
+            if self.active_alarms:
+                return False
+            self.tripped = False
+        self.commands.clear_lockout()
+        return True
+
+    def reset(self):
+        """Bağlantı değişti: alarm durumları sıfırlanır (kilit korunur)."""
+        for rule in self.rules:
+            rule.reset()
+
+    def latency_stats(self) -> Dict:
+        lat = self.latencies
+        return {
+            "trips": len(lat),
+            "latency_ms_mean": sum(lat) / len(lat) if lat else 0.0,
+            "latency_ms_max": max(lat) if lat else 0.0,
+        }
@@ -0,0 +1,114 @@
+"""
+Canlı grafik tamponu: zaman (float64) + değer (float32) dizileri.
+
+Örnekler düz bir dizinin sonuna eklenir, eskiler başlangıç indeksi
+ilerletilerek atılır; dizi dolunca geçerli bölge başa kaydırılır veya
+kapasite max_samples'a kadar ikiye katlanır. Görünen veri her zaman tek
+parça olduğundan grafiğe kopyasız görünüm (view) verilir. Tampon hiçbir
+zaman max_samples'ı aşmaz; aşılırsa en eski örnekler düşer.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+
+class SampleBuffer:
+    """Bir kanalın zaman penceresi; bellek üst sınırı max_samples."""
+
+    BYTES_PER_SAMPLE = 12  # float64 zaman + float32 değer
+    MIN_CAPACITY = 1024
+
+    def __init__(self, max_samples: int, initial: int = MIN_CAPACITY):
+        self.max_samples = max(self.MIN_CAPACITY, int(max_samples))
+        capacity = min(max(1, int(initial)), self.max_samples)
+        self._t = np.empty(capacity, dtype=np.float64)
+        self._v = np.empty(capacity, dtype=np.float32)
+        self._start = 0
+        self._end = 0
+        self.dropped = 0  # kapasite yüzünden pencereden önce düşen örnekler
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    @property
+    def nbytes(self) -> int:
+        return self._t.nbytes + self._v.nbytes
+
+    def clear(self) -> None:
+        self._start = self._end = 0
+
+    def append(self, t: float, value: float) -> None:
+        if self._end == len(self._t):
+            self._make_room(1)
+        self._t[self._end] = t
+        self._v[self._end] = value
+        self._end += 1
+
+    def extend(self, ts: np.ndarray, values: np.ndarray) -> None:
+        n = len(ts)
+        if n > self.max_samples:
+            self.dropped += n - self.max_samples
+            ts, values = ts[-self.max_samples :], values[-self.max_samples :]
+            n = self.max_samples
+        if self._end + n > len(self._t):
+            self._make_room(n)
+        self._t[self._end : self._end + n] = ts
+        self._v[self._end : self._end + n] = values
+        self._end += n
+
+    def trim_before(self, t_min: float) -> None:
+        """Zamanı t_min'den küçük örnekleri atar (zaman artan sıradadır)."""
+        t = self._t[self._start : self._end]
+        self._start += int(np.searchsorted(t, t_min, side="left"))
+
+    def arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """(zaman, değer) görünümleri; bir sonraki eklemeye kadar geçerlidir."""
+        return self._t[self._start : self._end], self._v[self._start : self._end]
+
+    def since(self, t: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Zamanı t'den büyük örneklerin float64 kopyası."""
+        ts, vs = self.arrays()
+        i = int(np.searchsorted(ts, t, side="right"))
+        return ts[i:].copy(), vs[i:].astype(np.float64)
+
+    def shrink(self, max_samples: int) -> int:
+        """Üst sınırı düşürür (en eski örnekler atılır); serbest kalan bayt."""
+        before = self.nbytes
+        self.max_samples = max(self.MIN_CAPACITY, int(max_samples))
+        n = len(self)
+        if n > self.max_samples:
+            self.dropped += n - self.max_samples
+            self._start = self._end - self.max_samples
+        if len(self._t) > self.max_samples:
+            self._reallocate(self.max_samples)
+        return before - self.nbytes
+
+    def _make_room(self, n: int) -> None:
+        size = len(self)
+        capacity = len(self._t)
+        if size + n > self.max_samples:
+            # Tavan: en eski örnekleri düşür
+            drop = size + n - self.max_samples
+            self.dropped += drop
+            self._start += drop
+            size -= drop
+        if size + n <= capacity // 2 or capacity >= self.max_samples:
+            # Yer var: geçerli bölgeyi başa kaydır
+            self._t[:size] = self._t[self._start : self._end]
+            self._v[:size] = self._v[self._start : self._end]
+            self._start, self._end = 0, size
+        else:
+            grown = capacity
+            while grown < size + n:
+                grown *= 2
+            self._reallocate(min(max(grown, 2 * capacity), self.max_samples))
+
+    def _reallocate(self, capacity: int) -> None:
+        size = len(self)
+        t = np.empty(capacity, dtype=np.float64)
+        v = np.empty(capacity, dtype=np.float32)
+        t[:size] = self._t[self._start : self._end]
+        v[:size] = self._v[self._start : self._end]
+        self._t, self._v = t, v
+        self._start, self._end = 0, size
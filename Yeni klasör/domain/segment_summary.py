@@ -0,0 +1,203 @@
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from core.channels import CHANNEL_KEYS, CHANNELS
+
+
+# Segment istatistiklerinde takip edilen kanallar (kanal kaydının tamamı)
+STAT_KEYS = CHANNEL_KEYS
+
+_STAT_NAMES = {"avg": "Average", "min": "Min", "max": "Max"}
+
+
+def new_segment_stats(start_time: Optional[float]) -> Dict:
+    """Boş bir segment istatistik sözlüğü döndürür."""
+    return {
+        "start_time": start_time,
+        "end_time": None,
+        "count": 0,
+        "sum": {k: 0.0 for k in STAT_KEYS},
+        # Kanal başına değeri olan örnek sayısı (ortalamanın paydası; kesinti
+        # satırları ve eksik değerler sayılmaz)
+        "n": {k: 0 for k in STAT_KEYS},
+        "max": {k: None for k in STAT_KEYS},
+        "min": {k: None for k in STAT_KEYS},
+        # Bağlantı kesintileri: {"t_start", "t_end"} (segment zamanı, s)
+        "gaps": [],
+        # Güvenlik durdurmaları: {"t", "key", "value", "limit", "reason",
+        # "latency_ms"} (t segment zamanı, s)
+        "events": [],
+        # Segment boyunca ölçülen en yüksek süreç RSS'i (bayt; canlı test)
+        "peak_rss": None,
+    }
+
+
+def format_segment_summary(stats: Dict, title: str) -> List[str]:
+    """
+    Segment istatistiklerinden SummaryDialog metin satırlarını üretir.
+
+    Canlı test ve kayıttan açılan segmentler aynı özeti gösterir.
+    """
+    duration = (
+        stats["end_time"] - stats["start_time"] if stats["end_time"] else 0.0
+    )
+    n = stats["count"]
+
+    lines = []
+    lines.append(title)
+    lines.append(f"Duration: {duration:.2f} s")
+    lines.append(f"Sample count: {n}")
+    gaps = stats.get("gaps") or []
+    if gaps:
+        lost = sum(g["t_end"] - g["t_start"] for g in gaps)
+        lines.append(f"Connection gaps: {len(gaps)} (total {lost:.2f} s)")
+    events = stats.get("events") or []
+    if events:
+        latencies = [e["latency_ms"] for e in events if e.get("latency_ms") is not None]
+        text = f"Safety stops: {len(events)}"
+        if latencies:
+            text += f" (STOP written within {max(latencies):.1f} ms)"
+        lines.append(text)
+        for e in events:
+            lines.append(f"  {e['t']:.2f} s  {e.get('reason', '')}")
+    if stats.get("peak_rss"):
+        lines.append(f"Peak memory (RSS): {stats['peak_rss'] / 2**20:.0f} MB")
+    lines.append("")
+    for ch in CHANNELS:
+        if not ch.summary:
+            continue
+        unit = "" if ch.unit == ch.name else f" {ch.unit}"
+        for stat in ch.summary:
+            value = segment_average(stats, ch.key) if stat == "avg" else stats[stat].get(ch.key)
+            text = "--" if value is None else ch.format(value)
+            lines.append(f"{_STAT_NAMES[stat]} {ch.name}: {text}{unit}")
+        lines.append("")
+    return lines
+
+
+def segment_average(stats: Dict, key: str) -> Optional[float]:
+    """Kanalın segment ortalaması: toplam / kanalın kendi örnek sayısı."""
+    s = stats["sum"].get(key)
+    n = stats["n"].get(key, 0)
+    return (s / n) if (s is not None and n > 0) else None
+
+
+def stats_metrics(stats: Dict) -> Dict:
+    """
+    Canlı segment istatistiklerini compute_segment_metrics biçimine çevirir
+    (yüzdelikler olmadan); katalog dosyayı yeniden okumadan bunu yazar.
+    """
+    n = stats["count"]
+    metrics: Dict = {
+        "count": n,
+        "duration": (
+            stats["end_time"] - stats["start_time"] if stats["end_time"] else 0.0
+        ),
+    }
+    for key in STAT_KEYS:
+        if stats["max"].get(key) is None:
+            metrics[key] = None
+            continue
+        metrics[key] = {
+            "avg": segment_average(stats, key),
+            "min": stats["min"][key],
+            "max": stats["max"][key],
+        }
+    return metrics
+
+
+# ============================================================
+#              KAYITTAN (SÜTUN DİZİLERİNDEN) METRİKLER
+# ============================================================
+PERCENTILES = (5, 50, 95)
+
+# Toplu karşılaştırmadaki karakteristik eğri çiftleri: (x, y)
+CURVE_PAIRS = (
+    ("current", "thrust_kgf"),
+    ("rpm", "thrust_kgf"),
+    ("power", "thrust_kgf"),
+)
+CURVE_BINS = 40
+
+
+def compute_segment_metrics(columns: Dict) -> Dict:
+    """
+    Bir segmentin sütun dizilerinden (csv_importer.import_csv çıktısı)
+    özet metrikleri üretir.
+
+    Ortalama, canlı özetle aynı şekilde kanalın sonlu değerlerinin toplamı /
+    sayısıdır (kesinti işaret satırları ve NaN hücreler paydaya girmez); ek
+    olarak her kanal için yüzdelikler döner.
+    """
+    t = columns.get("time_s")
+    n = 0 if t is None else len(t)
+    metrics: Dict = {
+        "count": n,
+        "duration": float(t[-1] - t[0]) if n else 0.0,
+    }
+
+    for key in STAT_KEYS:
+        values = columns.get(key)
+        finite = values[np.isfinite(values)] if values is not None else values
+        if finite is None or len(finite) == 0:
+            metrics[key] = None
+            continue
+
+        pct = np.percentile(finite, PERCENTILES)
+        metrics[key] = {
+            "avg": float(finite.sum() / len(finite)),
+            "min": float(finite.min()),
+            "max": float(finite.max()),
+            **{f"p{p}": float(v) for p, v in zip(PERCENTILES, pct)},
+        }
+
+    return metrics
+
+
+def find_gaps(columns: Dict) -> List[Dict]:
+    """
+    Kayıttaki bağlantı kesintilerini bulur.
+
+    Kesinti, CSV'de yalnızca zamanı dolu iki işaret satırıyla (başlangıç,
+    bitiş) yazılır; diğer tüm hücreleri NaN olan satırlar ikişer eşlenir.
+    """
+    t = columns.get("time_s")
+    if t is None or len(t) == 0:
+        return []
+    others = [v for k, v in columns.items() if k != "time_s"]
+    if not others:
+        return []
+
+    marker = np.ones(len(t), dtype=bool)
+    for values in others:
+        marker &= np.isnan(values)
+    times = t[marker].tolist()
+    if len(times) % 2:
+        times.append(float(t[-1]))  # kapanmamış kesinti kayıt sonuna kadar
+    return [
+        {"t_start": times[i], "t_end": times[i + 1]} for i in range(0, len(times), 2)
+    ]
+
+
+def compute_binned_curve(x, y, bins: int = CURVE_BINS):
+    """
+    y'nin x aralığındaki kova ortalamaları (x merkezleri, y ortalamaları).
+
+    Ham noktalar yerine yalnızca kova dizileri saklanır, böylece onlarca
+    segment tek grafikte ucuzca üst üste çizilebilir.
+    """
+    ok = np.isfinite(x) & np.isfinite(y)
+    x = x[ok]
+    y = y[ok]
+    if len(x) == 0 or x.min() == x.max():
+        return [], []
+
+    edges = np.linspace(x.min(), x.max(), bins + 1)
+    idx = np.clip(np.searchsorted(edges, x, side="right") - 1, 0, bins - 1)
+    counts = np.bincount(idx, minlength=bins)
+    sums = np.bincount(idx, weights=y, minlength=bins)
+
+    filled = counts > 0
+    centers = 0.5 * (edges[:-1] + edges[1:])
+    return centers[filled].tolist(), (sums[filled] / counts[filled]).tolist()
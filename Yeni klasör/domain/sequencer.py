@@ -0,0 +1,350 @@
+"""
+Otomatik throttle sweep: bildirimsel profil ve zamanlayıcı.
+
+Profil (JSON) adımları tanımlar, örn. 0 -> 100 % arası 5 % adım, her adımda
+3 s bekleme, sonda 10 s soğuma:
+    {"start_pct": 0, "stop_pct": 100, "step_pct": 5,
+     "dwell_s": 3, "ramp_s": 0.5, "cooldown_s": 10,
+     "limits": {"current": [null, 40], "temperature": [null, 80]}}
+Profil sınırları genel güvenlik sınırlarına (domain/safety.py) ek olarak
+teste özgü iptal sınırlarıdır ve onlarla aynı debounce ile denetlenir (tek
+gürültü sıçraması sweep'i iptal etmez); güvenlik durdurması da sweep'i
+iptal eder.
+
+SequenceRunner saf bir durum makinesidir; okuma thread'inde (SerialWorker)
+her turda tick() ve gelen her örnek paketiyle on_samples() çağrılır. Set
+noktaları CommandChannel'a doğrudan yazılır, böylece zamanlama ve iptal
+UI yükünden bağımsızdır. Segment açma/kapama gibi UI işleri notify() ile
+olay olarak bildirilir.
+"""
+
+import json
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from core.channels import CHANNELS_BY_KEY
+from core.constants import (
+    SAFETY_DEBOUNCE_SAMPLES,
+    SAFETY_HYSTERESIS,
+    SWEEP_SETPOINT_RATE_HZ,
+)
+from domain.commands import CommandChannel, motor_stop, throttle_setpoint
+from domain.safety import TRIP, build_rules, limit_text
+
+
+# Olay türleri (notify(kind, info))
+SEGMENT_START = "segment_start"
+SEGMENT_STOP = "segment_stop"
+STEP = "step"
+FINISHED = "finished"
+ABORTED = "aborted"
+
+# Faz türleri
+RAMP = "ramp"
+DWELL = "dwell"
+COOLDOWN = "cooldown"
+
+
+class SweepProfile:
+    """Throttle sweep profili (yüzde, saniye)."""
+
+    FIELDS = (
+        "name",
+        "start_pct",
+        "stop_pct",
+        "step_pct",
+        "dwell_s",
+        "ramp_s",
+        "cooldown_s",
+        "cooldown_pct",
+        "segment_per_step",
+        "limits",
+    )
+
+    def __init__(
+        self,
+        name: str = "sweep",
+        start_pct: float = 0.0,
+        stop_pct: float = 100.0,
+        step_pct: float = 5.0,
+        dwell_s: float = 3.0,
+        ramp_s: float = 0.5,
+        cooldown_s: float = 10.0,
+        cooldown_pct: float = 0.0,
+        segment_per_step: bool = False,
+        limits: Optional[Dict[str, Tuple[Optional[float], Optional[float]]]] = None,
+    ):
+        self.name = str(name)
+        self.start_pct = float(start_pct)
+        self.stop_pct = float(stop_pct)
+        self.step_pct = float(step_pct)
+        self.dwell_s = float(dwell_s)
+        self.ramp_s = float(ramp_s)
+        self.cooldown_s = float(cooldown_s)
+        self.cooldown_pct = float(cooldown_pct)
+        self.segment_per_step = bool(segment_per_step)
+        self.limits = {
+            key: (
+                None if lo is None else float(lo),
+                None if hi is None else float(hi),
+            )
+            for key, (lo, hi) in (limits or {}).items()
+        }
+        self._validate()
+
+    def _validate(self):
+        for name in ("start_pct", "stop_pct", "cooldown_pct"):
+            if not 0.0 <= getattr(self, name) <= 100.0:
+                raise ValueError(f"{name} must be within 0..100")
+        if self.step_pct <= 0:
+            raise ValueError("step_pct must be positive")
+        if self.dwell_s <= 0:
+            raise ValueError("dwell_s must be positive")
+        if self.ramp_s < 0 or self.cooldown_s < 0:
+            raise ValueError("ramp_s and cooldown_s must not be negative")
+        for key in self.limits:
+            if key not in CHANNELS_BY_KEY:
+                raise ValueError(f"Unknown limit channel: {key}")
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "SweepProfile":
+        unknown = set(data) - set(cls.FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown profile fields: {', '.join(sorted(unknown))}")
+        try:
+            return cls(**data)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Invalid sweep profile: {e}") from e
+
+    @classmethod
+    def load(cls, path: str) -> "SweepProfile":
+        with open(path, "r", encoding="utf-8") as f:
+            try:
+                data = json.load(f)
+            except ValueError as e:
+                raise ValueError(f"Invalid profile JSON: {e}") from e
+        if not isinstance(data, dict):
+            raise ValueError("Sweep profile must be a JSON object")
+        return cls.from_dict(data)
+
+    def levels(self) -> List[float]:
+        """Adım throttle değerleri (start -> stop, her iki uç dahil)."""
+        direction = 1.0 if self.stop_pct >= self.start_pct else -1.0
+        n = int(abs(self.stop_pct - self.start_pct) / self.step_pct + 1e-9)
+        levels = [self.start_pct + direction * i * self.step_pct for i in range(n + 1)]
+        if abs(levels[-1] - self.stop_pct) > 1e-9:
+            levels.append(self.stop_pct)
+        return levels
+
+
+class Phase:
+    """Zaman çizelgesinde tek faz (sweep başından saniye)."""
+
+    __slots__ = ("kind", "index", "t_start", "t_end", "from_pct", "to_pct")
+
+    def __init__(self, kind, index, t_start, t_end, from_pct, to_pct):
+        self.kind = kind
+        self.index = index
+        self.t_start = t_start
+        self.t_end = t_end
+        self.from_pct = from_pct
+        self.to_pct = to_pct
+
+    def setpoint(self, t: float) -> float:
+        if self.t_end <= self.t_start:
+            return self.to_pct
+        x = min(1.0, max(0.0, (t - self.t_start) / (self.t_end - self.t_start)))
+        return self.from_pct + (self.to_pct - self.from_pct) * x
+
+    def __repr__(self):
+        return (
+            f"Phase({self.kind}, {self.index}, {self.t_start:.2f}-{self.t_end:.2f} s, "
+            f"{self.from_pct:g}->{self.to_pct:g} %)"
+        )
+
+
+def build_phases(profile: SweepProfile) -> List[Phase]:
+    """Profilin zaman çizelgesi: her adımda rampa + bekleme, sonda soğuma."""
+    phases: List[Phase] = []
+    t = 0.0
+    pct = 0.0
+    for i, level in enumerate(profile.levels()):
+        if profile.ramp_s > 0 and level != pct:
+            phases.append(Phase(RAMP, i, t, t + profile.ramp_s, pct, level))
+            t += profile.ramp_s
+        phases.append(Phase(DWELL, i, t, t + profile.dwell_s, level, level))
+        t += profile.dwell_s
+        pct = level
+
+    index = len(profile.levels())  # soğuma adım numaralarından sonra gelir
+    if profile.ramp_s > 0 and profile.cooldown_pct != pct:
+        phases.append(Phase(RAMP, index, t, t + profile.ramp_s, pct, profile.cooldown_pct))
+        t += profile.ramp_s
+    phases.append(
+        Phase(COOLDOWN, index, t, t + profile.cooldown_s, profile.cooldown_pct, profile.cooldown_pct)
+    )
+    return phases
+
+
+class SequenceRunner:
+    """
+    Profili zaman çizelgesine göre yürütür (okuma thread'inde).
+
+    tick(now) vadesi gelen faz geçişlerini ve rampa set noktalarını
+    gönderir, bir sonraki vadeyi döndürür; çağıran en geç o ana kadar
+    uyur. Zamanlar sweep başlangıcına göre mutlak hesaplanır (birikmeli
+    kayma olmaz); her set noktasının planlanan zamana göre gecikmesi
+    ölçülür ve bitişte raporlanır.
+    """
+
+    def __init__(
+        self,
+        profile: SweepProfile,
+        commands: CommandChannel,
+        notify: Optional[Callable[[str, Dict], None]] = None,
+        setpoint_rate_hz: float = SWEEP_SETPOINT_RATE_HZ,
+    ):
+        self.profile = profile
+        self.commands = commands
+        self.notify = notify or (lambda kind, info: None)
+        self.setpoint_period = 1.0 / setpoint_rate_hz
+        self.levels = profile.levels()
+        self.phases = build_phases(profile)
+        self.duration_s = self.phases[-1].t_end if self.phases else 0.0
+
+        self._lock = threading.Lock()
+        self.state = "idle"
+        self.t0: Optional[float] = None
+        self._phase = -1
+        self._next_setpoint: Optional[float] = None
+        self.setpoints_sent = 0
+        self.lateness: List[float] = []
+        self.abort_reason: Optional[str] = None
+        self._rules = build_rules(profile.limits, SAFETY_HYSTERESIS, SAFETY_DEBOUNCE_SAMPLES)
+
+    @property
+    def running(self) -> bool:
+        return self.state == "running"
+
+    def start(self, now: Optional[float] = None):
+        with self._lock:
+            if self.state != "idle":
+                return
+            self.t0 = time.monotonic() if now is None else now
+            self.state = "running"
+            if not self.profile.segment_per_step:
+                self.notify(SEGMENT_START, {"name": self.profile.name})
+
+    # ============================================================
+    #                       ZAMANLAMA
+    # ============================================================
+    def tick(self, now: float) -> Optional[float]:
+        """Vadesi gelen işleri yapar; bir sonraki vade (monotonic) veya None."""
+        locked_out = self.commands.locked_out
+        if locked_out is not None and self.running:
+            self.abort(f"Safety stop: {locked_out}", now)
+        with self._lock:
+            if self.state != "running":
+                return None
+            t = now - self.t0
+
+            # Faz geçişleri (gecikmeli turda atlanan fazların olayları da sırayla)
+            while self._phase + 1 < len(self.phases) and t >= self.phases[self._phase + 1].t_start:
+                self._phase += 1
+                self._enter_phase(self.phases[self._phase], t)
+
+            if t >= self.duration_s:
+                self._finish(t)
+                return None
+
+            phase = self.phases[self._phase]
+            if phase.kind == RAMP:
+                due = self._next_setpoint
+                if due is not None and t >= due:
+                    self._send(phase.setpoint(t), t - due)
+                    due += self.setpoint_period * (1 + int((t - due) / self.setpoint_period))
+                    self._next_setpoint = due if due < phase.t_end else None
+                if self._next_setpoint is not None:
+                    return self.t0 + self._next_setpoint
+            return self.t0 + phase.t_end
+
+    def _enter_phase(self, phase: Phase, t: float):
+        n = len(self.levels)  # index == n: soğuma
+        previous = self.phases[self._phase - 1].index if self._phase > 0 else None
+        if phase.index != previous:
+            if self.profile.segment_per_step:
+                if previous is not None and previous < n:
+                    self.notify(SEGMENT_STOP, {"index": previous})
+                if phase.index < n:
+                    self.notify(
+                        SEGMENT_START, {"name": self.profile.name, "index": phase.index}
+                    )
+            if phase.index < n:
+                self.notify(
+                    STEP,
+                    {"index": phase.index, "count": n, "throttle": self.levels[phase.index]},
+                )
+
+        self._send(phase.setpoint(t), t - phase.t_start)
+        if phase.kind == RAMP:
+            # İlk set noktası girişte gitti; sonrakiler sabit ızgarada
+            self._next_setpoint = phase.t_start + self.setpoint_period
+        else:
+            self._next_setpoint = None
+
+    def _send(self, pct: float, late_s: float):
+        self.commands.submit(throttle_setpoint(pct))
+        self.setpoints_sent += 1
+        self.lateness.append(max(0.0, late_s))
+
+    def _finish(self, t: float):
+        self.commands.submit(motor_stop())
+        self.state = "finished"
+        # Adım başına segmentte son adımın segmenti soğumaya girerken kapandı
+        if not self.profile.segment_per_step:
+            self.notify(SEGMENT_STOP, {"name": self.profile.name})
+        self.notify(FINISHED, self.timing_stats(t))
+
+    # ============================================================
+    #                       İPTAL
+    # ============================================================
+    def on_samples(self, batch: List[Dict], now: float):
+        """
+        Her örnek iptal sınırlarına göre denetlenir (okuma thread'i); sınır
+        SAFETY_DEBOUNCE_SAMPLES ardışık örnek aşılınca sweep iptal edilir.
+        """
+        if self.state != "running":
+            return
+        for values in batch:
+            for rule in self._rules:
+                v = values.get(rule.key)
+                if v is None:
+                    continue
+                if rule.update(v) == TRIP:
+                    self.abort(limit_text(rule.key, v, *rule.violation(v)), now)
+                    return
+
+    def abort(self, reason: str, now: Optional[float] = None):
+        """Motoru hemen durdurur; herhangi bir thread'den çağrılabilir."""
+        with self._lock:
+            if self.state != "running":
+                return
+            self.commands.submit(motor_stop())
+            self.state = "aborted"
+            self.abort_reason = reason
+            now = time.monotonic() if now is None else now
+            info = self.timing_stats(now - self.t0)
+            info["reason"] = reason
+            info["index"] = self.phases[self._phase].index if self._phase >= 0 else 0
+            self.notify(ABORTED, info)
+
+    def timing_stats(self, t: float) -> Dict:
+        late = self.lateness
+        return {
+            "name": self.profile.name,
+            "elapsed_s": t,
+            "setpoints": self.setpoints_sent,
+            "late_ms_mean": 1000.0 * sum(late) / len(late) if late else 0.0,
+            "late_ms_max": 1000.0 * max(late) if late else 0.0,
+        }
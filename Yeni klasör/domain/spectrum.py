@@ -0,0 +1,207 @@
+"""
+Canlı spektrum: artımlı Welch PSD ve spektrogram.
+
+Kanal tamponlarına yeni gelen örnekler sabit aralıkla beslenir; yalnızca
+yeni tamamlanan (örtüşmeli) pencereler FFT'lenir. Tüm pencereler tek
+rfft çağrısında vektörize işlenir, pencere fonksiyonu ve ölçek katsayısı
+uzunluk başına bir kez hesaplanıp önbellekte tutulur.
+"""
+
+from functools import lru_cache
+from typing import Optional, Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+@lru_cache(maxsize=32)
+def hann_window(n: int) -> np.ndarray:
+    """Periyodik Hann penceresi (scipy.signal.get_window("hann") ile aynı)."""
+    w = np.hanning(n + 1)[:-1]
+    w.setflags(write=False)
+    return w
+
+
+@lru_cache(maxsize=32)
+def _psd_scale(n: int, fs: float) -> float:
+    w = hann_window(n)
+    return 1.0 / (fs * float((w * w).sum()))
+
+
+def frames_psd(frames: np.ndarray, fs: float) -> np.ndarray:
+    """
+    (k, n) pencere matrisinin tek taraflı PSD satırları ((k, n//2 + 1)).
+
+    Her pencerenin ortalaması çıkarılır (DC sızıntısı), Hann uygulanır;
+    ölçek scipy.signal.welch(scaling="density") ile aynıdır.
+    """
+    n = frames.shape[1]
+    x = frames - frames.mean(axis=1, keepdims=True)
+    spec = np.fft.rfft(x * hann_window(n), axis=1)
+    psd = (spec.real ** 2 + spec.imag ** 2) * _psd_scale(n, fs)
+    # Tek taraflı: DC ve (çift n'de) Nyquist hariç iki katı
+    psd[:, 1 : (n + 1) // 2] *= 2.0
+    return psd
+
+
+def welch(
+    x: np.ndarray, fs: float, nperseg: int = 256, overlap: float = 0.5
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Tüm dizi için Welch PSD; NaN içeren (kesinti) pencereler atlanır."""
+    x = np.asarray(x, dtype=np.float64)
+    freqs = np.fft.rfftfreq(nperseg, 1.0 / fs)
+    if len(x) < nperseg:
+        return freqs, np.full(len(freqs), np.nan)
+    step = max(1, int(nperseg * (1.0 - overlap)))
+    frames = sliding_window_view(x, nperseg)[::step]
+    frames = frames[~np.isnan(frames).any(axis=1)]
+    if len(frames) == 0:
+        return freqs, np.full(len(freqs), np.nan)
+    return freqs, frames_psd(frames, fs).mean(axis=0)
+
+
+class IncrementalWelch:
+    """
+    Akan veri üzerinde artımlı Welch.
+
+    feed() her çağrıda yeni tamamlanan pencereleri işler ve üç sonuç
+    günceller: son `recent` pencerenin ortalaması (canlı spektrum), segment
+    başından beri ortalama ve her feed için bir satır spektrogram (halka).
+    """
+
+    def __init__(
+        self,
+        fs: float,
+        nperseg: int,
+        overlap: float = 0.5,
+        recent: int = 8,
+        max_rows: int = 1200,
+    ):
+        self.fs = float(fs)
+        self.nperseg = int(nperseg)
+        self.step = max(1, int(self.nperseg * (1.0 - overlap)))
+        self.recent = recent
+        self.max_rows = max_rows
+        self.freqs = np.fft.rfftfreq(self.nperseg, 1.0 / self.fs)
+        self.reset()
+
+    def reset(self):
+        nbins = len(self.freqs)
+        self._tail = np.empty(0, dtype=np.float64)
+        self._sum = np.zeros(nbins)
+        self.frames = 0
+        self._recent = np.full((self.recent, nbins), np.nan)
+        self._recent_pos = 0
+        self._rows = np.full((self.max_rows, nbins), np.nan, dtype=np.float32)
+        self._row_times = np.full(self.max_rows, np.nan)
+        self.row_count = 0
+
+    def feed(self, samples: np.ndarray, t_end: Optional[float] = None) -> int:
+        """Yeni örnekleri ekler; işlenen (geçerli) pencere sayısını döndürür."""
+        if len(samples) == 0:
+            return 0
+        buf = np.concatenate((self._tail, np.asarray(samples, dtype=np.float64)))
+        if len(buf) < self.nperseg:
+            self._tail = buf
+            return 0
+
+        k = (len(buf) - self.nperseg) // self.step + 1
+        frames = sliding_window_view(buf, self.nperseg)[:: self.step][:k]
+        self._tail = buf[k * self.step :]
+
+        frames = frames[~np.isnan(frames).any(axis=1)]
+        if len(frames) == 0:
+            return 0
+
+        psd = frames_psd(frames, self.fs)
+        self._sum += psd.sum(axis=0)
+        self.frames += len(psd)
+
+        # Son `recent` pencere (halka)
+        for row in psd[-self.recent :]:
+            self._recent[self._recent_pos % self.recent] = row
+            self._recent_pos += 1
+
+        # Spektrogram: bu besleme turunun ortalaması tek satır
+        pos = self.row_count % self.max_rows
+        self._rows[pos] = psd.mean(axis=0)
+        self._row_times[pos] = np.nan if t_end is None else t_end
+        self.row_count += 1
+        return len(psd)
+
+    @property
+    def resolution_hz(self) -> float:
+        return self.fs / self.nperseg
+
+    def live(self) -> np.ndarray:
+        if self._recent_pos == 0:
+            return np.full(len(self.freqs), np.nan)
+        return self._recent[: min(self._recent_pos, self.recent)].mean(axis=0)
+
+    def average(self) -> np.ndarray:
+        if self.frames == 0:
+            return np.full(len(self.freqs), np.nan)
+        return self._sum / self.frames
+
+    @property
+    def nbytes(self) -> int:
+        return (
+            self._rows.nbytes + self._row_times.nbytes
+            + self._recent.nbytes + self._tail.nbytes + self._sum.nbytes
+        )
+
+    def shrink(self, min_rows: int = 100) -> None:
+        """Spektrogram halkasını yarıya indirir; en yeni satırlar korunur."""
+        rows = max(min_rows, self.max_rows // 2)
+        if rows >= self.max_rows:
+            return
+        times, psd = self.spectrogram()
+        keep = min(len(times), rows)
+        self.max_rows = rows
+        self._rows = np.full((rows, len(self.freqs)), np.nan, dtype=np.float32)
+        self._row_times = np.full(rows, np.nan)
+        self._rows[:keep] = psd[len(psd) - keep :]
+        self._row_times[:keep] = times[len(times) - keep :]
+        self.row_count = keep
+
+    def spectrogram(self) -> Tuple[np.ndarray, np.ndarray]:
+        """(satır zamanları, (satır, frekans) PSD) — kronolojik."""
+        n = min(self.row_count, self.max_rows)
+        end = self.row_count % self.max_rows
+        if self.row_count <= self.max_rows:
+            return self._row_times[:n].copy(), self._rows[:n].copy()
+        order = np.r_[end : self.max_rows, 0:end]
+        return self._row_times[order], self._rows[order]
+
+
+class UniformResampler:
+    """
+    Düzensiz zaman damgalı (host zamanı) örnekleri sabit hızlı ızgaraya
+    doğrusal enterpolasyonla çevirir; temel kanalların FFT'si için.
+    """
+
+    def __init__(self, fs: float):
+        self.fs = float(fs)
+        self.reset()
+
+    def reset(self):
+        self._last: Optional[Tuple[float, float]] = None
+        self._next_t: Optional[float] = None
+
+    def feed(self, ts: np.ndarray, vs: np.ndarray) -> np.ndarray:
+        if len(ts) == 0:
+            return np.empty(0)
+        if self._last is None:
+            self._next_t = float(ts[0])
+        else:
+            ts = np.concatenate(([self._last[0]], ts))
+            vs = np.concatenate(([self._last[1]], vs))
+        self._last = (float(ts[-1]), float(vs[-1]))
+
+        k = int(np.floor((ts[-1] - self._next_t) * self.fs)) + 1
+        if k <= 0:
+            return np.empty(0)
+        grid = self._next_t + np.arange(k) / self.fs
+        self._next_t = float(grid[-1]) + 1.0 / self.fs
+        # NaN (kesinti) komşuluğundaki ızgara noktaları da NaN olur
+        return np.interp(grid, ts, vs)
@@ -0,0 +1,225 @@
+import math
+from collections import deque
+from typing import Dict, List, Optional
+
+
+class RollingStats:
+    """Sabit uzunluklu pencerede O(1) kayan ortalama / varyans."""
+
+    # Kayan toplamlardaki yuvarlama birikimini bu kadar örnekte bir sıfırla
+    RESYNC_EVERY = 10000
+
+    def __init__(self, window: int):
+        self.window = window
+        self._values: deque = deque()
+        self._sum = 0.0
+        self._sum_sq = 0.0
+        self._pushes = 0
+
+    def push(self, value: float):
+        self._values.append(value)
+        self._sum += value
+        self._sum_sq += value * value
+        if len(self._values) > self.window:
+            old = self._values.popleft()
+            self._sum -= old
+            self._sum_sq -= old * old
+
+        self._pushes += 1
+        if self._pushes >= self.RESYNC_EVERY:
+            self._pushes = 0
+            self._sum = sum(self._values)
+            self._sum_sq = sum(v * v for v in self._values)
+
+    def reset(self):
+        self._values.clear()
+        self._sum = 0.0
+        self._sum_sq = 0.0
+        self._pushes = 0
+
+    @property
+    def full(self) -> bool:
+        return len(self._values) >= self.window
+
+    @property
+    def mean(self) -> float:
+        n = len(self._values)
+        return self._sum / n if n else 0.0
+
+    @property
+    def std(self) -> float:
+        n = len(self._values)
+        if n < 2:
+            return 0.0
+        mean = self._sum / n
+        # Kayan toplamlardaki yuvarlama hatası küçük negatif varyans verebilir
+        return math.sqrt(max(0.0, self._sum_sq / n - mean * mean))
+
+
+# Plato içinde ortalaması alınan kanallar
+STEP_KEYS = (
+    "thrust_kgf",
+    "rpm",
+    "current",
+    "voltage",
+    "power",
+    "pt_eff",
+    "tpa",
+)
+
+
+class SteadyStateDetector:
+    """
+    Canlı akış üzerinde kararlı-durum (plato) tespiti.
+
+    thrust/RPM/current kanallarının kayan pencere standart sapması
+    eşiklerin altındayken örnekler açık platoya eklenir; herhangi biri
+    eşiği aştığında plato kapanır. Her örnek O(1) işlenir, böylece Stop'a
+    basıldığı anda throttle adımı tablosu hazırdır.
+    """
+
+    WINDOW = 20
+    MIN_STEP_SAMPLES = 10
+    MIN_RPM = 500.0
+
+    # kanal -> (mutlak tolerans, bağıl tolerans); std <= max(abs, rel*|ort|)
+    TOLERANCES = {
+        "thrust_kgf": (0.02, 0.02),
+        "rpm": (50.0, 0.01),
+        "current": (0.2, 0.03),
+    }
+
+    def __init__(
+        self,
+        window: int = WINDOW,
+        min_step_samples: int = MIN_STEP_SAMPLES,
+        tolerances: Optional[Dict] = None,
+    ):
+        self.window = window
+        self.min_step_samples = min_step_samples
+        self.tolerances = dict(tolerances or self.TOLERANCES)
+        self._rolling = {k: RollingStats(window) for k in self.tolerances}
+
+        self.steps: List[Dict] = []
+        self._open: Optional[Dict] = None
+
+    def reset(self):
+        for rs in self._rolling.values():
+            rs.reset()
+        self.steps = []
+        self._open = None
+
+    @property
+    def in_plateau(self) -> bool:
+        return self._open is not None
+
+    def update(self, t: float, values: Dict):
+        for key, rs in self._rolling.items():
+            v = values.get(key)
+            if v is not None:
+                rs.push(v)
+
+        if self._is_steady():
+            if self._open is None:
+                self._open = {
+                    "t_start": t,
+                    "t_end": t,
+                    "count": 0,
+                    "sum": {k: 0.0 for k in STEP_KEYS},
+                    "n": {k: 0 for k in STEP_KEYS},
+                }
+            step = self._open
+            step["t_end"] = t
+            step["count"] += 1
+            for k in STEP_KEYS:
+                v = values.get(k)
+                if v is not None:
+                    step["sum"][k] += v
+                    step["n"][k] += 1
+        elif self._open is not None:
+            self._close_open()
+
+    def mark_gap(self):
+        """
+        Veri kesintisi: açık plato kapatılır ve kayan pencereler boşaltılır,
+        böylece kesintinin iki yanındaki örnekler tek plato sayılmaz.
+        """
+        if self._open is not None:
+            self._close_open()
+        for rs in self._rolling.values():
+            rs.reset()
+
+    def finish(self) -> List[Dict]:
+        """Açık platoyu kapatır ve adım listesini döndürür."""
+        if self._open is not None:
+            self._close_open()
+        return self.steps
+
+    def _is_steady(self) -> bool:
+        for key, rs in self._rolling.items():
+            if not rs.full:
+                return False
+            abs_tol, rel_tol = self.tolerances[key]
+            if rs.std > max(abs_tol, rel_tol * abs(rs.mean)):
+                return False
+        return True
+
+    def _close_open(self):
+        step = self._open
+        self._open = None
+        if step["count"] < self.min_step_samples:
+            return
+
+        means = {
+            k: (step["sum"][k] / step["n"][k]) if step["n"][k] else None
+            for k in STEP_KEYS
+        }
+        if means["rpm"] is not None and means["rpm"] < self.MIN_RPM:
+            return  # motor duruyor, verim anlamsız
+
+        self.steps.append(
+            {
+                "t_start": step["t_start"],
+                "t_end": step["t_end"],
+                "count": step["count"],
+                "mean": means,
+            }
+        )
+
+
+def detect_steps(columns: Dict, **kwargs) -> List[Dict]:
+    """Kayıttan okunmuş sütun dizileri üzerinde aynı tespiti çalıştırır."""
+    t = columns["time_s"]
+    keys = [k for k in STEP_KEYS if k in columns]
+    det = SteadyStateDetector(**kwargs)
+    for i in range(len(t)):
+        values = {}
+        for k in keys:
+            v = float(columns[k][i])
+            if v == v:  # NaN değil
+                values[k] = v
+        det.update(float(t[i]), values)
+    return det.finish()
+
+
+def format_step_table(steps: List[Dict]) -> List[str]:
+    """SummaryDialog için throttle adımı verim tablosu satırları."""
+    if not steps:
+        return ["Throttle steps: no steady-state plateau detected"]
+
+    def fmt(val, fmt_str):
+        return "--" if val is None else fmt_str.format(val)
+
+    lines = [f"Throttle steps ({len(steps)} steady plateaus):"]
+    lines.append("  #   Time (s)     Thrust   Power   PT Eff     TPA      RPM")
+    for i, step in enumerate(steps, start=1):
+        m = step["mean"]
+        lines.append(
+            f"  {i:<3d} {step['t_start']:5.1f}-{step['t_end']:<6.1f}"
+            f" {fmt(m['thrust_kgf'], '{:7.4f}')}"
+            f" {fmt(m['power'], '{:7.1f}')}"
+            f" {fmt(m['pt_eff'], '{:8.5f}')}"
+            f" {fmt(m['tpa'], '{:7.4f}')}"
+            f" {fmt(m['rpm'], '{:7.0f}')}"
+        )
+    return lines
@@ -0,0 +1,401 @@
+"""
+Oturum raporu: bir veya birden çok segment CSV'sinden tek dosyalık
+(kendi içinde bütün) HTML veya PDF rapor.
+
+Her segment için özet tablosu (ortalama/min/max/yüzdelikler, kesintiler),
+tam çözünürlüklü kayıttan çizilen kanal grafikleri ve throttle adımı verim
+tablosu üretilir; birden çok segment varsa başa karşılaştırma tablosu
+eklenir. Segment bölümleri dosya hash'ine göre `<klasör>/.gmkreport/`
+altında önbelleğe alınır, böylece aynı günün kayıtları tekrar
+raporlandığında yalnızca yeni/değişmiş segmentler işlenir.
+
+Grafikler QPainter ile QImage'a çizildiğinden çağıran süreçte bir
+QGuiApplication bulunmalıdır.
+"""
+
+import base64
+import html
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+from PyQt6.QtCore import QBuffer, QByteArray, QIODevice, QMarginsF, QThread, pyqtSignal
+from PyQt6.QtGui import QPageLayout, QPageSize, QPdfWriter, QTextDocument
+
+from core.channels import CHANNELS, CHANNELS_BY_KEY, PLOT_TITLES
+from data.batch_analyzer import (
+    CACHE_VERSION,
+    COMPARISON_COLUMNS,
+    BatchAnalyzer,
+    comparison_rows,
+    file_digest,
+    segment_sort_key,
+)
+from data.csv_importer import import_csv
+from domain.segment_summary import (
+    PERCENTILES,
+    compute_segment_metrics,
+    find_gaps,
+)
+from domain.steady_state import detect_steps
+from presentation.widgets.dashboard_export import render_channel_image
+
+
+REPORT_CACHE_DIR = ".gmkreport"
+# Bölüm biçimi değişince ilk sayı artırılır; metrik önbelleğinin sürümünü
+# (kanal kaydı + metrik şeması) de içerir
+REPORT_CACHE_VERSION = f"2-{CACHE_VERSION}"
+PLOT_SIZE_PX = (900, 260)
+PLOT_DPI = 96
+
+# Özet tablosundaki kanallar: (anahtar, etiket, biçim)
+SUMMARY_ROWS = [(ch.key, ch.label, f"{{:.{ch.precision}f}}") for ch in CHANNELS]
+
+_CSS = """
+body { font-family: 'Segoe UI', Arial, sans-serif; color: #111; margin: 24px; }
+h1 { color: #00AFAA; margin-bottom: 4px; }
+h2 { color: #00AFAA; border-bottom: 2px solid #00AFAA; padding-bottom: 2px; }
+h3 { margin-bottom: 4px; }
+table { border-collapse: collapse; margin: 6px 0 14px 0; }
+th, td { border: 1px solid #c8c8c8; padding: 3px 8px; text-align: right; }
+th { background: #eef7f7; }
+td.name, th.name { text-align: left; }
+.meta { color: #555; }
+img { display: block; margin: 4px 0; }
+.segment { page-break-before: always; }
+"""
+
+
+def _esc(text) -> str:
+    return html.escape(str(text))
+
+
+def _fmt(value, fmt: str) -> str:
+    return "--" if value is None else fmt.format(value)
+
+
+def _png_data_uri(image) -> str:
+    data = QByteArray()
+    buf = QBuffer(data)
+    buf.open(QIODevice.OpenModeFlag.WriteOnly)
+    image.save(buf, "PNG")
+    buf.close()
+    return "data:image/png;base64," + base64.b64encode(bytes(data)).decode("ascii")
+
+
+def _plot_title(key: str) -> str:
+    return PLOT_TITLES.get(key, key)
+
+
+def _plot_unit(key: str) -> str:
+    ch = CHANNELS_BY_KEY.get(key)
+    return ch.unit if ch is not None else ""
+
+
+# ============================================================
+#                       SEGMENT BÖLÜMÜ
+# ============================================================
+def analyze_for_report(path: str) -> Dict:
+    """
+    Segmentin sayısal analizi (süreç havuzunda çalışır, sonuç pickle'lanır).
+
+    Adım tespiti örnek başına Python döngüsü olduğundan GIL'e takılır;
+    grafik çizimi ise thread'lerde yapılır (QPainter çağrıları GIL'i bırakır).
+    """
+    columns = import_csv(path)
+    return {
+        "metrics": compute_segment_metrics(columns),
+        "gaps": find_gaps(columns),
+        "steps": detect_steps(columns) if "time_s" in columns else [],
+    }
+
+
+def build_segment_section(path: str, analysis: Optional[Dict] = None) -> Dict:
+    """
+    Tek segmentin rapor bölümünü üretir.
+
+    Dönen sözlük JSON'a yazılabilir: bölüm HTML'i (gömülü PNG'lerle) ve
+    karşılaştırma tablosu için metrikler. analysis verilmezse
+    analyze_for_report burada çalıştırılır.
+    """
+    columns = import_csv(path)
+    if analysis is None:
+        analysis = analyze_for_report(path)
+    metrics = analysis["metrics"]
+    gaps = analysis["gaps"]
+    steps = analysis["steps"]
+
+    name = os.path.basename(path)
+    parts = [f'<div class="segment"><h2>{_esc(name)}</h2>']
+
+    lost = sum(g["t_end"] - g["t_start"] for g in gaps)
+    parts.append(
+        '<p class="meta">'
+        f"Duration: {metrics['duration']:.2f} s &nbsp;|&nbsp; "
+        f"Samples: {metrics['count']} &nbsp;|&nbsp; "
+        f"Connection gaps: {len(gaps)} ({lost:.2f} s)"
+        f"<br>File: {_esc(os.path.abspath(path))}</p>"
+    )
+
+    # ————— Özet tablosu —————
+    stat_cols = ["avg", "min", "max"] + [f"p{p}" for p in PERCENTILES]
+    parts.append("<h3>Summary</h3><table><tr><th class='name'>Channel</th>")
+    parts.extend(f"<th>{c.upper() if c != 'avg' else 'Average'}</th>" for c in stat_cols)
+    parts.append("</tr>")
+    for key, label, fmt in SUMMARY_ROWS:
+        m = metrics.get(key)
+        if not m:
+            continue
+        parts.append(f"<tr><td class='name'>{_esc(label)}</td>")
+        parts.extend(f"<td>{_fmt(m.get(c), fmt)}</td>" for c in stat_cols)
+        parts.append("</tr>")
+    parts.append("</table>")
+
+    # ————— Throttle adımları —————
+    parts.append(f"<h3>Throttle steps ({len(steps)} steady plateaus)</h3>")
+    if steps:
+        parts.append(
+            "<table><tr><th>#</th><th>Time (s)</th><th>Samples</th>"
+            "<th>Thrust (kgf)</th><th>Current (A)</th><th>Voltage (V)</th>"
+            "<th>Power (W)</th><th>PT Eff (kgf/W)</th><th>TPA (kgf/A)</th>"
+            "<th>RPM</th></tr>"
+        )
+        for i, step in enumerate(steps, start=1):
+            mean = step["mean"]
+            parts.append(
+                f"<tr><td>{i}</td>"
+                f"<td>{step['t_start']:.1f}–{step['t_end']:.1f}</td>"
+                f"<td>{step['count']}</td>"
+                f"<td>{_fmt(mean['thrust_kgf'], '{:.4f}')}</td>"
+                f"<td>{_fmt(mean['current'], '{:.3f}')}</td>"
+                f"<td>{_fmt(mean['voltage'], '{:.3f}')}</td>"
+                f"<td>{_fmt(mean['power'], '{:.1f}')}</td>"
+                f"<td>{_fmt(mean['pt_eff'], '{:.5f}')}</td>"
+                f"<td>{_fmt(mean['tpa'], '{:.4f}')}</td>"
+                f"<td>{_fmt(mean['rpm'], '{:.0f}')}</td></tr>"
+            )
+        parts.append("</table>")
+    else:
+        parts.append("<p class='meta'>No steady-state plateau detected.</p>")
+
+    # ————— Kanal grafikleri (tam çözünürlük) —————
+    parts.append("<h3>Channels</h3>")
+    t = columns.get("time_s")
+    width, height = PLOT_SIZE_PX
+    if t is not None and len(t):
+        for key in PLOT_TITLES:
+            values = columns.get(key)
+            if values is None:
+                continue
+            # Filtreli kanalda filtrelenmiş sütun çizilir, ham sütun soluk iz olur
+            raw = None
+            filtered = columns.get(key + "_filt")
+            if filtered is not None:
+                values, raw = filtered, values
+            channel = _channel_for_plot(key, t, values, raw, gaps)
+            uri = _png_data_uri(render_channel_image(channel, width, height, PLOT_DPI))
+            parts.append(
+                f'<img src="{uri}" width="{width}" height="{height}" '
+                f'alt="{_esc(_plot_title(key))}">'
+            )
+
+    parts.append("</div>")
+    return {"name": name, "metrics": metrics, "html": "".join(parts)}
+
+
+def _channel_for_plot(key, t, values, raw, gaps) -> Dict:
+    """Kayıt sütunlarını dashboard_export kanal sözlüğüne çevirir."""
+    finite = np.concatenate(
+        [a[np.isfinite(a)] for a in (values, raw) if a is not None]
+    )
+    lo, hi = (float(finite.min()), float(finite.max())) if len(finite) else (0.0, 1.0)
+    span = (hi - lo) or (abs(hi) or 1.0)
+    return {
+        "key": key,
+        "title": _plot_title(key),
+        "unit": _plot_unit(key),
+        "x": t,
+        "y": values,
+        "raw_x": t if raw is not None else None,
+        "raw_y": raw,
+        "x_range": (float(t[0]), float(t[-1])),
+        "y_range": (lo - 0.1 * span, hi + 0.1 * span),
+        "gaps": [(g["t_start"], g["t_end"]) for g in gaps],
+    }
+
+
+# ============================================================
+#                       OTURUM RAPORU
+# ============================================================
+class SessionReport:
+    """
+    Segment CSV'lerinden oturum raporu.
+
+    Segmentler paralel işlenir (analiz süreç havuzunda, grafikler thread
+    havuzunda) ve bölümler her CSV'nin klasöründeki önbelleğe yazılır;
+    önbellek anahtarı dosya hash'idir.
+    """
+
+    def __init__(
+        self,
+        paths: List[str],
+        title: Optional[str] = None,
+        max_workers: Optional[int] = None,
+    ):
+        self.paths = sorted(paths, key=segment_sort_key)
+        self.title = title or "GMK AIR Motor Test Report"
+        self.max_workers = max_workers
+
+    @classmethod
+    def from_folder(cls, folder: str, **kwargs) -> "SessionReport":
+        return cls(BatchAnalyzer(folder).find_segments(), **kwargs)
+
+    def build_sections(
+        self, progress_cb: Optional[Callable[[int, int], None]] = None
+    ) -> List[Dict]:
+        total = len(self.paths)
+        digests = {p: file_digest(p) for p in self.paths}
+        sections: Dict[str, Dict] = {}
+        todo = []
+        for p in self.paths:
+            cached = self._load_cached(p, digests[p])
+            if cached is None:
+                todo.append(p)
+            else:
+                sections[p] = cached
+
+        done = total - len(todo)
+        if progress_cb:
+            progress_cb(done, total)
+
+        if todo:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as procs, \
+                    ThreadPoolExecutor(max_workers=self.max_workers) as threads:
+                # Analizi biten segmentin çizimi diğerleri sürerken başlar
+                futures = [
+                    threads.submit(build_segment_section, path, analysis)
+                    for path, analysis in zip(todo, procs.map(analyze_for_report, todo))
+                ]
+                for path, future in zip(todo, futures):
+                    section = future.result()
+                    sections[path] = section
+                    self._save_cached(path, digests[path], section)
+                    done += 1
+                    if progress_cb:
+                        progress_cb(done, total)
+
+        return [sections[p] for p in self.paths]
+
+    def render_html(
+        self, progress_cb: Optional[Callable[[int, int], None]] = None
+    ) -> str:
+        sections = self.build_sections(progress_cb)
+
+        parts = [
+            "<!DOCTYPE html><html><head><meta charset='utf-8'>",
+            f"<title>{_esc(self.title)}</title><style>{_CSS}</style></head><body>",
+            f"<h1>{_esc(self.title)}</h1>",
+            f"<p class='meta'>Generated {time.strftime('%Y-%m-%d %H:%M')}"
+            f" &nbsp;|&nbsp; {len(sections)} segment(s)</p>",
+        ]
+
+        if len(sections) > 1:
+            parts.append("<h2>Segment comparison</h2><table><tr><th class='name'>Segment</th>")
+            parts.extend(f"<th>{_esc(c[0])}</th>" for c in COMPARISON_COLUMNS)
+            parts.append("</tr>")
+            for name, cells in comparison_rows(sections):
+                parts.append(f"<tr><td class='name'>{_esc(name)}</td>")
+                parts.extend(f"<td>{_esc(c)}</td>" for c in cells)
+                parts.append("</tr>")
+            parts.append("</table>")
+
+        parts.extend(s["html"] for s in sections)
+        parts.append("</body></html>")
+        return "".join(parts)
+
+    def write(
+        self, path: str, progress_cb: Optional[Callable[[int, int], None]] = None
+    ) -> None:
+        """Uzantıya göre .html veya .pdf yazar."""
+        content = self.render_html(progress_cb)
+        if os.path.splitext(path)[1].lower() == ".pdf":
+            write_pdf(content, path)
+            return
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+
+    # ============================================================
+    #                       ÖNBELLEK
+    # ============================================================
+    @staticmethod
+    def _cache_path(path: str, digest: str) -> str:
+        folder = os.path.dirname(os.path.abspath(path))
+        return os.path.join(folder, REPORT_CACHE_DIR, digest + ".json")
+
+    def _load_cached(self, path: str, digest: str) -> Optional[Dict]:
+        try:
+            with open(self._cache_path(path, digest), "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if data.get("version") != REPORT_CACHE_VERSION:
+            return None
+        section = data["section"]
+        section["name"] = os.path.basename(path)
+        return section
+
+    def _save_cached(self, path: str, digest: str, section: Dict) -> None:
+        cache_path = self._cache_path(path, digest)
+        tmp = cache_path + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"version": REPORT_CACHE_VERSION, "section": section}, f)
+            os.replace(tmp, cache_path)
+        except OSError:
+            pass
+
+
+def write_pdf(content: str, path: str) -> None:
+    """HTML içeriğini A4 PDF'e basar (QTextDocument, gömülü data: görseller)."""
+    doc = QTextDocument()
+    doc.setHtml(content)
+
+    writer = QPdfWriter(path)
+    writer.setPageLayout(
+        QPageLayout(
+            QPageSize(QPageSize.PageSizeId.A4),
+            QPageLayout.Orientation.Portrait,
+            QMarginsF(12, 12, 12, 12),
+        )
+    )
+    writer.setResolution(96)
+    doc.setPageSize(writer.pageLayout().paintRectPixels(96).size().toSizeF())
+    doc.print(writer)
+
+
+# ============================================================
+#                       ARKA PLAN İŞÇİSİ
+# ============================================================
+class ReportWorker(QThread):
+    """SessionReport'u GUI thread'i dışında üretip dosyaya yazar."""
+
+    progress = pyqtSignal(int, int)
+    written = pyqtSignal(str)
+    failed = pyqtSignal(str)
+
+    def __init__(self, report: SessionReport, path: str, parent=None):
+        super().__init__(parent)
+        self.report = report
+        self.path = path
+
+    def run(self):
+        try:
+            self.report.write(self.path, progress_cb=self.progress.emit)
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self.written.emit(self.path)
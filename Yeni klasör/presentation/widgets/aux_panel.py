@@ -0,0 +1,160 @@
+from typing import TYPE_CHECKING, Dict
+
+from PyQt6.QtWidgets import (
+    QWidget,
+    QLabel,
+    QCheckBox,
+    QVBoxLayout,
+    QHBoxLayout,
+)
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtGui import QFont, QPen
+import numpy as np
+
+from core.channels import AUX_CHANNELS, AUX_CHANNELS_BY_KEY
+from domain.aux_stream import AuxStream
+from presentation.widgets.graph_panel import _pyqtgraph
+
+if TYPE_CHECKING:
+    import pyqtgraph as pg
+
+
+class AuxPanel(QWidget):
+    """
+    Hızlı kanalların (titreşim vb.) canlı min/max zarf görünümü.
+
+    Çizim blok gelişine bağlı değildir: sabit aralıklı zamanlayıcı her
+    turda AuxStream.envelope() ile piksel başına bir min/max çifti alır ve
+    değişen kanalları yeniden çizer. Örnek sayısı ne olursa olsun çizilen
+    nokta sayısı grafik genişliğiyle sınırlıdır.
+    """
+
+    VIEW_SECONDS = 5.0
+    REFRESH_MS = 100
+    PANEL_HEIGHT = 180
+
+    def __init__(self, streams: Dict[str, AuxStream], parent=None):
+        super().__init__(parent)
+        self.streams = streams
+        self.setFixedHeight(self.PANEL_HEIGHT)
+
+        self.layout = QHBoxLayout(self)
+        self.layout.setContentsMargins(4, 0, 4, 4)
+        self.layout.setSpacing(6)
+
+        self.plot_widgets: Dict[str, "pg.PlotWidget"] = {}
+        self.curves: Dict[str, "pg.PlotDataItem"] = {}
+        self.title_checkboxes: Dict[str, QCheckBox] = {}
+        self._containers: Dict[str, QVBoxLayout] = {}
+        self._drawn_count: Dict[str, int] = {}
+
+        for ch in AUX_CHANNELS:
+            container = QWidget()
+            vbox = QVBoxLayout(container)
+            vbox.setContentsMargins(0, 0, 0, 0)
+            vbox.setSpacing(2)
+
+            title_widget = QWidget()
+            title_row = QHBoxLayout(title_widget)
+            title_row.setContentsMargins(0, 0, 0, 0)
+            title_row.setSpacing(6)
+
+            title_label = QLabel(f"{ch.title} — {ch.rate_hz:g} Hz envelope")
+            title_label.setObjectName("graphTitleLabel")
+
+            checkbox = QCheckBox()
+            checkbox.setChecked(True)
+            checkbox.stateChanged.connect(
+                lambda _state, k=ch.key: self._invalidate(k)
+            )
+
+            title_row.addWidget(title_label)
+            title_row.addWidget(checkbox)
+            vbox.addWidget(title_widget, alignment=Qt.AlignmentFlag.AlignHCenter)
+
+            self.title_checkboxes[ch.key] = checkbox
+            self._containers[ch.key] = vbox
+            self.layout.addWidget(container)
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(self.REFRESH_MS)
+        self._timer.timeout.connect(self.refresh)
+
+    # ============================================================
+    #                       YAŞAM DÖNGÜSÜ
+    # ============================================================
+    def activate(self):
+        """İlk blok geldiğinde görünür olur ve yenilemeye başlar."""
+        if not self.isVisible():
+            self.show()
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def stop(self):
+        self._timer.stop()
+
+    def clear_all(self):
+        for key, curve in self.curves.items():
+            curve.setData([], [])
+            self._drawn_count[key] = -1
+
+    def _invalidate(self, key: str):
+        self._drawn_count[key] = -1
+        self.refresh()
+
+    # ============================================================
+    #                       ÇİZİM
+    # ============================================================
+    def _plot(self, key: str):
+        pw = self.plot_widgets.get(key)
+        if pw is not None:
+            return pw
+
+        pg = _pyqtgraph()
+        pw = pg.PlotWidget()
+        black_pen = QPen(Qt.GlobalColor.black)
+        for name in ("left", "bottom"):
+            axis = pw.getAxis(name)
+            axis.setTickFont(QFont("Segoe UI", 9))
+            axis.setPen(black_pen)
+            axis.setTextPen(black_pen)
+        pw.setBackground("#ffffff")
+        pw.showGrid(x=True, y=True, alpha=0.25)
+        pw.setLabel("left", AUX_CHANNELS_BY_KEY[key].unit, color="black")
+        pw.setLabel("bottom", "Time (s)", color="black")
+        pw.getAxis("bottom").enableAutoSIPrefix(False)
+        pw.setMouseEnabled(x=False, y=False)
+
+        self.curves[key] = pw.plot([], [], pen=pg.mkPen("#0078ff", width=1))
+        self.plot_widgets[key] = pw
+        self._containers[key].addWidget(pw, stretch=1)
+        return pw
+
+    def refresh(self):
+        for key, stream in self.streams.items():
+            if stream.count == self._drawn_count.get(key):
+                continue
+            self._drawn_count[key] = stream.count
+
+            pw = self._plot(key)
+            curve = self.curves[key]
+            if not self.title_checkboxes[key].isChecked() or stream.count == 0:
+                curve.setData([], [])
+                continue
+
+            centers, mins, maxs = stream.envelope(
+                self.VIEW_SECONDS, max(50, pw.width())
+            )
+            ok = np.isfinite(mins)
+            # Kova başına dikey min-max çizgisi (connect="pairs")
+            xs = np.repeat(centers[ok], 2)
+            ys = np.column_stack((mins[ok], maxs[ok])).ravel()
+            curve.setData(xs, ys, connect="pairs")
+
+            t_end = stream.t0 + stream.count / stream.rate_hz
+            t_start = max(0.0, t_end - self.VIEW_SECONDS)
+            pw.setXRange(t_start, t_start + self.VIEW_SECONDS, padding=0)
+            if len(ys):
+                lo, hi = float(ys.min()), float(ys.max())
+                span = (hi - lo) or (abs(hi) or 1.0)
+                pw.setYRange(lo - 0.1 * span, hi + 0.1 * span, padding=0)
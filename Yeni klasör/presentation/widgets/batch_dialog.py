@@ -0,0 +1,176 @@
+import os
+from typing import Dict, List
+
+from PyQt6.QtWidgets import (
+    QDialog,
+    QWidget,
+    QVBoxLayout,
+    QHBoxLayout,
+    QLabel,
+    QPushButton,
+    QComboBox,
+    QTableWidget,
+    QTableWidgetItem,
+    QSplitter,
+)
+from PyQt6.QtGui import QFont
+from PyQt6.QtCore import Qt, QThread, pyqtSignal
+import pyqtgraph as pg
+
+from data.batch_analyzer import COMPARISON_COLUMNS, BatchAnalyzer, comparison_rows
+from core.channels import PLOT_TITLES
+from domain.segment_summary import CURVE_PAIRS
+
+
+AXIS_LABELS = {key: PLOT_TITLES[key] for pair in CURVE_PAIRS for key in pair}
+
+
+class _BatchWorker(QThread):
+    """BatchAnalyzer'ı GUI thread'i dışında çalıştırır."""
+
+    progress = pyqtSignal(int, int)
+    results_ready = pyqtSignal(list)
+    failed = pyqtSignal(str)
+
+    def __init__(self, analyzer: BatchAnalyzer, parent=None):
+        super().__init__(parent)
+        self.analyzer = analyzer
+
+    def run(self):
+        try:
+            results = self.analyzer.run(progress_cb=self.progress.emit)
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self.results_ready.emit(results)
+
+
+class BatchCompareDialog(QDialog):
+    """
+    Bir klasördeki tüm segmentleri karşılaştıran pencere:
+    - Üstte metrik tablosu (özet metrikleri + yüzdelikler)
+    - Altta seçilen karakteristik eğrinin (örn. thrust vs current) üst üste çizimi
+    """
+
+    def __init__(self, folder: str, parent=None):
+        super().__init__(parent)
+        self.setObjectName("SummaryDialog")
+        self.setWindowTitle("Segment Comparison")
+        self.resize(1100, 720)
+
+        self.folder = folder
+        self.analyzer = BatchAnalyzer(folder)
+        self.results: List[Dict] = []
+
+        layout = QVBoxLayout(self)
+
+        title = QLabel("Segment Comparison")
+        title.setObjectName("SummaryTitle")
+        title.setFont(QFont("Segoe UI", 16, QFont.Weight.Bold))
+        layout.addWidget(title)
+
+        self.info_label = QLabel(f"Folder: {folder}")
+        layout.addWidget(self.info_label)
+
+        splitter = QSplitter(Qt.Orientation.Vertical)
+
+        self.table = QTableWidget(0, len(COMPARISON_COLUMNS) + 1)
+        self.table.setHorizontalHeaderLabels(
+            ["Segment"] + [c[0] for c in COMPARISON_COLUMNS]
+        )
+        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        splitter.addWidget(self.table)
+
+        plot_box = QWidget()
+        plot_layout = QVBoxLayout(plot_box)
+        plot_layout.setContentsMargins(0, 0, 0, 0)
+
+        self.pair_combo = QComboBox()
+        for x_key, y_key in CURVE_PAIRS:
+            self.pair_combo.addItem(
+                f"{AXIS_LABELS[y_key]} vs {AXIS_LABELS[x_key]}", (x_key, y_key)
+            )
+        self.pair_combo.currentIndexChanged.connect(self._draw_curves)
+        plot_layout.addWidget(self.pair_combo)
+
+        self.plot = pg.PlotWidget()
+        self.plot.setBackground("#ffffff")
+        self.plot.showGrid(x=True, y=True, alpha=0.25)
+        self.plot.addLegend()
+        plot_layout.addWidget(self.plot)
+        splitter.addWidget(plot_box)
+        layout.addWidget(splitter, stretch=1)
+
+        btn_layout = QHBoxLayout()
+        btn_layout.addStretch()
+        self.btn_export = QPushButton("Export CSV")
+        self.btn_export.setEnabled(False)
+        self.btn_export.clicked.connect(self._export_csv)
+        btn_layout.addWidget(self.btn_export)
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(self.accept)
+        btn_layout.addWidget(close_btn)
+        layout.addLayout(btn_layout)
+
+        self._worker = _BatchWorker(self.analyzer, self)
+        self._worker.progress.connect(self._on_progress)
+        self._worker.results_ready.connect(self._on_results)
+        self._worker.failed.connect(self._on_failed)
+        self._worker.start()
+
+    # ======================================================
+    # WORKER SONUÇLARI
+    # ======================================================
+    def _on_progress(self, done: int, total: int):
+        self.info_label.setText(f"Folder: {self.folder}  —  analyzing {done}/{total}")
+
+    def _on_failed(self, message: str):
+        self.info_label.setText(f"⚠ Analysis failed: {message}")
+
+    def _on_results(self, results: list):
+        self.results = results
+        self.info_label.setText(
+            f"Folder: {self.folder}  —  {len(results)} segment(s)"
+        )
+
+        rows = comparison_rows(results)
+        self.table.setRowCount(len(rows))
+        for r, (name, cells) in enumerate(rows):
+            self.table.setItem(r, 0, QTableWidgetItem(name))
+            for c, text in enumerate(cells, start=1):
+                item = QTableWidgetItem(text)
+                item.setTextAlignment(
+                    Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+                )
+                self.table.setItem(r, c, item)
+        self.table.resizeColumnsToContents()
+
+        self.btn_export.setEnabled(bool(results))
+        self._draw_curves()
+
+    def _draw_curves(self):
+        x_key, y_key = self.pair_combo.currentData()
+        self.plot.clear()
+        self.plot.setLabel("bottom", AXIS_LABELS[x_key], color="black")
+        self.plot.setLabel("left", AXIS_LABELS[y_key], color="black")
+
+        n = max(1, len(self.results))
+        for i, res in enumerate(self.results):
+            xs, ys = res["curves"].get(f"{y_key}:{x_key}", ([], []))
+            if not xs:
+                continue
+            self.plot.plot(
+                xs,
+                ys,
+                pen=pg.mkPen(pg.intColor(i, hues=n), width=2),
+                name=res["name"],
+            )
+
+    def _export_csv(self):
+        path = os.path.join(self.folder, "batch_comparison.csv")
+        try:
+            self.analyzer.write_comparison_csv(self.results, path)
+        except OSError as e:
+            self.info_label.setText(f"⚠ Export failed: {e}")
+            return
+        self.info_label.setText(f"Comparison table: {path}")
@@ -0,0 +1,199 @@
+import os
+import time
+from typing import Callable, Dict
+
+from PyQt6.QtWidgets import (
+    QDialog,
+    QDialogButtonBox,
+    QDoubleSpinBox,
+    QFormLayout,
+    QVBoxLayout,
+    QHBoxLayout,
+    QLabel,
+    QLineEdit,
+    QPushButton,
+    QTableWidget,
+    QTableWidgetItem,
+)
+from PyQt6.QtGui import QFont
+from PyQt6.QtCore import Qt
+
+from data.catalog import SegmentCatalog
+
+
+# Sonuç tablosu sütunları: (başlık, alan, biçim); "kanal.istatistik" alanları
+# metrik tablosundan gelir
+RESULT_COLUMNS = (
+    ("Started", "started", None),
+    ("Test", "test_name", None),
+    ("Seg", "segment", "{:d}"),
+    ("Motor", "motor", None),
+    ("Prop", "prop", None),
+    ("Ø (in)", "prop_diameter_in", "{:g}"),
+    ("ESC", "esc", None),
+    ("Battery", "battery", None),
+    ("Duration (s)", "duration_s", "{:.1f}"),
+    ("Max Thrust (kgf)", "thrust_kgf.max", "{:.3f}"),
+    ("Max Current (A)", "current.max", "{:.2f}"),
+    ("Min Voltage (V)", "voltage.min", "{:.2f}"),
+    ("Max Temp (°C)", "temperature.max", "{:.1f}"),
+    ("Stops", "safety_stops", "{:d}"),
+)
+_METRIC_NAMES = [field for _t, field, _f in RESULT_COLUMNS if "." in field]
+
+
+class SetupDialog(QDialog):
+    """Düzenek bilgisi (motor, pervane, ESC, batarya); katalog ve günlüğe yazılır."""
+
+    TEXT_FIELDS = (
+        ("motor", "Motor"),
+        ("prop", "Prop"),
+        ("esc", "ESC"),
+        ("battery", "Battery"),
+        ("notes", "Notes"),
+    )
+
+    def __init__(self, values: Dict, parent=None):
+        super().__init__(parent)
+        self.setObjectName("SummaryDialog")
+        self.setWindowTitle("Test Setup")
+
+        form = QFormLayout(self)
+        self.edits = {}
+        for key, label in self.TEXT_FIELDS:
+            edit = QLineEdit(str(values.get(key) or ""))
+            self.edits[key] = edit
+            form.addRow(label + ":", edit)
+            if key == "prop":
+                self.diameter = self._inch_box(values.get("prop_diameter_in"))
+                self.pitch = self._inch_box(values.get("prop_pitch_in"))
+                form.addRow("Prop diameter (in):", self.diameter)
+                form.addRow("Prop pitch (in):", self.pitch)
+
+        buttons = QDialogButtonBox(
+            QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
+        )
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        form.addRow(buttons)
+
+    @staticmethod
+    def _inch_box(value) -> QDoubleSpinBox:
+        box = QDoubleSpinBox()
+        box.setRange(0.0, 100.0)
+        box.setDecimals(1)
+        box.setSpecialValueText("--")  # 0: belirtilmedi
+        box.setValue(float(value or 0.0))
+        return box
+
+    def values(self) -> Dict:
+        values = {key: edit.text().strip() for key, edit in self.edits.items()}
+        values["prop_diameter_in"] = self.diameter.value() or None
+        values["prop_pitch_in"] = self.pitch.value() or None
+        return values
+
+
+class CatalogDialog(QDialog):
+    """
+    Segment kataloğu araması (modal değil).
+
+    Sorgu katalogda indekslerle yapılır, dosyalar taranmaz; bir satıra çift
+    tıklamak kaydı ana pencerede açar.
+    """
+
+    def __init__(
+        self,
+        catalog: SegmentCatalog,
+        open_recording: Callable[[str], None],
+        parent=None,
+    ):
+        super().__init__(parent)
+        self.setObjectName("SummaryDialog")
+        self.setWindowTitle("Segment Catalog")
+        self.resize(1150, 600)
+        self.setModal(False)
+
+        self.catalog = catalog
+        self.open_recording = open_recording
+        self.rows = []
+
+        layout = QVBoxLayout(self)
+
+        title = QLabel("Segment Catalog")
+        title.setObjectName("SummaryTitle")
+        title.setFont(QFont("Segoe UI", 16, QFont.Weight.Bold))
+        layout.addWidget(title)
+
+        search = QHBoxLayout()
+        self.query_edit = QLineEdit()
+        self.query_edit.setPlaceholderText(
+            "e.g.  prop_diameter_in = 10, thrust_kgf.max > 2   |   motor ~ 2306"
+        )
+        self.query_edit.returnPressed.connect(self.run_query)
+        search.addWidget(self.query_edit, stretch=1)
+        btn_search = QPushButton("Search")
+        btn_search.clicked.connect(self.run_query)
+        search.addWidget(btn_search)
+        layout.addLayout(search)
+
+        self.info_label = QLabel("")
+        layout.addWidget(self.info_label)
+
+        self.table = QTableWidget(0, len(RESULT_COLUMNS))
+        self.table.setHorizontalHeaderLabels([c[0] for c in RESULT_COLUMNS])
+        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.table.cellDoubleClicked.connect(self._on_double_click)
+        layout.addWidget(self.table, stretch=1)
+
+        btn_layout = QHBoxLayout()
+        btn_layout.addStretch()
+        btn_open = QPushButton("Open")
+        btn_open.clicked.connect(lambda: self._on_double_click(self.table.currentRow(), 0))
+        btn_layout.addWidget(btn_open)
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(self.accept)
+        btn_layout.addWidget(close_btn)
+        layout.addLayout(btn_layout)
+
+        self.run_query()
+
+    def run_query(self):
+        t = time.perf_counter()
+        try:
+            self.rows = self.catalog.search(self.query_edit.text(), _METRIC_NAMES)
+        except ValueError as e:
+            self.info_label.setText(f"⚠ {e}  (fields: test_name, motor, prop, "
+                                    f"prop_diameter_in, esc, battery, <channel>.max ...)")
+            return
+        dt_ms = 1000.0 * (time.perf_counter() - t)
+
+        self.table.setRowCount(len(self.rows))
+        for r, row in enumerate(self.rows):
+            for c, (_title, field, fmt) in enumerate(RESULT_COLUMNS):
+                value = row.get(field)
+                if value is None or value == "":
+                    text = "--"
+                elif fmt is None:
+                    text = str(value)
+                else:
+                    text = fmt.format(int(value) if fmt.endswith("d}") else value)
+                item = QTableWidgetItem(text)
+                if fmt is not None:
+                    item.setTextAlignment(
+                        Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+                    )
+                self.table.setItem(r, c, item)
+        self.table.resizeColumnsToContents()
+        self.info_label.setText(
+            f"{len(self.rows)} of {self.catalog.count()} segment(s)  —  {dt_ms:.1f} ms"
+        )
+
+    def _on_double_click(self, row: int, _column: int):
+        if not 0 <= row < len(self.rows):
+            return
+        path = self.rows[row]["path"]
+        if not os.path.exists(path):
+            self.info_label.setText(f"⚠ File not found: {path}")
+            return
+        self.open_recording(path)
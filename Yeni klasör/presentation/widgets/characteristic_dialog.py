@@ -0,0 +1,246 @@
+import os
+from typing import List, Optional
+
+from PyQt6.QtWidgets import (
+    QDialog,
+    QVBoxLayout,
+    QHBoxLayout,
+    QLabel,
+    QComboBox,
+    QCheckBox,
+    QPushButton,
+    QFileDialog,
+)
+from PyQt6.QtGui import QFont
+from PyQt6.QtCore import Qt, QThread, QTimer, pyqtSignal
+import pyqtgraph as pg
+
+from core.constants import CHARACTERISTIC_FIT, CHARACTERISTIC_REFRESH_MS
+from domain.characteristic import (
+    FIT_MODELS,
+    CharacteristicSession,
+    CharacteristicSet,
+    THROTTLE_KEY,
+    axis_label,
+)
+
+
+FIT_TITLES = {
+    None: "No fit",
+    "linear": "Linear",
+    "poly2": "Polynomial (2)",
+    "poly3": "Polynomial (3)",
+    "power": "Power law (a·x^b)",
+}
+LIVE_COLOR = "#0078ff"
+
+
+class _BinWorker(QThread):
+    """Seçilen segment CSV'lerini parça parça okuyup kovalara ekler."""
+
+    file_done = pyqtSignal(object)  # CharacteristicSet
+    failed = pyqtSignal(str)
+
+    def __init__(self, paths: List[str], pairs, parent=None):
+        super().__init__(parent)
+        self.paths = paths
+        self.pairs = pairs
+
+    def run(self):
+        from data.csv_importer import iter_row_chunks, read_header
+
+        for path in self.paths:
+            try:
+                header = read_header(path)
+                curves = CharacteristicSet(self.pairs, os.path.basename(path))
+                for rows in iter_row_chunks(path):
+                    curves.feed_columns(
+                        {key: rows[:, col] for col, key in enumerate(header)}
+                    )
+            except (OSError, ValueError) as e:
+                self.failed.emit(f"{os.path.basename(path)}: {e}")
+                continue
+            self.file_done.emit(curves)
+
+
+class CharacteristicDialog(QDialog):
+    """
+    X-Y karakteristik eğrileri penceresi (modal değil).
+
+    Canlı segmentin kova ortalamaları (± std) ve seçilen modelin uydurması
+    önceki segmentlerin / açılan kayıtların eğrileriyle üst üste çizilir.
+    Kovalar okuma akışıyla main_window'da birikir; pencere yalnızca açıkken
+    ve sabit aralıkla yeniden çizer.
+    """
+
+    def __init__(self, session: CharacteristicSession, parent=None):
+        super().__init__(parent)
+        self.setObjectName("SummaryDialog")
+        self.setWindowTitle("Characteristic Curves")
+        self.resize(900, 640)
+        self.setModal(False)
+
+        self.session = session
+        self._drawn_total = -1
+        self._worker: Optional[_BinWorker] = None
+
+        layout = QVBoxLayout(self)
+
+        title = QLabel("Characteristic Curves")
+        title.setObjectName("SummaryTitle")
+        title.setFont(QFont("Segoe UI", 16, QFont.Weight.Bold))
+        layout.addWidget(title)
+
+        top = QHBoxLayout()
+        self.pair_combo = QComboBox()
+        for x_key, y_key in session.pairs:
+            self.pair_combo.addItem(
+                f"{axis_label(y_key)} vs {axis_label(x_key)}", (x_key, y_key)
+            )
+        self.pair_combo.currentIndexChanged.connect(self._redraw)
+        top.addWidget(self.pair_combo)
+
+        self.fit_combo = QComboBox()
+        for model in (None,) + FIT_MODELS:
+            self.fit_combo.addItem(FIT_TITLES[model], model)
+        self.fit_combo.setCurrentIndex(max(0, self.fit_combo.findData(CHARACTERISTIC_FIT)))
+        self.fit_combo.currentIndexChanged.connect(self._redraw)
+        top.addWidget(self.fit_combo)
+
+        self.spread_check = QCheckBox("Spread (±1σ)")
+        self.spread_check.setChecked(True)
+        self.spread_check.stateChanged.connect(self._redraw)
+        top.addWidget(self.spread_check)
+        top.addStretch()
+        layout.addLayout(top)
+
+        self.plot = pg.PlotWidget()
+        self.plot.setBackground("#ffffff")
+        self.plot.showGrid(x=True, y=True, alpha=0.25)
+        self.plot.addLegend()
+        layout.addWidget(self.plot, stretch=1)
+
+        self.info_label = QLabel("")
+        self.info_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+        layout.addWidget(self.info_label)
+
+        btn_layout = QHBoxLayout()
+        self.btn_add = QPushButton("Add recording…")
+        self.btn_add.setToolTip("Overlay recorded segment CSV files")
+        self.btn_add.clicked.connect(self._add_recordings)
+        btn_layout.addWidget(self.btn_add)
+        btn_clear = QPushButton("Clear overlays")
+        btn_clear.clicked.connect(self._clear_overlays)
+        btn_layout.addWidget(btn_clear)
+        btn_layout.addStretch()
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(self.hide)
+        btn_layout.addWidget(close_btn)
+        layout.addLayout(btn_layout)
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(CHARACTERISTIC_REFRESH_MS)
+        self._timer.timeout.connect(self._on_tick)
+
+    # ============================================================
+    #                       YAŞAM DÖNGÜSÜ
+    # ============================================================
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._timer.start()
+        self._redraw()
+
+    def hideEvent(self, event):
+        self._timer.stop()
+        super().hideEvent(event)
+
+    def _on_tick(self):
+        # Yalnızca canlı kovalara yeni örnek eklendiyse çiz
+        if self.session.live.total != self._drawn_total:
+            self._redraw()
+
+    # ============================================================
+    #                       KATMANLAR
+    # ============================================================
+    def _add_recordings(self):
+        start_dir = ""
+        parent = self.parent()
+        if parent is not None and hasattr(parent, "control_panel"):
+            start_dir = parent.control_panel.output_edit.text().strip()
+        paths, _ = QFileDialog.getOpenFileNames(
+            self, "Add recordings", start_dir, "Segment CSV (*.csv)"
+        )
+        if not paths or (self._worker is not None and self._worker.isRunning()):
+            return
+        self.btn_add.setEnabled(False)
+        self.info_label.setText(f"Reading {len(paths)} recording(s)…")
+        self._worker = _BinWorker(paths, self.session.pairs, self)
+        self._worker.file_done.connect(self._on_file_binned)
+        self._worker.failed.connect(lambda msg: self.info_label.setText(f"⚠ {msg}"))
+        self._worker.finished.connect(lambda: self.btn_add.setEnabled(True))
+        self._worker.start()
+
+    def _on_file_binned(self, curves: CharacteristicSet):
+        self.session.add_overlay(curves)
+        self._redraw()
+
+    def _clear_overlays(self):
+        self.session.clear_overlays()
+        self._redraw()
+
+    # ============================================================
+    #                       ÇİZİM
+    # ============================================================
+    def _redraw(self, *_args):
+        data = self.pair_combo.currentData()
+        if data is None:
+            return
+        pair = x_key, y_key = tuple(data)
+        model = self.fit_combo.currentData()
+
+        self.plot.clear()
+        self.plot.setLabel("bottom", axis_label(x_key), color="black")
+        self.plot.setLabel("left", axis_label(y_key), color="black")
+
+        sets = list(self.session.overlays)
+        live = self.session.live
+        if live.total > 0:
+            sets.append(live)
+
+        fit_lines = []
+        n = max(1, len(self.session.overlays))
+        for i, curves in enumerate(sets):
+            curve = curves.curves.get(pair)
+            if curve is None:
+                continue
+            xs, ys, std, counts = curve.points()
+            if len(xs) == 0:
+                continue
+            color = LIVE_COLOR if curves is live else pg.intColor(i, hues=n)
+
+            if self.spread_check.isChecked():
+                self.plot.addItem(
+                    pg.ErrorBarItem(
+                        x=xs, y=ys, height=2 * std, beam=0, pen=pg.mkPen(color, width=1)
+                    )
+                )
+            self.plot.plot(
+                xs, ys,
+                pen=None, symbol="o", symbolSize=5,
+                symbolPen=pg.mkPen(color), symbolBrush=pg.mkBrush(color),
+                name=curves.label,
+            )
+
+            fit = curve.fit(model) if model else None
+            if fit is not None:
+                fx, fy = fit.curve()
+                self.plot.plot(
+                    fx, fy, pen=pg.mkPen(color, width=2, style=Qt.PenStyle.DashLine)
+                )
+                fit_lines.append(f"{curves.label}: {fit.label()}")
+
+        self._drawn_total = live.total
+        info = [f"Live: {live.total} samples, {len(self.session.overlays)} overlay(s)"]
+        if x_key == THROTTLE_KEY:
+            info.append("throttle is the commanded set point (live segments only)")
+        self.info_label.setText("\n".join(["  |  ".join(info)] + fit_lines))
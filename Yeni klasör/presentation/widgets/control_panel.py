@@ -11,9 +11,11 @@ from PyQt6.QtWidgets import (
     QGridLayout,
     QCheckBox,
     QFileDialog,
-    QSizePolicy
+    QSizePolicy,
+    QSlider,
+    QMenu,
 )
-from PyQt6.QtGui import QFont
+from PyQt6.QtGui import QFont, QAction
 from PyQt6.QtCore import Qt
 
 
@@ -21,7 +23,8 @@ class ControlPanel(QWidget):
     """
     Temiz, kurumsal, optimized Control Panel:
     - Üstte TEST KARTI: Start / Stop / Reset + Test Name + Output Folder
-    - Altta grafik gösterim checkbox'ları
+      ve Recording / Analysis menüleri
+    - Altında throttle / motor / sweep / güvenlik satırı
     """
 
     def __init__(self, parent=None):
@@ -81,6 +84,11 @@ class ControlPanel(QWidget):
         self.test_name_edit.setFixedSize(90, 22)
         bar.addWidget(self.test_name_edit)
 
+        self.btn_setup = QPushButton("Setup")
+        self.btn_setup.setFixedSize(55, 22)
+        self.btn_setup.setToolTip("Motor / prop / ESC / battery of this test (saved in the catalog)")
+        bar.addWidget(self.btn_setup)
+
         # --- Folder + Browse ---
 
 
@@ -96,13 +104,89 @@ class ControlPanel(QWidget):
         self.btn_browse.setFixedSize(70, 22)
         bar.addWidget(self.btn_browse)
 
+        # --- Kayıt ve analiz eylemleri (menüler; satır genişliği sabit kalır) ---
+
+        bar.addSpacing(10)
+        recording_menu = QMenu(self)
+        self.act_open_recording = recording_menu.addAction("Open recording…")
+        self.act_open_recording.setToolTip("Open a recorded segment CSV")
+        self.act_catalog = recording_menu.addAction("Catalog…")
+        self.act_catalog.setToolTip("Search all recorded segments")
+        recording_menu.addSeparator()
+        self.act_pin = recording_menu.addAction("Pin reference…")
+        self.act_pin.setToolTip("Pin recorded segments as reference traces in the live graphs")
+        self.act_unpin = recording_menu.addAction("Unpin references")
+        self.act_unpin.setEnabled(False)
+        recording_menu.setToolTipsVisible(True)
+        bar.addWidget(self._menu_button("Recording", recording_menu))
+
+        analysis_menu = QMenu(self)
+        self.act_compare = analysis_menu.addAction("Compare segments")
+        self.act_compare.setToolTip("Compare all segments in the output folder")
+        self.act_report = analysis_menu.addAction("Report…")
+        self.act_report.setToolTip("Generate an HTML/PDF report of the output folder")
+        analysis_menu.addSeparator()
+        self.act_spectrum = analysis_menu.addAction("Spectrum")
+        self.act_spectrum.setToolTip("Live spectrum / spectrogram (Welch FFT)")
+        self.act_curves = analysis_menu.addAction("Characteristic curves")
+        self.act_curves.setToolTip("Characteristic curves (thrust vs RPM / power, efficiency vs throttle)")
+        analysis_menu.setToolTipsVisible(True)
+        bar.addWidget(self._menu_button("Analysis", analysis_menu))
+
         bar.addStretch()
+        test_layout.addLayout(bar)
+
+        # İkinci satır: motor kontrolü
+        motor_bar = QHBoxLayout()
+        motor_bar.setSpacing(8)
+        # --- Throttle (ESC set noktası; bağlıyken etkin) ---
+
+        motor_bar.addWidget(QLabel("Throttle:"))
+
+        self.throttle_slider = QSlider(Qt.Orientation.Horizontal)
+        self.throttle_slider.setRange(0, 1000)  # 0.1 % adım
+        self.throttle_slider.setFixedSize(110, 22)
+        self.throttle_slider.valueChanged.connect(self._on_throttle_changed)
+        motor_bar.addWidget(self.throttle_slider)
+
+        self.throttle_label = QLabel("0.0 %")
+        self.throttle_label.setFixedWidth(44)
+        motor_bar.addWidget(self.throttle_label)
+
+        self.btn_motor_stop = QPushButton("Cut")
+        self.btn_motor_stop.setFixedSize(50, 22)
+        self.btn_motor_stop.setToolTip("Stop the motor immediately")
+        motor_bar.addWidget(self.btn_motor_stop)
+
+        self.btn_sweep = QPushButton("Sweep")
+        self.btn_sweep.setFixedSize(60, 22)
+        self.btn_sweep.setToolTip("Run a throttle sweep profile (JSON)")
+        motor_bar.addWidget(self.btn_sweep)
+
+        self.sweep_label = QLabel("")
+        motor_bar.addWidget(self.sweep_label)
+
+        # Güvenlik durdurması sonrası kilit; yalnızca kilitliyken görünür
+        self.btn_rearm = QPushButton("Re-arm")
+        self.btn_rearm.setFixedSize(60, 22)
+        self.btn_rearm.setToolTip("Release the safety lock (all limits must be clear)")
+        self.btn_rearm.hide()
+        motor_bar.addWidget(self.btn_rearm)
+
+        self.safety_label = QLabel("")
+        self.safety_label.setStyleSheet("color: #d32f2f; font-weight: bold;")
+        motor_bar.addWidget(self.safety_label)
+
+        self._safety_locked = False
+        self.set_throttle_enabled(False)
+
+        motor_bar.addStretch()
 
         
-        test_layout.addLayout(bar)
+        test_layout.addLayout(motor_bar)
 
-        # ince uzun ayar kısmı
-        test_frame.setFixedHeight(50)
+        # ince uzun ayar kısmı (iki satır)
+        test_frame.setFixedHeight(80)
 
 
 
@@ -122,6 +206,13 @@ class ControlPanel(QWidget):
         # ======================================================
         self.btn_browse.clicked.connect(self._choose_folder)
 
+    @staticmethod
+    def _menu_button(text: str, menu: QMenu) -> QPushButton:
+        button = QPushButton(text)
+        button.setFixedSize(90, 22)
+        button.setMenu(menu)
+        return button
+
     # ==================================================================
     # FOLDER SEÇME
     # ==================================================================
@@ -136,3 +227,48 @@ class ControlPanel(QWidget):
     def set_test_status(self, active: bool):
         self.btn_start_test.setEnabled(not active)
         self.btn_stop_test.setEnabled(active)
+
+    # ==================================================================
+    # THROTTLE
+    # ==================================================================
+    def throttle_percent(self) -> float:
+        return self.throttle_slider.value() / 10.0
+
+    def set_throttle_enabled(self, enabled: bool):
+        self.btn_motor_stop.setEnabled(enabled)
+        # Güvenlik kilidi varken motoru hareket ettiren kontroller kapalı
+        self.throttle_slider.setEnabled(enabled and not self._safety_locked)
+        self.btn_sweep.setEnabled(enabled and not self._safety_locked)
+
+    def reset_throttle(self):
+        """Kaydırıcıyı sıfırlar; valueChanged (komut) yayınlanmaz."""
+        self.show_throttle(0.0)
+
+    def show_throttle(self, percent: float):
+        """Sequencer'ın set noktasını gösterir; komut yayınlanmaz."""
+        value = int(round(percent * 10))
+        self.throttle_slider.blockSignals(True)
+        self.throttle_slider.setValue(value)
+        self.throttle_slider.blockSignals(False)
+        self._on_throttle_changed(value)
+
+    def set_sweep_running(self, running: bool):
+        self.btn_sweep.setText("Abort" if running else "Sweep")
+        self.throttle_slider.setEnabled(
+            not running and self.btn_motor_stop.isEnabled() and not self._safety_locked
+        )
+        if not running:
+            self.sweep_label.clear()
+
+    def set_sweep_progress(self, index: int, count: int):
+        self.sweep_label.setText(f"Step {index + 1}/{count}")
+
+    def set_safety_locked(self, reason: str | None):
+        """Güvenlik kilidini gösterir (None: kilit kalktı)."""
+        self._safety_locked = reason is not None
+        self.btn_rearm.setVisible(self._safety_locked)
+        self.safety_label.setText("" if reason is None else f"SAFETY STOP: {reason}")
+        self.set_throttle_enabled(self.btn_motor_stop.isEnabled())
+
+    def _on_throttle_changed(self, value: int):
+        self.throttle_label.setText(f"{value / 10.0:.1f} %")
@@ -0,0 +1,386 @@
+"""
+Grafik panosunun (4 sütunlu grafik ızgarası) dosyaya aktarımı.
+
+Ekran görüntüsü (QWidget.grab) yerine GraphPanel'in veri tamponlarından
+QPainter ile çizilir; bu yüzden GUI thread'i dışında, istenen çözünürlük
+ve DPI'da çalışabilir. Çıktı biçimi dosya uzantısından seçilir:
+.png/.jpg (QImage), .svg (QSvgGenerator), .pdf (QPdfWriter).
+"""
+
+import math
+import os
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from PyQt6.QtCore import (
+    QMarginsF,
+    QPointF,
+    QRectF,
+    QSize,
+    QSizeF,
+    Qt,
+    QThread,
+    pyqtSignal,
+)
+from PyQt6.QtGui import (
+    QColor,
+    QFont,
+    QImage,
+    QPageSize,
+    QPainter,
+    QPdfWriter,
+    QPen,
+    QPolygonF,
+)
+
+from core.constants import GAP_REGION_COLOR, RAW_TRACE_COLOR, SAFETY_EVENT_COLOR
+
+
+GRID_COLS = 4
+BASE_DPI = 96.0
+POLYLINE_CHUNK = 32
+
+CURVE_COLOR = "#0078ff"
+GRID_COLOR = (0, 0, 0, 40)
+
+
+def export_dashboard(
+    path: str,
+    snapshot: List[Dict],
+    width: int = 1920,
+    height: int = 1080,
+    dpi: float = BASE_DPI,
+) -> None:
+    """
+    GraphPanel.export_snapshot() çıktısını dosyaya yazar.
+
+    width/height piksel cinsindendir; dpi yazı ve çizgi kalınlıklarını
+    ölçekler (96 = ekrandaki boyut). Hata durumunda OSError yükseltir.
+    """
+    ext = os.path.splitext(path)[1].lower()
+
+    if ext == ".svg":
+        from PyQt6.QtSvg import QSvgGenerator
+
+        gen = QSvgGenerator()
+        gen.setFileName(path)
+        gen.setSize(QSize(width, height))
+        gen.setViewBox(QRectF(0, 0, width, height))
+        gen.setResolution(int(dpi))
+        gen.setTitle("GMK AIR Motor Test")
+        painter = QPainter()
+        if not painter.begin(gen):
+            raise OSError(f"SVG could not be written: {path}")
+        try:
+            render_dashboard(painter, width, height, snapshot, dpi / BASE_DPI)
+        finally:
+            painter.end()
+        return
+
+    if ext == ".pdf":
+        writer = QPdfWriter(path)
+        writer.setResolution(int(dpi))
+        writer.setPageSize(
+            QPageSize(
+                QSizeF(width * 25.4 / dpi, height * 25.4 / dpi),
+                QPageSize.Unit.Millimeter,
+            )
+        )
+        writer.setPageMargins(QMarginsF(0, 0, 0, 0))
+        painter = QPainter()
+        if not painter.begin(writer):
+            raise OSError(f"PDF could not be written: {path}")
+        try:
+            vp = painter.viewport()
+            render_dashboard(painter, vp.width(), vp.height(), snapshot, dpi / BASE_DPI)
+        finally:
+            painter.end()
+        return
+
+    image = QImage(width, height, QImage.Format.Format_ARGB32)
+    dots_per_meter = int(round(dpi / 0.0254))
+    image.setDotsPerMeterX(dots_per_meter)
+    image.setDotsPerMeterY(dots_per_meter)
+    painter = QPainter(image)
+    try:
+        render_dashboard(painter, width, height, snapshot, dpi / BASE_DPI)
+    finally:
+        painter.end()
+    if not image.save(path):
+        raise OSError(f"Image could not be written: {path}")
+
+
+# ============================================================
+#                           ÇİZİM
+# ============================================================
+def render_dashboard(
+    painter: QPainter, width: int, height: int, snapshot: List[Dict], scale: float = 1.0
+) -> None:
+    painter.fillRect(QRectF(0, 0, width, height), QColor("#ffffff"))
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+
+    rows = max(1, math.ceil(len(snapshot) / GRID_COLS))
+    cell_w = width / GRID_COLS
+    cell_h = height / rows
+    for index, channel in enumerate(snapshot):
+        row = index // GRID_COLS
+        col = index % GRID_COLS
+        cell = QRectF(col * cell_w, row * cell_h, cell_w, cell_h)
+        painter.save()
+        try:
+            _render_channel(painter, cell, channel, scale)
+        finally:
+            painter.restore()
+
+
+def render_channel_image(
+    channel: Dict, width: int, height: int, dpi: float = BASE_DPI
+) -> QImage:
+    """Tek kanalın grafiğini QImage olarak çizer (rapor üreteci için)."""
+    image = QImage(width, height, QImage.Format.Format_ARGB32)
+    image.fill(0xFFFFFFFF)
+    painter = QPainter(image)
+    try:
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        _render_channel(painter, QRectF(0, 0, width, height), channel, dpi / BASE_DPI)
+    finally:
+        painter.end()
+    return image
+
+
+def _font(px: float, scale: float, bold: bool = False) -> QFont:
+    font = QFont("Segoe UI")
+    font.setPixelSize(max(1, int(round(px * scale))))
+    font.setBold(bold)
+    return font
+
+
+def _render_channel(painter: QPainter, cell: QRectF, ch: Dict, s: float):
+    title_h = 30 * s
+    left = cell.left() + 72 * s
+    right = cell.right() - 12 * s
+    top = cell.top() + title_h
+    bottom = cell.bottom() - 42 * s
+    plot = QRectF(QPointF(left, top), QPointF(right, bottom))
+    if plot.width() <= 0 or plot.height() <= 0:
+        return
+
+    # ————— Başlık —————
+    painter.setPen(QColor("#000000"))
+    painter.setFont(_font(16, s, bold=True))
+    painter.drawText(
+        QRectF(cell.left(), cell.top(), cell.width(), title_h),
+        Qt.AlignmentFlag.AlignCenter,
+        ch["title"],
+    )
+
+    x0, x1 = ch["x_range"]
+    y0, y1 = ch["y_range"]
+    if not x1 > x0:
+        x1 = x0 + 1.0
+    if not y1 > y0:
+        y0, y1 = y0 - 0.5, y1 + 0.5
+
+    def px(x):
+        return plot.left() + (x - x0) / (x1 - x0) * plot.width()
+
+    def py(y):
+        return plot.bottom() - (y - y0) / (y1 - y0) * plot.height()
+
+    # ————— Izgara + eksen yazıları —————
+    painter.setFont(_font(12, s))
+    grid_pen = QPen(QColor(*GRID_COLOR))
+    grid_pen.setWidthF(1.0 * s)
+    text_pen = QPen(QColor("#000000"))
+
+    x_ticks = nice_ticks(x0, x1)
+    for v in x_ticks:
+        x = px(v)
+        painter.setPen(grid_pen)
+        painter.drawLine(QPointF(x, plot.top()), QPointF(x, plot.bottom()))
+        painter.setPen(text_pen)
+        painter.drawText(
+            QRectF(x - 40 * s, plot.bottom() + 2 * s, 80 * s, 18 * s),
+            Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop,
+            format_tick(v, x_ticks),
+        )
+
+    y_ticks = nice_ticks(y0, y1)
+    for v in y_ticks:
+        y = py(v)
+        painter.setPen(grid_pen)
+        painter.drawLine(QPointF(plot.left(), y), QPointF(plot.right(), y))
+        painter.setPen(text_pen)
+        painter.drawText(
+            QRectF(cell.left(), y - 9 * s, plot.left() - cell.left() - 6 * s, 18 * s),
+            Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
+            format_tick(v, y_ticks),
+        )
+
+    painter.drawText(
+        QRectF(plot.left(), plot.bottom() + 20 * s, plot.width(), 20 * s),
+        Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop,
+        "Time (s)",
+    )
+    painter.save()
+    painter.translate(cell.left() + 4 * s, plot.center().y())
+    painter.rotate(-90)
+    painter.drawText(
+        QRectF(-plot.height() / 2, 0, plot.height(), 18 * s),
+        Qt.AlignmentFlag.AlignCenter,
+        ch["unit"],
+    )
+    painter.restore()
+
+    # ————— Veri —————
+    painter.save()
+    painter.setClipRect(plot)
+
+    for t_start, t_end in ch.get("gaps", []):
+        if t_end is None:
+            pen = QPen(QColor(*GAP_REGION_COLOR[:3]))
+            pen.setWidthF(1.0 * s)
+            pen.setStyle(Qt.PenStyle.DashLine)
+            painter.setPen(pen)
+            painter.drawLine(
+                QPointF(px(t_start), plot.top()), QPointF(px(t_start), plot.bottom())
+            )
+        else:
+            painter.fillRect(
+                QRectF(QPointF(px(t_start), plot.top()), QPointF(px(t_end), plot.bottom())),
+                QColor(*GAP_REGION_COLOR),
+            )
+
+    if ch.get("events"):
+        pen = QPen(QColor(*SAFETY_EVENT_COLOR))
+        pen.setWidthF(2.0 * s)
+        painter.setPen(pen)
+        for t, _label in ch["events"]:
+            painter.drawLine(QPointF(px(t), plot.top()), QPointF(px(t), plot.bottom()))
+
+    n_px = max(1, int(plot.width()))
+    if ch.get("raw_x") is not None:
+        pen = QPen(QColor(*RAW_TRACE_COLOR))
+        pen.setWidthF(1.0 * s)
+        _draw_series(painter, pen, ch["raw_x"], ch["raw_y"], px, py, n_px)
+
+    pen = QPen(QColor(CURVE_COLOR))
+    pen.setWidthF(2.0 * s)
+    _draw_series(painter, pen, ch["x"], ch["y"], px, py, n_px)
+    painter.restore()
+
+    frame_pen = QPen(QColor("#000000"))
+    frame_pen.setWidthF(1.0 * s)
+    painter.setPen(frame_pen)
+    painter.setBrush(Qt.BrushStyle.NoBrush)
+    painter.drawRect(plot)
+
+
+def _draw_series(painter, pen, x, y, px, py, n_px: int):
+    """NaN noktalarda bölünen çoklu çizgi; çok yoğun veri piksel başına min/max'a indirgenir."""
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    if len(x) == 0:
+        return
+    if len(x) > 4 * n_px:
+        x, y = _decimate_minmax(x, y, n_px)
+
+    painter.setPen(pen)
+    finite = np.isfinite(y)
+    # Sonlu değerlerden oluşan kesintisiz parçalar
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], finite.view(np.int8), [0]))))
+    for start, end in zip(edges[::2], edges[1::2]):
+        xs = px(x[start:end])
+        ys = py(y[start:end])
+        if end - start == 1:
+            painter.drawPoint(QPointF(float(xs[0]), float(ys[0])))
+            continue
+        points = [QPointF(a, b) for a, b in zip(xs.tolist(), ys.tolist())]
+        # Kalın, kenar yumuşatmalı kalemde stroker maliyeti yol uzunluğuyla
+        # doğrusal değil; zikzak veriyi kısa (bir nokta örtüşen) parçalarla çiz
+        for i in range(0, len(points) - 1, POLYLINE_CHUNK):
+            painter.drawPolyline(QPolygonF(points[i : i + POLYLINE_CHUNK + 1]))
+
+
+def _decimate_minmax(x: np.ndarray, y: np.ndarray, n_px: int):
+    bins = np.linspace(x[0], x[-1], n_px + 1)
+    idx = np.clip(np.searchsorted(bins, x, side="right") - 1, 0, n_px - 1)
+    out_x: List[float] = []
+    out_y: List[float] = []
+    bounds = np.flatnonzero(np.diff(idx)) + 1
+    for seg in np.split(np.arange(len(x)), bounds):
+        ys = y[seg]
+        ok = np.isfinite(ys)
+        if not ok.any():
+            out_x.append(float(x[seg[0]]))
+            out_y.append(math.nan)
+            continue
+        i_min = seg[ok][np.argmin(ys[ok])]
+        i_max = seg[ok][np.argmax(ys[ok])]
+        for i in sorted((i_min, i_max)):
+            out_x.append(float(x[i]))
+            out_y.append(float(y[i]))
+    return np.asarray(out_x), np.asarray(out_y)
+
+
+def nice_ticks(lo: float, hi: float, target: int = 6) -> List[float]:
+    """lo..hi aralığında 1/2/5 x 10^n adımlı okunaklı tik değerleri."""
+    span = hi - lo
+    if not span > 0 or not math.isfinite(span):
+        return []
+    raw = span / target
+    mag = 10 ** math.floor(math.log10(raw))
+    step = next(m * mag for m in (1, 2, 5, 10) if m * mag >= raw)
+    first = math.ceil(lo / step) * step
+    return [first + i * step for i in range(int((hi - first) / step) + 1)]
+
+
+def format_tick(value: float, ticks: List[float]) -> str:
+    """Tik adımının gerektirdiği kadar ondalıkla yazar (5, 0.25, 0.002 ...)."""
+    step = ticks[1] - ticks[0] if len(ticks) > 1 else abs(value) or 1.0
+    decimals = max(0, -math.floor(math.log10(step) + 1e-9))
+    text = f"{value:.{min(decimals, 8)}f}"
+    return "0" if text.strip("-0.") == "" else text
+
+
+# ============================================================
+#                       ARKA PLAN İŞÇİSİ
+# ============================================================
+class ExportWorker(QThread):
+    """
+    Bir veya birden çok dosyayı GUI thread'i dışında yazar.
+
+    jobs: [(yol, genişlik, yükseklik, dpi), ...]; hepsi aynı anlık görüntüden.
+    """
+
+    progress = pyqtSignal(int, int)
+    exported = pyqtSignal(list)
+    failed = pyqtSignal(str)
+
+    def __init__(
+        self,
+        snapshot: List[Dict],
+        jobs: List[Tuple[str, int, int, float]],
+        parent=None,
+    ):
+        super().__init__(parent)
+        self.snapshot = snapshot
+        self.jobs = jobs
+
+    def run(self):
+        done: List[str] = []
+        errors: List[str] = []
+        self.progress.emit(0, len(self.jobs))
+        for i, (path, width, height, dpi) in enumerate(self.jobs, start=1):
+            try:
+                export_dashboard(path, self.snapshot, width, height, dpi)
+                done.append(path)
+            except Exception as e:
+                errors.append(f"{os.path.basename(path)}: {e}")
+            self.progress.emit(i, len(self.jobs))
+
+        if done:
+            self.exported.emit(done)
+        if errors:
+            self.failed.emit("\n".join(errors))
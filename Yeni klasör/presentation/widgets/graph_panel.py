@@ -1,4 +1,4 @@
-from typing import Dict, List, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 from PyQt6.QtWidgets import (
     QWidget,
@@ -8,94 +8,123 @@ from PyQt6.QtWidgets import (
     QVBoxLayout,
     QHBoxLayout,
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QEvent, QTimer
 from PyQt6.QtGui import QFont, QPen
-import pyqtgraph as pg
+import numpy as np
+
+from core.channels import CHANNELS, CSV_PRECISION
+from core.constants import (
+    CROSSHAIR_COLOR,
+    CROSSHAIR_RATE_HZ,
+    GAP_REGION_COLOR,
+    LIVE_BUFFER_MAX_SAMPLES,
+    RAW_TRACE_COLOR,
+    REFERENCE_COLORS,
+    SAFETY_EVENT_COLOR,
+)
+from domain.sample_buffer import SampleBuffer
+
+if TYPE_CHECKING:
+    import pyqtgraph as pg
+
+
+_pg = None
+
+
+def _pyqtgraph():
+    """pyqtgraph'ı ilk grafik oluşturulurken import eder (açılış süresi)."""
+    global _pg
+    if _pg is None:
+        import pyqtgraph
+
+        pyqtgraph.setConfigOptions(antialias=True)
+        _pg = pyqtgraph
+    return _pg
 
 
 class GraphPanel(QWidget):
-    """8 ayrı grafiği rolling-window ve smooth autoscale ile çizer."""
+    """
+    Kanal kaydındaki her kanal için ayrı grafiği (4 sütunlu ızgara) rolling-window ve smooth autoscale ile çizer.
+
+    Pencerenin ilk karesi geciktirilmesin diye grafikler panel ilk kez
+    çizildikten sonra olay döngüsünün her turunda birer birer oluşturulur;
+    grafiğe erişen her metot önce bekleyenleri tamamlar (_ensure_plots).
+
+    Pencere tamponları SampleBuffer'dır (float32 değer, kanal başına en
+    fazla max_samples örnek); bellek bütçesi shrink_memory() ile küçültür.
+
+    İmleç: fare bir grafiğin üzerindeyken tüm grafiklerde aynı zamanda dikey
+    çizgi, her grafikte o andaki değerde yatay çizgi ve başlık yanında değer
+    gösterilir. Fare olayları CROSSHAIR_RATE_HZ ile seyreltilir; değer
+    eğrinin zaman dizisinde ikili aramayla (searchsorted) bulunur.
+
+    Referans izler: sabitlenen önceki segmentler segment zamanına hizalı,
+    soluk renkte çizilir ve clear_all() ile silinmez. Seyreltilmiş diziler
+    bir kez verilir; eğriye yalnızca pencereyi yarım pencere önden ve
+    arkadan kapsayan dilim yüklenir ve dilim ancak kayan pencere ondan
+    taşınca yenilenir, böylece canlı örnek başına ek iş yoktur.
+    """
 
     WINDOW_SECONDS = 30.0
     SMOOTH_FACTOR = 0.15
     MIN_MARGIN_RATIO = 0.10
+    RECORDING_REFRESH_MS = 30
+    GRID_COLUMNS = 4
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, max_samples: int = LIVE_BUFFER_MAX_SAMPLES):
         super().__init__(parent)
-
-        pg.setConfigOptions(antialias=True)
+        self.max_samples = max_samples
 
         self.layout = QGridLayout(self)
         self.layout.setContentsMargins(4, 4, 4, 4)
         self.layout.setSpacing(6)
 
-        self.plot_widgets: Dict[str, pg.PlotWidget] = {}
-        self.curves: Dict[str, pg.PlotDataItem] = {}
-        self.data: Dict[str, List[Tuple[float, float]]] = {}
+        self.plot_widgets: Dict[str, "pg.PlotWidget"] = {}
+        self.curves: Dict[str, "pg.PlotDataItem"] = {}
+        self.data: Dict[str, SampleBuffer] = {}
         self.title_checkboxes: Dict[str, QCheckBox] = {}
+        self.value_labels: Dict[str, QLabel] = {}
 
-        titles = {
-            "thrust_kgf": "Thrust (kgf)",
-            "voltage": "Voltage (V)",
-            "current": "Current (A)",
-            "rpm": "Motor Speed (RPM)",
-            "temperature": "Temperature (°C)",
-            "power": "Electrical Power (W)",
-            "pt_eff": "PT Efficiency (kgf/W)",
-            "tpa": "Thrust per Amp (kgf/A)",
-        }
-
-        units = {
-            "thrust_kgf": "kgf",
-            "voltage": "V",
-            "current": "A",
-            "rpm": "RPM",
-            "temperature": "°C",
-            "power": "W",
-            "pt_eff": "kgf/W",
-            "tpa": "kgf/A",
-        }
-
-        keys = list(titles.keys())
-
-        # -------------------------------------------------------
-        #             ANA GRAFİK OLUŞTURMA DÖNGÜSÜ
-        # -------------------------------------------------------
-        for i, key in enumerate(keys):
-            row = i // 4
-            col = i % 4
-
-            # ————— Plot widget —————
-            pw = pg.PlotWidget()
+        # Filtrelenen kanalların ham izleri (ilk ham örnekle birlikte oluşur)
+        self.raw_curves: Dict[str, "pg.PlotDataItem"] = {}
+        self.raw_data: Dict[str, SampleBuffer] = {}
 
-            left_axis = pw.getAxis("left")
-            bottom_axis = pw.getAxis("bottom")
+        # Bağlantı kesintisi (çizgi / gölgeli bölge) ve olay işaretleri
+        # grafik başına
+        self.marker_items: Dict[str, list] = {}
+        self.gaps: List[List[Optional[float]]] = []  # [t_start, t_end | None]
+        self.events: List[Tuple[float, str]] = []  # (t, etiket)
 
-            black_pen = QPen(Qt.GlobalColor.black)
-            left_axis.setTickFont(QFont("Segoe UI", 10))
-            bottom_axis.setTickFont(QFont("Segoe UI", 10))
-            left_axis.setPen(black_pen)
-            bottom_axis.setPen(black_pen)
-            left_axis.setTextPen(black_pen)
-            bottom_axis.setTextPen(black_pen)
+        # İmleç: grafik başına (dikey, yatay) çizgi; fare olayı vekilleri
+        self.cursor_t: Optional[float] = None
+        self._cursor_lines: Dict[str, Tuple["pg.InfiniteLine", "pg.InfiniteLine"]] = {}
+        self._mouse_proxies: List["pg.SignalProxy"] = []
 
-            pw.setBackground("#ffffff")
-            pw.showGrid(x=True, y=True, alpha=0.25)
+        # Sabitlenmiş referans segmentler (clear_all() ile silinmez)
+        self.references: List[_ReferenceTrace] = []
 
-            pw.setLabel("left", units[key], color="black")
-            pw.setLabel("bottom", "Time (s)", color="black")
+        # Offline (kayıttan açılmış segment) görüntüleme durumu
+        self._recording = None
+        self._recording_timer = QTimer(self)
+        self._recording_timer.setSingleShot(True)
+        self._recording_timer.setInterval(self.RECORDING_REFRESH_MS)
+        self._recording_timer.timeout.connect(self._refresh_recording_view)
 
-            axis = pw.getAxis("bottom")
-            axis.setTickSpacing(major=5, minor=1)
-            axis.enableAutoSIPrefix(False)
+        # Henüz oluşturulmamış grafikler: key -> (yer tutucu, konteyner düzeni)
+        self._pending_plots: Dict[str, Tuple[QWidget, QVBoxLayout]] = {}
+        self._build_scheduled = False
 
-            pw.setXRange(0, self.WINDOW_SECONDS, padding=0)
+        self.titles = {ch.key: ch.title for ch in CHANNELS}
+        self.units = {ch.key: ch.unit for ch in CHANNELS}
 
-            curve = pw.plot([], [], pen=pg.mkPen("#0078ff", width=2))
+        # -------------------------------------------------------
+        #             ANA GRAFİK OLUŞTURMA DÖNGÜSÜ
+        # -------------------------------------------------------
+        for i, key in enumerate(self.titles):
+            row = i // self.GRID_COLUMNS
+            col = i % self.GRID_COLUMNS
 
-            self.plot_widgets[key] = pw
-            self.curves[key] = curve
-            self.data[key] = []
+            self.data[key] = SampleBuffer(self.max_samples)
 
             # ——————————————————————————————————————————————
             #             BAŞLIK + TİK KONTEYNERİ
@@ -110,7 +139,7 @@ class GraphPanel(QWidget):
             title_row.setContentsMargins(0, 0, 0, 0)
             title_row.setSpacing(6)
 
-            title_label = QLabel(titles[key])
+            title_label = QLabel(self.titles[key])
             title_label.setObjectName("graphTitleLabel")
 
             checkbox = QCheckBox()
@@ -121,52 +150,165 @@ class GraphPanel(QWidget):
                 )
             )
 
+            # İmleçteki değer (imleç yokken boş)
+            value_label = QLabel("")
+            value_label.setObjectName("graphCursorLabel")
+
             # Başlık + checkbox yan yana
             title_row.addWidget(title_label)
             title_row.addWidget(checkbox)
+            title_row.addWidget(value_label)
 
             # Ortalanmış başlık
             vbox.addWidget(title_widget, alignment=Qt.AlignmentFlag.AlignHCenter)
-            vbox.addWidget(pw)
+
+            # Grafik oluşana kadar aynı yeri kaplayan beyaz yer tutucu
+            placeholder = QWidget()
+            placeholder.setObjectName("graphPlaceholder")
+            placeholder.setStyleSheet("background-color: #ffffff;")
+            vbox.addWidget(placeholder, stretch=1)
+            self._pending_plots[key] = (placeholder, vbox)
 
             self.title_checkboxes[key] = checkbox
+            self.value_labels[key] = value_label
 
             # Grid'e ekle
             self.layout.addWidget(container, row, col)
 
+    # ============================================================
+    #                ERTELENMİŞ GRAFİK OLUŞTURMA
+    # ============================================================
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        # İlk kare çizildikten sonra grafikleri oluşturmaya başla
+        if self._pending_plots and not self._build_scheduled:
+            self._build_scheduled = True
+            QTimer.singleShot(0, self._build_next_plot)
+
+    def plots_pending(self) -> bool:
+        return bool(self._pending_plots)
+
+    def _build_next_plot(self):
+        if self._pending_plots:
+            self._build_plot(next(iter(self._pending_plots)))
+        if self._pending_plots:
+            QTimer.singleShot(0, self._build_next_plot)
+
+    def _ensure_plots(self):
+        while self._pending_plots:
+            self._build_plot(next(iter(self._pending_plots)))
+
+    def _build_plot(self, key: str):
+        pg = _pyqtgraph()
+        placeholder, vbox = self._pending_plots.pop(key)
+
+        # ————— Plot widget —————
+        pw = pg.PlotWidget()
+
+        left_axis = pw.getAxis("left")
+        bottom_axis = pw.getAxis("bottom")
+
+        black_pen = QPen(Qt.GlobalColor.black)
+        left_axis.setTickFont(QFont("Segoe UI", 10))
+        bottom_axis.setTickFont(QFont("Segoe UI", 10))
+        left_axis.setPen(black_pen)
+        bottom_axis.setPen(black_pen)
+        left_axis.setTextPen(black_pen)
+        bottom_axis.setTextPen(black_pen)
+
+        pw.setBackground("#ffffff")
+        pw.showGrid(x=True, y=True, alpha=0.25)
+
+        pw.setLabel("left", self.units[key], color="black")
+        pw.setLabel("bottom", "Time (s)", color="black")
+
+        axis = pw.getAxis("bottom")
+        axis.setTickSpacing(major=5, minor=1)
+        axis.enableAutoSIPrefix(False)
+
+        pw.setXRange(0, self.WINDOW_SECONDS, padding=0)
+
+        curve = pw.plot([], [], pen=pg.mkPen("#0078ff", width=2))
+
+        self.plot_widgets[key] = pw
+        self.curves[key] = curve
+
+        # ————— İmleç —————
+        cursor_pen = pg.mkPen(CROSSHAIR_COLOR, width=1, style=Qt.PenStyle.DashLine)
+        v_line = pg.InfiniteLine(angle=90, movable=False, pen=cursor_pen)
+        h_line = pg.InfiniteLine(angle=0, movable=False, pen=cursor_pen)
+        for line in (v_line, h_line):
+            line.setZValue(20)
+            line.hide()
+            pw.addItem(line, ignoreBounds=True)
+        self._cursor_lines[key] = (v_line, h_line)
+        self._mouse_proxies.append(
+            pg.SignalProxy(
+                pw.scene().sigMouseMoved,
+                rateLimit=CROSSHAIR_RATE_HZ,
+                slot=lambda args, k=key: self._on_mouse_moved(k, args[0]),
+            )
+        )
+        pw.installEventFilter(self)
+
+        vbox.replaceWidget(placeholder, pw)
+        vbox.setStretchFactor(pw, 1)
+        placeholder.deleteLater()
+
     # ============================================================
     #                       VERİ EKLEME
     # ============================================================
-    def add_sample(self, key: str, t: float, value: float, visible: bool = True):
+    def add_sample(
+        self,
+        key: str,
+        t: float,
+        value: float,
+        visible: bool = True,
+        raw: Optional[float] = None,
+    ):
         if key not in self.data:
             return
+        self._ensure_plots()
 
-        arr = self.data[key]
-        arr.append((t, value))
-
+        buf = self.data[key]
+        buf.append(t, value)
         min_t = max(0.0, t - self.WINDOW_SECONDS)
-        self.data[key] = [(tx, vy) for (tx, vy) in arr if tx >= min_t]
-
-        xs = [tx for (tx, vy) in self.data[key]]
-        ys = [vy for (tx, vy) in self.data[key]]
+        buf.trim_before(min_t)
+        xs, ys = buf.arrays()
+
+        raw_ys = None
+        if raw is not None:
+            raw_buf = self.raw_data.get(key)
+            if raw_buf is None:
+                raw_buf = self.raw_data[key] = SampleBuffer(self.max_samples)
+            raw_buf.append(t, raw)
+            raw_buf.trim_before(min_t)
+            raw_xs, raw_ys = raw_buf.arrays()
 
         pw = self.plot_widgets[key]
         curve = self.curves[key]
 
         if not visible:
             curve.setData([], [])
+            if key in self.raw_curves:
+                self.raw_curves[key].setData([], [])
             return
 
-        curve.setData(xs, ys)
-        
-        
-        
+        # Kesinti işaretleri (NaN) çizgiyi böler
+        curve.setData(xs, ys, connect="finite")
+        for ref in self.references:
+            ref.follow(key, min_t, t)
+        if raw is not None:
+            self._raw_curve(key).setData(raw_xs, raw_ys, connect="finite")
 
         # ————— Y ekseni smooth autoscale —————
-        if ys:
-            y_min = min(ys)
-            y_max = max(ys)
-
+        y_min, y_max = _finite_range(ys)
+        if raw_ys is not None:
+            raw_min, raw_max = _finite_range(raw_ys)
+            if raw_min is not None:
+                y_min = raw_min if y_min is None else min(y_min, raw_min)
+                y_max = raw_max if y_max is None else max(y_max, raw_max)
+        if y_min is not None:
             if y_min == y_max:
                 y_min -= 0.5
                 y_max += 0.5
@@ -192,76 +334,431 @@ class GraphPanel(QWidget):
         else:
             pw.setXRange(min_t, t, padding=0)
 
+    def samples_since(self, key: str, t: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Tampondaki (son WINDOW_SECONDS) zamanı t'den büyük örnekler."""
+        buf = self.data.get(key)
+        if buf is None:
+            return np.empty(0), np.empty(0)
+        return buf.since(t)
+
+    # ============================================================
+    #                       BELLEK BÜTÇESİ
+    # ============================================================
+    def memory_bytes(self) -> int:
+        buffers = list(self.data.values()) + list(self.raw_data.values())
+        return sum(buf.nbytes for buf in buffers)
+
+    def reference_bytes(self) -> int:
+        return sum(ref.nbytes for ref in self.references)
+
+    def shrink_memory(self) -> None:
+        """Tampon üst sınırını yarıya indirir (eski örnekler düşer)."""
+        self.max_samples = max(SampleBuffer.MIN_CAPACITY, self.max_samples // 2)
+        for buf in list(self.data.values()) + list(self.raw_data.values()):
+            buf.shrink(self.max_samples)
+
+    # ============================================================
+    #                       İMLEÇ (CROSSHAIR)
+    # ============================================================
+    def set_cursor(self, t: float):
+        """İmleci t anına taşır ve her kanalın o andaki değerini gösterir."""
+        self._ensure_plots()
+        self.cursor_t = t
+        for key, (v_line, h_line) in self._cursor_lines.items():
+            v_line.setPos(t)
+            v_line.show()
+
+            xs, ys = self.curves[key].getData()
+            i = _nearest_index(xs, t)
+            value = float(ys[i]) if i is not None else float("nan")
+            if not np.isfinite(value):
+                # Eğri gizli, imleç veri dışında veya kesintide
+                h_line.hide()
+                self.value_labels[key].setText("")
+                continue
+
+            h_line.setPos(value)
+            h_line.show()
+            p = CSV_PRECISION.get(key, 3)
+            self.value_labels[key].setText(
+                f"{value:.{p}f} {self.units[key]}  @ {float(xs[i]):.2f} s"
+            )
+
+    def clear_cursor(self):
+        self.cursor_t = None
+        for v_line, h_line in self._cursor_lines.values():
+            v_line.hide()
+            h_line.hide()
+        for label in self.value_labels.values():
+            label.setText("")
+
+    def _on_mouse_moved(self, key: str, pos):
+        pw = self.plot_widgets[key]
+        vb = pw.getPlotItem().vb
+        # Vekil gecikmeli iletir: fare bu arada grafikten çıkmış olabilir
+        if not pw.underMouse() or not vb.sceneBoundingRect().contains(pos):
+            return
+        self.set_cursor(vb.mapSceneToView(pos).x())
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Leave and obj in self.plot_widgets.values():
+            self.clear_cursor()
+        return super().eventFilter(obj, event)
+
+    # ============================================================
+    #                       REFERANS SEGMENTLER
+    # ============================================================
+    def add_reference(self, label: str, series: Dict[str, Tuple[np.ndarray, np.ndarray]]):
+        """
+        Önceden seyreltilmiş bir segmenti referans iz olarak sabitler.
+
+        series: kanal -> (segment zamanı, değer). REFERENCE_COLORS kadar
+        referans tutulur; dolunca en eskisi kaldırılır.
+        """
+        self._ensure_plots()
+        if len(self.references) >= len(REFERENCE_COLORS):
+            self._remove_reference(self.references[0])
+
+        pg = _pyqtgraph()
+        used = {ref.color for ref in self.references}
+        color = next(c for c in REFERENCE_COLORS if c not in used)
+        ref = _ReferenceTrace(label, color, series)
+        for key, pw in self.plot_widgets.items():
+            if key not in series:
+                continue
+            item = pw.plot([], [], pen=pg.mkPen(color, width=1))
+            item.setZValue(-2)  # ham izin de arkasında
+            item.setVisible(self.title_checkboxes[key].isChecked())
+            ref.items[key] = item
+            t0, t1 = pw.getPlotItem().vb.viewRange()[0]
+            ref.show_range(key, t0, t1)
+        self.references.append(ref)
+
+    def clear_references(self):
+        for ref in list(self.references):
+            self._remove_reference(ref)
+
+    def _remove_reference(self, ref: "_ReferenceTrace"):
+        for key, item in ref.items.items():
+            self.plot_widgets[key].removeItem(item)
+        self.references.remove(ref)
+
+    # ============================================================
+    #                   BAĞLANTI KESİNTİSİ İŞARETLERİ
+    # ============================================================
+    def begin_gap(self, t: float):
+        """
+        Kesinti başlangıcı: eğriler bu noktada bölünür ve kesik dikey
+        çizgi çizilir.
+        """
+        self._ensure_plots()
+        pg = _pyqtgraph()
+        self.gaps.append([t, None])
+        nan = float("nan")
+        for key, pw in self.plot_widgets.items():
+            self.data[key].append(t, nan)
+            if key in self.raw_data:
+                self.raw_data[key].append(t, nan)
+            # Eğriler tampon görünümünü tutar; ekleme tamponu kaydırmış olabilir
+            self.set_curve_visible(key, self.title_checkboxes[key].isChecked())
+
+            line = pg.InfiniteLine(
+                pos=t,
+                angle=90,
+                movable=False,
+                pen=pg.mkPen(GAP_REGION_COLOR[:3], width=1, style=Qt.PenStyle.DashLine),
+            )
+            pw.addItem(line)
+            self.marker_items.setdefault(key, []).append(line)
+
+    def end_gap(self, t_start: float, t_end: float):
+        """Kesinti bitti: [t_start, t_end] aralığı gölgeli bölge olarak işaretlenir."""
+        self._ensure_plots()
+        pg = _pyqtgraph()
+        if self.gaps and self.gaps[-1][1] is None:
+            self.gaps[-1][1] = t_end
+        else:
+            self.gaps.append([t_start, t_end])
+        for key, pw in self.plot_widgets.items():
+            region = pg.LinearRegionItem(
+                values=(t_start, t_end),
+                movable=False,
+                brush=pg.mkBrush(GAP_REGION_COLOR),
+                pen=pg.mkPen(None),
+            )
+            region.setZValue(-10)
+            pw.addItem(region)
+            self.marker_items.setdefault(key, []).append(region)
+
+    def mark_event(self, t: float, label: str):
+        """Güvenlik durdurması gibi anlık olay: tüm grafiklerde dikey çizgi."""
+        self._ensure_plots()
+        pg = _pyqtgraph()
+        self.events.append((t, label))
+        for key, pw in self.plot_widgets.items():
+            line = pg.InfiniteLine(
+                pos=t,
+                angle=90,
+                movable=False,
+                pen=pg.mkPen(SAFETY_EVENT_COLOR, width=2),
+                label=label,
+                labelOpts={"position": 0.92, "color": SAFETY_EVENT_COLOR},
+            )
+            pw.addItem(line)
+            self.marker_items.setdefault(key, []).append(line)
+
     # ============================================================
     #                       GRAFİK TEMİZLEME
     # ============================================================
     def clear_all(self):
+        self._ensure_plots()
+        if self._recording is not None:
+            self._detach_recording()
+
+        for key, items in self.marker_items.items():
+            for item in items:
+                self.plot_widgets[key].removeItem(item)
+        self.marker_items = {}
+        self.gaps = []
+        self.events = []
+        self.clear_cursor()
+
+        for ref in self.references:
+            for key in ref.items:
+                ref.show_range(key, 0.0, self.WINDOW_SECONDS)
+
         for key in self.data:
-            self.data[key] = []
+            self.data[key].clear()
             self.curves[key].setData([], [])
+            self.raw_data.pop(key, None)
+            if key in self.raw_curves:
+                self.raw_curves[key].setData([], [])
             self.plot_widgets[key].setXRange(0, self.WINDOW_SECONDS, padding=0)
 
     # ============================================================
     #                       SHOW / HIDE (tik)
     # ============================================================
     def set_curve_visible(self, key: str, visible: bool):
+        self._ensure_plots()
         curve = self.curves.get(key)
         if not curve:
             return
 
+        for ref in self.references:
+            if key in ref.items:
+                ref.items[key].setVisible(visible)
+
         if not visible:
             curve.setData([], [])
+            if key in self.raw_curves:
+                self.raw_curves[key].setData([], [])
             return
 
-        arr = self.data.get(key, [])
-        if not arr:
+        if self._recording is not None:
+            self._refresh_recording_view()
+            return
+
+        raw_buf = self.raw_data.get(key)
+        if raw_buf:
+            self._raw_curve(key).setData(*raw_buf.arrays(), connect="finite")
+
+        buf = self.data.get(key)
+        if not buf:
             curve.setData([], [])
             return
+        curve.setData(*buf.arrays(), connect="finite")
+
+    def _raw_curve(self, key: str) -> "pg.PlotDataItem":
+        """Ham (filtresiz) iz; filtrelenmiş eğrinin arkasında soluk renkte."""
+        curve = self.raw_curves.get(key)
+        if curve is None:
+            pg = _pyqtgraph()
+            curve = self.plot_widgets[key].plot(
+                [], [], pen=pg.mkPen(RAW_TRACE_COLOR, width=1)
+            )
+            curve.setZValue(-1)
+            self.raw_curves[key] = curve
+        return curve
+
+    # ============================================================
+    #                OFFLINE KAYIT GÖRÜNTÜLEME
+    # ============================================================
+    def show_recording(self, recording):
+        """
+        Kaydedilmiş bir segmenti (RecordingRepository) grafiklere yükler.
+
+        Tüm grafiklerin X ekseni bağlanır; kaydırma/yakınlaştırma sonrası
+        görünen aralık kısa bir gecikmeyle kayıttan yeniden okunur.
+        """
+        self.clear_all()
+        self._recording = recording
+
+        first = None
+        for pw in self.plot_widgets.values():
+            if first is None:
+                first = pw
+            else:
+                pw.setXLink(first)
+            pw.setMouseEnabled(x=True, y=False)
+
+        first.sigXRangeChanged.connect(self._on_recording_range_changed)
+
+        t_first, t_last = recording.time_span
+        if t_last <= t_first:
+            t_last = t_first + 1.0
+        first.setXRange(t_first, t_last, padding=0)
+        for event in recording.events:
+            self.mark_event(event["t"], "STOP")
+        self._refresh_recording_view()
+
+    def _detach_recording(self):
+        self._recording_timer.stop()
+        first = None
+        for pw in self.plot_widgets.values():
+            if first is None:
+                first = pw
+                first.sigXRangeChanged.disconnect(self._on_recording_range_changed)
+            else:
+                pw.setXLink(None)
+        self._recording = None
+
+    def _on_recording_range_changed(self, *_args):
+        self._recording_timer.start()
+
+    def _refresh_recording_view(self):
+        if self._recording is None:
+            return
 
-        xs = [tx for (tx, vy) in arr]
-        ys = [vy for (tx, vy) in arr]
-        curve.setData(xs, ys)
+        first = next(iter(self.plot_widgets.values()))
+        t0, t1 = first.getPlotItem().vb.viewRange()[0]
+        max_points = max(500, 2 * first.width())
+        series = self._recording.read_range(t0, t1, max_points=max_points)
+
+        for key, curve in self.curves.items():
+            if key not in series or not self.title_checkboxes[key].isChecked():
+                curve.setData([], [])
+                continue
+
+            xs, ys = series[key]
+            curve.setData(xs, ys, connect="finite")
+            for ref in self.references:
+                ref.show_range(key, t0, t1)
+
+            finite = ys[np.isfinite(ys)]
+            if len(finite):
+                y_min = float(finite.min())
+                y_max = float(finite.max())
+                span = (y_max - y_min) or (abs(y_max) or 1.0)
+                margin = span * self.MIN_MARGIN_RATIO
+                self.plot_widgets[key].setYRange(
+                    y_min - margin, y_max + margin, padding=0
+                )
 
-    def export_png(self, file_path: str, width: int = 1920, height: int = 1080) -> None:
+    # ============================================================
+    #                       DIŞA AKTARMA
+    # ============================================================
+    def export_snapshot(self) -> List[Dict]:
         """
-        Export all 8 graphs as a single dashboard PNG 
-        2x4 grid, her plot kendi hücresine yerleştirilir.
+        Görünen grafiklerin veri kopyası (dashboard_export için).
+
+        Yalnızca tamponlar ve eksen aralıkları kopyalanır; çizim bu
+        kopyadan GUI thread'i dışında yapılabilir.
         """
-        from PyQt6.QtGui import QImage, QPainter
-        from PyQt6.QtCore import QRect
+        self._ensure_plots()
+        snapshot = []
+        for key, pw in self.plot_widgets.items():
+            visible = self.title_checkboxes[key].isChecked()
+            (x0, x1), (y0, y1) = pw.getPlotItem().vb.viewRange()
+
+            if self._recording is not None:
+                xs, ys = self.curves[key].getData()
+                xs = np.array(xs if xs is not None and visible else [], dtype=np.float64)
+                ys = np.array(ys if ys is not None and visible else [], dtype=np.float64)
+                raw = None
+            else:
+                xs, ys = (
+                    self.data[key].since(float("-inf"))
+                    if visible
+                    else (np.empty(0), np.empty(0))
+                )
+                raw_buf = self.raw_data.get(key) if visible else None
+                raw = raw_buf.since(float("-inf")) if raw_buf else None
+
+            snapshot.append(
+                {
+                    "key": key,
+                    "title": self.titles[key],
+                    "unit": self.units[key],
+                    "x": xs,
+                    "y": ys,
+                    "raw_x": raw[0] if raw else None,
+                    "raw_y": raw[1] if raw else None,
+                    "x_range": (x0, x1),
+                    "y_range": (y0, y1),
+                    "gaps": [tuple(g) for g in self.gaps],
+                    "events": list(self.events),
+                }
+            )
+        return snapshot
 
-        # 1920x1080 beyaz arka planlı hedef görüntü
-        image = QImage(width, height, QImage.Format.Format_ARGB32)
-        image.fill(0xFFFFFFFF)  # beyaz
+    def export_png(
+        self, file_path: str, width: int = 1920, height: int = 1080, dpi: float = 96
+    ) -> None:
+        """
+        Grafikleri tek bir ızgara (4 sütun) pano görüntüsü olarak yazar (senkron).
 
-        painter = QPainter(image)
+        Segment sonunda bunun yerine dashboard_export.ExportWorker ile arka
+        planda yazılır; biçim uzantıdan seçilir (png/jpg/svg/pdf).
+        """
+        from presentation.widgets.dashboard_export import export_dashboard
 
-        try:
-            # 2 satır x 4 sütun layout
-            rows = 2
-            cols = 4
-            cell_w = width // cols
-            cell_h = height // rows
+        export_dashboard(file_path, self.export_snapshot(), width, height, dpi)
 
-            # self.plot_widgets: dict[str, PlotWidget]
-            
-            for index, pw in enumerate(self.plot_widgets.values()):
-                row = index // cols
-                col = index % cols
 
-                x = col * cell_w
-                y = row * cell_h
-                target_rect = QRect(x, y, cell_w, cell_h)
+class _ReferenceTrace:
+    """Sabitlenmiş bir segment: seyreltilmiş diziler ve grafik başına eğri."""
 
-                # Her plot widget'in snapshot'ını al (QPixmap)
-                pixmap = pw.grab()
+    __slots__ = ("label", "color", "series", "items", "spans", "nbytes")
 
-                # QPixmap → QImage ve hedef dikdörtgene çiz
-                painter.drawImage(target_rect, pixmap.toImage())
+    def __init__(self, label: str, color, series: Dict[str, Tuple[np.ndarray, np.ndarray]]):
+        self.label = label
+        self.color = color
+        self.series = series
+        self.items: Dict[str, "pg.PlotDataItem"] = {}
+        self.spans: Dict[str, Tuple[float, float]] = {}  # key -> yüklü dilim
+        self.nbytes = sum(xs.nbytes + ys.nbytes for xs, ys in series.values())
 
-        finally:
-            # Her durumda painter düzgün kapansın (hata olsa bile)
-            painter.end()
+    def follow(self, key: str, t_min: float, t_max: float):
+        """Canlı pencere [t_min, t_max] yüklü dilimden taştıysa dilimi kaydırır."""
+        lo, hi = self.spans.get(key, (0.0, -1.0))
+        if t_min < lo or t_max > hi:
+            margin = max(t_max - t_min, GraphPanel.WINDOW_SECONDS) / 2
+            self.show_range(key, t_min - margin, t_max + margin)
 
-        # Son olarak image'i dosyaya kaydet
-        image.save(file_path)
+    def show_range(self, key: str, t0: float, t1: float):
+        item = self.items.get(key)
+        if item is None:
+            return
+        xs, ys = self.series[key]
+        i0 = max(0, int(np.searchsorted(xs, t0, side="left")) - 1)
+        i1 = int(np.searchsorted(xs, t1, side="right")) + 1
+        item.setData(xs[i0:i1], ys[i0:i1], connect="finite")
+        self.spans[key] = (t0, t1)
+
+
+def _nearest_index(xs: Optional[np.ndarray], t: float) -> Optional[int]:
+    """Zamanı t'ye en yakın örneğin indeksi (xs artan); t aralık dışındaysa None."""
+    if xs is None or len(xs) == 0 or not xs[0] <= t <= xs[-1]:
+        return None
+    i = int(np.searchsorted(xs, t))
+    if i > 0 and (i == len(xs) or t - xs[i - 1] <= xs[i] - t):
+        i -= 1
+    return i
+
+
+def _finite_range(values: np.ndarray) -> Tuple[Optional[float], Optional[float]]:
+    """NaN (kesinti) hariç (min, max); hiç sonlu değer yoksa (None, None)."""
+    finite = values[np.isfinite(values)]
+    if len(finite) == 0:
+        return None, None
+    return float(finite.min()), float(finite.max())
@@ -10,6 +10,8 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt
 
+from core.channels import CHANNELS
+
 
 class LeftDataPanel(QWidget):
     """
@@ -45,23 +47,13 @@ class LeftDataPanel(QWidget):
         card_layout.addLayout(grid)
 
         # ===========================
-        # FIELDS (same as before)
+        # FIELDS (kanal kaydından)
         # ===========================
-        fields = [
-            ("Voltage (V)", "voltage"),
-            ("Current (A)", "current"),
-            ("Thrust (kgf)", "thrust_kgf"),
-            ("Motor Speed (RPM)", "rpm"),
-            ("Temperature (°C)", "temperature"),
-            ("Electrical Power (W)", "power"),
-            ("PT Efficiency (kgf/W)", "pt_eff"),
-            ("Thrust per Amp (kgf/A)", "tpa"),
-        ]
-
         self.value_labels: Dict[str, QLabel] = {}
 
-        for row, (title_text, key) in enumerate(fields):
-            title_label = QLabel(title_text)
+        for row, ch in enumerate(CHANNELS):
+            key = ch.key
+            title_label = QLabel(ch.title)
             title_label.setAlignment(
                 Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
             )
@@ -95,3 +87,8 @@ class LeftDataPanel(QWidget):
             if label is not None:
                 label.setText(str(value))
 
+    def reset_values(self):
+        """Tüm alanları kanal hassasiyetinde sıfır gösterir."""
+        for ch in CHANNELS:
+            self.value_labels[ch.key].setText(ch.format(0.0))
+
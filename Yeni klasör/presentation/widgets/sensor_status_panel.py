@@ -6,7 +6,7 @@ from PyQt6.QtWidgets import (
     QGridLayout,
     QFrame,
 )
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt
 
 
 class SensorStatusPanel(QWidget):
@@ -15,23 +15,15 @@ class SensorStatusPanel(QWidget):
 
     - Pasif UI + sınırlı kontrol
     - Serial detaylarını BİLMEZ
-    - Sadece callback tetikler
+    - Sadece callback tetikler; yanıt/zaman aşımı MainWindow'dan gelir
+      (komut katmanı, domain/commands.py)
     """
 
-    TIMEOUT_MS = 3000
-
     def __init__(self, parent=None):
         super().__init__(parent)
 
         self._request_cb = None
 
-        # ===========================
-        # TIMEOUT TIMER
-        # ===========================
-        self._timeout_timer = QTimer(self)
-        self._timeout_timer.setSingleShot(True)
-        self._timeout_timer.timeout.connect(self._on_timeout)
-
         # ===========================
         # OUTER LAYOUT (panel)
         # ===========================
@@ -121,7 +113,6 @@ class SensorStatusPanel(QWidget):
         self._request_cb = cb
 
     def reset_status(self):
-        self._timeout_timer.stop()
         self.btn_check.setEnabled(True)
         self.btn_check.setText("Check Sensor Status")
         self.info_label.clear()
@@ -132,8 +123,6 @@ class SensorStatusPanel(QWidget):
             lbl.setStyleSheet("")
 
     def update_status(self, status_dict: dict):
-        self._timeout_timer.stop()
-
         self.btn_check.setEnabled(True)
         self.btn_check.setText("Check Sensor Status")
 
@@ -176,6 +165,35 @@ class SensorStatusPanel(QWidget):
                 "color:#f7630c;background:#fff4ce;padding:4px;border-radius:4px;"
             )
 
+    def show_error(self, text: str):
+        self.btn_check.setEnabled(True)
+        self.btn_check.setText("Check Sensor Status")
+        self.info_label.setText(f"⚠ {text}")
+        self.info_label.setStyleSheet(
+            "color:#d13438;background:#fde7e9;padding:4px;border-radius:4px;"
+        )
+
+        for lbl in self.labels.values():
+            if lbl.text() == "...":
+                lbl.setText("--")
+                lbl.setStyleSheet("")
+
+    def show_timeout(self):
+        self.btn_check.setEnabled(True)
+        self.btn_check.setText("Check Sensor Status")
+
+        self.info_label.setText("⚠ No response from device")
+        self.info_label.setStyleSheet(
+            "color:#d13438;background:#fde7e9;padding:4px;border-radius:4px;"
+        )
+
+        for lbl in self.labels.values():
+            if lbl.text() == "...":
+                lbl.setText("TIMEOUT")
+                lbl.setStyleSheet(
+                    "color:#d13438;background:#fde7e9;padding:4px 8px;border-radius:4px;"
+                )
+
     # ======================================================
     # INTERNALS
     # ======================================================
@@ -195,21 +213,4 @@ class SensorStatusPanel(QWidget):
             lbl.setText("...")
             lbl.setStyleSheet("color:#666;background:#f5f5f5;")
 
-        self._timeout_timer.start(self.TIMEOUT_MS)
         self._request_cb()
-
-    def _on_timeout(self):
-        self.btn_check.setEnabled(True)
-        self.btn_check.setText("Check Sensor Status")
-
-        self.info_label.setText("⚠ No response from device")
-        self.info_label.setStyleSheet(
-            "color:#d13438;background:#fde7e9;padding:4px;border-radius:4px;"
-        )
-
-        for lbl in self.labels.values():
-            if lbl.text() == "...":
-                lbl.setText("TIMEOUT")
-                lbl.setStyleSheet(
-                    "color:#d13438;background:#fde7e9;padding:4px 8px;border-radius:4px;"
-                )
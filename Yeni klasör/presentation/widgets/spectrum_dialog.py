@@ -0,0 +1,215 @@
+from typing import Dict, Optional
+
+from PyQt6.QtWidgets import (
+    QDialog,
+    QVBoxLayout,
+    QHBoxLayout,
+    QLabel,
+    QComboBox,
+    QSplitter,
+)
+from PyQt6.QtGui import QFont
+from PyQt6.QtCore import Qt, QRectF, QTimer
+import numpy as np
+import pyqtgraph as pg
+
+from core.channels import AUX_CHANNELS_BY_KEY, CHANNELS_BY_KEY
+from core.constants import (
+    FILTER_SAMPLE_RATE_HZ,
+    SPECTRUM_CHANNELS,
+    SPECTRUM_REFRESH_MS,
+)
+from domain.spectrum import IncrementalWelch, UniformResampler
+
+
+class _SpectrumSource:
+    """
+    Bir kanalın tamponundan yalnızca yeni örnekleri çekip Welch'e besler.
+
+    Hızlı kanallar AuxStream örnek sayacıyla, temel kanallar GraphPanel
+    tamponundaki son zaman damgasıyla takip edilir; temel kanallar sabit
+    hızlı ızgaraya yeniden örneklenir.
+    """
+
+    def __init__(self, key: str, nperseg: int, graph_panel, aux_streams: Dict):
+        self.key = key
+        self.graph_panel = graph_panel
+        self.stream = aux_streams.get(key)
+        if self.stream is not None:
+            fs = self.stream.rate_hz
+            self.resampler = None
+            self.title = AUX_CHANNELS_BY_KEY[key].title
+        else:
+            fs = FILTER_SAMPLE_RATE_HZ
+            self.resampler = UniformResampler(fs)
+            self.title = CHANNELS_BY_KEY[key].title
+        self.engine = IncrementalWelch(fs, nperseg)
+        self.reset()
+
+    def reset(self):
+        self.engine.reset()
+        self._seen = 0
+        self._last_t = float("-inf")
+        if self.resampler is not None:
+            self.resampler.reset()
+
+    def update(self) -> int:
+        if self.stream is not None:
+            stream = self.stream
+            if stream.count < self._seen:
+                self.reset()  # yeni segment: tampon sıfırlandı
+            new = stream.count - self._seen
+            if new <= 0:
+                return 0
+            _t_first, samples = stream.latest(new)
+            self._seen = stream.count
+            t_end = stream.t0 + stream.count / stream.rate_hz
+            return self.engine.feed(samples, t_end)
+
+        ts, vs = self.graph_panel.samples_since(self.key, self._last_t)
+        if len(ts) == 0:
+            return 0
+        self._last_t = float(ts[-1])
+        return self.engine.feed(self.resampler.feed(ts, vs), self._last_t)
+
+
+class SpectrumDialog(QDialog):
+    """
+    Canlı spektrum penceresi (modal değil):
+    - Üstte seçili kanalın Welch PSD'si (son pencereler + segment ortalaması)
+    - Altta segment boyunca spektrogram (zaman x frekans, dB)
+
+    Hesap yalnızca pencere açıkken, sabit aralıkla ve yalnızca yeni
+    örnekler üzerinde yapılır; okuma döngüsüne iş eklemez.
+    """
+
+    def __init__(self, graph_panel, aux_streams: Dict, parent=None):
+        super().__init__(parent)
+        self.setObjectName("SummaryDialog")
+        self.setWindowTitle("Spectrum")
+        self.resize(900, 680)
+        self.setModal(False)
+
+        self.sources: Dict[str, _SpectrumSource] = {
+            key: _SpectrumSource(key, nperseg, graph_panel, aux_streams)
+            for key, nperseg in SPECTRUM_CHANNELS.items()
+            if key in aux_streams or key in CHANNELS_BY_KEY
+        }
+
+        layout = QVBoxLayout(self)
+
+        title = QLabel("Spectrum")
+        title.setObjectName("SummaryTitle")
+        title.setFont(QFont("Segoe UI", 16, QFont.Weight.Bold))
+        layout.addWidget(title)
+
+        top = QHBoxLayout()
+        self.channel_combo = QComboBox()
+        for key, source in self.sources.items():
+            self.channel_combo.addItem(source.title, key)
+        self.channel_combo.currentIndexChanged.connect(self._redraw)
+        top.addWidget(self.channel_combo)
+        self.info_label = QLabel("")
+        top.addWidget(self.info_label, stretch=1)
+        layout.addLayout(top)
+
+        splitter = QSplitter(Qt.Orientation.Vertical)
+
+        self.psd_plot = pg.PlotWidget()
+        self.psd_plot.setBackground("#ffffff")
+        self.psd_plot.showGrid(x=True, y=True, alpha=0.25)
+        self.psd_plot.addLegend()
+        self.psd_plot.setLabel("bottom", "Frequency (Hz)", color="black")
+        self.psd_plot.setLabel("left", "PSD (dB)", color="black")
+        self.avg_curve = self.psd_plot.plot(
+            [], [], pen=pg.mkPen((150, 150, 150), width=1), name="Segment average"
+        )
+        self.live_curve = self.psd_plot.plot(
+            [], [], pen=pg.mkPen("#0078ff", width=2), name="Live"
+        )
+        splitter.addWidget(self.psd_plot)
+
+        self.spec_plot = pg.PlotWidget()
+        self.spec_plot.setBackground("#ffffff")
+        self.spec_plot.setLabel("bottom", "Time (s)", color="black")
+        self.spec_plot.setLabel("left", "Frequency (Hz)", color="black")
+        self.spec_image = pg.ImageItem(axisOrder="row-major")
+        self.spec_image.setColorMap(pg.colormap.get("viridis"))
+        self.spec_plot.addItem(self.spec_image)
+        splitter.addWidget(self.spec_plot)
+
+        layout.addWidget(splitter, stretch=1)
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(SPECTRUM_REFRESH_MS)
+        self._timer.timeout.connect(self._on_tick)
+
+    # ============================================================
+    #                       YAŞAM DÖNGÜSÜ
+    # ============================================================
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._timer.start()
+        self._on_tick()
+
+    def hideEvent(self, event):
+        self._timer.stop()
+        super().hideEvent(event)
+
+    def reset(self):
+        """Yeni segment başladı: birikmiş spektrumları temizle."""
+        for source in self.sources.values():
+            source.reset()
+        self._redraw()
+
+    # ============================================================
+    #                       GÜNCELLEME
+    # ============================================================
+    def _on_tick(self):
+        # Tüm kanallar beslenir; kanal değiştirince geçmiş hazır olur
+        changed = False
+        for key, source in self.sources.items():
+            if source.update() and key == self.channel_combo.currentData():
+                changed = True
+        if changed:
+            self._redraw()
+
+    def _current(self) -> Optional[_SpectrumSource]:
+        return self.sources.get(self.channel_combo.currentData())
+
+    def _redraw(self, *_args):
+        source = self._current()
+        if source is None:
+            return
+        engine = source.engine
+        freqs = engine.freqs
+
+        self.info_label.setText(
+            f"fs {engine.fs:g} Hz  |  resolution {engine.resolution_hz:.3g} Hz  |  "
+            f"{engine.frames} windows"
+        )
+        self.live_curve.setData(freqs, _db(engine.live()), connect="finite")
+        self.avg_curve.setData(freqs, _db(engine.average()), connect="finite")
+
+        times, rows = engine.spectrogram()
+        if len(rows) == 0:
+            self.spec_image.clear()
+            return
+        image = _db(rows).T  # satır: frekans (y), sütun: zaman (x)
+        finite = image[np.isfinite(image)]
+        if len(finite) == 0:
+            return
+        lo, hi = np.percentile(finite, (5, 99.5))
+        self.spec_image.setImage(
+            np.nan_to_num(image, nan=lo, neginf=lo, posinf=hi), levels=(lo, hi)
+        )
+
+        t0 = float(np.nanmin(times)) if np.isfinite(times).any() else 0.0
+        t1 = float(np.nanmax(times)) if np.isfinite(times).any() else float(len(rows))
+        width = max(t1 - t0, 1e-6)
+        self.spec_image.setRect(QRectF(t0, 0.0, width, float(freqs[-1])))
+
+
+def _db(psd: np.ndarray) -> np.ndarray:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return 10.0 * np.log10(psd)
@@ -12,6 +12,9 @@ from PyQt6.QtCore import Qt
 class SummaryDialog(QDialog):
     """
     Test bitiminde özet bilgiyi gösteren açılan diyalog penceresi (SUMMARY)
+
+    Modal değildir ve show() ile açılır: özet açıkken seri okuma, grafik
+    ve loglama ana olay döngüsünde kesintisiz sürer.
     """
 
     def __init__(self, summary_text: str, parent=None):
@@ -19,6 +22,7 @@ class SummaryDialog(QDialog):
         self.setObjectName("SummaryDialog")
         self.setWindowTitle("Test Summary")
         self.setMinimumWidth(520)
+        self.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
 
         layout = QVBoxLayout(self)
 
@@ -28,17 +32,20 @@ class SummaryDialog(QDialog):
         title.setObjectName("SummaryTitle")
         layout.addWidget(title)
 
-        label = QLabel(summary_text)
-        label.setAlignment(Qt.AlignmentFlag.AlignTop)
-        label.setWordWrap(True)
-        label.setFont(QFont("Segoe UI", 11))
-        layout.addWidget(label)
+        self.label = QLabel(summary_text)
+        self.label.setAlignment(Qt.AlignmentFlag.AlignTop)
+        self.label.setWordWrap(True)
+        self.label.setFont(QFont("Segoe UI", 11))
+        self.label.setTextInteractionFlags(
+            Qt.TextInteractionFlag.TextSelectableByMouse
+        )
+        layout.addWidget(self.label)
 
         btn_layout = QHBoxLayout()
         btn_layout.addStretch()
         ok_btn = QPushButton("OK")
-        ok_btn.clicked.connect(self.accept)
+        ok_btn.clicked.connect(self.close)
         btn_layout.addWidget(ok_btn)
         layout.addLayout(btn_layout)
 
-        self.setModal(True)
+        self.setModal(False)
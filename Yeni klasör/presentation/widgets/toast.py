@@ -0,0 +1,117 @@
+from typing import List
+
+from PyQt6.QtWidgets import QFrame, QLabel, QVBoxLayout, QWidget
+from PyQt6.QtCore import QEvent, QObject, QTimer
+
+
+class Toast(QFrame):
+    """
+    Pencerenin sağ altında beliren, kendiliğinden kaybolan bildirim kartı.
+
+    Pencerenin çocuğudur (ayrı üst düzey pencere değil); odak çalmaz ve
+    iç içe olay döngüsü açmaz, tıklanınca hemen kapanır.
+    """
+
+    WIDTH = 340
+
+    def __init__(self, title: str, text: str, level: str, timeout_ms: int, manager):
+        super().__init__(manager.host)
+        self.manager = manager
+        self.level = level
+        self.text = text
+        self.setObjectName("Toast")
+        self.setProperty("level", level)
+        self.setFixedWidth(self.WIDTH)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(12, 8, 12, 10)
+        layout.setSpacing(2)
+
+        title_label = QLabel(title)
+        title_label.setObjectName("ToastTitle")
+        text_label = QLabel(text)
+        text_label.setObjectName("ToastText")
+        text_label.setWordWrap(True)
+
+        layout.addWidget(title_label)
+        layout.addWidget(text_label)
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self.dismiss)
+        self._timer.start(timeout_ms)
+
+    def mousePressEvent(self, event):
+        self.dismiss()
+
+    def dismiss(self):
+        self._timer.stop()
+        self.hide()
+        self.manager._remove(self)
+        self.deleteLater()
+
+
+class ToastManager(QObject):
+    """
+    QMessageBox.exec() yerine kullanılan modal olmayan bildirimler.
+
+    Bildirimler host widget'ın sağ alt köşesinde alt alta dizilir; host
+    yeniden boyutlanınca konumları güncellenir. Seri okuma ve çizim
+    bildirim açıkken kesintisiz devam eder.
+    """
+
+    MAX_VISIBLE = 4
+    MARGIN = 16
+    SPACING = 8
+    TIMEOUTS_MS = {"info": 3000, "warning": 5000, "error": 8000}
+
+    def __init__(self, host: QWidget):
+        super().__init__(host)
+        self.host = host
+        self._toasts: List[Toast] = []
+        host.installEventFilter(self)
+
+    def info(self, title: str, text: str):
+        self.show_message(title, text, "info")
+
+    def warning(self, title: str, text: str):
+        self.show_message(title, text, "warning")
+
+    def error(self, title: str, text: str):
+        self.show_message(title, text, "error")
+
+    def show_message(self, title: str, text: str, level: str = "info"):
+        # Aynı bildirim zaten görünüyorsa yenisini üst üste yığma
+        for toast in self._toasts:
+            if toast.level == level and toast.text == text:
+                toast._timer.start(self.TIMEOUTS_MS.get(level, 3000))
+                return
+
+        while len(self._toasts) >= self.MAX_VISIBLE:
+            self._toasts[0].dismiss()
+
+        toast = Toast(title, text, level, self.TIMEOUTS_MS.get(level, 3000), self)
+        self._toasts.append(toast)
+        toast.adjustSize()
+        toast.show()
+        toast.raise_()
+        self._relayout()
+
+    def eventFilter(self, obj, event):
+        if obj is self.host and event.type() == QEvent.Type.Resize:
+            self._relayout()
+        return False
+
+    def _remove(self, toast: Toast):
+        if toast in self._toasts:
+            self._toasts.remove(toast)
+            self._relayout()
+
+    def _relayout(self):
+        # En yeni bildirim en altta
+        x = self.host.width() - Toast.WIDTH - self.MARGIN
+        y = self.host.height() - self.MARGIN
+        for toast in reversed(self._toasts):
+            y -= toast.sizeHint().height()
+            toast.move(x, y)
+            y -= self.SPACING
@@ -1,35 +1,80 @@
 import os
 import csv
+import json
 import time
 import ctypes
 from pathlib import Path
 
-import serial
-from serial.tools import list_ports
-
 from PyQt6.QtWidgets import (
     QMainWindow,
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
-    QMessageBox,
     QLabel,
     QFrame,
     QComboBox,
     QPushButton,
+    QFileDialog,
 )
 
 from PyQt6.QtGui import QFont, QPixmap
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, QTimer, QStandardPaths, QSettings, pyqtSignal
 
 from presentation.widgets.summary_dialog import SummaryDialog
+from presentation.widgets.toast import ToastManager
 from presentation.widgets.left_panel import LeftDataPanel
 from presentation.widgets.graph_panel import GraphPanel
+from presentation.widgets.aux_panel import AuxPanel
 from presentation.widgets.control_panel import ControlPanel
-from data.serial_repository import SerialRepository
-from domain.ports import SerialPortReader
+from data.port_scanner import PortWatcher, find_port, port_key
+from domain.ports import SAMPLE_TIME_KEY, SerialPortReader
+from core.channels import (
+    AUX_CHANNELS,
+    AUX_CHANNELS_BY_KEY,
+    CHANNELS,
+    CHANNELS_BY_KEY,
+    CSV_COLUMNS,
+    CSV_PRECISION,
+    DERIVED_CHANNELS,
+)
+from core.constants import (
+    FILTERS,
+    FILTER_SAMPLE_RATE_HZ,
+    GRAPH_EXPORT_DPI,
+    GRAPH_EXPORT_FORMATS,
+    GRAPH_EXPORT_SIZE_PX,
+    CATALOG_ENABLED,
+    JOURNAL_ENABLED,
+    JOURNAL_KEEP,
+    MEMORY_CHECK_INTERVAL_MS,
+    REFERENCE_MAX_POINTS,
+    REFERENCE_POINTS_PER_WINDOW,
+    SERIAL_BAUDRATE,
+    SIMULATOR_ENABLED,
+    SIMULATOR_URL,
+)
+from domain.segment_summary import new_segment_stats, format_segment_summary
+from domain.steady_state import SteadyStateDetector, format_step_table
+from domain.derived_channels import DerivedChannelEngine
+from domain.filters import FilterStage
+from domain.aux_stream import AuxStream
+from domain.characteristic import CharacteristicSession
+from domain.commands import CommandChannel
+from domain.memory_budget import MB, MemoryBudget
+from domain.safety import SafetyMonitor
 from presentation.widgets.sensor_status_panel import SensorStatusPanel
 
+# Açılışı hızlandırmak için pyserial, kayıt/karşılaştırma modülleri ve
+# pyqtgraph ilk kullanıldıkları yerde import edilir.
+
+NO_PORTS_TEXT = "No ports"
+SCANNING_TEXT = "Scanning..."
+LOGO_SIZE = 42
+
+SETTINGS_ORG = "GMK AIR"
+SETTINGS_APP = "Motor Test Unit"
+# Yeniden bağlanma denemeleri arası bekleme (ms); son değerde sabitlenir
+RECONNECT_BACKOFF_MS = (250, 500, 1000, 2000, 5000)
 
 
 class MainWindow(QMainWindow):
@@ -39,73 +84,38 @@ class MainWindow(QMainWindow):
 
     """
 
+    # Sequencer ve güvenlik olayları okuma thread'inden gelir (kuyruklu bağlantı)
+    sequence_event = pyqtSignal(str, dict)
+    safety_event = pyqtSignal(str, dict)
+
     # ==========================================
 
     def _check_sensor_status(self):
-        """Sensör durumunu kontrol et - butona basıldığında çalışır"""
-        if not self.ser or not self.ser.is_open:
-            self.sensor_status_panel.info_label.setText("⚠ Not connected")
-            self.sensor_status_panel.info_label.setStyleSheet(
-                "color: #d13438; padding: 4px; background-color: #fde7e9; border-radius: 4px;"
-            )
-            self.sensor_status_panel.btn_check.setEnabled(True)
-            self.sensor_status_panel.btn_check.setText("Check Sensor Status")
-            self.sensor_status_panel._timeout_timer.stop()
+        """Sensör durumunu iste - butona basıldığında çalışır (yanıt: _on_status_reply)"""
+        if self.serial_worker is None:
+            self.sensor_status_panel.show_error("Not connected")
             return
 
-        try:
-            # STATUS? komutunu gönder
-            self.ser.write(b"STATUS?\n")
-            self.ser.flush()
+        from domain.commands import status_request
 
-        except serial.SerialException as e:
-            self.sensor_status_panel.info_label.setText(f"⚠ Error: {str(e)[:30]}")
-            self.sensor_status_panel.info_label.setStyleSheet(
-                "color: #d13438; padding: 4px; background-color: #fde7e9; border-radius: 4px;"
-            )
-            self.sensor_status_panel.btn_check.setEnabled(True)
-            self.sensor_status_panel.btn_check.setText("Check Sensor Status")
-            self.sensor_status_panel._timeout_timer.stop()
-            self._update_status_label("error")
+        self._send_command(status_request(), self._on_status_reply)
 
-        except Exception as e:
-            self.sensor_status_panel.info_label.setText("⚠ Unexpected error")
-            self.sensor_status_panel.info_label.setStyleSheet(
-                "color: #d13438; padding: 4px; background-color: #fde7e9; border-radius: 4px;"
-            )
-            self.sensor_status_panel.btn_check.setEnabled(True)
-            self.sensor_status_panel.btn_check.setText("Check Sensor Status")
-            self.sensor_status_panel._timeout_timer.stop()
+    def _on_status_reply(self, result):
+        from domain.commands import TIMEOUT
+        from data.serial_repository import parse_status
+
+        if result.ok:
+            self.sensor_status_panel.update_status(parse_status(result.reply))
+        elif result.status == TIMEOUT:
+            self.sensor_status_panel.show_timeout()
+        else:
+            self.sensor_status_panel.show_error(result.reply or "Request failed")
 
     # ==========================================
 
 
 
 
-    def _fix_messagebox_theme(self, box: QMessageBox):
-        """Tüm uyarı pencerelerinde beyaz arka plan ve okunaklı butonlar kullan."""
-        box.setStyleSheet(
-            """
-        QMessageBox {
-            background-color: #ffffff;
-        }
-        QLabel {
-            color: #000000;
-            font-size: 11pt;
-        }
-        QPushButton {
-            background-color: #00b4aa;
-            color: #ffffff;
-            padding: 6px 14px;
-            border-radius: 6px;
-            font-size: 10pt;
-        }
-        QPushButton:hover {
-            background-color: #009a92;
-        }
-        """
-        )
-
     def __init__(self):
         super().__init__()
 
@@ -120,8 +130,6 @@ class MainWindow(QMainWindow):
         self.setWindowFlags(Qt.WindowType.Window)
         self.setMinimumSize(1280, 720)
         self.resize(1280, 760)
-        self.setGeometry(100, 100, 1280, 760)
-        self.showNormal()
 
         central = QWidget(self)
         self.setCentralWidget(central)
@@ -145,6 +153,25 @@ class MainWindow(QMainWindow):
         self.left_panel = LeftDataPanel(self)
         self.graph_panel = GraphPanel(self)
 
+        # Blok çerçeveli hızlı kanallar (titreşim vb.): ayrı halka tampon,
+        # ayrı kayıt dosyası; panel ilk blok gelince görünür
+        self.aux_streams = {
+            ch.key: AuxStream(ch.key, ch.rate_hz) for ch in AUX_CHANNELS
+        }
+        self.aux_writers: dict = {}  # key -> AuxRecordingWriter
+        self.aux_panel = AuxPanel(self.aux_streams, self)
+        self.aux_panel.hide()
+        self.spectrum_dialog = None  # SpectrumDialog (ilk açılışta oluşur)
+
+        # X-Y karakteristik kovaları: segment boyunca her batch'le birikir,
+        # biten segmentler üst üste çizim için saklanır
+        self.characteristics = CharacteristicSession()
+        self.characteristic_dialog = None  # CharacteristicDialog
+
+        graph_column = QVBoxLayout()
+        graph_column.setSpacing(4)
+        graph_column.addWidget(self.graph_panel, stretch=1)
+        graph_column.addWidget(self.aux_panel)
 
 
         left_column = QVBoxLayout()
@@ -154,12 +181,17 @@ class MainWindow(QMainWindow):
         left_column.addStretch()
 
         center_layout.addLayout(left_column, stretch=1)
-        center_layout.addWidget(self.graph_panel, stretch=5)
+        center_layout.addLayout(graph_column, stretch=5)
 
         main_layout.addLayout(center_layout, stretch=4)
         main_layout.addSpacing(4)
 
         self.control_panel = ControlPanel(self)
+
+        # Modal olmayan bildirimler ve özet penceresi
+        self.toasts = ToastManager(self)
+        self.summary_dialog: SummaryDialog | None = None
+        self.export_workers: list = []  # ExportWorker / ReportWorker
         #main_layout.addWidget(self.control_panel, stretch=1)
 
         main_layout.addStretch()
@@ -167,28 +199,134 @@ class MainWindow(QMainWindow):
 
 
         # Serial / zaman / logging / segment state
-        self.ser: serial.Serial | None = None
+        self.ser = None  # serial.Serial
         self.serial_repo: SerialPortReader | None = None
-        self.read_timer = QTimer(self)
-        self.read_timer.setInterval(100)  # 10 Hz
-        self.read_timer.timeout.connect(self._poll_serial)
+        self.serial_worker = None  # SerialWorker (okuma + komut yazma thread'i)
+
+        # Cihaza giden komutlar; yanıtlar istek no ile geri çağrılara eşlenir
+        self.commands = CommandChannel()
+        self._command_callbacks: dict = {}
+
+        # Otomatik throttle sweep (SequenceRunner, okuma thread'inde çalışır)
+        self.sequence = None
+        self.sequence_event.connect(self._on_sequence_event)
+
+        # Güvenlik sınırları okuma thread'inde her örnekte denetlenir;
+        # aşımda STOP yazılır ve Re-arm'a kadar throttle kilitlenir
+        self.safety = SafetyMonitor(self.commands, notify=self.safety_event.emit)
+        self.safety_event.connect(self._on_safety_event)
+        self.event_log = None  # EventLogWriter (segmentin ilk olayında açılır)
 
         self.stream_start_time: float | None = None
         self.segment_start_time: float | None = None
         self.segment_active: bool = False
         self.segment_index: int = 0
+        self.segment_started_at: float | None = None  # duvar saati (katalog)
 
         self.logging_enabled = False
         self.log_file = None
         self.log_writer: csv.writer | None = None
+        self.journal = None  # SegmentJournal (CSV satırlarının çökmeye dayanıklı kopyası)
+        self._journal_warned: set = set()  # eski günlük uyarısı gösterilen klasörler
         self.current_log_path: str | None = None
+        self.last_segment_path: str | None = None  # Pin'in önerdiği son kayıt
 
         self.segment_stats = None
+        self.step_detector = SteadyStateDetector()
+
+        # Gürültülü kanallar için filtre katmanı (ham değer kanalda kalır,
+        # filtrelenmiş değer *_filt anahtarında gösterilir)
+        self.filter_stage = FilterStage(FILTERS, FILTER_SAMPLE_RATE_HZ)
+
+        # power / pt_eff / tpa ve ek kanallar (kayıttaki derived) ham verilerden hesaplanır
+        self.derived_engine = DerivedChannelEngine(DERIVED_CHANNELS)
+
+        # Kanal kaydından bir kez üretilen tablolar; _update_ui_with_values
+        # her örnekte anahtar listeleri kurmak yerine bunları dolaşır
+        self._display_fields = [
+            (ch.key, ch.key + FilterStage.FILT_SUFFIX, f"{{:.{ch.precision}f}}")
+            for ch in CHANNELS
+        ]
+        self._plot_fields = [
+            (
+                ch.key,
+                ch.key + FilterStage.FILT_SUFFIX,
+                self.graph_panel.title_checkboxes[ch.key],
+            )
+            for ch in CHANNELS
+        ]
+        self._csv_fields = [
+            (key, f"={{:.{CSV_PRECISION.get(key, 3)}f}}") for key in list(CSV_COLUMNS)[1:]
+        ] + [
+            (key + FilterStage.FILT_SUFFIX, f"={{:.{CSV_PRECISION.get(key, 3)}f}}")
+            for key in self.filter_stage.filters
+        ]
+
+        # Offline görüntülenen kayıt (Open)
+        self.recording = None  # RecordingRepository
+
+        # Bellek bütçesi: büyüyebilen tamponlar kaydolur, RSS periyodik
+        # ölçülür; sınır aşılırsa önce kayıt piramidi, sonra tamponlar küçülür
+        self.memory = MemoryBudget()
+        self.memory.register(
+            "graph buffers", self.graph_panel.memory_bytes, self.graph_panel.shrink_memory
+        )
+        self.memory.register(
+            "aux buffers", lambda: sum(s.nbytes for s in self.aux_streams.values())
+        )
+        self.memory.register("spectrogram", self._spectrum_bytes, self._shrink_spectrum)
+        self.memory.register("characteristics", lambda: self.characteristics.nbytes)
+        self.memory.register("reference traces", self.graph_panel.reference_bytes)
+        self.memory.register(
+            "recording index",
+            lambda: self.recording.memory_bytes() if self.recording else 0,
+            lambda: self.recording and self.recording.release_memory(),
+            spillable=True,
+        )
+        self._memory_warned = False
+        self.memory_timer = QTimer(self)
+        self.memory_timer.setInterval(MEMORY_CHECK_INTERVAL_MS)
+        self.memory_timer.timeout.connect(self._check_memory)
+        self.memory_timer.start()
+
+        # Segment kataloğu (ilk kullanımda açılır) ve düzenek bilgisi
+        self.catalog = None  # SegmentCatalog
+        self.catalog_dialog = None
+
+        # Port listesi arka planda izlenir (hot-plug); son bağlanılan
+        # düzenek VID/PID/seri no ile hatırlanır
+        self.settings = QSettings(SETTINGS_ORG, SETTINGS_APP)
+        self.setup_info = self._load_setup()
+        self.known_ports: list = []
+        self.port_watcher = PortWatcher(self)
+        self.port_watcher.ports_changed.connect(self._on_ports_changed)
+
+        # Kablo kopması sonrası otomatik yeniden bağlanma (artan beklemeli).
+        # Aktif segment kesinti boyunca açık kalır; kesinti gap olarak işlenir.
+        self.connected_key: str | None = None
+        self.reconnect_key: str | None = None
+        self.reconnect_attempts = 0
+        self.reconnect_timer = QTimer(self)
+        self.reconnect_timer.setSingleShot(True)
+        self.reconnect_timer.timeout.connect(self._try_reconnect)
+        self.gap_start: float | None = None
 
         self._connect_control_signals()
-        self._refresh_ports()
+        self.port_combo.addItem(SCANNING_TEXT)
+        self.port_watcher.start()
         self._update_status_label("idle")
 
+    def closeEvent(self, event):
+        self.reconnect_timer.stop()
+        self._close_port()
+        if self.catalog is not None:
+            self.catalog.close()
+        self.aux_panel.stop()
+        self.port_watcher.stop()
+        for worker in self.export_workers:
+            worker.wait()  # yarım kalmış grafik dosyası bırakma
+        super().closeEvent(event)
+
     def _build_header(self) -> QWidget:
         frame = QFrame(self)
         frame.setObjectName("HeaderFrame")
@@ -201,23 +339,8 @@ class MainWindow(QMainWindow):
         # LOGO
         # -------------------------------------------------------
         logo_label = QLabel()
-        root_dir = Path(__file__).resolve().parent.parent
-        logo_06 = root_dir / "gmkair-logo-06.png"
-        logo_05 = root_dir / "gmkair-logo-05.png"
-
-        pix = QPixmap()
-        if logo_06.exists():
-            pix.load(str(logo_06))
-        elif logo_05.exists():
-            pix.load(str(logo_05))
-
+        pix = self._load_logo()
         if not pix.isNull():
-            pix = pix.scaled(
-                42,
-                42,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation,
-            )
             logo_label.setPixmap(pix)
         logo_label.setFixedSize(50, 50)
 
@@ -286,7 +409,47 @@ class MainWindow(QMainWindow):
 
         return frame
 
+    def _load_logo(self) -> QPixmap:
+        """
+        Başlık logosunu döndürür.
+
+        Kaynak PNG'ler çok büyük (4500x4500) olduğundan çözme + ölçekleme
+        açılışın en pahalı adımıdır; küçültülmüş kopya kullanıcı önbellek
+        klasöründe tutulur ve kaynak dosya değişince yenilenir.
+        """
+        root_dir = Path(__file__).resolve().parents[2]  # proje kökü
+        src = root_dir / "gmkair-logo-06.png"
+        if not src.exists():
+            src = root_dir / "gmkair-logo-05.png"
+        if not src.exists():
+            return QPixmap()
+
+        st = src.stat()
+        cache_dir = Path(
+            QStandardPaths.writableLocation(
+                QStandardPaths.StandardLocation.CacheLocation
+            )
+        )
+        cached = cache_dir / f"{src.stem}-{LOGO_SIZE}-{st.st_size}-{st.st_mtime_ns}.png"
 
+        pix = QPixmap()
+        if cached.exists() and pix.load(str(cached)):
+            return pix
+
+        if not pix.load(str(src)):
+            return pix
+        pix = pix.scaled(
+            LOGO_SIZE,
+            LOGO_SIZE,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation,
+        )
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            pix.save(str(cached), "PNG")
+        except OSError:
+            pass
+        return pix
 
     def _update_status_label(self, mode: str):
         """
@@ -302,6 +465,8 @@ class MainWindow(QMainWindow):
             text = "STATUS: TEST ACTIVE"
         elif mode == "error":
             text = "STATUS: ERROR"
+        elif mode == "reconnecting":
+            text = "STATUS: RECONNECTING"
         else:
             text = "STATUS: IDLE"
             mode = "idle"
@@ -324,69 +489,259 @@ class MainWindow(QMainWindow):
         # Aşağıdaki kontrol paneli
         cp.btn_start_test.clicked.connect(self._start_test_segment)
         cp.btn_reset.clicked.connect(self._reset_test)
-        cp.btn_stop_test.clicked.connect(
-            lambda _checked=False: self._stop_test_segment(show_summary=True)
-        )
+        cp.btn_stop_test.clicked.connect(self._on_stop_clicked)
+        cp.act_open_recording.triggered.connect(self._open_recording)
+        cp.act_compare.triggered.connect(self._open_batch_compare)
+        cp.act_catalog.triggered.connect(self._open_catalog)
+        cp.btn_setup.clicked.connect(self._edit_setup)
+        cp.act_report.triggered.connect(self._generate_report)
+        cp.act_spectrum.triggered.connect(self._open_spectrum)
+        cp.act_curves.triggered.connect(self._open_characteristics)
+        cp.act_pin.triggered.connect(self._pin_references)
+        cp.act_unpin.triggered.connect(self._unpin_references)
+        cp.throttle_slider.valueChanged.connect(self._on_throttle_changed)
+        cp.btn_motor_stop.clicked.connect(self._stop_motor)
+        cp.btn_sweep.clicked.connect(self._toggle_sweep)
+        cp.btn_rearm.clicked.connect(self._rearm_safety)
 
 
         
     # Serial port yönetimi
     def _refresh_ports(self):
-        self.port_combo.clear()
-        ports = list_ports.comports()
-        if not ports:
-            self.port_combo.addItem("No ports")
-            return
+        self.port_watcher.rescan()
+
+    def _on_ports_changed(self, ports: list):
+        """
+        Port listesini yerinde günceller: kaybolanlar çıkarılır, yeniler
+        eklenir; kullanıcının seçimi korunur. Hatırlanan düzenek yeni
+        takıldıysa seçili hale getirilir.
+        """
+        if SIMULATOR_ENABLED:
+            ports = ports + [
+                {
+                    "device": SIMULATOR_URL,
+                    "description": "Simulated test bench",
+                    "vid": None,
+                    "pid": None,
+                    "serial_number": None,
+                }
+            ]
+        self.known_ports = ports
+        combo = self.port_combo
+        devices = {p["device"] for p in ports}
+
+        # Yer tutucular (item data'sı yok) ve sökülen portlar
+        for i in reversed(range(combo.count())):
+            if combo.itemData(i) is None or combo.itemText(i) not in devices:
+                combo.removeItem(i)
+
+        present = {combo.itemText(i) for i in range(combo.count())}
+        bench_key = self.settings.value("bench/key", "", type=str)
         for p in ports:
-            self.port_combo.addItem(p.device)
+            if p["device"] in present:
+                continue
+            combo.addItem(p["device"], p)
+            combo.setItemData(
+                combo.count() - 1, p["description"], Qt.ItemDataRole.ToolTipRole
+            )
+            if bench_key and port_key(p) == bench_key:
+                combo.setCurrentIndex(combo.count() - 1)
 
+        if combo.count() == 0:
+            combo.addItem(NO_PORTS_TEXT)
 
-    def _connect_serial(self):
-        if self.ser and self.ser.is_open:
-            box = QMessageBox(
-                QMessageBox.Icon.Information, "Serial", "Already connected."
-            )
-            self._fix_messagebox_theme(box)
-            box.exec()
-            return
+        if self.reconnect_key is not None:
+            self._try_reconnect()
 
-        port_text = self.port_combo.currentText()
-        if not port_text or port_text == "No ports":
-            box = QMessageBox(
-                QMessageBox.Icon.Warning, "Serial", "Select a valid COM port."
-            )
-            self._fix_messagebox_theme(box)
-            box.exec()
+    def _open_port(self, port_text: str) -> str | None:
+        """
+        Portu açar ve okuma döngüsünü başlatır.
 
-            return
+        Başarılıysa None, değilse hata metnini döndürür.
+        """
+        import serial
+        from data.serial_repository import SerialRepository, open_serial
+        from data.serial_worker import SerialWorker
 
         try:
-            self.ser = serial.Serial(port_text, baudrate=115200, timeout=0.1)
+            self.ser = open_serial(port_text, SERIAL_BAUDRATE)
         except serial.SerialException as e:
-            box = QMessageBox(
-                QMessageBox.Icon.Critical, "Serial", f"Port could not be opened:\n{e}"
-            )
-            self._fix_messagebox_theme(box)
-            box.exec()
-
             self.ser = None
-            self._update_status_label("error")
-            return
+            return str(e)
 
         self.stream_start_time = time.monotonic()
-        self.read_timer.start()
 
         self.btn_connect.setEnabled(False)
         self.btn_disconnect.setEnabled(True)
-        self.serial_repo = SerialRepository(self.ser)
+        self.serial_repo = SerialRepository(self.ser, self.commands)
+        self.serial_worker = SerialWorker(self.serial_repo, self.commands, self)
+        self.serial_worker.batch_ready.connect(self._on_serial_batch)
+        self.serial_worker.results_ready.connect(self._on_command_results)
+        self.serial_worker.connection_lost.connect(self._on_serial_error)
+        self.safety.reset()
+        self.serial_worker.add_task(self.safety)
+        self.serial_worker.start()
+
+        self.control_panel.reset_throttle()
+        self.control_panel.set_throttle_enabled(True)
+
+        # Düzeneği hatırla (port adı değişse de yeniden bulunabilsin)
+        self.connected_key = port_key(self._port_info(port_text))
+        self.settings.setValue("bench/key", self.connected_key)
+        self.settings.setValue("bench/device", port_text)
+        return None
+
+    def _close_port(self):
+        """Okuma thread'ini durdurur ve port'u kapatır (UI bildirimi yapmaz)."""
+        if self.sequence is not None:
+            self._abort_sweep("Connection closed")
+        if self.serial_worker is not None:
+            if self.control_panel.throttle_percent() > 0:
+                from domain.commands import motor_stop
+
+                # Worker çıkmadan önce kuyruktakileri yazar
+                self.commands.submit(motor_stop())
+            self.serial_worker.stop()
+            self.serial_worker = None
+        self.control_panel.reset_throttle()
+        self.control_panel.set_throttle_enabled(False)
+        # Yanıtı beklenen istekler (STATUS? vb.) başarısız sayılır
+        self._on_command_results(self.commands.cancel_all("Connection closed"))
 
+        if self.ser:
+            import serial
 
-        self._update_status_label("connected")
-        box = QMessageBox(
-            QMessageBox.Icon.Information, "Serial", f"{port_text} connected."
+            try:
+                self.ser.close()
+            except serial.SerialException:
+                pass
+            self.ser = None
+            self.serial_repo = None
+
+    def _on_serial_error(self, _error: str):
+        if self.sender() is not self.serial_worker:
+            return  # kapatılmış eski bağlantıdan gecikmiş sinyal
+        self._on_connection_lost()
+
+    def _on_connection_lost(self):
+        """
+        Okuma sırasında port hatası (kablo kopması vb.).
+
+        Port kapatılır ve aynı düzenek (VID/PID/seri no) yeniden
+        göründüğünde elle Connect gerekmeden tekrar bağlanılır. Aktif
+        segment durdurulmaz; kesinti log, istatistik ve grafiklerde
+        işaretlenir ve bağlantı gelince kayıt kaldığı yerden sürer.
+        """
+        self._close_port()
+        self.sensor_status_panel.reset_status()
+        if self.segment_active and self.gap_start is None:
+            self._begin_gap()
+
+        self.reconnect_key = self.connected_key
+        self.reconnect_attempts = 0
+        self.btn_connect.setEnabled(False)
+        self.btn_disconnect.setEnabled(True)  # yeniden bağlanmayı iptal eder
+        self._update_status_label("reconnecting")
+        self._schedule_reconnect()
+        self.port_watcher.rescan()
+
+    def _schedule_reconnect(self):
+        delay = RECONNECT_BACKOFF_MS[
+            min(self.reconnect_attempts, len(RECONNECT_BACKOFF_MS) - 1)
+        ]
+        self.reconnect_attempts += 1
+        self.reconnect_timer.start(delay)
+
+    def _port_info(self, device: str) -> dict:
+        for p in self.known_ports:
+            if p["device"] == device:
+                return p
+        return {"device": device}
+
+    def _try_reconnect(self):
+        if self.reconnect_key is None:
+            return
+
+        port = find_port(self.known_ports, self.reconnect_key)
+        if port is not None:
+            index = self.port_combo.findText(port["device"])
+            if index >= 0:
+                self.port_combo.setCurrentIndex(index)
+        if port is None or self._open_port(port["device"]) is not None:
+            # Düzenek henüz geri gelmedi ya da port açılamıyor
+            if not self.reconnect_timer.isActive():
+                self._schedule_reconnect()
+            return
+
+        self.reconnect_key = None
+        self.reconnect_timer.stop()
+        if self.segment_active:
+            if self.gap_start is not None:
+                self._end_gap()
+            self._update_status_label("active")
+        else:
+            self._update_status_label("connected")
+
+    # Segment içi bağlantı kesintileri
+    def _segment_time(self) -> float:
+        return time.monotonic() - self.segment_start_time
+
+    def _begin_gap(self):
+        t = self._segment_time()
+        self.gap_start = t
+        self._write_gap_marker(t)
+        self.graph_panel.begin_gap(t)
+        self.step_detector.mark_gap()
+        for stream in self.aux_streams.values():
+            stream.mark_gap()
+
+    def _end_gap(self):
+        t = self._segment_time()
+        if self.segment_stats is not None:
+            self.segment_stats["gaps"].append({"t_start": self.gap_start, "t_end": t})
+        self._write_gap_marker(t)
+        self.graph_panel.end_gap(self.gap_start, t)
+        # Kesinti öncesi filtre durumu artık geçersiz
+        self.filter_stage.reset()
+        self.gap_start = None
+
+    def _write_gap_marker(self, t: float):
+        """
+        CSV'ye yalnızca zamanı dolu, diğer hücreleri boş bir satır yazar.
+
+        İçe aktarıcı boş hücreleri NaN okur; kesintinin başı ve sonu bu iki
+        satırla işaretlenir ve grafikler bu noktada bölünür.
+        """
+        if not self.logging_enabled or self.log_writer is None:
+            return
+        self.log_writer.writerow(
+            [self._format_csv_value("time_s", t)] + [""] * len(self._csv_fields)
         )
-        self._fix_messagebox_theme(box)
-        box.exec()
+        try:
+            self.log_file.flush()
+        except OSError:
+            pass
+
+    def _connect_serial(self):
+        if self.ser and self.ser.is_open:
+            self.toasts.info("Serial", "Already connected.")
+            return
+
+        port_text = self.port_combo.currentText()
+        if not port_text or port_text in (NO_PORTS_TEXT, SCANNING_TEXT):
+            self.toasts.warning("Serial", "Select a valid COM port.")
+
+            return
+
+        error = self._open_port(port_text)
+        if error is not None:
+            self.toasts.error("Serial", f"Port could not be opened:\n{error}")
+
+            self._update_status_label("error")
+            return
+
+        self._update_status_label("connected")
+        self.toasts.info("Serial", f"{port_text} connected.")
 
     def _disconnect_serial(self):
         """
@@ -399,17 +754,12 @@ class MainWindow(QMainWindow):
         4. Sensor status panel'i sıfırla (YENİ)
         5. UI durumunu güncelle
         """
-        # Timer'ı durdur
-        self.read_timer.stop()
+        # Bekleyen otomatik yeniden bağlanmayı iptal et
+        self.reconnect_key = None
+        self.reconnect_timer.stop()
 
-        # Serial port'u kapat
-        if self.ser:
-            try:
-                self.ser.close()
-            except serial.SerialException:
-                pass
-            self.ser = None
-            self.serial_repo = None
+        # Timer'ı durdur, serial port'u kapat
+        self._close_port()
 
         # Aktif test varsa durdur
         if self.segment_active:
@@ -425,49 +775,31 @@ class MainWindow(QMainWindow):
         self.btn_disconnect.setEnabled(False)
 
         # Kullanıcıya bildir
-        box = QMessageBox(QMessageBox.Icon.Information, "Serial", "Connection closed.")
-        self._fix_messagebox_theme(box)
-        box.exec()
+        self.toasts.info("Serial", "Connection closed.")
 
     def _reset_test(self):
         """Test duruyken grafikleri ve canlı verileri sıfırlar."""
         if self.segment_active:
-            box = QMessageBox(
-                QMessageBox.Icon.Warning,
-                "Reset",
-                "Reset için önce testi durdur (Stop Test).",
+            self.toasts.warning(
+                "Reset", "Reset için önce testi durdur (Stop Test)."
             )
-            self._fix_messagebox_theme(box)
-            box.exec()
             return
 
         # Grafikleri temizle
         self.graph_panel.clear_all()
+        self._close_recording()
 
         # Segment istatistiklerini ve indexi sıfırla
         self.segment_stats = None
         self.segment_index = 0
 
         # Sol paneldeki canlı verileri sıfırla
-        self.left_panel.update_values(
-            voltage="0.000",
-            current="0.000",
-            thrust_kgf="0.0000",
-            temperature="0.00",
-            rpm="0",
-            power="0.00",
-            pt_eff="0.000000",
-            tpa="0.000000",
-        )
+        self.left_panel.reset_values()
 
     # Test / logging yönetimi
     def _start_test_segment(self):
         if not self.ser or not self.ser.is_open:
-            box = QMessageBox(
-                QMessageBox.Icon.Warning, "Test", "Connect to a COM port first."
-            )
-            self._fix_messagebox_theme(box)
-            box.exec()
+            self.toasts.warning("Test", "Connect to a COM port first.")
             return
 
         if self.segment_active:
@@ -475,11 +807,21 @@ class MainWindow(QMainWindow):
 
         self.segment_index += 1
         self.segment_active = True
+        self.gap_start = None
         self.segment_start_time = time.monotonic()
+        self.segment_started_at = time.time()
         self.stream_start_time = self.segment_start_time
 
         self.graph_panel.clear_all()
+        self._close_recording()
         self._reset_segment_stats()
+        for stream in self.aux_streams.values():
+            stream.reset()
+        self.aux_panel.clear_all()
+        if self.spectrum_dialog is not None:
+            self.spectrum_dialog.reset()
+        self.characteristics.start_segment()
+        self.filter_stage.reset()
 
         if not self._start_logging_segment():
             # logging başlatılamadı ama test yine de çalışabilir
@@ -492,15 +834,28 @@ class MainWindow(QMainWindow):
         if not self.segment_active:
             return
 
+        if self.gap_start is not None:
+            self._end_gap()  # kesinti sürerken durduruldu
+
+        self._check_memory()  # tepe RSS segmentin son ölçümünü de içersin
         self.segment_active = False
+        self.characteristics.finish_segment(f"Segment #{self.segment_index}")
         if self.segment_stats is not None:
             self.segment_stats["end_time"] = time.monotonic()
+            self.segment_stats["steps"] = self.step_detector.finish()
 
+        log_path = self.current_log_path
         self._stop_logging()
+        if log_path is not None:
+            self.last_segment_path = log_path
+        if log_path is not None and self.segment_stats is not None:
+            self._catalog_segment(log_path)
         self.control_panel.set_test_status(active=False)
 
         # Bağlantı duruyorsa CONNECTED'e, yoksa IDLE'a dön
-        if self.ser and self.ser.is_open:
+        if self.reconnect_key is not None:
+            self._update_status_label("reconnecting")
+        elif self.ser and self.ser.is_open:
             self._update_status_label("connected")
         else:
             self._update_status_label("idle")
@@ -511,23 +866,8 @@ class MainWindow(QMainWindow):
         self.segment_stats = None
 
     def _reset_segment_stats(self):
-        keys = [
-            "thrust_kgf",
-            "current",
-            "voltage",
-            "temperature",
-            "rpm",
-            "pt_eff",
-            "tpa",
-        ]
-        self.segment_stats = {
-            "start_time": self.segment_start_time,
-            "end_time": None,
-            "count": 0,
-            "sum": {k: 0.0 for k in keys},
-            "max": {k: None for k in keys},
-            "min": {k: None for k in keys},
-        }
+        self.segment_stats = new_segment_stats(self.segment_start_time)
+        self.step_detector.reset()
 
     # Logging
     def _resolve_output_folder_and_name(self):
@@ -556,27 +896,62 @@ class MainWindow(QMainWindow):
         try:
             self.log_file = open(path, "w", newline="", encoding="utf-8")
         except OSError as e:
-            QMessageBox.critical(self, "Logging", f"File could not be opened:\n{e}")
+            self.toasts.error("Logging", f"File could not be opened:\n{e}")
             self.log_file = None
             return False
 
+        if JOURNAL_ENABLED:
+            self._open_journal(path)
+
         self.log_writer = csv.writer(self.log_file, delimiter=";")
-        header = [
-            "time_s",
-            "voltage_V",
-            "current_A",
-            "thrust_kgf",
-            "temperature_C",
-            "rpm",
-            "power_W",
-            "pt_eff_kgf_per_W",
-            "tpa_kgf_per_A",
+        header = [CSV_COLUMNS["time_s"]] + [
+            CSV_COLUMNS.get(key, key) for key, _fmt in self._csv_fields
         ]
         self.log_writer.writerow(header)
         self.logging_enabled = True
         self.current_log_path = path
         return True
 
+    def _open_journal(self, csv_path: str):
+        """CSV yazmalarını segment günlüğüne de yönlendirir (log_file sarılır)."""
+        from data.segment_journal import (
+            JournaledFile,
+            SegmentJournal,
+            find_journals,
+            journal_path,
+        )
+
+        folder = os.path.dirname(csv_path)
+        stale = find_journals(folder)
+        if stale and folder not in self._journal_warned:
+            # Önceki bir oturum temiz kapanmamış (çökme / elektrik kesintisi)
+            self._journal_warned.add(folder)
+            self.toasts.warning(
+                "Logging",
+                f"{len(stale)} unfinished journal(s) in the output folder.\n"
+                f"Recover with: python -m app.recover_journal \"{folder}\"",
+            )
+
+        header = {
+            "csv": os.path.basename(csv_path),
+            "segment": self.segment_index,
+            "test_name": self.control_panel.test_name_edit.text().strip(),
+            "started": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "port": getattr(self.ser, "port", None),
+            "setup": self.setup_info,
+            "baudrate": SERIAL_BAUDRATE,
+            "filters": FILTERS,
+            "safety_limits": {
+                rule.key: (rule.lo, rule.hi) for rule in self.safety.rules
+            },
+        }
+        try:
+            self.journal = SegmentJournal(journal_path(csv_path), header)
+        except OSError as e:
+            self.toasts.error("Logging", f"Journal could not be opened:\n{e}")
+            return
+        self.log_file = JournaledFile(self.log_file, self.journal, discard=not JOURNAL_KEEP)
+
     def _stop_logging(self):
         if not self.logging_enabled:
             return
@@ -588,8 +963,15 @@ class MainWindow(QMainWindow):
             except OSError:
                 pass
         self.log_file = None
+        self.journal = None
         self.log_writer = None
         self.current_log_path = None
+        for writer in self.aux_writers.values():
+            writer.close()
+        self.aux_writers = {}
+        if self.event_log is not None:
+            self.event_log.close()
+            self.event_log = None
 
     def _format_csv_value(self, key, value):
             if value is None:
@@ -600,20 +982,8 @@ class MainWindow(QMainWindow):
             except:
                 return str(value)
 
-            # Alanlara göre gösterilecek hassasiyet
-            precision = {
-                "time_s": 3,
-                "voltage": 3,
-                "current": 3,
-                "thrust_kgf": 3,
-                "temperature": 2,
-                "rpm": 0,
-                "power": 3,
-                "pt_eff": 4,
-                "tpa": 4,
-            }
-
-            p = precision.get(key, 3)
+            # Alanlara göre gösterilecek hassasiyet (kanal kaydından)
+            p = CSV_PRECISION.get(key, 3)
 
             # Excel’in TARİH saçmalığını engellemek için başa '=' koyuyoruz
             return f"={num:.{p}f}"
@@ -622,89 +992,304 @@ class MainWindow(QMainWindow):
 
 
 
-    # Serial'den veri okuma
-    def _poll_serial(self):
-        if not self.serial_repo:
+    # Serial'den veri okuma (SerialWorker toplu iletir)
+    def _on_serial_batch(self, batch: list, blocks: list):
+        if batch:
+            self.filter_stage.apply(batch)
+            self.derived_engine.apply(batch)
+            for values in batch:
+                self._update_ui_with_values(values)
+            if self.segment_active:
+                self.characteristics.live.feed_batch(
+                    batch, self.control_panel.throttle_percent()
+                )
+        if blocks:
+            self._ingest_blocks(blocks)
+
+    # Cihaz komutları
+    def _send_command(self, command, on_result=None) -> int:
+        """
+        Komutu okuma thread'i üzerinden gönderir.
+
+        on_result yalnızca yanıt bekleyen komutlarda (reply_prefix) çağrılır:
+        yanıt, zaman aşımı veya bağlantı kapanması sonucu UI thread'inde.
+        """
+        request_id = self.commands.submit(command)
+        if on_result is not None and command.reply_prefix is not None:
+            self._command_callbacks[request_id] = on_result
+        return request_id
+
+    def _on_command_results(self, results: list):
+        for result in results:
+            callback = self._command_callbacks.pop(result.request_id, None)
+            if callback is not None:
+                callback(result)
+
+    def _on_throttle_changed(self, _value: int):
+        if self.serial_worker is None:
+            return
+        from domain.commands import throttle_setpoint
+
+        # Gönderilmemiş önceki set noktasının yerine geçer
+        self._send_command(throttle_setpoint(self.control_panel.throttle_percent()))
+
+    def _stop_motor(self):
+        if self.serial_worker is None:
+            return
+        if self.sequence is not None:
+            self.sequence.abort("Cut by operator")
+            return
+        from domain.commands import motor_stop
+
+        self._send_command(motor_stop())
+        self.control_panel.reset_throttle()
+
+    # Güvenlik sınırları
+    def _on_safety_event(self, kind: str, info: dict):
+        from domain import safety
+
+        if kind == safety.CLEAR:
+            if self.safety.tripped and not self.safety.active_alarms:
+                self.toasts.info("Safety", "All limits clear. Re-arm to continue.")
+            return
+
+        self.control_panel.reset_throttle()
+        self.control_panel.set_safety_locked(info["reason"])
+        if self.segment_active and self.segment_start_time is not None:
+            event = dict(info, event="safety_stop", t=info["t"] - self.segment_start_time)
+            self.graph_panel.mark_event(event["t"], "STOP")
+            if self.segment_stats is not None:
+                self.segment_stats["events"].append(event)
+            self._write_event(event)
+        self.toasts.error(
+            "Safety",
+            f"Motor stopped: {info['reason']}\n"
+            f"STOP written {info['latency_ms']:.1f} ms after detection",
+        )
+
+    def _write_event(self, event: dict):
+        if not self.logging_enabled or self.current_log_path is None:
+            return
+        if self.journal is not None:
+            self.journal.append_event(event)
+        if self.event_log is None:
+            from data.event_log import EventLogWriter, event_log_path
+
+            try:
+                self.event_log = EventLogWriter(event_log_path(self.current_log_path))
+            except OSError as e:
+                self.toasts.error("Logging", f"Event log could not be opened:\n{e}")
+                return
+        self.event_log.write(event)
+
+    def _rearm_safety(self):
+        if not self.safety.rearm():
+            names = ", ".join(
+                CHANNELS_BY_KEY[key].name for key in self.safety.active_alarms
+            )
+            self.toasts.warning("Safety", f"Still outside limits: {names}")
+            return
+        self.control_panel.set_safety_locked(None)
+        self.toasts.info("Safety", "Safety lock released.")
+
+    # Otomatik throttle sweep
+    def _toggle_sweep(self):
+        if self.sequence is not None:
+            self.sequence.abort("Aborted by operator")
+        else:
+            self._start_sweep()
+
+    def _start_sweep(self):
+        if self.serial_worker is None:
+            self.toasts.warning("Sweep", "Connect to a COM port first.")
+            return
+        if self.segment_active:
+            self.toasts.warning("Sweep", "Stop the running test first.")
             return
 
+        folder = self.control_panel.output_edit.text().strip()
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Open Sweep Profile", folder, "Sweep profile (*.json)"
+        )
+        if not path:
+            return
+
+        from domain.sequencer import SequenceRunner, SweepProfile
+
         try:
-            for values in self.serial_repo.read_available():
-                self._update_ui_with_values(values)
-        except serial.SerialException:
-            self._update_status_label("error")
-            self._disconnect_serial()
+            profile = SweepProfile.load(path)
+        except (OSError, ValueError) as e:
+            self.toasts.error("Sweep", f"Profile could not be loaded:\n{e}")
+            return
 
-    def _update_ui_with_values(self, values: dict):
+        runner = SequenceRunner(profile, self.commands, notify=self.sequence_event.emit)
+        self.sequence = runner
+        self.control_panel.set_sweep_running(True)
+        self.serial_worker.add_task(runner)
+        runner.start()
+        self.toasts.info(
+            "Sweep",
+            f"{profile.name}: {len(runner.levels)} steps, {runner.duration_s:.0f} s",
+        )
+
+    def _on_sequence_event(self, kind: str, info: dict):
+        from domain import sequencer
+
+        runner = self.sequence
+        if runner is None:
+            return  # bağlantı kapanırken iptal edildi
+
+        if kind == sequencer.SEGMENT_START:
+            self._start_test_segment()
+        elif kind == sequencer.SEGMENT_STOP:
+            self._stop_test_segment(show_summary=not runner.profile.segment_per_step)
+        elif kind == sequencer.STEP:
+            self.control_panel.show_throttle(info["throttle"])
+            self.control_panel.set_sweep_progress(info["index"], info["count"])
+        elif kind == sequencer.FINISHED:
+            self._finish_sweep()
+            self.toasts.info(
+                "Sweep",
+                f"{info['name']} finished in {info['elapsed_s']:.0f} s "
+                f"(set point timing: max {info['late_ms_max']:.1f} ms late)",
+            )
+        elif kind == sequencer.ABORTED:
+            self._finish_sweep()
+            if self.segment_active:
+                self._stop_test_segment(show_summary=True)
+            self.toasts.error("Sweep", f"Sweep aborted: {info['reason']}")
+
+    def _abort_sweep(self, reason: str):
+        """Sweep'i UI thread'inden hemen sonlandırır (ABORTED olayı beklenmez)."""
+        self.sequence.abort(reason)
+        self._finish_sweep()
+        self.toasts.error("Sweep", f"Sweep aborted: {reason}")
+
+    def _finish_sweep(self):
+        if self.serial_worker is not None:
+            self.serial_worker.remove_task(self.sequence)
+        self.sequence = None
+        self.control_panel.set_sweep_running(False)
+        self.control_panel.reset_throttle()
+
+    def _on_stop_clicked(self):
+        if self.sequence is not None:
+            self.sequence.abort("Stopped by operator")
+        else:
+            self._stop_test_segment(show_summary=True)
+
+    def _ingest_blocks(self, blocks: list):
+        """
+        Hızlı kanal çerçevelerini tampona ve (log açıksa) kayıt dosyasına yazar.
+
+        Örnek başına Python işi yapılmaz; çizim AuxPanel'in kendi
+        zamanlayıcısıyla sabit aralıkta yapılır.
+        """
         now = time.monotonic()
         if self.stream_start_time is None:
             self.stream_start_time = now
-
         if self.segment_active and self.segment_start_time is not None:
             t = now - self.segment_start_time
         else:
             t = now - self.stream_start_time
 
+        for key, seq, samples in blocks:
+            stream = self.aux_streams.get(key)
+            if stream is None:
+                continue
+            chunk = stream.push(seq, samples, t)
+            if self.segment_active and self.logging_enabled:
+                writer = self._aux_writer(key, stream, len(chunk))
+                if writer is not None:
+                    writer.write(chunk)
+
+        self.aux_panel.activate()
+
+    def _aux_writer(self, key: str, stream: AuxStream, chunk_len: int):
+        """Segment CSV'sinin yanındaki .aux dosyasını ilk blokta açar."""
+        writer = self.aux_writers.get(key)
+        if writer is not None or self.current_log_path is None:
+            return writer
+
+        from data.aux_recording import AuxRecordingWriter, aux_recording_path
+
+        ch = AUX_CHANNELS_BY_KEY[key]
+        t0 = stream.t0 + (stream.count - chunk_len) / stream.rate_hz
+        try:
+            writer = AuxRecordingWriter(
+                aux_recording_path(self.current_log_path, key),
+                key,
+                ch.unit,
+                ch.rate_hz,
+                t0,
+            )
+        except OSError as e:
+            self.toasts.error("Logging", f"{ch.title} file could not be opened:\n{e}")
+            return None
+        self.aux_writers[key] = writer
+        return writer
+
+    def _update_ui_with_values(self, values: dict):
+        # Okuma anı worker'da damgalanır (paket/UI gecikmesinden bağımsız)
+        stamp = values.get(SAMPLE_TIME_KEY)
+        if stamp is None:
+            stamp = time.monotonic()
+        if self.stream_start_time is None:
+            self.stream_start_time = stamp
+
+        # Segment başlamadan okunup sonra iletilen örnekler segmente girmez
+        in_segment = (
+            self.segment_active
+            and self.segment_start_time is not None
+            and stamp >= self.segment_start_time
+        )
+        if in_segment:
+            t = stamp - self.segment_start_time
+        else:
+            t = stamp - self.stream_start_time
+
         # --- SENSOR STATUS GÜNCELLEME ---
         if "sensor_status" in values:
             status_dict = values["sensor_status"]
             self.sensor_status_panel.update_status(status_dict)
-            if len(values) == 1:
+            if not values.keys() - {"sensor_status", SAMPLE_TIME_KEY}:
                 return  # Sadece sensor_status var
 
         # --- NORMAL DATA ---
         left_updates = {}
-        if "voltage" in values:
-            left_updates["voltage"] = f"{values['voltage']:.3f}"
-        if "current" in values:
-            left_updates["current"] = f"{values['current']:.3f}"
-        if "thrust_kgf" in values:
-            left_updates["thrust_kgf"] = f"{values['thrust_kgf']:.4f}"
-        if "temperature" in values:
-            left_updates["temperature"] = f"{values['temperature']:.2f}"
-        if "rpm" in values:
-            left_updates["rpm"] = f"{values['rpm']:.0f}"
-        if "power" in values:
-            left_updates["power"] = f"{values['power']:.2f}"
-        if "pt_eff" in values:
-            left_updates["pt_eff"] = f"{values['pt_eff']:.6f}"
-        if "tpa" in values:
-            left_updates["tpa"] = f"{values['tpa']:.6f}"
+        for key, filt_key, fmt in self._display_fields:
+            v = values.get(filt_key, values.get(key))
+            if v is not None:
+                left_updates[key] = fmt.format(v)
 
         if left_updates:
             self.left_panel.update_values(**left_updates)
 
-        if self.segment_active:
-            for key in (
-                    "thrust_kgf",
-                    "voltage",
-                    "current",
-                    "rpm",
-                    "temperature",
-                    "power",
-                    "pt_eff",
-                    "tpa",
-            ):
-                if key in values:
-                    visible = self.graph_panel.title_checkboxes[key].isChecked()
-                    self.graph_panel.add_sample(key, t, values[key], visible=visible)
+        if in_segment:
+            for key, filt_key, checkbox in self._plot_fields:
+                v = values.get(key)
+                if v is not None:
+                    # Filtreli kanalda filtrelenmiş iz, ham değer soluk iz olarak
+                    filtered = values.get(filt_key)
+                    self.graph_panel.add_sample(
+                        key,
+                        t,
+                        v if filtered is None else filtered,
+                        visible=checkbox.isChecked(),
+                        raw=None if filtered is None else v,
+                    )
 
             if self.logging_enabled and self.log_writer is not None:
-                row = [
-                    self._format_csv_value("time_s", t),
-                    self._format_csv_value("voltage", values.get("voltage")),
-                    self._format_csv_value("current", values.get("current")),
-                    self._format_csv_value("thrust_kgf", values.get("thrust_kgf")),
-                    self._format_csv_value("temperature", values.get("temperature")),
-                    self._format_csv_value("rpm", values.get("rpm")),
-                    self._format_csv_value("power", values.get("power")),
-                    self._format_csv_value("pt_eff", values.get("pt_eff")),
-                    self._format_csv_value("tpa", values.get("tpa")),
-                ]
+                row = [self._format_csv_value("time_s", t)]
+                for key, fmt in self._csv_fields:
+                    v = values.get(key)
+                    row.append("" if v is None else fmt.format(v))
                 self.log_writer.writerow(row)
 
             self._update_segment_stats(values)
+            self.step_detector.update(t, values)
 
-def _update_segment_stats(self, values: dict):
+    def _update_segment_stats(self, values: dict):
         if self.segment_stats is None:
             return
 
@@ -716,6 +1301,7 @@ def _update_segment_stats(self, values: dict):
             if v is None:
                 continue
             self.segment_stats["sum"][k] += v
+            self.segment_stats["n"][k] += 1
 
             cur_max = self.segment_stats["max"][k]
             cur_min = self.segment_stats["min"][k]
@@ -726,82 +1312,361 @@ def _update_segment_stats(self, values: dict):
                 self.segment_stats["min"][k] = v
 
     # Summary
-def _show_segment_summary(self):
+    def _show_segment_summary(self):
         stats = self.segment_stats
         if not stats or stats["count"] == 0:
-            box = QMessageBox(
-                QMessageBox.Icon.Information, "Summary", "No data in this segment."
+            self.toasts.info("Summary", "No data in this segment.")
+            return
+
+        lines = format_segment_summary(stats, f"Segment #{self.segment_index}")
+        lines.extend(format_step_table(stats.get("steps", [])))
+        lines.append("")
+
+        for key, stream in self.aux_streams.items():
+            if stream.count:
+                lines.append(
+                    f"{AUX_CHANNELS_BY_KEY[key].title}: {stream.count} samples "
+                    f"@ {stream.rate_hz:g} Hz, dropped frames: {stream.dropped_frames}"
+                )
+
+        if self.current_log_path:
+            lines.append(f"CSV file: {self.current_log_path}")
+
+        folder, base_name = self._resolve_output_folder_and_name()
+        if folder is not None:
+            paths = [
+                os.path.join(folder, f"{base_name}_segment{self.segment_index}.{ext}")
+                for ext in GRAPH_EXPORT_FORMATS
+            ]
+            self._export_graphs(paths)
+            for path in paths:
+                lines.append(f"Graph {os.path.splitext(path)[1][1:].upper()}: {path}")
+
+        self._show_summary("\n".join(lines))
+
+    def _export_graphs(self, paths: list):
+        """
+        Grafik panosunu arka planda dosyalara yazar.
+
+        Anlık görüntü (veri kopyası) burada alınır; çizim ve dosya yazma
+        işçi thread'inde yapılır, sonuç ve hatalar bildirimle raporlanır.
+        """
+        from presentation.widgets.dashboard_export import ExportWorker
+
+        width, height = GRAPH_EXPORT_SIZE_PX
+        jobs = [(path, width, height, GRAPH_EXPORT_DPI) for path in paths]
+        worker = ExportWorker(self.graph_panel.export_snapshot(), jobs, self)
+        worker.exported.connect(
+            lambda done: self.toasts.info(
+                "Export", "Graphs saved:\n" + "\n".join(os.path.basename(p) for p in done)
+            )
+        )
+        worker.failed.connect(
+            lambda msg: self.toasts.error("Export", f"Graph export failed:\n{msg}")
+        )
+        worker.finished.connect(lambda w=worker: self._on_export_finished(w))
+        self.export_workers.append(worker)
+        worker.start()
+
+    def _on_export_finished(self, worker):
+        if worker in self.export_workers:
+            self.export_workers.remove(worker)
+        worker.deleteLater()
+
+    # Kayıttan açma (offline görüntüleme)
+    def _open_recording(self):
+        if self.segment_active:
+            self.toasts.warning(
+                "Open Recording", "Kayıt açmak için önce testi durdur (Stop Test)."
             )
-            self._fix_messagebox_theme(box)
-            box.exec()
             return
 
-        duration = (
-            stats["end_time"] - stats["start_time"] if stats["end_time"] else 0.0
+        start_dir = self.control_panel.output_edit.text().strip()
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Open Recording", start_dir, "Segment CSV (*.csv)"
         )
-        n = stats["count"]
+        if not path:
+            return
+        self._load_recording(path)
 
-        def avg(key):
-            s = stats["sum"].get(key)
-            return (s / n) if (s is not None and n > 0) else None
+    def _load_recording(self, path: str):
+        """Segment CSV'sini grafiklerde açar (Open veya katalogdan)."""
+        if self.segment_active:
+            self.toasts.warning(
+                "Open Recording", "Kayıt açmak için önce testi durdur (Stop Test)."
+            )
+            return
 
-        def fmt(val, fmt_str):
-            if val is None:
-                return "--"
-            return fmt_str.format(val)
+        from data.recording_repository import RecordingRepository
 
-        lines = []
-        lines.append(f"Segment #{self.segment_index}")
-        lines.append(f"Duration: {duration:.2f} s")
-        lines.append(f"Sample count: {n}")
-        lines.append("")
-        lines.append(
-            f"Average Thrust: {fmt(avg('thrust_kgf'), '{:.4f}')} kgf"
+        try:
+            recording = RecordingRepository(path)
+        except (OSError, ValueError) as e:
+            self.toasts.error(
+                "Open Recording", f"Recording could not be opened:\n{e}"
+            )
+            return
+
+        self._close_recording()
+        self.recording = recording
+        self.graph_panel.show_recording(recording)
+
+        lines = format_segment_summary(
+            recording.stats, f"Recording: {os.path.basename(path)}"
         )
-        lines.append(
-            f"Max Thrust: {fmt(stats['max']['thrust_kgf'], '{:.4f}')} kgf"
+        lines.append(f"CSV file: {path}")
+        self._show_summary("\n".join(lines))
+
+    # Referans segmentler (canlı grafikte sabitlenmiş önceki koşular)
+    def _pin_references(self):
+        start = self.last_segment_path or self.control_panel.output_edit.text().strip()
+        paths, _ = QFileDialog.getOpenFileNames(
+            self, "Pin Reference Segments", start, "Segment CSV (*.csv)"
         )
+        for path in paths:
+            self._pin_reference(path)
 
-        lines.append("")
-        lines.append(f"Average Current: {fmt(avg('current'), '{:.3f}')} A")
-        lines.append(f"Max Current: {fmt(stats['max']['current'], '{:.3f}')} A")
-        lines.append("")
-        lines.append(f"Average Voltage: {fmt(avg('voltage'), '{:.3f}')} V")
-        lines.append(f"Min Voltage: {fmt(stats['min']['voltage'], '{:.3f}')} V")
-        lines.append("")
-        lines.append(f"Average Temperature: {fmt(avg('temperature'), '{:.2f}')} °C")
-        lines.append(
-            f"Max Temperature: {fmt(stats['max']['temperature'], '{:.2f}')} °C"
+    def _pin_reference(self, path: str) -> bool:
+        """
+        Kaydı bir kez seyreltip grafiklere referans iz olarak ekler.
+
+        Piramit kaydın yan dosyasından (.gmkidx.npz) gelir; okunan diziler
+        dışında kayıt açık tutulmaz.
+        """
+        from data.recording_repository import RecordingRepository
+
+        try:
+            recording = RecordingRepository(path)
+            try:
+                t_first, t_last = recording.time_span
+                window = self.graph_panel.WINDOW_SECONDS
+                max_points = int(
+                    min(
+                        REFERENCE_MAX_POINTS,
+                        max(1.0, (t_last - t_first) / window) * REFERENCE_POINTS_PER_WINDOW,
+                    )
+                )
+                series = recording.read_range(t_first, t_last, max_points=max_points)
+            finally:
+                recording.close()
+        except (OSError, ValueError) as e:
+            self.toasts.error("Pin Reference", f"Recording could not be opened:\n{e}")
+            return False
+
+        self.graph_panel.add_reference(os.path.basename(path), series)
+        self._update_reference_controls()
+        return True
+
+    def _unpin_references(self):
+        self.graph_panel.clear_references()
+        self._update_reference_controls()
+
+    def _update_reference_controls(self):
+        labels = [ref.label for ref in self.graph_panel.references]
+        cp = self.control_panel
+        cp.act_unpin.setEnabled(bool(labels))
+        cp.act_unpin.setToolTip(
+            "Remove reference traces:\n" + "\n".join(labels) if labels else ""
         )
-        lines.append("")
-        lines.append(f"Average RPM: {fmt(avg('rpm'), '{:.0f}')}")
-        lines.append(f"Max RPM: {fmt(stats['max']['rpm'], '{:.0f}')}")
-        lines.append("")
-        lines.append(
-            f"Average PT Efficiency: {fmt(avg('pt_eff'), '{:.6f}')} kgf/W"
+
+    def _show_summary(self, text: str):
+        """
+        Özeti modal olmayan pencerede gösterir; önceki özet açıksa kapatılır.
+
+        exec() kullanılmaz: iç içe olay döngüsü okuma thread'inden gelen
+        örneklerin işlenmesini ve komut yanıtlarını bekletir.
+        """
+        if self.summary_dialog is not None:
+            self.summary_dialog.close()
+
+        dlg = SummaryDialog(text, self)
+        dlg.destroyed.connect(lambda _obj=None, d=dlg: self._on_summary_closed(d))
+        self.summary_dialog = dlg
+        dlg.show()
+
+    def _on_summary_closed(self, dlg):
+        if self.summary_dialog is dlg:
+            self.summary_dialog = None
+
+    def _open_batch_compare(self):
+        folder = self.control_panel.output_edit.text().strip()
+        if not folder or not os.path.isdir(folder):
+            folder = QFileDialog.getExistingDirectory(self, "Select Segment Folder")
+            if not folder:
+                return
+
+        from presentation.widgets.batch_dialog import BatchCompareDialog
+
+        dlg = BatchCompareDialog(folder, self)
+        dlg.show()
+
+    # Segment kataloğu
+    def _load_setup(self) -> dict:
+        try:
+            return json.loads(self.settings.value("setup/info", "{}") or "{}")
+        except ValueError:
+            return {}
+
+    def _edit_setup(self):
+        from presentation.widgets.catalog_dialog import SetupDialog
+
+        dlg = SetupDialog(self.setup_info, self)
+        if dlg.exec():
+            self.setup_info = dlg.values()
+            self.settings.setValue("setup/info", json.dumps(self.setup_info))
+
+    def _get_catalog(self):
+        if self.catalog is None:
+            import sqlite3
+            from data.catalog import SegmentCatalog, default_catalog_path
+
+            try:
+                self.catalog = SegmentCatalog(default_catalog_path())
+            except (OSError, ValueError, sqlite3.Error) as e:
+                self.toasts.error("Catalog", f"Catalog could not be opened:\n{e}")
+        return self.catalog
+
+    def _catalog_segment(self, csv_path: str):
+        """Biten segmenti düzenek bilgisi ve özet metriklerle kataloğa yazar."""
+        if not CATALOG_ENABLED or self._get_catalog() is None:
+            return
+        import sqlite3
+        from data.catalog import flatten_metrics
+        from domain.segment_summary import stats_metrics
+
+        stats = self.segment_stats
+        metrics = stats_metrics(stats)
+        info = dict(
+            self.setup_info,
+            path=csv_path,
+            test_name=self.control_panel.test_name_edit.text().strip(),
+            segment=self.segment_index,
+            started=time.strftime(
+                "%Y-%m-%d %H:%M:%S", time.localtime(self.segment_started_at)
+            ),
+            started_ts=self.segment_started_at,
+            duration_s=metrics["duration"],
+            samples=stats["count"],
+            port=getattr(self.ser, "port", None),
+            safety_stops=len(stats["events"]),
+            gaps=len(stats["gaps"]),
         )
-        lines.append(
-            f"Average Thrust per Amp: {fmt(avg('tpa'), '{:.6f}')} kgf/A"
+        try:
+            self.catalog.add_segment(info, flatten_metrics(metrics))
+        except sqlite3.Error as e:
+            self.toasts.error("Catalog", f"Segment could not be cataloged:\n{e}")
+
+    def _open_catalog(self):
+        if self._get_catalog() is None:
+            return
+        if self.catalog_dialog is None:
+            from presentation.widgets.catalog_dialog import CatalogDialog
+
+            self.catalog_dialog = CatalogDialog(self.catalog, self._load_recording, self)
+        else:
+            self.catalog_dialog.run_query()
+        self.catalog_dialog.show()
+        self.catalog_dialog.raise_()
+
+    # ============================================================
+    #                       BELLEK BÜTÇESİ
+    # ============================================================
+    def _check_memory(self):
+        """Bütçeyi uygular; segment boyunca tepe RSS'i istatistiklere yazar."""
+        over = self.memory.check()
+        rss = self.memory.rss
+        if rss is None:
+            return
+        if self.segment_stats is not None:
+            self.segment_stats["peak_rss"] = max(self.segment_stats["peak_rss"] or 0, rss)
+        self.status_label.setToolTip(
+            f"Memory: {rss / MB:.0f} MB RSS (peak {self.memory.peak_rss / MB:.0f} MB, "
+            f"limit {self.memory.max_rss_bytes / MB:.0f} MB)"
         )
-        lines.append("")
+        if over and not self._memory_warned:
+            self._memory_warned = True
+            self.toasts.warning(
+                "Memory",
+                f"Memory use {rss / MB:.0f} MB exceeds the "
+                f"{self.memory.max_rss_bytes / MB:.0f} MB limit; live buffers were reduced.",
+            )
 
-        if self.current_log_path:
-            lines.append(f"CSV file: {self.current_log_path}")
+    def _spectrum_bytes(self) -> int:
+        if self.spectrum_dialog is None:
+            return 0
+        return sum(src.engine.nbytes for src in self.spectrum_dialog.sources.values())
 
-        folder, base_name = self._resolve_output_folder_and_name()
-        if folder is not None:
-            png_path = os.path.join(
-                folder, f"{base_name}_segment{self.segment_index}.png"
+    def _shrink_spectrum(self):
+        if self.spectrum_dialog is not None:
+            for source in self.spectrum_dialog.sources.values():
+                source.engine.shrink()
+
+    def _open_spectrum(self):
+        """Canlı spektrum penceresi; kapatılınca gizlenir, geçmiş korunur."""
+        if self.spectrum_dialog is None:
+            from presentation.widgets.spectrum_dialog import SpectrumDialog
+
+            self.spectrum_dialog = SpectrumDialog(
+                self.graph_panel, self.aux_streams, self
             )
-            try:
-                self.graph_panel.export_png(png_path)
-                lines.append(f"Graph PNG: {png_path}")
-            except Exception:
-                pass
+        self.spectrum_dialog.show()
+        self.spectrum_dialog.raise_()
+        self.spectrum_dialog.activateWindow()
 
-        text = "\n".join(lines)
-        dlg = SummaryDialog(text, self)
-        dlg.exec()
+    def _open_characteristics(self):
+        """X-Y karakteristik eğrileri; kapatılınca gizlenir, kovalar korunur."""
+        if self.characteristic_dialog is None:
+            from presentation.widgets.characteristic_dialog import CharacteristicDialog
+
+            self.characteristic_dialog = CharacteristicDialog(self.characteristics, self)
+        self.characteristic_dialog.show()
+        self.characteristic_dialog.raise_()
+        self.characteristic_dialog.activateWindow()
+
+    def _generate_report(self):
+        """
+        Çıktı klasöründeki segmentlerden oturum raporu üretir.
 
+        Grafik çizimi ve PDF basımı işçi thread'inde yapılır; önbellekteki
+        segmentler yeniden işlenmez.
+        """
+        folder = self.control_panel.output_edit.text().strip()
+        if not folder or not os.path.isdir(folder):
+            folder = QFileDialog.getExistingDirectory(self, "Select Segment Folder")
+            if not folder:
+                return
 
+        from presentation.reports.session_report import ReportWorker, SessionReport
 
+        report = SessionReport.from_folder(folder)
+        if not report.paths:
+            self.toasts.warning("Report", "No segment files found in the folder.")
+            return
+
+        path, _ = QFileDialog.getSaveFileName(
+            self,
+            "Save Report",
+            os.path.join(folder, "session_report.pdf"),
+            "PDF (*.pdf);;HTML (*.html)",
+        )
+        if not path:
+            return
+
+        worker = ReportWorker(report, path, self)
+        worker.written.connect(
+            lambda p: self.toasts.info("Report", f"Report saved:\n{os.path.basename(p)}")
+        )
+        worker.failed.connect(
+            lambda msg: self.toasts.error("Report", f"Report could not be generated:\n{msg}")
+        )
+        worker.finished.connect(lambda w=worker: self._on_export_finished(w))
+        self.export_workers.append(worker)
+        self.toasts.info("Report", f"Generating report for {len(report.paths)} segment(s)...")
+        worker.start()
+
+    def _close_recording(self):
+        if self.recording is None:
+            return
+        self.graph_panel.clear_all()
+        self.recording.close()
+        self.recording = None